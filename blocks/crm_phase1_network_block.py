@@ -61,6 +61,12 @@ def render_network_tagging_panel(person_id: str, agent_id: str, key_prefix: str
     # 기존 태그 목록
     if current_tags:
         st.markdown("**📋 등록된 관계망 태그**")
+        # [GP-BATCH] 태그 카드별 관계 대상 조회를 in_() 1회로 합침
+        for _aid in {t.get("agent_id", "") for t in current_tags}:
+            du.prime_customer_cards(
+                [t.get("related_person_id", "") for t in current_tags if t.get("agent_id", "") == _aid],
+                _aid,
+            )
         for tag in current_tags:
             _render_tag_card(tag, key_prefix)
     else:
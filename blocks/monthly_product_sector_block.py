@@ -13,7 +13,7 @@ from datetime import datetime
 from typing import List, Dict, Optional
 
 try:
-    from supabase import create_client
+    from supabase_pool import get_supabase_client
 except ImportError:
     st.error("❌ supabase 라이브러리가 설치되어 있지 않습니다.")
     st.stop()
@@ -55,7 +55,7 @@ def render_monthly_product_sector(
             st.warning("⚠️ Supabase 설정이 없습니다.")
             return
         
-        supabase = create_client(supabase_url, supabase_key)
+        supabase = get_supabase_client(supabase_url, supabase_key)
         
         # RPC 함수 호출
         result = supabase.rpc(
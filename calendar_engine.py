@@ -46,9 +46,175 @@ def _get_sb():
 def extract_tags(text: str) -> list[str]:
     return re.findall(r"#\w+", text or "")
 
-def cal_save(agent_id, title, body, date, start_time="09:00", end_time="10:00",
-             category="consult", person_id="", customer_name="", schedule_id="") -> str:
-    sid = schedule_id or str(uuid.uuid4())
+# ── [2-A] 반복 일정 RRULE (RFC 5545 부분집합) ─────────────────────────────────
+# 반복 일정은 마스터 1행(date=DTSTART, rrule, rrule_until, exdates)으로 저장하고
+# 조회 창(월간·오늘·기간) 안의 회차만 지연 전개한다. 회차 ID = "{마스터ID}@{YYYY-MM-DD}"
+_RRULE_FREQ = {"daily": "DAILY", "weekly": "WEEKLY", "monthly": "MONTHLY", "yearly": "YEARLY"}
+_BYDAY      = ["MO","TU","WE","TH","FR","SA","SU"]   # Python weekday() 순서
+_RRULE_MAX_COUNT = 365
+_OCC_SEP    = "@"
+
+def build_rrule(recur_type: str, interval: int = 1, end_type: str = "noend",
+                end_date_str: str = "", count: int = 10, weekdays: list | None = None) -> str:
+    """팝업 되풀이 설정 → RRULE 문자열. weekdays: JS 기준 0=일~6=토"""
+    parts = [f"FREQ={_RRULE_FREQ.get(recur_type, 'DAILY')}", f"INTERVAL={max(1, int(interval or 1))}"]
+    if recur_type == "weekly" and weekdays:
+        py_days = sorted({(d - 1) % 7 for d in weekdays})
+        parts.append("BYDAY=" + ",".join(_BYDAY[d] for d in py_days))
+    if end_type == "count":
+        parts.append(f"COUNT={max(1, min(_RRULE_MAX_COUNT, int(count or 1)))}")
+    elif end_type == "date" and end_date_str:
+        parts.append("UNTIL=" + end_date_str.replace("-", "")[:8])
+    return ";".join(parts)
+
+def parse_rrule(rule: str) -> Optional[dict]:
+    """RRULE 문자열 → {freq, interval, count, until, byday}. 미지원·오류 시 None"""
+    if not rule:
+        return None
+    kv = dict(p.split("=", 1) for p in rule.upper().replace("RRULE:", "").split(";") if "=" in p)
+    if kv.get("FREQ") not in _RRULE_FREQ.values():
+        return None
+    try:
+        return {
+            "freq":     kv["FREQ"],
+            "interval": max(1, int(kv.get("INTERVAL") or 1)),
+            "count":    int(kv["COUNT"]) if kv.get("COUNT") else None,
+            "until":    datetime.datetime.strptime(kv["UNTIL"][:8], "%Y%m%d").date() if kv.get("UNTIL") else None,
+            "byday":    sorted({_BYDAY.index(d[-2:]) for d in kv.get("BYDAY", "").split(",") if d[-2:] in _BYDAY}),
+        }
+    except (ValueError, KeyError):
+        return None
+
+def _iter_rrule(rule: dict, dtstart: datetime.date, stop: datetime.date,
+                start_at: Optional[datetime.date] = None):
+    """
+    DTSTART 부터 회차 날짜를 순서대로 생성 (stop·UNTIL·COUNT 중 먼저 닿는 곳까지).
+    COUNT 가 없으면 start_at 직전 회차까지 산술로 건너뜀 → 조회 창 크기만큼만 순회.
+    월·연 반복은 매 회차 DTSTART 의 일(日)을 그 달 말일로 보정 (31일 → 2월 28/29일 → 3월 31일).
+    """
+    end = min(stop, rule["until"]) if rule["until"] else stop
+    step = rule["interval"]
+    skip = rule["count"] is None and start_at is not None and start_at > dtstart
+    td = datetime.timedelta
+
+    def _gen():
+        if rule["freq"] == "DAILY":
+            k = (start_at - dtstart).days // step if skip else 0
+            cur = dtstart + td(days=k * step)
+            while cur <= end:
+                yield cur
+                cur += td(days=step)
+        elif rule["freq"] == "WEEKLY":
+            days = rule["byday"] or [dtstart.weekday()]
+            week = dtstart - td(days=dtstart.weekday())
+            if skip:
+                week += td(weeks=(start_at - week).days // 7 // step * step)
+            while week <= end:
+                for wd in days:
+                    d = week + td(days=wd)
+                    if d < dtstart:
+                        continue
+                    if d > end:
+                        return
+                    yield d
+                week += td(weeks=step)
+        else:
+            months = step if rule["freq"] == "MONTHLY" else 12 * step
+            k = 0
+            if skip:
+                k = ((start_at.year - dtstart.year) * 12 + start_at.month - dtstart.month) // months
+            while True:
+                m0 = dtstart.month - 1 + k * months
+                y, m = dtstart.year + m0 // 12, m0 % 12 + 1
+                if y > end.year:
+                    return
+                d = datetime.date(y, m, min(dtstart.day, _cal_mod.monthrange(y, m)[1]))
+                if d > end:
+                    return
+                yield d
+                k += 1
+
+    if rule["count"] is None:
+        yield from _gen()
+        return
+    for i, d in enumerate(_gen()):
+        if i >= rule["count"]:
+            return
+        yield d
+
+def _rrule_until(rule_str: str, dtstart: str) -> Optional[str]:
+    """마스터 행 rrule_until — 마지막 회차 날짜 (종료 없음이면 None). 기간 조회 범위 필터용"""
+    rule = parse_rrule(rule_str)
+    try:
+        start = datetime.date.fromisoformat(dtstart[:10])
+    except (TypeError, ValueError):
+        return None
+    if rule is None:
+        return dtstart[:10]
+    if rule["count"] is not None:
+        last = None
+        for last in _iter_rrule(rule, start, rule["until"] or datetime.date.max):
+            pass
+        return (last or start).isoformat()
+    return rule["until"].isoformat() if rule["until"] else None
+
+def _expand_series(row: dict, start: str, end: str) -> list[dict]:
+    """마스터 행 → 조회 창 [start, end] 안의 회차 행 (예외일 제외)"""
+    rule = parse_rrule(row.get("rrule") or "")
+    d0 = (row.get("date") or "")[:10]
+    if rule is None:
+        return [row] if start <= d0 <= end else []
+    try:
+        dtstart = datetime.date.fromisoformat(d0)
+        ws, we = datetime.date.fromisoformat(start), datetime.date.fromisoformat(end)
+    except ValueError:
+        return []
+    ex  = set(row.get("exdates") or [])
+    sid = row.get("schedule_id", "")
+    out = []
+    for d in _iter_rrule(rule, dtstart, we, start_at=ws):
+        ds = d.isoformat()
+        if d >= ws and ds not in ex:
+            out.append(dict(row, date=ds, schedule_id=f"{sid}{_OCC_SEP}{ds}", series_id=sid))
+    return out
+
+def _expand_rows(rows: list, start: str, end: str) -> list[dict]:
+    """단건 행은 창 필터, 마스터 행은 회차 전개 후 (날짜, 시작시각) 정렬"""
+    out: list = []
+    for r in rows:
+        if r.get("rrule"):
+            out.extend(_expand_series(r, start, end))
+        elif start <= (r.get("date") or "") <= end:
+            out.append(r)
+    out.sort(key=lambda e: (e.get("date") or "", e.get("start_time") or ""))
+    return out
+
+def _expand_open(rows: list, horizon: str = "") -> list[dict]:
+    """
+    조회 창이 없는 목록(태그 검색·고객 타임라인)용 — 마스터는 DTSTART 부터
+    마지막 회차(rrule_until)까지 전개하되 종료 없는·먼 시리즈는 horizon(기본 1년 뒤)에서 자름.
+    """
+    horizon = horizon or _year_after(datetime.date.today().isoformat())
+    out: list = []
+    for r in rows:
+        if not r.get("rrule"):
+            out.append(r)
+            continue
+        d0 = (r.get("date") or "")[:10]
+        last = min(r.get("rrule_until") or horizon, horizon)
+        out.extend(_expand_series(r, d0, max(d0, last)))
+    return out
+
+def _split_occurrence_id(schedule_id: str) -> tuple:
+    """회차 ID → (마스터ID, 회차 날짜). 단건 ID 는 (schedule_id, "")"""
+    if _OCC_SEP in (schedule_id or ""):
+        sid, occ = schedule_id.rsplit(_OCC_SEP, 1)
+        return sid, occ
+    return schedule_id, ""
+
+# ── [2-B] 일정 저장/삭제 ──────────────────────────────────────────────────────
+def _schedule_payload(sid, agent_id, title, body, date, start_time, end_time,
+                      category, person_id, customer_name, is_new) -> dict:
     now = datetime.datetime.utcnow().isoformat()
     payload = {
         "schedule_id": sid, "agent_id": agent_id, "title": title,
@@ -56,40 +222,180 @@ def cal_save(agent_id, title, body, date, start_time="09:00", end_time="10:00",
         "end_time": end_time, "category": category,
         "is_deleted": False, "updated_at": now,
     }
-    if not schedule_id:
+    if is_new:
         payload["created_at"] = now
     if person_id:
         payload["person_id"] = person_id
     if customer_name:
         payload["customer_name"] = customer_name
+    return payload
+
+_MINIMAL_COLUMNS = ("schedule_id","agent_id","title","memo","date",
+                    "start_time","category","is_deleted","updated_at","created_at","person_id")
+
+def _minimal_payload(payload: dict) -> dict:
+    """확장 컬럼 미적용 DB 용 최소 컬럼"""
+    return {k: payload[k] for k in _MINIMAL_COLUMNS if k in payload}
+
+def _cache_events(payloads: list) -> None:
+    """세션 캐시(_cal_events) 일괄 갱신 — DB 미연결 시 조회 fallback (session_state 쓰기 1회)"""
+    if not payloads:
+        return
+    fresh: dict = {}
+    for payload in payloads:
+        ev = {k: payload.get(k, "") for k in (
+            "schedule_id","title","memo","date","start_time","end_time",
+            "category","customer_name","person_id")}
+        ev["tags"] = extract_tags((ev["title"] or "") + " " + (ev["memo"] or ""))
+        if payload.get("rrule"):
+            ev.update(rrule=payload["rrule"], rrule_until=payload.get("rrule_until"),
+                      exdates=list(payload.get("exdates") or []))
+        fresh[ev["schedule_id"]] = ev
+    evs = [e for e in st.session_state.get("_cal_events", []) if e.get("schedule_id") not in fresh]
+    st.session_state["_cal_events"] = evs + list(fresh.values())
+
+def _cache_event(payload: dict) -> None:
+    _cache_events([payload])
+
+def cal_save(agent_id, title, body, date, start_time="09:00", end_time="10:00",
+             category="consult", person_id="", customer_name="", schedule_id="") -> str:
+    """
+    단건 일정 저장. schedule_id 가 반복 회차 ID("{마스터ID}@{날짜}")면
+    해당 회차를 시리즈 예외일로 돌리고 수정 내용은 새 단건 일정으로 분리 저장.
+    """
+    series_id, occ_date = _split_occurrence_id(schedule_id)
+    if occ_date:
+        cal_add_exdate(series_id, occ_date, agent_id=agent_id)
+        schedule_id = ""
+    sid = schedule_id or str(uuid.uuid4())
+    payload = _schedule_payload(sid, agent_id, title, body, date, start_time, end_time,
+                                category, person_id, customer_name, is_new=not schedule_id)
     sb = _get_sb()
     if sb:
         try:
             sb.table("gk_schedules").upsert(payload, on_conflict="schedule_id").execute()
         except Exception:
             try:
-                minimal = {k: payload[k] for k in [
-                    "schedule_id","agent_id","title","memo","date",
-                    "start_time","category","is_deleted","updated_at"]}
-                if not schedule_id:
-                    minimal["created_at"] = now
-                if person_id:
-                    minimal["person_id"] = person_id
-                sb.table("gk_schedules").upsert(minimal, on_conflict="schedule_id").execute()
+                sb.table("gk_schedules").upsert(_minimal_payload(payload), on_conflict="schedule_id").execute()
             except Exception:
                 pass
-    evs = st.session_state.get("_cal_events", [])
-    evs = [e for e in evs if e.get("schedule_id") != sid]
-    evs.append({"schedule_id":sid,"title":title,"memo":body,"date":date,
-                "start_time":start_time,"end_time":end_time,"category":category,
-                "tags":extract_tags(title+" "+body),"customer_name":customer_name,"person_id":person_id})
-    st.session_state["_cal_events"] = evs
+    _cache_event(payload)
+    return sid
+
+def cal_save_series(agent_id, title, body, date, rrule, start_time="09:00", end_time="10:00",
+                    category="consult", person_id="", customer_name="", schedule_id="",
+                    exdates: list | None = None) -> str:
+    """
+    [GP-CALENDAR] 반복 일정 저장 — 마스터 1행(RRULE + 예외일) upsert 1회.
+    회차는 cal_load_range 등에서 조회 창 안에서만 전개.
+    rrule 컬럼 미적용 DB 는 회차(최대 365개)를 단건 행으로 펼쳐 배치 upsert 1회로 저장.
+    """
+    sid = schedule_id or str(uuid.uuid4())
+    payload = _schedule_payload(sid, agent_id, title, body, date, start_time, end_time,
+                                category, person_id, customer_name, is_new=not schedule_id)
+    payload.update(rrule=rrule, rrule_until=_rrule_until(rrule, date), exdates=sorted(exdates or []))
+    sb = _get_sb()
+    if sb:
+        try:
+            sb.table("gk_schedules").upsert(payload, on_conflict="schedule_id").execute()
+        except Exception:
+            try:
+                from db_utils import bulk_upsert_schedules
+                rows = [
+                    _minimal_payload(dict(payload, schedule_id=str(uuid.uuid4()), date=occ["date"],
+                                          created_at=payload["updated_at"]))
+                    for occ in _expand_series(payload, date, payload["rrule_until"] or _year_after(date))
+                ]
+                bulk_upsert_schedules(rows[:_RRULE_MAX_COUNT])
+            except Exception:
+                pass
+    _cache_event(payload)
     return sid
 
+def cal_save_bulk(agent_id: str, events: list, ignore_duplicates: bool = False,
+                  chunk_size: int = 500, update_session: bool = True) -> dict:
+    """
+    [GP-BULK] 여러 일정 일괄 저장 — 청크당 다중 행 upsert 1회 + 세션 캐시 갱신 1회.
+
+    Args:
+        events: [{"title", "date", "body"|"memo", "start_time", "end_time", "category",
+                  "person_id", "customer_name", "schedule_id", "rrule", "exdates"}, ...]
+        ignore_duplicates: True 면 기존 schedule_id 는 덮어쓰지 않음 (가져오기 재실행)
+        update_session: False 면 세션 캐시 갱신 생략 (호출자가 report["rows"] 로 마지막에 1회 갱신)
+        schedule_id 를 지정한 일정(ICS 재가져오기 등)은 기존 행의 created_at 을 유지
+
+    Returns:
+        db_utils.bulk_upsert_schedules 보고서 (written / conflicts / requests)
+    """
+    payloads = []
+    for ev in events:
+        p = _schedule_payload(
+            ev.get("schedule_id") or str(uuid.uuid4()), agent_id, ev.get("title", ""),
+            ev.get("body", ev.get("memo", "")), ev.get("date", ""),
+            ev.get("start_time") or "09:00", ev.get("end_time") or "10:00",
+            ev.get("category") or "consult", ev.get("person_id", ""), ev.get("customer_name", ""),
+            is_new=not ev.get("schedule_id"),
+        )
+        if ev.get("rrule"):
+            p.update(rrule=ev["rrule"], rrule_until=_rrule_until(ev["rrule"], p["date"]),
+                     exdates=sorted(ev.get("exdates") or []))
+        payloads.append(p)
+    report = {"success": False, "written": [], "rows": payloads, "conflicts": [], "requests": 0}
+    if _get_sb():
+        try:
+            from db_utils import bulk_upsert_schedules
+            report = bulk_upsert_schedules(payloads, chunk_size=chunk_size,
+                                           ignore_duplicates=ignore_duplicates,
+                                           fallback_columns=_MINIMAL_COLUMNS,
+                                           keep_created_at=True)
+        except Exception:
+            pass
+        written = set(report["written"])
+        report["rows"] = [p for p in payloads if p["schedule_id"] in written]
+    else:
+        report.update(success=True, written=[p["schedule_id"] for p in payloads])
+    if update_session:
+        _cache_events(report["rows"])
+    return report
+
+def _year_after(date_str: str) -> str:
+    try:
+        return (datetime.date.fromisoformat(date_str[:10]) + datetime.timedelta(days=365)).isoformat()
+    except ValueError:
+        return date_str
+
+def cal_add_exdate(series_id: str, occ_date: str, agent_id: str = "") -> None:
+    """반복 일정의 특정 회차 제외 (EXDATE) — 마스터 행 exdates 배열에 날짜 추가"""
+    sb = _get_sb()
+    if sb and series_id and occ_date:
+        try:
+            q = sb.table("gk_schedules").select("exdates").eq("schedule_id", series_id)
+            if agent_id:
+                q = q.eq("agent_id", agent_id)
+            rows = q.limit(1).execute().data or []
+            if rows:
+                u = sb.table("gk_schedules").update({
+                    "exdates": sorted(set(rows[0].get("exdates") or []) | {occ_date}),
+                    "updated_at": datetime.datetime.utcnow().isoformat(),
+                }).eq("schedule_id", series_id)
+                if agent_id:
+                    u = u.eq("agent_id", agent_id)
+                u.execute()
+        except Exception:
+            pass
+    for e in st.session_state.get("_cal_events", []):
+        if e.get("schedule_id") == series_id:
+            e["exdates"] = sorted(set(e.get("exdates") or []) | {occ_date})
+
 def cal_delete(schedule_id: str, agent_id: str = "") -> bool:
     """
     [GP-SEC] agent_id 제공 시 소유권 검증 — 타 설계사 일정 삭제 원천 차단.
+    반복 회차 ID("{마스터ID}@{날짜}")는 해당 회차만 예외일로 제외.
     """
+    series_id, occ_date = _split_occurrence_id(schedule_id)
+    if occ_date:
+        cal_add_exdate(series_id, occ_date, agent_id=agent_id)
+        return True
     sb = _get_sb()
     if sb and schedule_id:
         try:
@@ -120,40 +426,37 @@ def cal_search_by_tag(agent_id: str, tag: str, limit: int = 50) -> list[dict]:
                 .or_(f"memo.ilike.%{sq}%,title.ilike.%{q}%")
                 .order("date", desc=True).limit(limit).execute().data or []
             )
-            return rows
+            return sorted(_expand_open(rows), key=lambda e: e.get("date") or "", reverse=True)[:limit]
         except Exception:
             pass
     ql = sq.lower()
-    return [e for e in st.session_state.get("_cal_events", [])
+    hits = [e for e in st.session_state.get("_cal_events", [])
             if ql in (e.get("memo","") + e.get("title","")).lower()]
+    return sorted(_expand_open(hits), key=lambda e: e.get("date") or "", reverse=True)[:limit]
 
-def cal_load_month(agent_id: str, year: int, month: int) -> list[dict]:
-    start = f"{year:04d}-{month:02d}-01"
-    days  = _cal_mod.monthrange(year, month)[1]
-    end   = f"{year:04d}-{month:02d}-{days:02d}"
+def cal_load_range(agent_id: str, start: str, end: str) -> list[dict]:
+    """
+    기간 [start, end] (YYYY-MM-DD) 일정 — 단건 행 + 창과 겹치는 반복 마스터 행을 1회 조회해
+    반복 회차는 창 안에서만 전개.
+    """
     sb = _get_sb()
     if sb:
         try:
-            return (sb.table("gk_schedules").select("*, gk_people(name)")
-                    .eq("is_deleted",False).eq("agent_id",agent_id)
-                    .gte("date",start).lte("date",end)
-                    .order("date").order("start_time").execute().data or [])
+            from db_utils import _fetch_schedule_window
+            return _expand_rows(_fetch_schedule_window(sb, agent_id, start, end), start, end)
         except Exception:
             pass
-    ym = f"{year:04d}-{month:02d}"
-    return [e for e in st.session_state.get("_cal_events",[]) if e.get("date","")[:7]==ym]
+    return _expand_rows(st.session_state.get("_cal_events",[]), start, end)
+
+def cal_load_month(agent_id: str, year: int, month: int) -> list[dict]:
+    start = f"{year:04d}-{month:02d}-01"
+    days  = _cal_mod.monthrange(year, month)[1]
+    end   = f"{year:04d}-{month:02d}-{days:02d}"
+    return cal_load_range(agent_id, start, end)
 
 def cal_load_today(agent_id: str) -> list[dict]:
     today = datetime.date.today().isoformat()
-    sb = _get_sb()
-    if sb:
-        try:
-            return (sb.table("gk_schedules").select("*, gk_people(name)")
-                    .eq("is_deleted",False).eq("agent_id",agent_id)
-                    .eq("date",today).order("start_time").execute().data or [])
-        except Exception:
-            pass
-    return [e for e in st.session_state.get("_cal_events",[]) if e.get("date")==today]
+    return cal_load_range(agent_id, today, today)
 
 def cal_load_expiry_soon(agent_id: str, days: int = 7) -> list[dict]:
     today_str = datetime.date.today().isoformat()
@@ -161,11 +464,10 @@ def cal_load_expiry_soon(agent_id: str, days: int = 7) -> list[dict]:
     sb = _get_sb()
     if sb:
         try:
-            return (sb.table("gk_schedules").select("*")
-                    .eq("is_deleted",False).eq("agent_id",agent_id)
-                    .ilike("memo","%#보험만기%")
-                    .gte("date",today_str).lte("date",end_str)
-                    .order("date").execute().data or [])
+            from db_utils import _fetch_schedule_window
+            rows = _fetch_schedule_window(sb, agent_id, today_str, end_str, select="*",
+                                          refine=lambda q: q.ilike("memo", "%#보험만기%"))
+            return _expand_rows(rows, today_str, end_str)
         except Exception:
             pass
     return []
@@ -176,12 +478,14 @@ def cal_load_customer(agent_id: str, person_id: str) -> list[dict]:
     sb = _get_sb()
     if sb:
         try:
-            return (sb.table("gk_schedules").select("*")
+            rows = (sb.table("gk_schedules").select("*")
                     .eq("is_deleted",False).eq("agent_id",agent_id)
                     .eq("person_id",person_id).order("date").execute().data or [])
+            return sorted(_expand_open(rows), key=lambda e: e.get("date") or "")
         except Exception:
             pass
-    return [e for e in st.session_state.get("_cal_events",[]) if e.get("person_id")==person_id]
+    evs = [e for e in st.session_state.get("_cal_events",[]) if e.get("person_id")==person_id]
+    return sorted(_expand_open(evs), key=lambda e: e.get("date") or "")
 
 # ══ [3] ICS 생성기 (RFC 5545) ════════════════════════════════════════════════
 def generate_ics(title, date_str, start_time="09:00", end_time="10:00",
@@ -206,6 +510,189 @@ def generate_ics(title, date_str, start_time="09:00", end_time="10:00",
     )
     return ics.encode("utf-8")
 
+# ══ [3-A] ICS 가져오기 (스트리밍 파서 + 일괄 저장) ══════════════════════════
+# 파일 전체를 메모리에 올리지 않고 줄 단위로 읽어 VEVENT 를 하나씩 만들고,
+# chunk_size 개가 모일 때마다 cal_save_bulk 로 전송한다.
+# UID 기반 schedule_id(uuid5) → 같은 파일을 다시 가져와도 중복 일정이 생기지 않음.
+_ICS_NS      = uuid.UUID("6f1c2a8e-9b7d-4c55-a0e3-5d2f8b4c9e17")
+_KST         = datetime.timezone(datetime.timedelta(hours=9))
+_ICS_RRULE_KEYS = {"FREQ", "INTERVAL", "COUNT", "UNTIL", "BYDAY", "WKST"}
+
+def _ics_unescape(v: str) -> str:
+    return re.sub(r"\\([\\;,nN])", lambda m: "\n" if m.group(1) in "nN" else m.group(1), v)
+
+def _ics_lines(stream):
+    """RFC 5545 줄 접기(folding) 해제 — bytes/str 줄 이터러블 → 논리 줄"""
+    buf = ""
+    for raw in stream:
+        line = raw.decode("utf-8", "replace") if isinstance(raw, bytes) else raw
+        line = line.rstrip("\r\n")
+        if line[:1] in (" ", "\t"):
+            buf += line[1:]
+            continue
+        if buf:
+            yield buf
+        buf = line
+    if buf:
+        yield buf
+
+def _ics_zone(tzid: str):
+    """TZID(IANA 이름) → tzinfo. Windows 표기 등 미확인 이름은 None (현지 시각 그대로 사용)."""
+    try:
+        from zoneinfo import ZoneInfo
+        return ZoneInfo(tzid.strip('"'))
+    except (ImportError, ValueError, KeyError, OSError):   # ZoneInfoNotFoundError 는 KeyError 하위
+        return None
+
+def _ics_datetime(value: str, params: dict) -> tuple:
+    """DTSTART/DTEND 값 → (YYYY-MM-DD, HH:MM | "") — UTC(Z)·TZID 시각은 KST 로 변환, 종일 일정은 시각 ""."""
+    v = value.strip()
+    if params.get("VALUE") == "DATE" or len(v) == 8:
+        d = datetime.datetime.strptime(v[:8], "%Y%m%d")
+        return d.date().isoformat(), ""
+    dt = datetime.datetime.strptime(v[:15], "%Y%m%dT%H%M%S")
+    zone = datetime.timezone.utc if v.endswith("Z") else (
+        _ics_zone(params["TZID"]) if params.get("TZID") else None)
+    if zone is not None:
+        dt = dt.replace(tzinfo=zone).astimezone(_KST)
+    return dt.date().isoformat(), dt.strftime("%H:%M")
+
+def _ics_rrule_supported(rule: str) -> bool:
+    """지연 전개기가 그대로 재현 가능한 RRULE 인지 (서수 BYDAY·BYMONTHDAY 등 제외)"""
+    kv = dict(p.split("=", 1) for p in rule.upper().split(";") if "=" in p)
+    if not set(kv) <= _ICS_RRULE_KEYS or parse_rrule(rule) is None:
+        return False
+    if "BYDAY" in kv:
+        return kv.get("FREQ") == "WEEKLY" and all(d in _BYDAY for d in kv["BYDAY"].split(","))
+    return True
+
+def iter_ics_events(stream, agent_id: str = "", stats: dict | None = None):
+    """
+    ICS 스트림 → cal_save_bulk 입력 dict 를 하나씩 yield.
+    stats 에 건너뛴 사유별 건수 누적 (cancelled / invalid / unsupported_rrule / overrides).
+    전개기가 재현할 수 없는 RRULE 시리즈는 첫 회차만 단건으로 남기지 않고 통째로 건너뛴다.
+    RECURRENCE-ID 회차 수정본은 단건으로 가져오고 원래 회차는 마스터의 exdates 로 제외
+    (stats["overrides"] = {uid: [날짜, ...]}).
+    """
+    stats = stats if stats is not None else {}
+    for k in ("cancelled", "invalid", "unsupported_rrule"):
+        stats.setdefault(k, 0)
+    overrides = stats.setdefault("overrides", {})
+    ev = None
+    for line in _ics_lines(stream):
+        if line == "BEGIN:VEVENT":
+            ev = {}
+            continue
+        if ev is None:
+            continue
+        if line == "END:VEVENT":
+            out = _ics_event_payload(ev, agent_id, stats, overrides)
+            ev = None
+            if out:
+                yield out
+            continue
+        name, _, value = line.partition(":")
+        key, *raw_params = name.split(";")
+        params = dict(p.split("=", 1) for p in raw_params if "=" in p)
+        key = key.upper()
+        if key == "EXDATE":
+            ev.setdefault("EXDATE", []).extend((v, params) for v in value.split(",") if v)
+        elif key not in ev:
+            ev[key] = (value, params)
+
+def _ics_event_payload(ev: dict, agent_id: str, stats: dict, overrides: dict) -> Optional[dict]:
+    if (ev.get("STATUS", ("",))[0]).upper() == "CANCELLED":
+        stats["cancelled"] += 1
+        return None
+    try:
+        date, stime = _ics_datetime(*ev["DTSTART"])
+        _, etime = _ics_datetime(*ev["DTEND"]) if "DTEND" in ev else (date, "")
+    except (KeyError, ValueError):
+        stats["invalid"] += 1
+        return None
+    title = _ics_unescape(ev.get("SUMMARY", ("",))[0]) or "(제목 없음)"
+    memo  = _ics_unescape(ev.get("DESCRIPTION", ("",))[0])
+    loc   = _ics_unescape(ev.get("LOCATION", ("",))[0])
+    if loc:
+        memo = (memo + "\n" if memo else "") + f"📍 {loc}"
+    uid = ev.get("UID", ("",))[0] or f"{title}|{date}|{stime}"
+    key = f"ics:{agent_id}:{uid}"
+    if "RECURRENCE-ID" in ev:
+        try:
+            occ, _ = _ics_datetime(*ev["RECURRENCE-ID"])
+        except ValueError:
+            occ = ""
+        overrides.setdefault(uid, []).append(occ)
+        key += f":{ev['RECURRENCE-ID'][0]}"
+    out = {
+        "schedule_id": str(uuid.uuid5(_ICS_NS, key)), "uid": uid,
+        "title": title, "body": memo, "date": date,
+        "start_time": stime or "00:00", "end_time": etime or ("23:59" if not stime else stime),
+        "category": "appointment",
+    }
+    rule = ev.get("RRULE", ("",))[0].replace("RRULE:", "")
+    if rule and "RECURRENCE-ID" not in ev:
+        if not _ics_rrule_supported(rule):
+            stats["unsupported_rrule"] += 1   # 단건으로 저장하면 반복 일정이 1회로 축소됨 → 건너뜀
+            return None
+        out["rrule"] = rule
+        exd = []
+        for v, params in ev.get("EXDATE", []):
+            try:
+                exd.append(_ics_datetime(v, params)[0])
+            except ValueError:
+                pass
+        out["exdates"] = exd
+    return out
+
+def cal_import_ics(agent_id: str, stream, chunk_size: int = 500,
+                   on_progress=None) -> dict:
+    """
+    [GP-BULK] .ics 대량 가져오기 — 스트리밍 파싱 + 청크 단위 cal_save_bulk.
+    반복 마스터는 회차 수정본(RECURRENCE-ID)을 exdates 에 반영하기 위해 마지막에 한 번에 저장.
+
+    Args:
+        stream: 바이너리/텍스트 줄 이터러블 (UploadedFile, open(..., "rb") 등)
+        on_progress: (처리한 일정 수) 콜백
+
+    Returns:
+        {"events", "written", "conflicts", "requests", "skipped": {...}, "seconds"}
+    """
+    import time as _time
+    t0 = _time.perf_counter()
+    stats: dict = {}
+    report = {"events": 0, "written": 0, "conflicts": [], "requests": 0}
+    pending: list = []
+    masters: list = []
+    saved: list = []
+
+    def _flush(batch):
+        r = cal_save_bulk(agent_id, batch, chunk_size=chunk_size, update_session=False)
+        saved.extend(r["rows"])
+        report["written"]   += len(r["written"])
+        report["conflicts"] += r["conflicts"]
+        report["requests"]  += r["requests"]
+
+    for ev in iter_ics_events(stream, agent_id, stats):
+        report["events"] += 1
+        (masters if ev.get("rrule") else pending).append(ev)
+        if len(pending) >= chunk_size:
+            _flush(pending)
+            pending = []
+            if on_progress:
+                on_progress(report["events"])
+    for m in masters:
+        m["exdates"] = sorted(set(m.get("exdates", [])) | set(stats["overrides"].get(m["uid"], [])))
+    for batch in (pending, masters):
+        for i in range(0, len(batch), chunk_size):
+            _flush(batch[i:i + chunk_size])
+    _cache_events(saved)
+    if on_progress:
+        on_progress(report["events"])
+    report["skipped"] = {k: stats[k] for k in ("cancelled", "invalid", "unsupported_rrule")}
+    report["seconds"] = round(_time.perf_counter() - t0, 2)
+    return report
+
 # ══ [4] 오늘의 핵심 영업 일정 위젯 ══════════════════════════════════════════
 def render_today_widget(agent_id: str) -> None:
     if not agent_id:
@@ -398,62 +885,20 @@ def render_customer_timeline(agent_id: str, person_id: str, customer_name: str =
 def _gen_recur_dates(start_str: str, recur_type: str, interval: int,
                     end_type: str, end_date_str: str, count: int,
                     weekdays: list) -> list:
-    """되풀이 날짜 목록 생성. weekdays: JS 기준 0=일~6=토"""
-    import datetime as _dt
-    dates: list = []
+    """되풀이 날짜 목록 생성 (최대 365회, 종료일 미지정 시 1년). weekdays: JS 기준 0=일~6=토"""
     try:
-        cur = _dt.date.fromisoformat(start_str)
+        start = datetime.date.fromisoformat(start_str)
     except Exception:
-        return dates
-    interval = max(1, interval)
+        return []
+    rule = parse_rrule(build_rrule(recur_type, interval, end_type, end_date_str, count, weekdays))
+    stop = start + datetime.timedelta(days=365)
     if end_type == "date" and end_date_str:
-        try:
-            end_d = _dt.date.fromisoformat(end_date_str)
-        except Exception:
-            end_d = cur + _dt.timedelta(days=365)
-    else:
-        end_d = cur + _dt.timedelta(days=365)
-    max_n = min(count, 365) if end_type == "count" else 365
-
-    if recur_type == "daily":
-        while cur <= end_d and len(dates) < max_n:
-            dates.append(cur.isoformat())
-            cur += _dt.timedelta(days=interval)
-
-    elif recur_type == "weekly":
-        if not weekdays:
-            weekdays = [(cur.weekday() + 1) % 7]
-        py_days = {(d - 1) % 7 for d in weekdays}
-        week_start = cur - _dt.timedelta(days=cur.weekday())
-        while week_start <= end_d and len(dates) < max_n:
-            for offset in range(7):
-                d = week_start + _dt.timedelta(days=offset)
-                if d < cur or d > end_d:
-                    continue
-                if d.weekday() in py_days:
-                    dates.append(d.isoformat())
-                    if len(dates) >= max_n:
-                        break
-            week_start += _dt.timedelta(weeks=interval)
-
-    elif recur_type == "monthly":
-        while cur <= end_d and len(dates) < max_n:
-            dates.append(cur.isoformat())
-            m = cur.month + interval
-            y = cur.year + (m - 1) // 12
-            m = (m - 1) % 12 + 1
-            leap = 1 if (y % 4 == 0 and (y % 100 != 0 or y % 400 == 0)) else 0
-            max_day = [31, 28+leap, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31][m-1]
-            cur = _dt.date(y, m, min(cur.day, max_day))
-
-    elif recur_type == "yearly":
-        while cur <= end_d and len(dates) < max_n:
-            dates.append(cur.isoformat())
-            try:
-                cur = _dt.date(cur.year + interval, cur.month, cur.day)
-            except ValueError:
-                cur = _dt.date(cur.year + interval, cur.month, 28)
-
+        stop = rule["until"] or stop
+    dates: list = []
+    for d in _iter_rrule(rule, start, stop):
+        if len(dates) >= _RRULE_MAX_COUNT:
+            break
+        dates.append(d.isoformat())
     return dates
 
 
@@ -578,9 +1023,9 @@ def render_smart_calendar(agent_id: str, customers: list | None = None) -> None:
                 _r_end_d = st.query_params.get("cal_recur_end_date", "")
                 _r_cnt   = max(1, min(365, int(st.query_params.get("cal_recur_cnt", "10") or "10")))
                 _r_days  = [int(x) for x in st.query_params.get("cal_recur_days","").split(",") if x.strip().isdigit()]
-                for _d in _gen_recur_dates(_p_date, _r_type, _r_int, _r_end_t, _r_end_d, _r_cnt, _r_days):
-                    cal_save(agent_id=agent_id, title=_p_title, body=_p_memo,
-                             date=_d, start_time=_p_stime, end_time=_p_etime, category=_p_cat)
+                cal_save_series(agent_id=agent_id, title=_p_title, body=_p_memo,
+                                date=_p_date, start_time=_p_stime, end_time=_p_etime, category=_p_cat,
+                                rrule=build_rrule(_r_type, _r_int, _r_end_t, _r_end_d, _r_cnt, _r_days))
             else:
                 cal_save(agent_id=agent_id, title=_p_title, body=_p_memo,
                          date=_p_date, start_time=_p_stime, end_time=_p_etime,
@@ -786,6 +1231,9 @@ def render_smart_calendar(agent_id: str, customers: list | None = None) -> None:
     # ── 월간 영업 전략 메모장 (자동저장)
     _render_monthly_memo(agent_id, month_key)
 
+    # ── 기존 캘린더 가져오기 (.ics)
+    _render_ics_import(agent_id)
+
     # [C] 일정 추가/편집 폼
     _render_event_form(agent_id, customers, year, month)
 
@@ -896,6 +1344,29 @@ def _render_monthly_memo(agent_id: str, month_key: str) -> None:
         height=100, on_change=_on_change)
 
 
+def _render_ics_import(agent_id: str) -> None:
+    """[GP-BULK] 구글·아이폰 캘린더 내보내기(.ics) 일괄 가져오기"""
+    with st.expander("📥 기존 캘린더 가져오기 (.ics)", expanded=False):
+        _f = st.file_uploader("캘린더 파일", type=["ics"], key="cal_ics_import",
+                              label_visibility="collapsed")
+        if _f is None or not st.button("가져오기", key="cal_ics_import_btn", use_container_width=True):
+            return
+        _bar = st.progress(0.0, text="일정 읽는 중…")
+        _size = max(getattr(_f, "size", 0), 1)
+        _f.seek(0)
+        _rep = cal_import_ics(
+            agent_id, _f,
+            on_progress=lambda n: _bar.progress(min(_f.tell() / _size, 1.0), text=f"{n:,}건 처리"),
+        )
+        _bar.empty()
+        _sk = _rep["skipped"]
+        st.success(f"✅ {_rep['written']:,} / {_rep['events']:,}건 저장 ({_rep['seconds']}초)")
+        if _rep["conflicts"] or any(_sk.values()):
+            st.caption(f"충돌 {len(_rep['conflicts'])}건 · 취소 일정 {_sk['cancelled']}건 · "
+                       f"날짜 오류 {_sk['invalid']}건 · 미지원 반복 규칙(가져오지 않음) {_sk['unsupported_rrule']}건")
+        st.session_state["_schedule_ctx_dirty"] = True
+
+
 def _render_event_form(agent_id, customers, year, month):
     sel_date_str = st.session_state.get("_cal_sel_date","")
     try:
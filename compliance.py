@@ -201,12 +201,12 @@ def _save_feedback(
     # Supabase best-effort 저장
     try:
         from shared_components import get_env_secret
-        from supabase import create_client
+        from supabase_pool import get_supabase_client
         _url = get_env_secret("SUPABASE_URL", "")
         _key = get_env_secret("SUPABASE_SERVICE_ROLE_KEY",
                               get_env_secret("SUPABASE_KEY", ""))
         if _url and _key:
-            _sb = create_client(_url, _key)
+            _sb = get_supabase_client(_url, _key)
             _sb.table("ai_feedback_log").insert(record).execute()
     except Exception:
         pass
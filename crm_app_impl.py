@@ -83,6 +83,7 @@ try:
         render_voice_player_zephyr   as _ve_player_zephyr,
         build_morning_briefing       as _ve_build_brief,
         build_customer_briefing      as _ve_build_cust_brief,
+        presynthesize_priority_briefings as _ve_presynth,
         render_voice_search          as _ve_voice_search,
         parse_voice_intent           as _ve_parse_intent,
     )
@@ -90,6 +91,7 @@ try:
 except Exception as _ve_err:
     _VOICE_OK = False
     _ve_morning_auto = _ve_player_zephyr = _ve_build_brief = _ve_build_cust_brief = None
+    _ve_presynth = None
     _ve_voice_search = _ve_parse_intent = None
     _MODULE_LOAD_ERRORS.append(f"voice_engine — {_ve_err}")
 
@@ -2154,6 +2156,14 @@ if _spa_mode == "list":
             _ve_morning_auto(_user_id, _user_name)
         except Exception:
             pass
+        # [GP-VOICE-CACHE] 오늘 우선순위 고객 브리핑 사전 합성 (세션당 1일 1회, 백그라운드)
+        _presynth_key = f"_ve_presynth_{datetime.date.today().isoformat()}"
+        if _ve_presynth and not st.session_state.get(_presynth_key):
+            st.session_state[_presynth_key] = True
+            try:
+                _ve_presynth(_user_id, _load_customers(_user_id))
+            except Exception:
+                pass
     render_crm_consultation_center(
         _user_id,
         sel_pid=_sel_pid,
@@ -6,17 +6,18 @@ from __future__ import annotations
 
 
 def fetch_customers_for_agent(agent_id: str, query: str = "") -> list:
+    """담당 고객 전체 — 키셋 페이지(next_cursor)를 끝까지 따라감 (200/500건 절단 없음)."""
     try:
-        from head_api_client import list_customer_records
+        from head_api_client import list_all_customer_records
 
-        r = list_customer_records(user_id=agent_id, query=query, include_deleted=False)
+        r = list_all_customer_records(user_id=agent_id, query=query, include_deleted=False)
         if isinstance(r, dict) and r.get("ok") and isinstance(r.get("items"), list):
             return r["items"]
     except Exception:
         pass
     from db_utils import load_customers
 
-    return load_customers(agent_id, query)
+    return load_customers(agent_id, query, limit=None)
 
 
 def fetch_schedules_for_agent(agent_id: str) -> list:
@@ -13,35 +13,343 @@ Tables:
 """
 from __future__ import annotations
 
+import copy
 import uuid
+import weakref
 import datetime
 import threading
-from typing import Optional, Any
+import contextlib
+import contextvars
+from typing import Optional, Any, Callable, Hashable, Iterable
 
 # ── Supabase 클라이언트 (프로세스 내 싱글턴) ──────────────────────────────────
 _SB_CLIENT: Any = None
 
 
 def _get_sb() -> Any:
-    """Supabase 클라이언트 lazy init (환경변수 자동 탐지)."""
+    """
+    Supabase 클라이언트 lazy init (환경변수 자동 탐지).
+    [GP-POOL] supabase_pool 공유 커넥션 풀(HTTP/2 keep-alive·타임아웃·재시도) 사용.
+    """
     global _SB_CLIENT
     if _SB_CLIENT is not None:
         return _SB_CLIENT
     try:
-        from shared_components import get_env_secret
-        from supabase import create_client
-        _url = get_env_secret("SUPABASE_URL", "")
-        _key = get_env_secret(
-            "SUPABASE_SERVICE_ROLE_KEY",
-            get_env_secret("SUPABASE_KEY", ""),
-        )
-        if _url and _key:
-            _SB_CLIENT = create_client(_url, _key)
+        from supabase_pool import get_supabase_client
+        _SB_CLIENT = get_supabase_client()
     except Exception:
         pass
     return _SB_CLIENT
 
 
+# ══════════════════════════════════════════════════════════════════════════════
+# §0 [GP-BATCH] 요청(rerun) 단위 배치 로더 — 고객 카드별 N+1 조회 제거
+# ══════════════════════════════════════════════════════════════════════════════
+#
+# 고객 목록 화면이 카드마다 get_customer / get_person_policies_summary / ... 를
+# 호출하면 Supabase HTTP 왕복이 (고객 수 × 테이블 수)만큼 발생한다.
+#   1. prime_customer_cards(person_ids, agent_id) 로 화면에 표시할 id를 예약
+#   2. 첫 get_* 호출 시 예약된 id 전체를 테이블당 in_() 1회로 조회
+#   3. 결과는 같은 rerun 동안 메모이즈 (다음 rerun 에서는 최신 데이터 재조회)
+# Streamlit 밖(FastAPI 등)에서는 `with batch_scope():` 블록이 요청 범위가 된다.
+
+class _BatchScope:
+    """한 요청(rerun) 동안의 로더별 메모/예약 id."""
+
+    def __init__(self, marker: Any = None):
+        self.marker  = marker   # Streamlit rerun 식별자 (ctx.cursors 객체)
+        self.memo:    dict = {}
+        self.pending: dict = {}
+        self.lock = threading.Lock()
+
+
+_BATCH_SCOPE_VAR: contextvars.ContextVar = contextvars.ContextVar("gk_batch_scope", default=None)
+_ST_BATCH_SCOPES: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+@contextlib.contextmanager
+def batch_scope():
+    """명시적 요청 범위 (Streamlit 외부 또는 테스트용)."""
+    token = _BATCH_SCOPE_VAR.set(_BatchScope())
+    try:
+        yield
+    finally:
+        _BATCH_SCOPE_VAR.reset(token)
+
+
+def _current_batch_scope() -> Optional[_BatchScope]:
+    """
+    현재 요청 범위 반환.
+    우선순위: batch_scope() 블록 → Streamlit 세션의 현재 rerun → 없음(None, 메모 없이 즉시 조회)
+    """
+    scope = _BATCH_SCOPE_VAR.get()
+    if scope is not None:
+        return scope
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx(suppress_warning=True)
+    except Exception:
+        return None
+    if ctx is None:
+        return None
+    # ctx.cursors 는 rerun 마다 새 dict 로 교체됨 → rerun 경계 식별
+    marker = getattr(ctx, "cursors", None)
+    scope = _ST_BATCH_SCOPES.get(ctx)
+    if scope is None or scope.marker is not marker:
+        scope = _BatchScope(marker)
+        _ST_BATCH_SCOPES[ctx] = scope
+    return scope
+
+
+class BatchLoader:
+    """
+    per-id 조회를 요청 범위 내에서 1회 배치 조회로 합치는 로더 (dataloader 패턴).
+
+    batch_fn(keys) → {key: value} 를 받아, 누락 key 는 default 로 채운다.
+    batch_fn 예외 시 default 반환 + 메모하지 않음 (다음 호출에서 재시도).
+    """
+
+    def __init__(self, name: str, batch_fn: Callable[[list], dict], default: Callable[[], Any]):
+        self.name     = name
+        self.batch_fn = batch_fn
+        self.default  = default
+
+    def _fetch(self, keys: list) -> Optional[dict]:
+        try:
+            return self.batch_fn(keys) or {}
+        except Exception:
+            return None
+
+    def prime(self, keys: Iterable[Hashable]) -> None:
+        """다음 load() 때 함께 조회할 key 예약 (요청 범위 없으면 무시)."""
+        scope = _current_batch_scope()
+        if scope is None:
+            return
+        with scope.lock:
+            memo    = scope.memo.setdefault(self.name, {})
+            pending = scope.pending.setdefault(self.name, set())
+            pending.update(k for k in keys if k not in memo)
+
+    def seed(self, values: dict) -> None:
+        """이미 조회한 결과를 메모에 등록 (추가 왕복 없음)."""
+        scope = _current_batch_scope()
+        if scope is None:
+            return
+        with scope.lock:
+            scope.memo.setdefault(self.name, {}).update(values)
+
+    def load_many(self, keys: Iterable[Hashable]) -> dict:
+        keys  = list(dict.fromkeys(keys))
+        scope = _current_batch_scope()
+        if scope is None:
+            fetched = self._fetch(keys) or {}
+            return {k: fetched.get(k, self.default()) for k in keys}
+
+        with scope.lock:
+            memo    = scope.memo.setdefault(self.name, {})
+            pending = scope.pending.setdefault(self.name, set())
+            missing = [k for k in keys if k not in memo]
+            if missing:
+                batch = list(dict.fromkeys(missing + [k for k in pending if k not in memo]))
+                pending.clear()
+                fetched = self._fetch(batch)
+                if fetched is None:
+                    return {k: memo.get(k, self.default()) for k in keys}
+                for k in batch:
+                    memo[k] = fetched.get(k, self.default())
+            return {k: copy.deepcopy(memo[k]) for k in keys}
+
+    def load(self, key: Hashable) -> Any:
+        return self.load_many([key])[key]
+
+
+def invalidate_batch_cache(*names: str) -> None:
+    """쓰기 후 현재 요청 범위의 메모 무효화 (names 생략 시 전체)."""
+    scope = _current_batch_scope()
+    if scope is None:
+        return
+    with scope.lock:
+        for name in (names or list(scope.memo)):
+            scope.memo.pop(name, None)
+
+
+def _group_keys_by_agent(keys: list) -> dict:
+    """[(person_id, agent_id), ...] → {agent_id: [person_id, ...]}"""
+    groups: dict = {}
+    for pid, aid in keys:
+        groups.setdefault(aid or "", []).append(pid)
+    return groups
+
+
+_PAGE_SIZE = 1000   # PostgREST max-rows
+
+
+def _fetch_paged(query_fn: Callable[[], Any], page: int = _PAGE_SIZE) -> list:
+    """PostgREST max-rows 잘림 방지 — range() 페이지 조회 (query_fn 은 정렬 포함 쿼리 생성)."""
+    rows, offset = [], 0
+    while True:
+        chunk = query_fn().range(offset, offset + page - 1).execute().data or []
+        rows.extend(chunk)
+        if len(chunk) < page:
+            return rows
+        offset += page
+
+
+def _decode_json_fields(row: dict, fields: Iterable[str]) -> dict:
+    import json as _j
+    for json_field in fields:
+        if row.get(json_field) and isinstance(row[json_field], str):
+            try:
+                row[json_field] = _j.loads(row[json_field])
+            except Exception:
+                pass
+    return row
+
+
+def _batch_customers(keys: list) -> dict:
+    sb = _get_sb()
+    if not sb:
+        return {}
+    out: dict = {}
+    for aid, pids in _group_keys_by_agent(keys).items():
+        def _query(aid=aid, pids=pids):
+            q = sb.table("gk_people").select("*").in_("person_id", pids)
+            return (q.eq("agent_id", aid) if aid else q).order("person_id")
+        for r in _fetch_paged(_query):
+            out[(r.get("person_id"), aid)] = r
+    return out
+
+
+def _batch_policies_summary(keys: list) -> dict:
+    sb = _get_sb()
+    if not sb:
+        return {}
+    rows = _fetch_paged(lambda: (
+        sb.table("gk_policy_roles")
+        .select("person_id, role, policies:policy_id("
+                "product_name,insurance_company,"
+                "premium,contract_date,"
+                "policy_number,policy_id)")
+        .in_("person_id", list(keys))
+        .eq("is_deleted", False)
+        .order("person_id")
+        .order("policy_id")
+    ))
+    out: dict = {k: [] for k in keys}
+    for r in rows:
+        pid = r.pop("person_id", None)
+        if pid in out:
+            out[pid].append(r)
+    return out
+
+
+def _batch_relationships(keys: list) -> dict:
+    sb = _get_sb()
+    if not sb:
+        return {}
+    pids   = list(dict.fromkeys(pid for pid, _ in keys))
+    id_csv = ",".join(pids)
+    rows = _fetch_paged(lambda: (
+        sb.table("gk_relationships")
+        .select("from_person_id,to_person_id,relation_type,"
+                "from_person:from_person_id(name),"
+                "to_person:to_person_id(name)")
+        .eq("is_deleted", False)
+        .or_(f"from_person_id.in.({id_csv}),to_person_id.in.({id_csv})")
+        .order("from_person_id")
+        .order("to_person_id")
+    ))
+    by_pid: dict = {pid: [] for pid in pids}
+    for r in rows:
+        ends = {r.get("from_person_id"), r.get("to_person_id")}
+        view = {k: v for k, v in r.items() if k not in ("from_person_id", "to_person_id")}
+        for pid in ends:
+            if pid in by_pid:
+                by_pid[pid].append(dict(view))
+    out: dict = {}
+    for pid, aid in keys:
+        rels = by_pid.get(pid, [])
+        if aid:
+            rels = [r for r in rels if r.get("agent_id", aid) == aid]
+        out[(pid, aid)] = rels
+    return out
+
+
+def _latest_per_person(table: str, order_col: str, json_fields: tuple = (),
+                       view: str = "") -> Callable[[list], dict]:
+    """
+    테이블별 person_id 최신 1건 배치 조회 함수 생성.
+    1순위: view — (person_id, agent_id)별 최신 1행 뷰 (gk_latest_views.sql, DISTINCT ON)
+    폴백 : 원본 테이블 전체 이력 페이지 조회 후 Python 에서 최신 선택 (뷰 미배포 환경)
+    """
+    def _rows(sb, source: str, aid: str, pids: list) -> list:
+        def _query():
+            q = sb.table(source).select("*").in_("person_id", pids)
+            if aid:
+                q = q.eq("agent_id", aid)
+            return q.order(order_col, desc=True).order("person_id")
+        return _fetch_paged(_query)
+
+    def _batch(keys: list) -> dict:
+        sb = _get_sb()
+        if not sb:
+            return {}
+        out: dict = {}
+        for aid, pids in _group_keys_by_agent(keys).items():
+            rows = None
+            if view:
+                try:
+                    rows = _rows(sb, view, aid, pids)
+                except Exception:
+                    rows = None
+            if rows is None:
+                rows = _rows(sb, table, aid, pids)
+            # 정렬이 order_col 내림차순 → person_id 별 첫 행이 최신 (agent 미지정 시 설계사 간 최신)
+            for r in rows:
+                key = (r.get("person_id"), aid)
+                if key not in out:
+                    out[key] = _decode_json_fields(r, json_fields)
+        return out
+    return _batch
+
+
+_CUSTOMER_LOADER      = BatchLoader("customer", _batch_customers, lambda: None)
+_POLICIES_LOADER      = BatchLoader("policies_summary", _batch_policies_summary, list)
+_RELATIONSHIPS_LOADER = BatchLoader("relationships", _batch_relationships, list)
+_CRAWL_STATUS_LOADER  = BatchLoader(
+    "crawl_status", _latest_per_person("gk_crawl_status", "created_at", view="v_gk_crawl_status_latest"), dict)
+_TRINITY_LOADER       = BatchLoader(
+    "trinity_latest",
+    _latest_per_person("gk_trinity_analysis", "analyzed_at",
+                       ("analysis_data", "income_breakdown", "coverage_needs", "kb7_metadata"),
+                       view="v_gk_trinity_analysis_latest"),
+    dict)
+_KB_LOADER            = BatchLoader(
+    "kb_latest",
+    _latest_per_person("gk_kb_analysis", "analyzed_at",
+                       ("analysis_data", "category_scores", "gap_analysis", "kosis_weights", "raw_coverages"),
+                       view="v_gk_kb_analysis_latest"),
+    dict)
+
+
+def prime_customer_cards(person_ids: Iterable[str], agent_id: str = "") -> None:
+    """
+    [GP-BATCH] 고객 카드 목록 렌더링 전에 호출 — 이후 카드별 get_customer /
+    get_person_policies_summary / get_person_relationships / get_latest_trinity_analysis /
+    get_latest_kb_analysis / get_crawl_status 가 테이블당 in_() 1회로 합쳐진다.
+    """
+    pids = [p for p in dict.fromkeys(person_ids) if p]
+    if not pids:
+        return
+    agent_keys = [(p, agent_id or "") for p in pids]
+    _CUSTOMER_LOADER.prime(agent_keys)
+    _POLICIES_LOADER.prime(pids)
+    _RELATIONSHIPS_LOADER.prime(agent_keys)
+    _CRAWL_STATUS_LOADER.prime([(p, "") for p in pids])
+    _TRINITY_LOADER.prime(agent_keys)
+    _KB_LOADER.prime(agent_keys)
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # §1 고객 (gk_people)
 # ══════════════════════════════════════════════════════════════════════════════
@@ -88,10 +396,46 @@ def _matches_query(row: dict, clean_q: str, tokens: list[str]) -> bool:
         return clean_q.lower() in full_text_clean
 
 
-def load_customers(agent_id: str, query: str = "") -> list[dict]:
+def search_customers(
+    agent_id: str,
+    query: str = "",
+    limit: int = 50,
+    cursor: Optional[dict] = None,
+) -> dict:
     """
-    gk_people 조회 (담당 설계사 + [GP-SEARCH] 띄어쓰기 무시 + 복합키워드 AND 필터).
-    @st.cache_data(ttl=60) 적용 — 호출 측에서 wrapping 필요.
+    [GP-SEARCH] 서버측 고객 검색 + 키셋 페이지네이션 (RPC search_gk_people).
+    매칭 규칙은 _matches_query 와 동일 (띄어쓰기 무시 + 복합 키워드 AND).
+    gk_people_search_schema.sql 적용 필요.
+
+    Args:
+        cursor: 직전 페이지의 next_cursor (None이면 첫 페이지)
+
+    Returns:
+        {"items": [...], "total_count": int, "next_cursor": dict | None}
+        RPC 미적용/오류 시 {"items": [], "total_count": 0, "next_cursor": None, "error": "..."}
+    """
+    sb = _get_sb()
+    if not sb:
+        return {"items": [], "total_count": 0, "next_cursor": None, "error": "db_unavailable"}
+    try:
+        data = sb.rpc("search_gk_people", {
+            "p_agent_id": agent_id or None,
+            "p_query":    (query or "").strip(),
+            "p_limit":    limit,
+            "p_cursor":   cursor,
+        }).execute().data or {}
+        return {
+            "items":       data.get("items") or [],
+            "total_count": int(data.get("total_count") or 0),
+            "next_cursor": data.get("next_cursor"),
+        }
+    except Exception as e:
+        return {"items": [], "total_count": 0, "next_cursor": None, "error": str(e)}
+
+
+def _load_customers_legacy(agent_id: str, query: str = "", limit: Optional[int] = 200) -> list[dict]:
+    """
+    search_gk_people RPC 미적용 환경용 폴백.
 
     검색 전략:
       1. DB: agent_id 필터 + 단일 키워드면 name ilike 프리필터 (속도 최적화)
@@ -116,38 +460,69 @@ def load_customers(agent_id: str, query: str = "") -> list[dict]:
             # 복합 키워드('3월 자동차') or 공백포함 단일어: DB 필터 생략 → Python 전량 처리
 
         q = q.order("management_tier").order("name")
-        rows = (q.execute().data or [])[:500]  # Python 포스트필터용 여유분 확보
+        rows = q.execute().data or []
+        if limit is not None:
+            rows = rows[:max(500, limit)]  # Python 포스트필터용 여유분 확보
 
         if query and clean_q:
             rows = [r for r in rows if _matches_query(r, clean_q, tokens)]
 
-        return rows[:200]
+        return rows if limit is None else rows[:limit]
     except Exception:
         return []
 
 
+_CUSTOMER_PAGE_SIZE = 500
+
+
+def load_customers(agent_id: str, query: str = "", limit: Optional[int] = 200) -> list[dict]:
+    """
+    gk_people 조회 (담당 설계사 + [GP-SEARCH] 띄어쓰기 무시 + 복합키워드 AND 필터).
+    @st.cache_data(ttl=60) 적용 — 호출 측에서 wrapping 필요.
+
+    검색 전략:
+      1. search_gk_people RPC — 매칭·정렬·절단 모두 DB 에서 수행 (전체 고객 대상, 누락 없음)
+      2. RPC 미적용 시 _load_customers_legacy 폴백 (500건 선조회 + Python 필터)
+
+    Args:
+        limit: 최대 건수 — None 이면 next_cursor 를 끝까지 따라가 전체 반환 (CRM 고객 목록)
+    """
+    if limit is None:
+        rows, cursor, result = [], None, {}
+        while True:
+            result = search_customers(agent_id, query, limit=_CUSTOMER_PAGE_SIZE, cursor=cursor)
+            if "error" in result:
+                break
+            rows.extend(result["items"])
+            cursor = result["next_cursor"]
+            if not cursor or not result["items"]:
+                break
+        if "error" in result:
+            rows = _load_customers_legacy(agent_id, query, limit=None)
+    else:
+        result = search_customers(agent_id, query, limit=limit)
+        rows = result["items"] if "error" not in result else _load_customers_legacy(agent_id, query, limit)
+    # [GP-BATCH] 목록에서 받은 행으로 get_customer 메모 선등록 (카드별 재조회 없음)
+    _CUSTOMER_LOADER.seed({(r.get("person_id"), agent_id or ""): r for r in rows if r.get("person_id")})
+    return rows
+
+
 def get_customer(person_id: str, agent_id: str = "") -> Optional[dict]:
     """
     person_id 단건 조회.
     [GP-SEC] agent_id 제공 시 소유권 검증 — 타 설계사 고객 행 조회 차단.
     """
-    sb = _get_sb()
-    if not sb or not person_id:
-        return None
-    try:
-        q = sb.table("gk_people").select("*").eq("person_id", person_id)
-        if agent_id:
-            q = q.eq("agent_id", agent_id)
-        rows = q.execute().data or []
-        return rows[0] if rows else None
-    except Exception:
+    if not person_id or not _get_sb():
         return None
+    # [GP-BATCH] 같은 rerun 내 다른 카드 조회와 in_() 1회로 합침
+    return _CUSTOMER_LOADER.load((person_id, agent_id or ""))
 
 
 def save_customer(data: dict, agent_id: str) -> bool:
     """고객 upsert — shared_components.customer_input_form() 위임."""
     try:
         from shared_components import customer_input_form
+        invalidate_batch_cache("customer")
         customer_input_form(data, agent_id, _get_sb())
         return True
     except Exception:
@@ -163,6 +538,7 @@ def delete_customer(person_id: str, agent_id: str = "") -> bool:
     if not sb or not person_id:
         return False
     try:
+        invalidate_batch_cache("customer")
         q = sb.table("gk_people").update({
             "is_deleted": True,
             "updated_at": datetime.datetime.utcnow().isoformat(),
@@ -179,24 +555,33 @@ def delete_customer(person_id: str, agent_id: str = "") -> bool:
 # §2 일정 (gk_schedules)
 # ══════════════════════════════════════════════════════════════════════════════
 
-def load_schedules(agent_id: str, date: str) -> list[dict]:
-    """특정 날짜 일정 조회 (JOIN gk_people.name)."""
-    sb = _get_sb()
-    if not sb:
-        return []
+def _fetch_schedule_window(sb: Any, agent_id: str, start: str, end: str,
+                           select: str = "*, gk_people(name)",
+                           refine: Optional[Callable[[Any], Any]] = None) -> list[dict]:
+    """
+    [GP-RRULE] 기간 [start, end] 와 겹치는 일정 원본 행 — 단건 행 + 반복 마스터 행 (회차 전개 전).
+    반복 회차 전개는 calendar_engine._expand_rows. rrule 컬럼 마이그레이션 전 DB 는 단건 기간 조회로 폴백.
+    refine: 공통 필터 뒤에 붙일 추가 조건 (예: 메모 태그 ilike). 조회 실패 시 예외 전파.
+    """
+    def _q():
+        q = sb.table("gk_schedules").select(select).eq("is_deleted", False).eq("agent_id", agent_id)
+        return refine(q) if refine else q
+
+    def _ordered(q):
+        return q.order("date").order("start_time").order("schedule_id")
+
     try:
-        return (
-            sb.table("gk_schedules")
-            .select("*, gk_people(name)")
-            .eq("is_deleted", False)
-            .eq("agent_id", agent_id)
-            .eq("date", date)
-            .order("start_time")
-            .execute()
-            .data or []
-        )
+        return _fetch_paged(lambda: _ordered(_q().or_(
+            f"and(rrule.is.null,date.gte.{start},date.lte.{end}),"
+            f"and(rrule.not.is.null,date.lte.{end},"
+            f"or(rrule_until.is.null,rrule_until.gte.{start}))")))
     except Exception:
-        return []
+        return _fetch_paged(lambda: _ordered(_q().gte("date", start).lte("date", end)))
+
+
+def load_schedules(agent_id: str, date: str) -> list[dict]:
+    """특정 날짜 일정 조회 (JOIN gk_people.name, 반복 일정은 해당 날짜 회차 포함)."""
+    return load_schedules_range(agent_id, date, date)
 
 
 def load_schedules_today(agent_id: str) -> list[dict]:
@@ -205,23 +590,13 @@ def load_schedules_today(agent_id: str) -> list[dict]:
 
 
 def load_schedules_range(agent_id: str, start: str, end: str) -> list[dict]:
-    """날짜 범위 일정 조회 (캘린더 월간 뷰용)."""
+    """날짜 범위 일정 조회 (캘린더 월간 뷰용) — 반복 마스터는 범위 안의 회차로 전개."""
     sb = _get_sb()
     if not sb:
         return []
     try:
-        return (
-            sb.table("gk_schedules")
-            .select("*, gk_people(name)")
-            .eq("is_deleted", False)
-            .eq("agent_id", agent_id)
-            .gte("date", start)
-            .lte("date", end)
-            .order("date")
-            .order("start_time")
-            .execute()
-            .data or []
-        )
+        from calendar_engine import _expand_rows
+        return _expand_rows(_fetch_schedule_window(sb, agent_id, start, end), start, end)
     except Exception:
         return []
 
@@ -266,6 +641,142 @@ def save_schedule(
         return False
 
 
+# ── [GP-BULK] 일정 대량 upsert ────────────────────────────────────────────────
+# 사후관리·자동 부킹·ICS 가져오기처럼 여러 일정을 한꺼번에 만드는 경로는
+# 행마다 insert 하지 않고 청크당 다중 행 upsert 1회로 전송한다.
+#   - 키 구성이 같은 행끼리 묶어 전송 (PostgREST 다중 행은 누락 키를 NULL 로 덮어씀)
+#   - 청크 실패 시 fallback_columns 로 축소 재시도 → 그래도 실패하면 이분 분할로 실패 행만 격리
+#   - ignore_duplicates=True 면 이미 있는 schedule_id 는 건너뛰고 "exists" 충돌로 보고
+#   - keep_created_at=True 면 created_at 없는 행은 기존 행 값을 청크당 in_() 1회로 조회해 유지
+SCHEDULE_CHUNK_SIZE = 500
+
+
+def bulk_upsert_schedules(
+    payloads: Iterable[dict],
+    chunk_size: int = SCHEDULE_CHUNK_SIZE,
+    ignore_duplicates: bool = False,
+    fallback_columns: Optional[Iterable[str]] = None,
+    keep_created_at: bool = False,
+) -> dict:
+    """
+    gk_schedules 다중 행 upsert (청크당 요청 1회).
+
+    Args:
+        payloads: 일정 행 dict 목록 — schedule_id 없으면 uuid4 부여, created_at/updated_at 기본값 보충
+        chunk_size: 요청당 최대 행 수
+        ignore_duplicates: True 면 기존 행 유지 (가져오기 재실행 시 중복 방지)
+        fallback_columns: 확장 컬럼 미적용 DB 재시도용 최소 컬럼 목록
+        keep_created_at: created_at 없는 행이 이미 있으면 기존 created_at 유지 (재가져오기 시 생성일 보존)
+
+    Returns:
+        {"success": bool, "written": [schedule_id, ...], "rows": [전송한 행, ...],
+         "conflicts": [{"index": 입력 순번, "schedule_id": str, "reason": str}, ...],
+         "requests": int}
+    """
+    now = datetime.datetime.utcnow().isoformat()
+    rows: list[dict] = []
+    index_of: dict[str, int] = {}
+    conflicts: list[dict] = []
+    lookup: list[dict] = []   # keep_created_at: 기존 created_at 조회 대상
+    for i, p in enumerate(payloads):
+        row = dict(p)
+        row.setdefault("schedule_id", str(uuid.uuid4()))
+        row.setdefault("updated_at", now)
+        if keep_created_at and "created_at" not in row:
+            lookup.append(row)
+        row.setdefault("created_at", row["updated_at"])
+        sid = row["schedule_id"]
+        if sid in index_of:
+            # 같은 요청 안 중복 키 — PostgREST 는 청크 전체를 거부하므로 마지막 행만 유지
+            prev = index_of[sid]
+            conflicts.append({"index": prev, "schedule_id": sid, "reason": "duplicate_in_batch"})
+            rows[prev] = None
+        index_of[sid] = len(rows)
+        rows.append(row)
+    order = {id(r): i for i, r in enumerate(rows) if r is not None}
+    rows = [r for r in rows if r is not None]
+
+    sb = _get_sb()
+    if not sb or not rows:
+        return {"success": sb is not None and not conflicts, "written": [], "rows": rows,
+                "conflicts": conflicts, "requests": 0}
+
+    fallback = list(fallback_columns or [])
+    written: list[str] = []
+    requests = 0
+
+    size = max(1, int(chunk_size))
+    for i in range(0, len(lookup), size):
+        chunk = lookup[i:i + size]
+        requests += 1
+        try:
+            res = sb.table("gk_schedules").select("schedule_id, created_at") \
+                .in_("schedule_id", [r["schedule_id"] for r in chunk]).execute()
+        except Exception:
+            continue   # 조회 실패 시 새 created_at 으로 진행
+        existing = {r.get("schedule_id"): r.get("created_at") for r in (res.data or [])}
+        for r in chunk:
+            if existing.get(r["schedule_id"]):
+                r["created_at"] = existing[r["schedule_id"]]
+
+    def _send(chunk: list[dict]) -> list[str]:
+        nonlocal requests
+        requests += 1
+        res = sb.table("gk_schedules").upsert(
+            chunk, on_conflict="schedule_id", ignore_duplicates=ignore_duplicates,
+            returning="representation" if ignore_duplicates else "minimal",
+        ).execute()
+        if not ignore_duplicates:
+            return [r["schedule_id"] for r in chunk]
+        inserted = {r.get("schedule_id") for r in (res.data or [])}
+        for r in chunk:
+            if r["schedule_id"] not in inserted:
+                conflicts.append({"index": order[id(r)], "schedule_id": r["schedule_id"], "reason": "exists"})
+        return [r["schedule_id"] for r in chunk if r["schedule_id"] in inserted]
+
+    def _write(chunk: list[dict], allow_fallback: bool) -> None:
+        try:
+            written.extend(_send(chunk))
+            return
+        except Exception as e:
+            err = e
+        if allow_fallback and fallback:
+            slim = []
+            for r in chunk:
+                s = {k: r[k] for k in fallback if k in r}
+                s["schedule_id"] = r["schedule_id"]
+                order[id(s)] = order[id(r)]
+                slim.append(s)
+            _write(slim, allow_fallback=False)
+            return
+        if len(chunk) == 1:
+            r = chunk[0]
+            conflicts.append({"index": order[id(r)], "schedule_id": r["schedule_id"], "reason": str(err)[:200]})
+            return
+        mid = len(chunk) // 2
+        _write(chunk[:mid], allow_fallback)
+        _write(chunk[mid:], allow_fallback)
+
+    groups: dict[tuple, list[dict]] = {}
+    for r in rows:
+        groups.setdefault(tuple(sorted(r)), []).append(r)
+    for group in groups.values():
+        for i in range(0, len(group), size):
+            _write(group[i:i + size], allow_fallback=True)
+
+    conflicts.sort(key=lambda c: c["index"])
+    if conflicts:
+        import logging
+        logging.warning(f"[GP-BULK] gk_schedules upsert 충돌 {len(conflicts)}건 / {len(rows)}행 ({requests}회 요청)")
+    return {
+        "success":   not conflicts,
+        "written":   written,
+        "rows":      rows,
+        "conflicts": conflicts,
+        "requests":  requests,
+    }
+
+
 def generate_followup_schedules(
     person_id: str,
     agent_id: str,
@@ -306,8 +817,9 @@ def generate_followup_schedules(
         36, 48, 60,            # 장기 관리 (3~5년)
     ]
     
-    created_schedules = []
     now_iso = datetime.datetime.utcnow().isoformat()
+    payloads: list[dict] = []
+    planned: list[dict] = []
     
     for months in intervals:
         # 날짜 계산 (relativedelta 대신 월 단위 계산)
@@ -325,8 +837,7 @@ def generate_followup_schedules(
         
         memo = f"시스템 자동 생성 일정: 계약 후 {months}개월이 경과했습니다. 안부 인사 및 보장 유지 상태를 점검하세요."
         
-        # gk_schedules 테이블에 INSERT
-        schedule_payload = {
+        payloads.append({
             "schedule_id": str(uuid.uuid4()),
             "agent_id": agent_id,
             "person_id": person_id,
@@ -340,19 +851,17 @@ def generate_followup_schedules(
             "is_deleted": False,
             "created_at": now_iso,
             "updated_at": now_iso,
-        }
-        
-        try:
-            sb.table("gk_schedules").insert(schedule_payload).execute()
-            created_schedules.append({
-                "months": months,
-                "date": followup_date.isoformat(),
-                "title": title,
-            })
-        except Exception as e:
-            # 개별 일정 생성 실패 시 로그만 남기고 계속 진행
-            import logging
-            logging.warning(f"[STEP 12] {months}개월차 일정 생성 실패: {e}")
+        })
+        planned.append({
+            "months": months,
+            "date": followup_date.isoformat(),
+            "title": title,
+        })
+    
+    # gk_schedules 다중 행 upsert 1회 (실패 행만 제외)
+    report = bulk_upsert_schedules(payloads)
+    failed = {c["index"] for c in report["conflicts"]}
+    created_schedules = [p for i, p in enumerate(planned) if i not in failed]
     
     return {
         "success": len(created_schedules) > 0,
@@ -494,23 +1003,10 @@ def cancel_future_schedules(policy_id: str, agent_id: str = "") -> dict:
 # ══════════════════════════════════════════════════════════════════════════════
 
 def get_crawl_status(person_id: str) -> dict:
-    """내보험다보여 크롤링 상태 최신 1건 조회."""
-    sb = _get_sb()
-    if not sb or not person_id:
-        return {}
-    try:
-        rows = (
-            sb.table("gk_crawl_status")
-            .select("*")
-            .eq("person_id", person_id)
-            .order("created_at", desc=True)
-            .limit(1)
-            .execute()
-            .data or []
-        )
-        return rows[0] if rows else {}
-    except Exception:
+    """내보험다보여 크롤링 상태 최신 1건 조회 ([GP-BATCH] rerun 단위 배치)."""
+    if not person_id or not _get_sb():
         return {}
+    return _CRAWL_STATUS_LOADER.load((person_id, ""))
 
 
 def set_crawl_status(
@@ -537,6 +1033,7 @@ def set_crawl_status(
         if data:
             import json as _j
             payload["raw_json"] = _j.dumps(data, ensure_ascii=False)
+        invalidate_batch_cache("crawl_status")
         sb.table("gk_crawl_status").upsert(
             payload, on_conflict="person_id"
         ).execute()
@@ -705,6 +1202,7 @@ def safe_update_customer(
         payload["agent_id"] = agent_id
 
     try:
+        invalidate_batch_cache("customer")
         q = sb.table("gk_people").update(payload).eq("person_id", person_id)
         if agent_id:
             q = q.eq("agent_id", agent_id)
@@ -752,6 +1250,7 @@ def get_or_create_customer(
                 "created_at": now,
                 "updated_at": now,
             }
+            invalidate_batch_cache("customer")
             sb.table("gk_people").insert(base).execute()
             cust = base
 
@@ -780,13 +1279,11 @@ def log_consulting(
     ai_briefing_json: Optional[dict] = None,
 ) -> bool:
     """
-    상담일지 기록.
+    상담일지 기록 (write-behind 큐 적재 후 즉시 반환 — 실제 insert 는 백그라운드 배치).
+    반환: 큐 적재 시 True, 큐 포화·종료로 스필 파일에 우회 기록했거나 실패 시 False.
     log_type: 'ai_brief' | 'kakao_sent' | 'nibo' | 'manual' | 'schedule'
     ai_briefing_json: AI 분석 결과 원본 JSONB 저장 (consulting_logs.ai_briefing_json)
     """
-    sb = _get_sb()
-    if not sb:
-        return False
     try:
         import json as _j
         import uuid as _uuid
@@ -803,8 +1300,9 @@ def log_consulting(
             payload["ai_briefing_json"] = _j.dumps(
                 ai_briefing_json, ensure_ascii=False
             )
-        sb.table("gk_consulting_logs").insert(payload).execute()
-        return True
+        # [GP-WB] write-behind — 요청 경로에서 DB 왕복 제거 (배치 기록·재시도·스필)
+        from write_behind import enqueue_row
+        return enqueue_row("gk_consulting_logs", payload)
     except Exception:
         return False
 
@@ -850,7 +1348,7 @@ def schedule_gcs_customer_profile_async(
 ) -> None:
     """
     [Dual Write · Body1] Supabase 저장 직후 GCS로 동일 스냅샷 백업(암호화).
-    네트워크 지연으로 Streamlit이 멈추지 않도록 백그라운드 스레드에서만 업로드.
+    네트워크 지연으로 Streamlit이 멈추지 않도록 백그라운드 워커 풀에서만 업로드.
     """
     if not person_id or not profile_data:
         return
@@ -862,7 +1360,9 @@ def schedule_gcs_customer_profile_async(
         except Exception:
             pass
 
-    threading.Thread(target=_run, name="gcs-profile-backup", daemon=True).start()
+    # [GP-WB] 고정 워커 풀 — 같은 고객의 대기 중 백업은 최신 스냅샷으로 교체
+    from write_behind import submit_background
+    submit_background(("gcs-profile-backup", person_id), _run)
 
 
 def upload_ai_brief_snapshot_gcs(agent_id: str, brief_text: str) -> bool:
@@ -905,7 +1405,8 @@ def schedule_ai_brief_gcs_async(agent_id: str, brief_text: str) -> None:
         except Exception:
             pass
 
-    threading.Thread(target=_run, name="gcs-ai-brief-backup", daemon=True).start()
+    from write_behind import submit_background
+    submit_background(("gcs-ai-brief-backup", agent_id), _run)
 
 
 def _get_fernet():
@@ -1072,6 +1573,7 @@ def save_customer_profile_with_gcs(
                 "updated_at":   _dt.datetime.utcnow().isoformat(),
             }
             _row = {k: v for k, v in _row.items() if v is not None}
+            invalidate_batch_cache("customer")
             sb.table("gk_people").update(_row).eq("person_id", person_id).execute()
             _db_ok = True
         except Exception:
@@ -1726,46 +2228,18 @@ def get_crawl_status_list(agent_id: str, limit: int = 5) -> list[dict]:
 def get_person_policies_summary(person_id: str) -> list[dict]:
     """
     gk_policy_roles JOIN gk_policies — 고객의 증권 목록 요약.
-    (crm_fortress.get_person_policies의 경량 버전)
+    (crm_fortress.get_person_policies의 경량 버전, [GP-BATCH] rerun 단위 배치)
     """
-    sb = _get_sb()
-    if not sb or not person_id:
-        return []
-    try:
-        return (
-            sb.table("gk_policy_roles")
-            .select("role, policies:policy_id("
-                    "product_name,insurance_company,"
-                    "premium,contract_date,"
-                    "policy_number,policy_id)")
-            .eq("person_id", person_id)
-            .eq("is_deleted", False)
-            .execute().data or []
-        )
-    except Exception:
+    if not person_id or not _get_sb():
         return []
+    return _POLICIES_LOADER.load(person_id)
 
 
 def get_person_relationships(person_id: str, agent_id: str = "") -> list[dict]:
-    """고객의 인맥 관계망 조회 (gk_relationships)."""
-    sb = _get_sb()
-    if not sb or not person_id:
-        return []
-    try:
-        rows = (
-            sb.table("gk_relationships")
-            .select("relation_type,"
-                    "from_person:from_person_id(name),"
-                    "to_person:to_person_id(name)")
-            .eq("is_deleted", False)
-            .or_(f"from_person_id.eq.{person_id},to_person_id.eq.{person_id}")
-            .execute().data or []
-        )
-        if agent_id:
-            rows = [r for r in rows if r.get("agent_id", agent_id) == agent_id]
-        return rows
-    except Exception:
+    """고객의 인맥 관계망 조회 (gk_relationships, [GP-BATCH] rerun 단위 배치)."""
+    if not person_id or not _get_sb():
         return []
+    return _RELATIONSHIPS_LOADER.load((person_id, agent_id or ""))
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -1856,34 +2330,45 @@ def log_device(
     ua_hint: str = "",
     max_devices: int = 5,
 ) -> bool:
-    """디바이스 인증 기록 + 최대 N개 초과 시 가장 오래된 항목 삭제."""
-    sb = _get_sb()
-    if not sb:
-        return False
+    """
+    디바이스 인증 기록 + 최대 N개 초과 시 가장 오래된 항목 삭제.
+    [GP-WB] upsert 는 write-behind 큐, 초과분 정리는 백그라운드 워커 — 로그인 경로 무대기.
+    """
     now_str = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     try:
-        sb.table("gk_device_history").upsert({
+        from write_behind import enqueue_row, submit_background
+        enqueue_row("gk_device_history", {
             "user_name": user_name,
             "fp_id":     fp_id,
             "ua_hint":   ua_hint,
             "last_seen": now_str,
-        }, on_conflict="user_name,fp_id").execute()
-        _rows = (
-            sb.table("gk_device_history")
-            .select("fp_id,last_seen")
-            .eq("user_name", user_name)
-            .order("last_seen", desc=False)
-            .execute().data or []
-        )
-        if len(_rows) > max_devices:
-            oldest_fp = _rows[0]["fp_id"]
-            sb.table("gk_device_history").delete()\
-              .eq("user_name", user_name).eq("fp_id", oldest_fp).execute()
+        }, on_conflict="user_name,fp_id")
+        submit_background(("device-prune", user_name),
+                          lambda: _prune_devices(user_name, max_devices))
         return True
     except Exception:
         return False
 
 
+def _prune_devices(user_name: str, max_devices: int) -> None:
+    """최대 N개 초과 디바이스 중 가장 오래된 항목부터 삭제 (큐 flush 후 실행)."""
+    from write_behind import get_write_behind_queue
+    get_write_behind_queue().flush()
+    sb = _get_sb()
+    if not sb:
+        return
+    _rows = (
+        sb.table("gk_device_history")
+        .select("fp_id,last_seen")
+        .eq("user_name", user_name)
+        .order("last_seen", desc=False)
+        .execute().data or []
+    )
+    for _row in _rows[:max(0, len(_rows) - max_devices)]:
+        sb.table("gk_device_history").delete()\
+          .eq("user_name", user_name).eq("fp_id", _row["fp_id"]).execute()
+
+
 def get_devices(user_name: str) -> list[dict]:
     """등록된 디바이스 목록 조회."""
     sb = _get_sb()
@@ -2068,6 +2553,7 @@ def merge_customer_fields(
         if device_id:
             merged["last_device_id"] = device_id
 
+        invalidate_batch_cache("customer")
         (
             sb.table("gk_people")
             .update(merged)
@@ -2639,6 +3125,7 @@ def restore_from_backup(backup_id: str) -> bool:
         
         restore_data = {k: v for k, v in restore_data.items() if v is not None}
         
+        invalidate_batch_cache("customer")
         sb.table("gk_people").update(restore_data).eq("person_id", person_id).execute()
         return True
     except Exception:
@@ -2704,6 +3191,7 @@ def save_trinity_analysis(
             "updated_at": now,
         }
         
+        invalidate_batch_cache("trinity_latest")
         result = sb.table("gk_trinity_analysis").insert(payload).execute()
         if result.data and len(result.data) > 0:
             return result.data[0].get("analysis_id", "")
@@ -2758,6 +3246,9 @@ def get_latest_trinity_analysis(person_id: str, agent_id: str = "") -> dict:
     Returns:
         최신 분석 결과 1건 (없으면 빈 dict)
     """
+    if person_id and _get_sb():
+        # [GP-BATCH] 같은 rerun 내 다른 고객 조회와 in_() 1회로 합침
+        return _TRINITY_LOADER.load((person_id, agent_id or ""))
     history = get_trinity_analysis_history(person_id=person_id, agent_id=agent_id, limit=1)
     return history[0] if history else {}
 
@@ -2817,6 +3308,7 @@ def save_kb_analysis(
             "updated_at": now,
         }
         
+        invalidate_batch_cache("kb_latest")
         result = sb.table("gk_kb_analysis").insert(payload).execute()
         if result.data and len(result.data) > 0:
             return result.data[0].get("analysis_id", "")
@@ -2871,6 +3363,9 @@ def get_latest_kb_analysis(person_id: str, agent_id: str = "") -> dict:
     Returns:
         최신 분석 결과 1건 (없으면 빈 dict)
     """
+    if person_id and _get_sb():
+        # [GP-BATCH] 같은 rerun 내 다른 고객 조회와 in_() 1회로 합침
+        return _KB_LOADER.load((person_id, agent_id or ""))
     history = get_kb_analysis_history(person_id=person_id, agent_id=agent_id, limit=1)
     return history[0] if history else {}
 
@@ -3287,6 +3782,16 @@ def get_expiry_alerts(
     sb = _get_sb()
     if not sb or not agent_id:
         return []
+
+    # [GP-NBA] 야간 사전 계산 테이블 우선 (gk_agent_actions 1행 — 변경 시 증분 재계산)
+    try:
+        from nba_precompute import load_agent_actions, filter_expiry_alerts
+        _rec = load_agent_actions(agent_id)
+        if _rec is not None:
+            return filter_expiry_alerts(_rec.get("expiry_alerts") or [], days_range, priority_only)
+    except Exception as e:
+        import logging
+        logging.warning(f"[GP-NBA] 사전 계산 만기 알림 로드 실패 → 실시간 뷰 조회: {e}")
     
     try:
         # v_expiry_alerts 뷰 조회
@@ -10,7 +10,8 @@ import tempfile
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import google.generativeai as genai
-from supabase import create_client, Client
+from supabase import Client
+from supabase_pool import get_supabase_client
 
 
 class AccidentAnalyzer:
@@ -40,7 +41,7 @@ class AccidentAnalyzer:
         self.gemini_model = genai.GenerativeModel('gemini-1.5-pro')
         
         # Supabase 초기화 (RAG 검색용)
-        self.supabase: Client = create_client(supabase_url, supabase_key)
+        self.supabase: Client = get_supabase_client(supabase_url, supabase_key)
     
     def analyze_dashcam_video(
         self,
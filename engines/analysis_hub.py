@@ -22,7 +22,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Optional, Any
 
-from engines.kb_scoring_system import run_kb_analysis, KBReport
+from engines.kb_scoring_system import run_kb_analysis, KBScoreReport as KBReport
 from engines.trinity_value_engine import run_trinity_analysis, TrinityReport, _w
 from engines.surgery_classifier import (
     classify_surgery_coverages_bulk,
@@ -173,7 +173,7 @@ class AnalysisHub:
         # ── KB 엔진 실행 ────────────────────────────────────────────────
         try:
             kb_rpt = run_kb_analysis(
-                coverages = self.coverages,
+                raw_items = self.coverages,
                 age       = self.age,
                 gender    = self.gender,
             )
@@ -18,8 +18,16 @@ KB손해보험 전문 증권분석 엔진 — 제2장: 8K급 초정밀 담보 
   사망: 사망(1.0) / 재해사망(0.8)
 """
 import re
+from bisect import bisect_right
+from functools import lru_cache
 from typing import Optional
 
+try:
+    from hq_backend.services.term_automaton import TermAutomaton
+    AUTOMATON_AVAILABLE = True
+except ImportError:
+    AUTOMATON_AVAILABLE = False
+
 # ─────────────────────────────────────────────────────────────────────────────
 # §1  카테고리 상수
 # ─────────────────────────────────────────────────────────────────────────────
@@ -342,33 +350,103 @@ _EXACT_DICT: dict[str, tuple[str, float, str]] = {
     for row in KB_EXACT_MAP
 }
 
+_NORM_RE = re.compile(r"[\s\-_\(\)（）\[\]「」]")
+_KEY_SEP = "\x00"          # 포함 검색용 키 연결 구분자 (담보명에 나오지 않는 문자)
+_MAP_MEMO_SIZE = 8192       # 담보명 → 매핑 결과 LRU 메모 크기
+
+
+class CoverageMappingIndex:
+    """
+    import 시 1회 컴파일하는 담보명 매핑 인덱스 — map_coverage 와 결과 동일.
+
+    - 정규화 키 해시맵: 공백·특수문자 제거 키 → 값 (같은 정규화 키는 사전 순서상 첫 항목)
+    - 포함 검색: "키 ⊂ 담보명" 은 Aho–Corasick 오토마톤 1회 스캔,
+      "담보명 ⊂ 키" 는 전체 키를 구분자로 이어 붙인 문자열에서 str.find 1회
+      → 두 후보 중 사전 순서가 앞선 키 (기존 순차 탐색의 첫 일치와 동일)
+    - 패턴 검색: 패턴마다 lookahead 로 감싼 단일 정규식 — 앞선 패턴부터 시도하므로
+      "목록 순서상 처음 일치하는 패턴" 이 그대로 유지됨
+    """
+
+    def __init__(self, exact: dict, patterns: list):
+        self._exact = exact
+        index: dict[str, tuple[str, float, str]] = {}
+        for raw_key, val in exact.items():
+            index.setdefault(_NORM_RE.sub("", raw_key), val)
+        self._norm = index
+        self._keys = list(index)
+        self._vals = list(index.values())
+        self._joined = _KEY_SEP.join(self._keys)
+        self._starts: list[int] = []
+        offset = 0
+        for k in self._keys:
+            self._starts.append(offset)
+            offset += len(k) + len(_KEY_SEP)
+        self._automaton = TermAutomaton(self._keys) if AUTOMATON_AVAILABLE else None
+        self._empty_key = self._keys.index("") if "" in index else None   # 빈 키는 항상 포함
+
+        self._pattern_vals = [(cat, weight, display) for _, cat, weight, display in patterns]
+        self._pattern_re = re.compile(
+            "|".join(rf"(?=[\s\S]*?(?P<p{i}>{pat}))" for i, (pat, _, _, _) in enumerate(patterns)),
+            re.IGNORECASE,
+        ) if patterns else None
+
+    def _contained(self, clean: str) -> Optional[int]:
+        """clean 을 포함하거나 clean 에 포함되는 첫 키 번호"""
+        best = None
+        if _KEY_SEP not in clean:
+            pos = self._joined.find(clean)
+            if pos >= 0:
+                best = bisect_right(self._starts, pos) - 1
+        else:
+            best = next((i for i, k in enumerate(self._keys) if clean in k), None)
+        if self._automaton is not None:
+            hits = self._automaton.find(clean)
+            if self._empty_key is not None:
+                hits.append(self._empty_key)
+            if hits:
+                first = min(hits)
+                best = first if best is None else min(best, first)
+        else:
+            first = next((i for i, k in enumerate(self._keys) if k in clean), None)
+            if first is not None:
+                best = first if best is None else min(best, first)
+        return best
+
+    def lookup(self, name: str) -> tuple[str, float, str]:
+        # 우선순위를 바꾸면 coverage_taxonomy_resolver._CACHE_FORMAT 을 올릴 것 (영구 캐시 폐기)
+        # 1순위: 완전 일치
+        key = name.strip()
+        if key in self._exact:
+            return self._exact[key]
+
+        # 2순위: 공백·특수문자 제거 후 일치 → 부분 포함
+        clean = _NORM_RE.sub("", name)
+        if clean in self._norm:
+            return self._norm[clean]
+        i = self._contained(clean)
+        if i is not None:
+            return self._vals[i]
+
+        # 3순위: regex 패턴
+        if self._pattern_re is not None:
+            m = self._pattern_re.match(name)
+            if m:
+                return self._pattern_vals[int(m.lastgroup[1:])]
+
+        return (CAT_OTHER, 0.30, name)
+
+
+_MAPPING_INDEX = CoverageMappingIndex(_EXACT_DICT, KB_REGEX_PATTERNS)
+
+
+@lru_cache(maxsize=_MAP_MEMO_SIZE)
 def map_coverage(name: str) -> tuple[str, float, str]:
     """
     특약명 → (카테고리, scope_weight, 표시명) 반환.
     1순위: 완전 일치, 2순위: 공백 제거 포함 일치, 3순위: regex 패턴.
+    사전·패턴은 _MAPPING_INDEX 로 사전 컴파일, 반복 특약명은 LRU 메모.
     """
-    # 1순위: 완전 일치
-    key = name.strip()
-    if key in _EXACT_DICT:
-        return _EXACT_DICT[key]
-
-    # 2순위: 공백·특수문자 제거 후 포함 검색
-    clean = re.sub(r"[\s\-_\(\)（）\[\]「」]", "", name)
-    for raw_key, val in _EXACT_DICT.items():
-        if re.sub(r"[\s\-_\(\)（）\[\]「」]", "", raw_key) == clean:
-            return val
-    # 부분 포함
-    for raw_key, val in _EXACT_DICT.items():
-        stripped = re.sub(r"[\s\-_\(\)（）\[\]「」]", "", raw_key)
-        if stripped in clean or clean in stripped:
-            return val
-
-    # 3순위: regex 패턴
-    for pattern, cat, weight, display in KB_REGEX_PATTERNS:
-        if re.search(pattern, name, re.IGNORECASE):
-            return (cat, weight, display)
-
-    return (CAT_OTHER, 0.30, name)
+    return _MAPPING_INDEX.lookup(name)
 
 
 def map_coverages_bulk(items: list[dict]) -> list[dict]:
@@ -378,8 +456,14 @@ def map_coverages_bulk(items: list[dict]) -> list[dict]:
                "display": str, "amount": float}, ...]
     """
     result = []
-    for item in items:
-        cat, weight, display = map_coverage(item.get("name", ""))
+    resolver = _taxonomy_resolver()
+    resolved = resolver.resolve_many([item.get("name", "") for item in items]) if resolver else None
+    for i, item in enumerate(items):
+        if resolved is not None:
+            taxonomy = resolved[i]
+            cat, weight, display = taxonomy.kb_category, taxonomy.kb_weight, taxonomy.kb_display
+        else:
+            cat, weight, display = map_coverage(item.get("name", ""))
         result.append({
             "name":        item.get("name", ""),
             "category":    cat,
@@ -388,3 +472,12 @@ def map_coverages_bulk(items: list[dict]) -> list[dict]:
             "amount":      float(item.get("amount", 0) or 0),
         })
     return result
+
+
+def _taxonomy_resolver():
+    """통합 담보 분류 리졸버 (16대·수술비 분류와 결과·영구 캐시 공유, hq_backend 미존재 시 None)"""
+    try:
+        from hq_backend.services.coverage_taxonomy_resolver import get_taxonomy_resolver
+    except ImportError:
+        return None
+    return get_taxonomy_resolver()
@@ -8,6 +8,7 @@ Gap 공식:     Gap = KB_Benchmark - Score
 ────────────────────────────────────────────────────────────────────────────
 """
 from __future__ import annotations
+import re
 from dataclasses import dataclass, field
 from typing import Optional
 from engines.kb_policy_mapper import (
@@ -281,6 +282,24 @@ def calculate_kb_score(
     )
 
 
+def parse_amount_man(v) -> float:
+    """가입금액(숫자·"3,000만"·"1억" 등) → 만원 단위. 100만 이상 숫자는 원 단위로 간주."""
+    if v is None:
+        return 0.0
+    s = str(v).replace(",", "").replace(" ", "")
+    m = re.search(r"(\d+(?:\.\d+)?)\s*(억|만|천)?", s)
+    if not m:
+        return 0.0
+    num = float(m.group(1))
+    unit = m.group(2) or ""
+    if unit == "억":   return num * 10000
+    elif unit == "만": return num
+    elif unit == "천": return num / 10
+    else:
+        if num >= 1_000_000: return num / 10000  # 원 단위
+        return num
+
+
 def run_kb_analysis(
     raw_items: list[dict],
     age: Optional[int] = None,
@@ -291,22 +310,6 @@ def run_kb_analysis(
     raw_items: [{"name": str, "amount": float/str}, ...]
     """
     # 금액 정규화
-    import re as _re
-    def _parse_amount(v) -> float:
-        if v is None:
-            return 0.0
-        s = str(v).replace(",", "").replace(" ", "")
-        m = _re.search(r"(\d+(?:\.\d+)?)\s*(억|만|천)?", s)
-        if not m:
-            return 0.0
-        num = float(m.group(1))
-        unit = m.group(2) or ""
-        if unit == "억":   return num * 10000
-        elif unit == "만": return num
-        elif unit == "천": return num / 10
-        else:
-            if num >= 1_000_000: return num / 10000  # 원 단위
-            return num
-    normalized = [{"name": it.get("name",""), "amount": _parse_amount(it.get("amount",0))} for it in raw_items]
+    normalized = [{"name": it.get("name",""), "amount": parse_amount_man(it.get("amount",0))} for it in raw_items]
     mapped = map_coverages_bulk(normalized)
     return calculate_kb_score(mapped, age=age, gender=gender)
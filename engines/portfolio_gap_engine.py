@@ -0,0 +1,414 @@
+# -*- coding: utf-8 -*-
+"""
+engines/portfolio_gap_engine.py
+────────────────────────────────────────────────────────────────────────────
+📊 설계사 고객 전체(Book of Business) 일괄 갭 분석 — AnalysisHub 배치 모드
+  고객 1명씩 AnalysisHub.run() 을 돌리는 대신, 설계사 전체 고객의 담보를
+  열 단위 NumPy/pandas 배열로 적재해 KB 카테고리 스코어 · 트리니티 골든타임 자금 ·
+  통합 Gap 을 모든 고객에 대해 1회 벡터 연산으로 산출
+  ("내 고객 2,000명 중 암 공백이 가장 큰 고객" 같은 포트폴리오 조회용)
+
+데이터 흐름:
+  gk_people + gk_policy_roles(피보험자) + gk_policy_coverages + gk_trinity_analysis(최신 건보료)
+      ↓ fetch_portfolio()
+  customers / coverages DataFrame
+      ↓ score_portfolio()   ← AnalysisHub.run() 과 동일 공식 (수술비 분류·클로징 멘트 제외)
+  고객별 결과 + 설계사 내 암 공백 순위(gap_rank)
+      ↓ save_portfolio_gaps()
+  gk_portfolio_gaps (portfolio_gap_schema.sql)
+      ↓ load_portfolio_gaps() / render_portfolio_gap_widget()
+  HQ 홈 대시보드 "보장 공백 순위" (야간 배치: run_portfolio_gaps.py)
+────────────────────────────────────────────────────────────────────────────
+"""
+from __future__ import annotations
+
+import time
+import logging
+import datetime
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from engines.kb_policy_mapper import map_coverages_bulk
+from engines.kb_scoring_system import KB_BENCHMARKS, _CAT_BENCHMARK_MAP, parse_amount_man
+from engines.trinity_value_engine import (
+    TOTAL_HEALTH_RATE_2026, AVERAGE_TOTAL_DEDUCTION_RATE, LTC_RATE_ON_NHIS,
+    MONTHLY_INCOME_MAX, MONTHLY_INCOME_MIN, GOLDEN_TIME_MONTHS, _LOCAL_APPROX_TABLE,
+)
+
+logger = logging.getLogger(__name__)
+
+TABLE = "gk_portfolio_gaps"
+
+# KB 표시 카테고리 순서 (열 번호 = _CAT_BENCHMARK_MAP 순서)
+_BENCH_FIELDS = [bench_field for _, bench_field, _ in _CAT_BENCHMARK_MAP]
+_CATEGORY_COLUMN = {cat: j for j, (_, _, cats) in enumerate(_CAT_BENCHMARK_MAP) for cat in cats}
+_CANCER_COLUMNS = np.array(["암" in display for display, _, _ in _CAT_BENCHMARK_MAP])
+
+# AnalysisHub 기본값 (나이·성별 미상 고객도 화면 분석과 같은 기준으로 채점)
+_DEFAULT_AGE = 40
+_DEFAULT_GENDER = "남"
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# §1  열 단위 변환
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _col(df: pd.DataFrame, name: str, default) -> pd.Series:
+    return df[name] if name in df else pd.Series(default, index=df.index, dtype=object)
+
+
+def _amounts_man(values: pd.Series) -> np.ndarray:
+    """
+    자유 입력 가입금액 열 → 만원 (parse_amount_man 과 동일 — 100만 미만 숫자는 만원으로 간주).
+    숫자는 벡터 변환, 문자열만 개별 파싱. 단위가 확정된 DB 금액은 amount_man 열로 전달할 것.
+    """
+    numeric = pd.to_numeric(values, errors="coerce").to_numpy(dtype=float)
+    fast = np.isfinite(numeric) & (numeric >= 0) & (numeric < 1e15)
+    out = np.where(numeric >= 1_000_000, numeric / 10000, numeric)
+    if not fast.all():
+        slow = ~fast
+        out[slow] = [parse_amount_man(v) for v in values.to_numpy()[slow]]
+    return out
+
+
+def _premiums(customers: pd.DataFrame) -> np.ndarray:
+    return pd.to_numeric(_col(customers, "nhis_premium", 0), errors="coerce").fillna(0).to_numpy(dtype=float)
+
+
+def _ages(customers: pd.DataFrame, today: datetime.date) -> np.ndarray:
+    """age 열 우선, 없으면 birth_date(YYYYMMDD) 만 나이 — 미상은 AnalysisHub 기본 40세."""
+    if "age" in customers:
+        age = pd.to_numeric(customers["age"], errors="coerce")
+    else:
+        birth = pd.to_datetime(_col(customers, "birth_date", None).astype("string").str.replace("-", "").str[:8],
+                               format="%Y%m%d", errors="coerce")
+        before_birthday = (birth.dt.month > today.month) | (
+            (birth.dt.month == today.month) & (birth.dt.day > today.day))
+        age = today.year - birth.dt.year - before_birthday.astype("float")
+    age = age.fillna(0).astype(int).to_numpy()
+    return np.where(age == 0, _DEFAULT_AGE, age)
+
+
+def _benchmark_matrix(ages: np.ndarray, genders: pd.Series) -> np.ndarray:
+    """get_benchmark() 벡터판 — 고객 × KB 표시 카테고리 권장액 (만원)."""
+    keys = list(KB_BENCHMARKS)
+    table = np.array([[getattr(KB_BENCHMARKS[k], f, 0) or 0 for f in _BENCH_FIELDS] for k in keys], dtype=float)
+    male = genders.fillna(_DEFAULT_GENDER).astype(str).str.upper().isin(["M", "남", "남성", "MALE"]).to_numpy()
+    decade = np.clip((ages // 10) * 10, 30, 60)
+    bench_key = pd.Series(decade.astype(str)) + np.where(male, "M", "F")
+    index = bench_key.map({k: i for i, k in enumerate(keys)}).fillna(keys.index("DEF")).astype(int)
+    return table[index.to_numpy()]
+
+
+def _golden_time_fund(customers: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    """TrinityValueEngine._reverse_calculate_income() 벡터판 → (추정 월소득 만원, 골든타임 자금 만원)."""
+    premium = _premiums(customers)
+    ltc = _col(customers, "ltc_included", False).astype("boolean").fillna(False).to_numpy(dtype=bool)
+    premium = np.where(ltc & (premium > 0), premium / (1 + LTC_RATE_ON_NHIS), premium)
+
+    employment = _col(customers, "employment_type", "직장").fillna("직장")
+    workplace = (employment == "직장").to_numpy()
+
+    gross = np.where(premium > 0, np.round(premium * 2 / TOTAL_HEALTH_RATE_2026), 0.0)
+    gross = np.clip(gross, MONTHLY_INCOME_MIN, MONTHLY_INCOME_MAX)
+    points = np.array([p for p, _ in _LOCAL_APPROX_TABLE], dtype=float)
+    incomes = np.array([i for _, i in _LOCAL_APPROX_TABLE], dtype=float)
+    local = np.round(np.interp(premium, points, incomes), 1)
+
+    monthly = np.where(workplace, gross / 10_000, local)
+    golden = np.round(monthly * (1 - AVERAGE_TOTAL_DEDUCTION_RATE) * GOLDEN_TIME_MONTHS, 1)
+    return monthly, golden
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# §2  일괄 채점
+# ─────────────────────────────────────────────────────────────────────────────
+
+def score_portfolio(
+    customers: pd.DataFrame,
+    coverages: pd.DataFrame,
+    today: Optional[datetime.date] = None,
+) -> pd.DataFrame:
+    """
+    고객 전체 KB·트리니티·통합 Gap 1회 벡터 산출.
+
+    Args:
+        customers: person_id, (agent_id, name, age 또는 birth_date, gender,
+                   nhis_premium, employment_type, ltc_included)
+        coverages: person_id, name + 금액 열 — 피보험자(person_id) 기준 담보 행
+                   amount_man: 만원 단위 확정 금액 (DB 원 단위 ÷ 10,000 — fetch_portfolio)
+                   amount    : 자유 입력 금액 (원·만원·"3,000만" 혼용, amount_man 없을 때만 추정 변환)
+
+    Returns:
+        고객 1행 DataFrame — AnalysisHub.run() 의 kb(total_score, overall_pct, grade)·
+        gap(UnifiedGapResult) 필드 + 카테고리별 score_*/gap_* 열 + 설계사 내 gap_rank
+        (건보료 입력 고객 우선, 암 공백 income_gap 내림차순)
+    """
+    today = today or datetime.date.today()
+    cust = customers.copy()
+    for col in ("agent_id", "name"):
+        if col not in cust:
+            cust[col] = ""
+    cust["agent_id"] = cust["agent_id"].fillna("")
+    cust = cust.drop_duplicates("person_id").reset_index(drop=True)   # gk_people PK
+    n, k = len(cust), len(_BENCH_FIELDS)
+
+    # ── 담보 → (고객 행, 카테고리 열, 가중 금액) ─────────────────────────────
+    cov = coverages.copy()
+    cov["name"] = cov["name"].fillna("").astype(str)
+    names = pd.unique(cov["name"])
+    mapped = map_coverages_bulk([{"name": name} for name in names])
+    column = pd.Series([_CATEGORY_COLUMN.get(m["category"], -1) for m in mapped], index=names, dtype=int)
+    weight = pd.Series([m["scope_weight"] for m in mapped], index=names, dtype=float)
+
+    rows = pd.Index(cust["person_id"]).get_indexer(cov["person_id"])
+    cols = column.reindex(cov["name"]).to_numpy()
+    if "amount_man" in cov:
+        amount = pd.to_numeric(cov["amount_man"], errors="coerce").fillna(0).to_numpy(dtype=float)
+    else:
+        amount = _amounts_man(cov["amount"])
+    valid = (rows >= 0) & (cols >= 0)
+    flat = rows[valid] * k + cols[valid]
+    weighted = np.bincount(flat, weights=amount[valid] * weight.reindex(cov["name"]).to_numpy()[valid],
+                           minlength=n * k).reshape(n, k)
+    total_amount = np.bincount(flat, weights=amount[valid], minlength=n * k).reshape(n, k)
+
+    # ── KB 스코어 (calculate_kb_score) ──────────────────────────────────────
+    ages = _ages(cust, today)
+    bench = _benchmark_matrix(ages, _col(cust, "gender", None))
+    total_ws = weighted.sum(axis=1)
+    total_bm = bench.sum(axis=1)
+    pct = np.divide(total_ws * 100, total_bm, out=np.zeros(n), where=total_bm > 0)
+    grade = np.select([pct >= 90, pct >= 75, pct >= 55, pct >= 35], ["S", "A", "B", "C"], "D")
+    shortfall = ((bench > 0) & (weighted < bench)).sum(axis=1)
+
+    # ── 트리니티 + 통합 Gap (AnalysisHub._calc_unified_gap) ─────────────────
+    monthly, golden = _golden_time_fund(cust)
+    k_cancer = weighted[:, _CANCER_COLUMNS].sum(axis=1)
+    ratio = np.minimum(np.divide(k_cancer * 100, golden, out=np.zeros(n), where=golden > 0), 200.0)
+    income_gap = golden - k_cancer
+    risk = np.select([ratio >= 80, ratio >= 50], ["양호", "주의"], "위험")
+
+    out = pd.DataFrame({
+        "agent_id":           cust["agent_id"],
+        "person_id":          cust["person_id"],
+        "name":               cust["name"].fillna(""),
+        "age":                ages,
+        "has_income":         _premiums(cust) > 0,
+        "kb_total_score":     np.round(total_ws, 1),
+        "kb_total_benchmark": total_bm,
+        "kb_pct":             np.round(pct, 1),
+        "kb_grade":           grade,
+        "shortfall_count":    shortfall,
+        "monthly_income":     np.round(monthly, 1),
+        "golden_time_fund":   golden,
+        "kb_cancer_score":    np.round(k_cancer, 1),
+        "income_gap":         np.round(income_gap, 1),
+        "total_gap":          np.round(golden - total_ws, 1),
+        "coverage_ratio":     np.round(ratio, 1),
+        "risk_level":         risk,
+        "alert_mode":         (ratio < 50) | (income_gap >= 10_000),
+    })
+    for j, field in enumerate(_BENCH_FIELDS):
+        out[f"score_{field}"] = np.round(weighted[:, j], 1)
+        out[f"gap_{field}"] = np.round(bench[:, j] - weighted[:, j], 1)
+    out["covered_amount"] = np.round(total_amount.sum(axis=1), 1)
+
+    out = out.sort_values(["agent_id", "has_income", "income_gap", "name"],
+                          ascending=[True, False, False, True], kind="mergesort")
+    out["gap_rank"] = out.groupby("agent_id").cumcount() + 1
+    return out.reset_index(drop=True)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# §3  원천 조회 (설계사 1명 또는 전 설계사)
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _get_sb():
+    try:
+        from db_utils import _get_sb as _sb
+        return _sb()
+    except Exception:
+        return None
+
+
+def fetch_portfolio(sb, agent_id: Optional[str] = None) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    피보험자 기준 고객·담보 열 적재 (테이블당 페이지 조회 1회 패스).
+    agent_id=None 이면 전 설계사. 반환: (customers, coverages[person_id, name, amount_man])
+    gk_policy_coverages.coverage_amount 는 항상 원 단위 (crm_fortress_schema.sql) → ÷10,000 만원 고정 변환
+    (parse_amount_man 의 "100만 미만은 만원" 추정을 적용하면 입원일당·수술비 소액 특약이 1만 배로 부풀려짐)
+    """
+    from nba_engine import _fetch_all
+
+    def _query(table: str, columns: str, **eq):
+        def _q():
+            q = sb.table(table).select(columns).eq("is_deleted", False)
+            for col, val in eq.items():
+                q = q.eq(col, val)
+            if agent_id is not None:
+                q = q.eq("agent_id", agent_id)
+            return q.order(columns.split(",")[0])
+        return _q
+
+    people = pd.DataFrame(_fetch_all(_query("gk_people", "person_id,agent_id,name,birth_date,gender")),
+                          columns=["person_id", "agent_id", "name", "birth_date", "gender"])
+    roles = pd.DataFrame(_fetch_all(_query("gk_policy_roles", "role_id,policy_id,person_id", role="피보험자")),
+                         columns=["role_id", "policy_id", "person_id"])
+    covs = pd.DataFrame(_fetch_all(_query("gk_policy_coverages",
+                                          "coverage_id,policy_id,coverage_name,coverage_amount,is_active")),
+                        columns=["coverage_id", "policy_id", "coverage_name", "coverage_amount", "is_active"])
+
+    trinity_cols = ["person_id", "agent_id", "nhis_premium", "employment_type", "ltc_included", "analyzed_at"]
+    try:
+        def _tq():
+            q = sb.table("gk_trinity_analysis").select(",".join(trinity_cols))
+            if agent_id is not None:
+                q = q.eq("agent_id", agent_id)
+            return q.order("analyzed_at", desc=True).order("analysis_id")
+        trinity = pd.DataFrame(_fetch_all(_tq), columns=trinity_cols)
+    except Exception as e:
+        logger.warning(f"[GP-PORTFOLIO] 트리니티 분석 조회 실패 → 건보료 미입력 처리: {e}")
+        trinity = pd.DataFrame(columns=trinity_cols)
+
+    latest = trinity.drop_duplicates(["agent_id", "person_id"])[
+        ["agent_id", "person_id", "nhis_premium", "employment_type", "ltc_included"]]
+    customers = people.merge(latest, on=["agent_id", "person_id"], how="left")
+
+    covs = covs[covs["is_active"].ne(False)]
+    insured = roles[["policy_id", "person_id"]].drop_duplicates()
+    coverages = covs.merge(insured, on="policy_id", how="inner").rename(columns={"coverage_name": "name"})
+    coverages["amount_man"] = pd.to_numeric(coverages["coverage_amount"], errors="coerce") / 10_000
+    return customers, coverages[["person_id", "name", "amount_man"]]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# §4  순위 테이블 저장 · 조회
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _to_rows(df: pd.DataFrame, computed_at: str) -> list[dict]:
+    gap_cols = [f"gap_{f}" for f in _BENCH_FIELDS]
+    score_cols = [f"score_{f}" for f in _BENCH_FIELDS]
+    base = df.drop(columns=gap_cols + score_cols)
+    rows = base.to_dict("records")
+    scores = df[score_cols].to_numpy().tolist()
+    gaps = df[gap_cols].to_numpy().tolist()
+    for row, s, g in zip(rows, scores, gaps):
+        for key, val in row.items():
+            if isinstance(val, np.generic):
+                row[key] = val.item()
+        row["category_scores"] = dict(zip(_BENCH_FIELDS, s))
+        row["category_gaps"] = dict(zip(_BENCH_FIELDS, g))
+        row["computed_at"] = computed_at
+    return rows
+
+
+def save_portfolio_gaps(sb, df: pd.DataFrame, agent_id: Optional[str] = None, batch_size: int = 500) -> int:
+    """
+    순위 행 upsert → 이번 계산 범위에서 빠진 고객(삭제·담당 변경) 행 정리.
+    agent_id: df 가 계산한 범위 — None 이면 전 설계사 (고객이 0명이 된 설계사의 이전 순위도 삭제)
+    """
+    computed_at = datetime.datetime.now(datetime.timezone.utc).isoformat()
+    rows = _to_rows(df, computed_at)
+    for start in range(0, len(rows), batch_size):
+        sb.table(TABLE).upsert(rows[start:start + batch_size], on_conflict="agent_id,person_id").execute()
+    stale = sb.table(TABLE).delete()
+    if agent_id is not None:
+        stale = stale.eq("agent_id", agent_id)
+    stale.lt("computed_at", computed_at).execute()
+    return len(rows)
+
+
+def run_portfolio_analysis(agent_id: Optional[str] = None, save: bool = True) -> dict:
+    """
+    설계사(또는 전 설계사) 고객 전체 일괄 갭 분석 + gk_portfolio_gaps 저장.
+    반환: {"ok", "customers", "coverages", "written", "elapsed_s"}
+    """
+    sb = _get_sb()
+    if not sb:
+        return {"ok": False, "error": "db_unavailable"}
+    started = time.perf_counter()
+    customers, coverages = fetch_portfolio(sb, agent_id)
+    result = score_portfolio(customers, coverages)
+    written = save_portfolio_gaps(sb, result, agent_id=agent_id) if save else 0
+    if customers.empty:
+        return {"ok": False, "error": "no_customers", "elapsed_s": round(time.perf_counter() - started, 2)}
+    return {
+        "ok":        True,
+        "customers": len(result),
+        "coverages": len(coverages),
+        "written":   written,
+        "elapsed_s": round(time.perf_counter() - started, 2),
+    }
+
+
+def load_portfolio_gaps(agent_id: str, limit: int = 50, risk_level: Optional[str] = None) -> list[dict]:
+    """저장된 순위 테이블 조회 (gap_rank 오름차순 = 암 공백 큰 고객부터)."""
+    sb = _get_sb()
+    if not sb or not agent_id:
+        return []
+    try:
+        q = sb.table(TABLE).select("*").eq("agent_id", agent_id)
+        if risk_level:
+            q = q.eq("risk_level", risk_level)
+        return q.order("gap_rank").limit(limit).execute().data or []
+    except Exception as e:
+        logger.info(f"[GP-PORTFOLIO] {TABLE} 조회 불가: {e}")
+        return []
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# §5  HQ 홈 위젯 — 보장 공백 순위
+# ─────────────────────────────────────────────────────────────────────────────
+
+_RISK_COLORS = {"위험": "#dc2626", "주의": "#f59e0b", "양호": "#16a34a"}
+
+
+def render_portfolio_gap_widget(agent_id: str, limit: int = 10) -> None:
+    """
+    대시보드 — 📊 내 고객 보장 공백 순위 (gk_portfolio_gaps 조회).
+    야간 배치(run_portfolio_gaps.py)가 채우며, [🔄 지금 재계산] 으로 설계사 본인 고객만 즉시 갱신.
+    """
+    import streamlit as st
+
+    if not agent_id:
+        return
+
+    with st.expander("📊 내 고객 보장 공백 순위 (암 골든타임 기준)", expanded=False):
+        _c1, _c2 = st.columns([3, 1])
+        with _c1:
+            risk = st.radio("위험 등급", ["전체", "위험", "주의", "양호"], horizontal=True,
+                            key="portfolio_gap_risk", label_visibility="collapsed")
+        with _c2:
+            if st.button("🔄 지금 재계산", key="portfolio_gap_refresh", use_container_width=True):
+                with st.spinner("고객 전체 보장 공백 계산 중..."):
+                    result = run_portfolio_analysis(agent_id)
+                if result.get("ok"):
+                    st.toast(f"✅ 고객 {result['customers']}명 갱신 ({result['elapsed_s']}초)")
+                elif result.get("error") != "no_customers":
+                    st.warning(f"재계산 실패: {result.get('error', '')}")
+
+        rows = load_portfolio_gaps(agent_id, limit=limit, risk_level=None if risk == "전체" else risk)
+        if not rows:
+            st.caption("아직 계산된 순위가 없습니다. [🔄 지금 재계산] 을 눌러 주세요.")
+            return
+
+        for row in rows:
+            color = _RISK_COLORS.get(row.get("risk_level"), "#64748b")
+            income_gap = float(row.get("income_gap") or 0)
+            detail = (f"암 공백 {income_gap:,.0f}만원 · 커버율 {float(row.get('coverage_ratio') or 0):.0f}%"
+                      if row.get("has_income") else "건보료 미입력 — KB 기준만 산출")
+            st.markdown(
+                f"<div style='border:1px solid #e2e8f0;border-left:4px solid {color};border-radius:8px;"
+                f"padding:8px 12px;margin-bottom:6px;display:flex;justify-content:space-between;'>"
+                f"<span style='font-weight:800;color:#1e293b;'>#{row.get('gap_rank')} {row.get('name', '')}"
+                f"<span style='font-weight:400;color:#64748b;font-size:0.78rem;margin-left:8px;'>{detail}</span></span>"
+                f"<span style='font-size:0.75rem;color:#475569;'>KB {row.get('kb_grade', '-')} · "
+                f"{float(row.get('kb_pct') or 0):.0f}%</span></div>",
+                unsafe_allow_html=True,
+            )
+        computed_at = str(rows[0].get("computed_at") or "")[:16].replace("T", " ")
+        if computed_at:
+            st.caption(f"기준 시각 {computed_at} (UTC)")
@@ -65,6 +65,14 @@ INTEGRATED_KEYWORDS = [
 ]
 
 
+# 명시적 질병/상해 수술 키워드 (최우선)
+EXPLICIT_DISEASE_KEYWORDS = ["질병수술", "질환수술"]
+EXPLICIT_INJURY_KEYWORDS = ["상해수술", "재해수술"]
+
+# 수술비 담보 판별 키워드 (배치 분류 대상 필터)
+SURGERY_FILTER_KEYWORDS = ["수술", "시술", "절제", "적출"]
+
+
 def classify_by_keyword(coverage_name: str) -> tuple[str, float]:
     """
     키워드 기반 1차 분류.
@@ -78,23 +86,31 @@ def classify_by_keyword(coverage_name: str) -> tuple[str, float]:
         - 확률: 0.0~1.0
     """
     name_lower = coverage_name.lower()
-    
+    return classify_by_keyword_hits(lambda kw: kw in name_lower)
+
+
+def classify_by_keyword_hits(contains) -> tuple[str, float]:
+    """
+    키워드 포함 판정 함수(contains(kw) → bool, 소문자 담보명 기준)로 1차 분류.
+    통합 분류 리졸버가 오토마톤 1회 스캔 결과로 같은 규칙을 적용할 때 사용.
+    판정 규칙을 바꾸면 coverage_taxonomy_resolver._CACHE_FORMAT 을 올려 영구 캐시를 폐기할 것.
+    """
     # 명시적 질병/상해 키워드 우선 체크 (가장 높은 확률)
-    if "질병수술" in name_lower or "질환수술" in name_lower:
+    if any(contains(kw) for kw in EXPLICIT_DISEASE_KEYWORDS):
         return ("질병", 0.98)
-    if "상해수술" in name_lower or "재해수술" in name_lower:
+    if any(contains(kw) for kw in EXPLICIT_INJURY_KEYWORDS):
         return ("상해", 0.98)
     
     # 통합 키워드 체크 (질병/상해 구분 없음)
     for keyword in INTEGRATED_KEYWORDS:
-        if keyword in name_lower:
+        if contains(keyword):
             return ("통합", 0.95)
     
     # 상해 키워드 체크
-    injury_score = sum(1 for kw in INJURY_KEYWORDS if kw in name_lower)
+    injury_score = sum(1 for kw in INJURY_KEYWORDS if contains(kw))
     
     # 질병 키워드 체크
-    disease_score = sum(1 for kw in DISEASE_KEYWORDS if kw in name_lower)
+    disease_score = sum(1 for kw in DISEASE_KEYWORDS if contains(kw))
     
     # 점수 기반 분류
     total_score = injury_score + disease_score
@@ -175,6 +191,7 @@ def classify_surgery_coverage(
     amount: float,
     context: str = "",
     use_llm: bool = True,
+    keyword_result: Optional[tuple[str, float]] = None,
 ) -> SurgeryClassification:
     """
     수술비 담보를 질병/상해로 정밀 분류.
@@ -184,6 +201,7 @@ def classify_surgery_coverage(
         amount: 보장 금액 (만원)
         context: 추가 문맥 정보 (약관 전체 문장 등)
         use_llm: LLM 에이전트 사용 여부 (기본값: True)
+        keyword_result: 통합 분류 리졸버가 이미 계산한 키워드 1차 분류 (있으면 재사용)
     
     Returns:
         SurgeryClassification 객체
@@ -195,7 +213,7 @@ def classify_surgery_coverage(
         >>> print(result.display_name)  # "질병수술비"
     """
     # 1차: 키워드 기반 분류
-    surgery_type, confidence = classify_by_keyword(coverage_name)
+    surgery_type, confidence = keyword_result or classify_by_keyword(coverage_name)
     classification_method = "keyword"
     
     # 2차: 모호한 경우 LLM 에이전트 활용
@@ -267,20 +285,36 @@ def classify_surgery_coverages_bulk(
         ...     print(f"{r.original_name} → {r.surgery_type} ({r.confidence:.0%})")
     """
     results = []
+    resolver = _taxonomy_resolver()
+    resolved = resolver.resolve_many([cov.get("name", "") for cov in coverages]) if resolver else None
     
-    for cov in coverages:
+    for i, cov in enumerate(coverages):
         name = cov.get("name", "")
         amount = float(cov.get("amount", 0))
         context = cov.get("context", "")
         
-        # 수술비 관련 담보만 분류
-        if any(kw in name for kw in ["수술", "시술", "절제", "적출"]):
+        # 수술비 관련 담보만 분류 (리졸버가 있으면 판별·키워드 분류 결과 재사용)
+        if resolved is not None:
+            taxonomy = resolved[i]
+            if taxonomy.is_surgery:
+                keyword_result = (taxonomy.surgery_type, taxonomy.surgery_confidence)
+                results.append(classify_surgery_coverage(name, amount, context, use_llm, keyword_result))
+        elif any(kw in name for kw in SURGERY_FILTER_KEYWORDS):
             result = classify_surgery_coverage(name, amount, context, use_llm)
             results.append(result)
     
     return results
 
 
+def _taxonomy_resolver():
+    """통합 담보 분류 리졸버 (hq_backend 미존재 시 None → 키워드 직접 스캔)"""
+    try:
+        from hq_backend.services.coverage_taxonomy_resolver import get_taxonomy_resolver
+    except ImportError:
+        return None
+    return get_taxonomy_resolver()
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # §6  KB 7대 분류 자동 매핑 헬퍼
 # ─────────────────────────────────────────────────────────────────────────────
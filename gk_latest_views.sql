@@ -0,0 +1,49 @@
+-- ============================================================
+-- 고객별 최신 분석 / 크롤링 상태 1행 뷰
+-- [GP-BATCH] Goldkey AI Masters 2026
+--
+-- 목적: db_utils 배치 로더(prime_customer_cards)가 고객 N명의 최신 분석을
+--       in_() 1회로 조회할 때 전체 이력 대신 (person_id, agent_id)별 최신 1행만 전송
+--       → PostgREST max-rows(1000) 잘림 방지 + JSONB 이력 전송량 제거
+--
+-- 선행: phase2_analysis_persistence_schema.sql, gk_crawl_status 테이블
+-- 뷰 미배포 시 db_utils 는 원본 테이블 페이지 조회로 폴백합니다.
+-- Supabase SQL Editor에서 1회 실행하세요.
+-- ============================================================
+
+-- security_invoker: 조회자 권한으로 원본 테이블 RLS 적용 (PostgreSQL 15+)
+
+-- ──────────────────────────────────────────────────────────
+-- 1. 트리니티 분석 최신 1행
+-- ──────────────────────────────────────────────────────────
+CREATE OR REPLACE VIEW public.v_gk_trinity_analysis_latest
+WITH (security_invoker = on) AS
+SELECT DISTINCT ON (person_id, agent_id) *
+  FROM public.gk_trinity_analysis
+ ORDER BY person_id, agent_id, analyzed_at DESC;
+
+-- ──────────────────────────────────────────────────────────
+-- 2. KB 분석 최신 1행
+-- ──────────────────────────────────────────────────────────
+CREATE OR REPLACE VIEW public.v_gk_kb_analysis_latest
+WITH (security_invoker = on) AS
+SELECT DISTINCT ON (person_id, agent_id) *
+  FROM public.gk_kb_analysis
+ ORDER BY person_id, agent_id, analyzed_at DESC;
+
+-- ──────────────────────────────────────────────────────────
+-- 3. 크롤링 상태 최신 1행
+-- ──────────────────────────────────────────────────────────
+CREATE OR REPLACE VIEW public.v_gk_crawl_status_latest
+WITH (security_invoker = on) AS
+SELECT DISTINCT ON (person_id, agent_id) *
+  FROM public.gk_crawl_status
+ ORDER BY person_id, agent_id, created_at DESC;
+
+-- DISTINCT ON 정렬 지원 인덱스 (phase2 의 idx_*_person_agent 는 analyzed_at 미포함)
+CREATE INDEX IF NOT EXISTS idx_trinity_person_agent_latest
+    ON public.gk_trinity_analysis (person_id, agent_id, analyzed_at DESC);
+CREATE INDEX IF NOT EXISTS idx_kb_person_agent_latest
+    ON public.gk_kb_analysis (person_id, agent_id, analyzed_at DESC);
+CREATE INDEX IF NOT EXISTS idx_crawl_status_person_agent_latest
+    ON public.gk_crawl_status (person_id, agent_id, created_at DESC);
@@ -0,0 +1,168 @@
+-- ============================================================
+-- gk_people 서버측 검색 + 키셋 페이지네이션
+-- [GP-SEARCH] Goldkey AI Masters 2026
+--
+-- 목적: db_utils.load_customers 의 "500건 선조회 → Python 필터 → 200건 절단"을
+--       Postgres 로 이전하여 고객 1만 명 이상 설계사도 빠르고 누락 없이 검색
+--
+-- 매칭 규칙 (db_utils._matches_query 와 동일):
+--   - 단일 키워드 : 공백 제거 검색어가 공백 제거 검색 텍스트에 포함
+--   - 복합 키워드 : 모든 토큰이 검색 텍스트 어딘가에 포함 (AND)
+--   - 검색 필드   : name, memo, job, address, status, contact,
+--                   auto_renewal_month, fire_renewal_month
+-- 정렬: management_tier(NULL 마지막) → name → person_id (키셋 커서)
+--
+-- Supabase SQL Editor에서 1회 실행하세요.
+-- ============================================================
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- ──────────────────────────────────────────────────────────
+-- 1. 정규화 검색 텍스트 (생성 컬럼)
+-- ──────────────────────────────────────────────────────────
+CREATE OR REPLACE FUNCTION public.gk_people_search_text(
+    p_name               TEXT,
+    p_memo               TEXT,
+    p_job                TEXT,
+    p_address            TEXT,
+    p_status             TEXT,
+    p_contact            TEXT,
+    p_auto_renewal_month INT,
+    p_fire_renewal_month INT
+)
+RETURNS TEXT
+LANGUAGE sql
+IMMUTABLE
+PARALLEL SAFE
+SET search_path = ''
+AS $$
+    SELECT lower(
+        coalesce(p_name, '')    || ' ' ||
+        coalesce(p_memo, '')    || ' ' ||
+        coalesce(p_job, '')     || ' ' ||
+        coalesce(p_address, '') || ' ' ||
+        coalesce(p_status, '')  || ' ' ||
+        coalesce(p_contact, '') || ' ' ||
+        coalesce(p_auto_renewal_month::TEXT, '') || ' ' ||
+        coalesce(p_fire_renewal_month::TEXT, '')
+    );
+$$;
+
+ALTER TABLE gk_people ADD COLUMN IF NOT EXISTS search_text TEXT
+    GENERATED ALWAYS AS (
+        public.gk_people_search_text(
+            name, memo, job, address, status, contact,
+            auto_renewal_month, fire_renewal_month
+        )
+    ) STORED;
+
+-- 띄어쓰기 무시 매칭용 ('치매 보험' == '치매보험')
+ALTER TABLE gk_people ADD COLUMN IF NOT EXISTS search_compact TEXT
+    GENERATED ALWAYS AS (
+        replace(
+            public.gk_people_search_text(
+                name, memo, job, address, status, contact,
+                auto_renewal_month, fire_renewal_month
+            ),
+            ' ', ''
+        )
+    ) STORED;
+
+COMMENT ON COLUMN gk_people.search_text    IS '[GP-SEARCH] 소문자 정규화 검색 텍스트 (복합 키워드 AND 매칭)';
+COMMENT ON COLUMN gk_people.search_compact IS '[GP-SEARCH] 공백 제거 검색 텍스트 (단일 키워드 띄어쓰기 무시 매칭)';
+
+-- ──────────────────────────────────────────────────────────
+-- 2. 인덱스 (trigram 부분 문자열 + 키셋 정렬)
+-- ──────────────────────────────────────────────────────────
+CREATE INDEX IF NOT EXISTS idx_gk_people_search_text_trgm
+    ON gk_people USING gin (search_text gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_gk_people_search_compact_trgm
+    ON gk_people USING gin (search_compact gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_gk_people_agent_keyset
+    ON gk_people (agent_id, (coalesce(management_tier, 2147483647)), name, person_id)
+    WHERE is_deleted = FALSE;
+
+-- ──────────────────────────────────────────────────────────
+-- 3. 검색 RPC
+--    p_cursor: 직전 페이지의 next_cursor ({"tier":..,"name":..,"person_id":..})
+--    반환: {"items": [...], "total_count": N, "next_cursor": {...} | null}
+-- ──────────────────────────────────────────────────────────
+CREATE OR REPLACE FUNCTION public.search_gk_people(
+    p_agent_id TEXT DEFAULT NULL,
+    p_query    TEXT DEFAULT '',
+    p_limit    INT DEFAULT 50,
+    p_cursor   JSONB DEFAULT NULL
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+STABLE
+SECURITY INVOKER
+SET search_path = ''
+AS $$
+DECLARE
+    v_query    TEXT := lower(trim(coalesce(p_query, '')));
+    v_tokens   TEXT[];
+    v_patterns TEXT[];
+    v_compact  TEXT;
+    v_limit    INT := least(greatest(coalesce(p_limit, 50), 1), 1000);
+    v_total    BIGINT;
+    v_items    JSONB;
+    v_last     JSONB;
+BEGIN
+    -- LIKE 와일드카드 이스케이프 (Python 'in' 연산과 동일한 리터럴 매칭)
+    IF v_query <> '' THEN
+        v_tokens := regexp_split_to_array(v_query, '\s+');
+        SELECT array_agg('%' || replace(replace(replace(t, '\', '\\'), '%', '\%'), '_', '\_') || '%')
+          INTO v_patterns
+          FROM unnest(v_tokens) AS t;
+        v_compact := v_patterns[1];
+    END IF;
+
+    WITH matched AS (
+        SELECT p.*, coalesce(p.management_tier, 2147483647) AS _tier
+          FROM public.gk_people p
+         WHERE p.is_deleted = FALSE
+           AND (p_agent_id IS NULL OR p_agent_id = '' OR p.agent_id = p_agent_id)
+           AND (
+                v_query = ''
+                OR (array_length(v_tokens, 1) = 1 AND p.search_compact LIKE v_compact)
+                OR (array_length(v_tokens, 1) > 1 AND p.search_text LIKE ALL (v_patterns))
+           )
+    )
+    SELECT
+        (SELECT count(*) FROM matched),
+        (
+            SELECT coalesce(jsonb_agg(to_jsonb(page) - '_tier' - 'search_text' - 'search_compact'
+                                      ORDER BY page._tier, page.name, page.person_id), '[]'::jsonb)
+              FROM (
+                SELECT m.*
+                  FROM matched m
+                 WHERE p_cursor IS NULL
+                    OR (m._tier, m.name, m.person_id) >
+                       ((p_cursor->>'tier')::INT, p_cursor->>'name', p_cursor->>'person_id')
+                 ORDER BY m._tier, m.name, m.person_id
+                 LIMIT v_limit
+              ) AS page
+        )
+      INTO v_total, v_items;
+
+    IF jsonb_array_length(v_items) = v_limit THEN
+        v_last := v_items -> (v_limit - 1);
+        v_last := jsonb_build_object(
+            'tier',      coalesce((v_last->>'management_tier')::INT, 2147483647),
+            'name',      v_last->>'name',
+            'person_id', v_last->>'person_id'
+        );
+    END IF;
+
+    RETURN jsonb_build_object(
+        'items',       v_items,
+        'total_count', v_total,
+        'next_cursor', v_last
+    );
+END;
+$$;
+
+COMMENT ON FUNCTION public.search_gk_people IS
+    '[GP-SEARCH] 설계사 고객 검색 (띄어쓰기 무시 + 복합 키워드 AND, 키셋 페이지네이션 + 전체 건수)';
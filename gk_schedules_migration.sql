@@ -44,6 +44,20 @@ CREATE INDEX IF NOT EXISTS idx_gk_schedules_agent_date
 CREATE INDEX IF NOT EXISTS idx_gk_schedules_policy_id
   ON public.gk_schedules (policy_id, date) WHERE policy_id IS NOT NULL;
 
+-- [GP-CALENDAR] 반복 일정 — 마스터 1행 + RRULE + 예외일 (회차는 조회 시 전개)
+--   rrule       : RFC 5545 RRULE (예: FREQ=WEEKLY;INTERVAL=1;BYDAY=MO,WE;COUNT=10), 단건 일정은 NULL
+--   rrule_until : 마지막 회차 날짜 (YYYY-MM-DD, 종료 없음은 NULL) — 기간 조회 범위 필터
+--   exdates     : 제외된 회차 날짜 (삭제·개별 수정된 회차)
+ALTER TABLE public.gk_schedules
+  ADD COLUMN IF NOT EXISTS rrule         TEXT,
+  ADD COLUMN IF NOT EXISTS rrule_until   TEXT,
+  ADD COLUMN IF NOT EXISTS exdates       TEXT[] DEFAULT '{}';
+
+-- 반복 마스터 행 전용 부분 인덱스 (월간 뷰: date <= 월말 AND rrule_until >= 월초)
+CREATE INDEX IF NOT EXISTS idx_gk_schedules_agent_rrule
+  ON public.gk_schedules (agent_id, date, rrule_until)
+  WHERE rrule IS NOT NULL AND is_deleted = FALSE;
+
 -- ── RLS (Row Level Security) ────────────────────────────────────────────────
 -- 기존 RLS가 없을 경우에만 활성화
 ALTER TABLE public.gk_schedules ENABLE ROW LEVEL SECURITY;
@@ -9,7 +9,7 @@ from fastapi import APIRouter, Depends
 from pydantic import BaseModel, Field
 
 from head_api.dependencies import AuthContext, get_auth_context
-from db_utils import _get_sb
+from db_utils import _get_sb, search_customers
 
 router = APIRouter(
     prefix="/api/v1/ops",
@@ -31,6 +31,8 @@ class CustomerUpsertRequest(BaseModel):
 class CustomerListRequest(BaseModel):
     query: str = ""
     include_deleted: bool = False
+    limit: int = Field(default=200, ge=1, le=1000)
+    cursor: dict[str, Any] | None = None
 
 
 @router.post("/customer/upsert")
@@ -103,6 +105,17 @@ def list_customers(body: CustomerListRequest, auth: AuthContext = Depends(get_au
     if not sb:
         return {"ok": False, "error": "db_unavailable"}
     uid = auth.user_id
+    if not body.include_deleted:
+        # [GP-SEARCH] 서버측 검색 + 키셋 페이지네이션 (RPC 미적용 시 아래 폴백)
+        result = search_customers(uid, body.query, limit=body.limit, cursor=body.cursor)
+        if "error" not in result:
+            return {
+                "ok": True,
+                "items": result["items"],
+                "count": len(result["items"]),
+                "total_count": result["total_count"],
+                "next_cursor": result["next_cursor"],
+            }
     try:
         q = sb.table("gk_people").select("*").eq("agent_id", uid)
         if not body.include_deleted:
@@ -197,17 +197,57 @@ def upsert_customer_record(
     )
 
 
-def list_customer_records(*, user_id: str, query: str = "", include_deleted: bool = False) -> dict:
+def list_customer_records(
+    *,
+    user_id: str,
+    query: str = "",
+    include_deleted: bool = False,
+    limit: int = 200,
+    cursor: dict | None = None,
+) -> dict:
     return _post_json(
         "/api/v1/ops/customer/list",
         {
             "user_id": user_id,
             "query": query,
             "include_deleted": include_deleted,
+            "limit": limit,
+            "cursor": cursor,
         },
     )
 
 
+def list_all_customer_records(
+    *,
+    user_id: str,
+    query: str = "",
+    include_deleted: bool = False,
+    page_size: int = 500,
+    max_pages: int = 200,
+) -> dict:
+    """
+    list_customer_records 를 next_cursor 가 끝날 때까지 따라가 전체 고객 반환.
+    중간 페이지 실패 시 해당 실패 응답을 그대로 반환 (부분 목록을 전체로 오인하지 않도록).
+    """
+    items: list = []
+    cursor = None
+    seen: set = set()
+    for _ in range(max_pages):
+        r = list_customer_records(
+            user_id=user_id, query=query, include_deleted=include_deleted,
+            limit=page_size, cursor=cursor,
+        )
+        if not (isinstance(r, dict) and r.get("ok") and isinstance(r.get("items"), list)):
+            return r if isinstance(r, dict) else {"ok": False, "error": "invalid_response"}
+        items.extend(r["items"])
+        cursor = r.get("next_cursor")
+        key = json.dumps(cursor, sort_keys=True, default=str) if cursor else ""
+        if not cursor or key in seen:
+            break
+        seen.add(key)
+    return {"ok": True, "items": items, "count": len(items), "total_count": len(items)}
+
+
 def trigger_reanalyze_report(
     *,
     user_id: str,
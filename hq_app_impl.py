@@ -8293,9 +8293,9 @@ def hybrid_purge_user(uid: str, jwt_token: str) -> bool:
 # ══════════════════════════════════════════════════════════════════════════════
 
 def _lazy_sb_create_client():
-    """supabase: DB 접근 시점에만 로드 (부팅 ~0.6s 절감)"""
+    """supabase: DB 접근 시점에만 로드 (부팅 ~0.6s 절감) — [GP-POOL] 공유 커넥션 풀 팩토리"""
     try:
-        from supabase import create_client as _c
+        from supabase_pool import get_supabase_client as _c
         return _c
     except Exception:
         return None
@@ -9191,16 +9191,21 @@ def update_usage(user_name, model_used: str = ""):
     """분석 성공 후에만 호출해야 함 — Supabase usage_logs insert 우선, 로컬 JSON 폴백"""
     today = str(date.today())
     # ── Supabase usage_logs 테이블 insert (행 단위 기록 → count(*) 집계) ─
+    # [GP-WB] write-behind 큐 적재 — 분석 응답이 DB 왕복을 기다리지 않음
     try:
         _sb = _get_sb_client()
         if _sb:
-            _sb.table("usage_logs").insert({
+            from write_behind import enqueue_row
+            enqueue_row("usage_logs", {
                 "user_name":  user_name,
                 "usage_date": today,
                 "model_used": model_used or "",
-            }).execute()
-            # 세션 캐시 무효화 (즉시 최신값 반영)
-            st.session_state.pop(f"_ud_cnt_{user_name}", None)
+            })
+            # 세션 캐시 +1 (큐 flush 전 재조회로 카운트가 누락되지 않도록 무효화 대신 갱신)
+            _cache_key = f"_ud_cnt_{user_name}"
+            if (st.session_state.get(f"_ud_date_{user_name}") == today
+                    and _cache_key in st.session_state):
+                st.session_state[_cache_key] += 1
             return
     except Exception:
         pass
@@ -24636,11 +24641,14 @@ def _gp88_ocr_scan() -> None:
                 if _ext == "pdf":
                     try:
                         from modules.scan_engine import iter_pdf_pages as _iter_pages
-                        _batches = list(_iter_pages(_ocr_raw_bytes, batch_size=5))
+                        from modules.pdf_rasterizer import pdf_page_count as _pdf_page_count
+                        # 배치를 미리 모두 만들지 않고 1배치씩 래스터화 (메모리 상한)
+                        _total = max(-(-_pdf_page_count(_ocr_raw_bytes) // 5), 1)
+                        _batches = _iter_pages(_ocr_raw_bytes, batch_size=5)
                     except Exception:
                         _batches = [([None], [_ocr_raw_bytes])]
+                        _total = 1
 
-                    _total = max(len(_batches), 1)
                     for _bi, (_page_idxs, _page_imgs) in enumerate(_batches):
                         _pct = int((_bi / _total) * 90) + 5
                         _plabel = (
@@ -24755,9 +24763,19 @@ def _gp88_ocr_scan() -> None:
             if _fname.endswith(".pdf"):
                 try:
                     import fitz as _fitz
-                    _doc = _fitz.open(stream=_ocr_raw_bytes, filetype="pdf")
-                    for _pg in _doc:
-                        _raw_text += _pg.get_text()
+                    with _fitz.open(stream=_ocr_raw_bytes, filetype="pdf") as _doc:
+                        _page_texts = [_pg.get_text() for _pg in _doc]
+                    # 텍스트 레이어 없는 스캔 페이지 — 래스터 배열 보정(Deskew·CLAHE) 후 바로 Tesseract
+                    _scan_pages = [_i for _i, _t in enumerate(_page_texts) if not _t.strip()]
+                    if _scan_pages:
+                        try:
+                            import pytesseract as _tess
+                            from modules.scan_engine import iter_preprocessed_pdf_pages as _iter_pre
+                            for _pre in _iter_pre(_ocr_raw_bytes, pages=_scan_pages):
+                                _page_texts[_pre["index"]] = _tess.image_to_string(_pre["image"], lang="kor+eng")
+                        except ImportError:
+                            st.warning("Tesseract/OpenCV 미설치 — 스캔 페이지는 텍스트 레이어만 사용합니다.")
+                    _raw_text = "".join(_page_texts)
                 except ImportError:
                     st.warning("PyMuPDF(fitz) 미설치 — PDF 텍스트 레이어만 추출합니다.")
                     _raw_text = _ocr_raw_bytes.decode("utf-8", errors="ignore")
@@ -25153,6 +25171,7 @@ JSON 외 설명·주석·마크다운 코드블록은 절대 포함하지 마십
 try:
     from policy_ocr_engine import (
         prepare_image_for_vision,
+        iter_pdf_pages_for_vision as _ocr_pdf_vision_pages,
         postprocess_ocr_text,
         postprocess_coverages as _ocr_postprocess_covs,
         mask_personal_info as _ocr_mask_pii,
@@ -25167,6 +25186,7 @@ try:
 except ImportError:
     _OCR_ENGINE_AVAILABLE = False
     def prepare_image_for_vision(b, m): return b, m          # type: ignore
+    def _ocr_pdf_vision_pages(b, **_k): raise ImportError("policy_ocr_engine 미설치")  # type: ignore
     def postprocess_ocr_text(t): return t                    # type: ignore
     def _ocr_postprocess_covs(c): return c                   # type: ignore
     def _ocr_mask_pii(t): return t                           # type: ignore
@@ -25454,22 +25474,13 @@ def parse_medical_record_with_vision(files: list) -> dict:
                     _parts = [{"text": _MEDICAL_RECORD_PROMPT
                                + "\n\n첨부 의무기록 이미지에서 보이는 내용만 분석하십시오."}]
                     try:
-                        import fitz
                         f.seek(0)
-                        _pdf_doc = fitz.open(stream=f.read(), filetype="pdf")
-                        _page_count = min(len(_pdf_doc), 10)
-                        for _pno in range(_page_count):
-                            _page = _pdf_doc[_pno]
-                            _mat  = fitz.Matrix(2.5, 2.5)  # 2.5x 확대 (핸드폰 촬영본 대응)
-                            _pix  = _page.get_pixmap(matrix=_mat, alpha=False)
-                            _img_bytes = _pix.tobytes("png")
-                            # OpenCV 전처리 (노이즈제거·투영보정)
-                            _img_bytes, _ = prepare_image_for_vision(_img_bytes, "image/png")
+                        # 180 DPI(2.5x, 핸드폰 촬영본 대응) 래스터 배열 → OpenCV 전처리 → PNG 1회 인코딩
+                        for _img_bytes in _ocr_pdf_vision_pages(f.read(), max_pages=10):
                             _parts.append({
                                 "inline_data": {"mime_type": "image/png",
                                                 "data": base64.b64encode(_img_bytes).decode()}
                             })
-                        _pdf_doc.close()
                     except ImportError:
                         f.seek(0)
                         _pdf_b64 = base64.b64encode(f.read()).decode()
@@ -39050,6 +39061,13 @@ function selectCustomer(name) {{
             except Exception:
                 pass
 
+            # ── [GP-PORTFOLIO] 내 고객 보장 공백 순위 ──────────────────────────
+            try:
+                from engines.portfolio_gap_engine import render_portfolio_gap_widget as _rpgw
+                _rpgw(agent_id=st.session_state.get("agent_id", ""))
+            except Exception:
+                pass
+
             # ── [GP-SMART-SEARCH] 지능형 고객 검색 (조회 전용) ─────────────────
             try:
                 from modules.smart_search_engine import render_smart_search_widget as _rssw
@@ -43465,14 +43483,14 @@ div[data-testid="stButton"] {
                     
                     _rag_results = []
                     try:
-                        from supabase import create_client
+                        from supabase_pool import get_supabase_client
                         import os
                         
                         _sb_url = os.getenv("SUPABASE_URL")
                         _sb_key = os.getenv("SUPABASE_SERVICE_KEY")
                         
                         if _sb_url and _sb_key:
-                            _sb = create_client(_sb_url, _sb_key)
+                            _sb = get_supabase_client(_sb_url, _sb_key)
                             _cname = st.session_state.get("ps_cname_l", "")
                             
                             _rag_query = _sb.table("gk_knowledge_base").select("document_name, document_category").limit(5).execute()
@@ -48773,6 +48791,12 @@ div[data-testid="stButton"] {
                 st.warning("📥 좌측 패널에서 파일을 먼저 선택해 주세요.")
             else:
                 _kp_success_r, _kp_fail_r = 0, 0
+                # 전 파일을 스캔 작업 러너에 먼저 등록 → 백업·추출·분류 단계가 파일 간 중첩 실행
+                from modules.scan_job_runner import get_scan_job_runner
+                from modules.scan_engine import HQ_KNOWLEDGE_PERSON_ID
+                _kp_runner = get_scan_job_runner()
+                _kp_gcs = _get_gcs_client() if _gcs_client_ok else None
+                _kp_jobs = []
                 for _kp_f in _kp_files:
                     _prog_ph = st.empty()
                     _prog_ph.markdown(
@@ -48780,28 +48804,41 @@ div[data-testid="stButton"] {
                         unsafe_allow_html=True,
                     )
                     try:
-                        _fb = _kp_f.read()
-
-                        def _kp_progress_cb(step, pct, msg):
-                            _prog_ph.markdown(
-                                f'<div class="kp-progress-box">🤖 {msg} ({int(pct*100)}%)</div>',
-                                unsafe_allow_html=True,
-                            )
-
-                        _pipe_result = _kp_scan_iface(
-                            file_bytes=_fb,
-                            filename=_kp_f.name,
+                        _kp_job_id = _kp_runner.submit(
+                            _kp_f.getvalue(),
+                            _kp_f.name,
                             source_tab="kp_knowledge_pipeline",
                             doc_type=_kp_doc_type,
-                            gcs_client=_get_gcs_client() if _gcs_client_ok else None,
+                            # [GP-IDENTITY] 본사 지식 자산 — 고객 미연결, 등록 설계사만 태깅
+                            person_id=HQ_KNOWLEDGE_PERSON_ID,
+                            agent_id=st.session_state.get("user_id", ""),
+                            gcs_client=_kp_gcs,
                             gcs_bucket=_KP_GCS_BUCKET,
                             dai_project=_KP_DAI_PROJECT,
                             dai_location=_KP_DAI_LOCATION,
                             dai_processor_id=_KP_DAI_PROCESSOR,
                             ai_call_fn=st.session_state.get("_ai_call_fn"),
-                            rag_add_fn=None,
-                            session_state=st.session_state,
-                            progress_callback=_kp_progress_cb,
+                        )
+                    except Exception as _kp_e:
+                        _kp_job_id = _kp_e
+                    _kp_jobs.append((_kp_f, _prog_ph, _kp_job_id))
+
+                def _kp_poll(_snap=None):
+                    for _jf, _jph, _jid in _kp_jobs:
+                        _js = _kp_runner.snapshot(_jid) if isinstance(_jid, str) else None
+                        if _js and _js["status"] in ("queued", "running"):
+                            _jmsg = "대기열" if _js["status"] == "queued" else _js["message"]
+                            _jph.markdown(
+                                f'<div class="kp-progress-box">🤖 [{_jf.name}] {_jmsg} ({int(_js["pct"]*100)}%)</div>',
+                                unsafe_allow_html=True,
+                            )
+
+                for _kp_f, _prog_ph, _kp_job_id in _kp_jobs:
+                    try:
+                        if not isinstance(_kp_job_id, str):
+                            raise _kp_job_id
+                        _pipe_result = _kp_runner.collect(
+                            _kp_job_id, session_state=st.session_state, on_poll=_kp_poll,
                         )
                         _prog_ph.empty()
                         render_scan_progress_ui(_pipe_result)
@@ -62134,6 +62171,31 @@ border-radius:0 10px 10px 0;padding:10px 16px;margin-bottom:12px;">
                             st.session_state["_ocr_cam_analyzing"] = False
                             st.rerun()
 
+        # ── 복수 문서 일괄 스캔 (태블릿 드롭존 → 비동기 스캔 작업) ──────
+        with st.expander("📦 복수 문서 일괄 스캔 — 태블릿 드래그 앤 드롭", expanded=False):
+            try:
+                from modules.scan_engine import unified_scan_batch_component as _sh_batch
+                _sh_batch(
+                    source_tab="scan_hub_batch",
+                    person_id=st.session_state.get("selected_customer_id", "") or "",
+                    agent_id=st.session_state.get("user_id", ""),
+                    customer_name=_sh_name,
+                    gcs_client=_get_gcs_client(),
+                    gcs_bucket=(
+                        os.environ.get("GCS_KNOWLEDGE_BUCKET")
+                        or get_env_secret("GCS_KNOWLEDGE_BUCKET", "")
+                        or "goldkey-knowledge-vault"
+                    ),
+                    dai_project=os.environ.get("GCS_PROJECT_ID") or get_env_secret("GCS_PROJECT_ID", ""),
+                    dai_location=os.environ.get("DAI_LOCATION", "us"),
+                    dai_processor_id=os.environ.get("DAI_PROCESSOR_ID") or get_env_secret("DAI_PROCESSOR_ID", ""),
+                    ai_call_fn=st.session_state.get("_ai_call_fn"),
+                    session_state=st.session_state,
+                    uploader_key="sh_batch_scan",
+                )
+            except Exception as _sh_batch_e:
+                st.warning(f"일괄 스캔 모듈 로드 실패: {_sh_batch_e}")
+
         # ── SmartScanner (AI 의무기록 판독) ──────────────────────────
         with st.expander("🔬 SmartScanner — AI 의무기록 자동 판독", expanded=False):
             if _SMART_SCANNER_OK:
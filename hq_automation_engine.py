@@ -125,7 +125,7 @@ def auto_schedule_happy_call_cycle(
         contract_date = datetime.datetime.now().strftime("%Y%m%d")
     
     try:
-        from db_utils import _get_sb
+        from db_utils import _get_sb, bulk_upsert_schedules
         sb = _get_sb()
         if not sb:
             return []
@@ -160,7 +160,7 @@ def auto_schedule_happy_call_cycle(
             {"months": 12, "label": "12M"}
         ]
         
-        created_schedule_ids = []
+        schedule_payloads = []
         
         for period in happy_call_periods:
             months = period["months"]
@@ -182,12 +182,10 @@ def auto_schedule_happy_call_cycle(
                 "is_deleted": False
             }
             
-            # gk_schedules에 삽입
-            result = sb.table("gk_schedules").insert(schedule_data).execute()
-            
-            if result and result.data:
-                schedule_id = result.data[0].get("schedule_id")
-                created_schedule_ids.append(schedule_id)
+            schedule_payloads.append(schedule_data)
+        
+        # gk_schedules 다중 행 upsert 1회
+        created_schedule_ids = bulk_upsert_schedules(schedule_payloads)["written"]
         
         return created_schedule_ids
     except Exception as e:
@@ -229,7 +227,7 @@ def auto_schedule_car_insurance_renewal(
         return []
     
     try:
-        from db_utils import _get_sb
+        from db_utils import _get_sb, bulk_upsert_schedules
         sb = _get_sb()
         if not sb:
             return []
@@ -278,7 +276,7 @@ def auto_schedule_car_insurance_renewal(
             }
         ]
         
-        created_schedule_ids = []
+        schedule_payloads = []
         
         for renewal in renewal_schedules:
             days_before = renewal["days_before"]
@@ -301,12 +299,10 @@ def auto_schedule_car_insurance_renewal(
                 "is_deleted": False
             }
             
-            # gk_schedules에 삽입
-            result = sb.table("gk_schedules").insert(schedule_data).execute()
-            
-            if result and result.data:
-                schedule_id = result.data[0].get("schedule_id")
-                created_schedule_ids.append(schedule_id)
+            schedule_payloads.append(schedule_data)
+        
+        # gk_schedules 다중 행 upsert 1회
+        created_schedule_ids = bulk_upsert_schedules(schedule_payloads)["written"]
         
         return created_schedule_ids
     except Exception as e:
@@ -40,7 +40,7 @@ except ImportError:
 
 # Supabase
 try:
-    from supabase import create_client
+    from supabase_pool import get_supabase_client
 except ImportError:
     print("❌ supabase 라이브러리가 설치되어 있지 않습니다.")
     print("pip install supabase 를 실행하세요.")
@@ -147,7 +147,7 @@ def search_knowledge_base(
     if not supabase_url or not supabase_key:
         raise ValueError("SUPABASE_URL 또는 SUPABASE_SERVICE_KEY 환경 변수가 설정되지 않았습니다.")
     
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase_client(supabase_url, supabase_key)
     
     try:
         # Supabase RPC 함수 호출 (search_knowledge_base)
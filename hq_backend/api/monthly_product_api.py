@@ -30,7 +30,7 @@ try:
     from hq_backend.services.marketing_point_extractor import MarketingPointExtractor
     from hq_backend.services.document_processor import InsuranceDocumentProcessor
     from hq_backend.utils.folder_manager import FolderManager
-    from supabase import create_client
+    from supabase_pool import get_supabase_client
 except ImportError as e:
     print(f"❌ 모듈 import 실패: {e}")
     raise
@@ -139,7 +139,7 @@ async def process_leaflet_background(
         }
         
         # Supabase 로그 테이블에 저장
-        supabase = create_client(
+        supabase = get_supabase_client(
             os.getenv("SUPABASE_URL"),
             os.getenv("SUPABASE_SERVICE_KEY")
         )
@@ -181,7 +181,7 @@ async def get_monthly_products(
     
     try:
         # Supabase RPC 함수 호출
-        supabase = create_client(
+        supabase = get_supabase_client(
             os.getenv("SUPABASE_URL"),
             os.getenv("SUPABASE_SERVICE_KEY")
         )
@@ -127,7 +127,7 @@ async def vectorize_document(
         
         # 4. Supabase에 저장
         print(f"\n💾 [4/5] Supabase에 저장 중...")
-        from supabase import create_client
+        from supabase_pool import get_supabase_client
         
         supabase_url = os.getenv("SUPABASE_URL")
         supabase_key = os.getenv("SUPABASE_SERVICE_KEY")
@@ -135,7 +135,7 @@ async def vectorize_document(
         if not supabase_url or not supabase_key:
             raise ValueError("SUPABASE_URL 또는 SUPABASE_SERVICE_KEY 환경 변수가 설정되지 않았습니다.")
         
-        supabase = create_client(supabase_url, supabase_key)
+        supabase = get_supabase_client(supabase_url, supabase_key)
         
         for idx, chunk in enumerate(chunks, 1):
             data = {
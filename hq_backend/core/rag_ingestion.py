@@ -25,7 +25,8 @@ except ImportError:
     print("[WARNING] OpenAI SDK 미설치. pip install openai 실행 필요")
 
 try:
-    from supabase import create_client, Client
+    from supabase import Client
+    from supabase_pool import get_supabase_client
     _SUPABASE_OK = True
 except ImportError:
     _SUPABASE_OK = False
@@ -58,7 +59,7 @@ class RAGIngestionPipeline:
             )
         
         # Supabase 클라이언트
-        self.supabase: Client = create_client(supabase_url, supabase_key)
+        self.supabase: Client = get_supabase_client(supabase_url, supabase_key)
         
         # OpenAI 클라이언트
         openai.api_key = openai_api_key
@@ -13,6 +13,8 @@ import os
 import json
 import hashlib
 import re
+import asyncio
+import tempfile
 from datetime import datetime
 
 try:
@@ -31,16 +33,44 @@ except ImportError:
     print("[WARNING] OpenAI SDK 미설치. pip install openai 실행 필요")
 
 try:
-    from supabase import create_client, Client
+    from supabase import Client
+    from supabase_pool import get_supabase_client
     _SUPABASE_OK = True
 except ImportError:
     _SUPABASE_OK = False
     print("[WARNING] Supabase 클라이언트 미설치. pip install supabase 실행 필요")
 
+try:
+    from hq_backend.services.embedding_cache import get_embedding_cache
+    from hq_backend.services.embedding_scheduler import EmbeddingScheduler, EmbeddingCheckpoint, EmbeddingJob
+    from hq_backend.services.parallel_extractor import ParallelPDFExtractor
+except ImportError:
+    try:
+        from services.embedding_cache import get_embedding_cache
+        from services.embedding_scheduler import EmbeddingScheduler, EmbeddingCheckpoint, EmbeddingJob
+        from services.parallel_extractor import ParallelPDFExtractor
+    except ImportError:
+        get_embedding_cache = None
+        EmbeddingScheduler = None
+
 
 class IntelligentRAGPipeline:
     """지능형 증분 업데이트 RAG 파이프라인"""
     
+    # 청크 분할 설정 (프로세스 풀 추출 워커와 공유)
+    SPLITTER_OPTIONS = {
+        "chunk_size": 1500,
+        "chunk_overlap": 200,
+        "separators": ["\n\n", "\n", ".", "!", "?", ",", " ", ""]
+    }
+    
+    # 스케줄러 모드 체크포인트 기본 경로 (중단 후 재실행 시 이어서 처리)
+    # 소스 트리 밖(임시 디렉터리) 기본, GK_INGESTION_CHECKPOINT_PATH 로 재지정
+    DEFAULT_CHECKPOINT_PATH = Path(
+        os.environ.get("GK_INGESTION_CHECKPOINT_PATH", "")
+        or os.path.join(tempfile.gettempdir(), "gk_ingestion_checkpoint.txt")
+    )
+    
     # 카테고리 자동 분류 규칙
     CATEGORY_RULES = {
         "법인": ["법인", "corporate", "임원", "퇴직금", "세무"],
@@ -75,18 +105,19 @@ class IntelligentRAGPipeline:
             )
         
         # Supabase 클라이언트
-        self.supabase: Client = create_client(supabase_url, supabase_key)
+        self.supabase: Client = get_supabase_client(supabase_url, supabase_key)
         
         # OpenAI 클라이언트
         openai.api_key = openai_api_key
         self.embedding_model = embedding_model
         
+        # 임베딩 캐시 (변경되지 않은 청크 재임베딩 방지, RAGEngine과 공유)
+        self.embedding_cache = get_embedding_cache() if get_embedding_cache else None
+        
         # LangChain Text Splitter
         self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=1500,
-            chunk_overlap=200,
             length_function=len,
-            separators=["\n\n", "\n", ".", "!", "?", ",", " ", ""]
+            **self.SPLITTER_OPTIONS
         )
         
         print("✅ 지능형 RAG 파이프라인 초기화 완료")
@@ -301,12 +332,16 @@ class IntelligentRAGPipeline:
         print(f"🧠 임베딩 생성 중: {len(texts)}개 텍스트")
         
         try:
-            response = openai.embeddings.create(
-                model=self.embedding_model,
-                input=texts
-            )
+            if self.embedding_cache is not None:
+                misses_before = self.embedding_cache.misses
+                embeddings = self.embedding_cache.get_or_embed(
+                    self.embedding_model, texts, self._create_embeddings
+                )
+                cached = len(texts) - (self.embedding_cache.misses - misses_before)
+                print(f"✅ 임베딩 생성 완료: {len(embeddings)}개 벡터 (캐시 적중 {cached}개)")
+                return embeddings
             
-            embeddings = [item.embedding for item in response.data]
+            embeddings = self._create_embeddings(texts)
             print(f"✅ 임베딩 생성 완료: {len(embeddings)}개 벡터")
             return embeddings
         
@@ -314,6 +349,14 @@ class IntelligentRAGPipeline:
             print(f"❌ 임베딩 생성 실패: {str(e)}")
             raise
     
+    def _create_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """OpenAI 임베딩 API 호출 (캐시 미스 경로)"""
+        response = openai.embeddings.create(
+            model=self.embedding_model,
+            input=texts
+        )
+        return [item.embedding for item in response.data]
+    
     def extract_keywords(self, text: str, max_keywords: int = 5) -> List[str]:
         """
         텍스트에서 키워드 추출 (간단한 빈도 기반)
@@ -337,6 +380,75 @@ class IntelligentRAGPipeline:
         
         return keywords
     
+    def extract_file_metadata(self, pdf_path: str, source_root: Optional[str] = None) -> Dict:
+        """
+        파일 메타데이터 추출 (해시, 크기, 날짜, 버전, 폴더 경로)
+        
+        Args:
+            pdf_path: PDF 파일 경로
+            source_root: 소스 루트 디렉토리 (상대 경로 계산용)
+        
+        Returns:
+            메타데이터 딕셔너리
+        """
+        file_path = Path(pdf_path)
+        document_name = file_path.name
+        
+        # 폴더 경로 계산 (source_root 기준 상대 경로)
+        if source_root:
+            try:
+                folder_path = str(file_path.parent.relative_to(Path(source_root)))
+            except ValueError:
+                # 상대 경로 계산 실패 시 절대 경로 사용
+                folder_path = str(file_path.parent)
+        else:
+            folder_path = str(file_path.parent)
+        
+        doc_date = self.extract_date_from_filename(document_name)
+        if not doc_date:
+            # 파일 최종 수정일 사용
+            mod_time = datetime.fromtimestamp(file_path.stat().st_mtime)
+            doc_date = mod_time.strftime('%Y-%m-%d')
+        
+        return {
+            "document_name": document_name,
+            "folder_path": folder_path,
+            "file_hash": self.calculate_file_hash(pdf_path),
+            "file_size": file_path.stat().st_size,
+            "doc_date": doc_date,
+            "version": self.extract_version_from_filename(document_name)
+        }
+    
+    def build_record(self, chunk: Dict, embedding: List[float], document_category: str, meta: Dict) -> Dict:
+        """
+        gk_knowledge_base 저장 레코드 생성
+        
+        Args:
+            chunk: split_into_chunks 결과 청크
+            embedding: 임베딩 벡터
+            document_category: 문서 카테고리
+            meta: extract_file_metadata 결과
+        
+        Returns:
+            Supabase upsert 레코드
+        """
+        return {
+            "document_name": chunk["document_name"],
+            "document_category": document_category,
+            "chunk_index": chunk["chunk_index"],
+            "content": chunk["content"],
+            "content_length": chunk["content_length"],
+            "embedding": embedding,
+            "source_page": chunk["source_page"],
+            "keywords": self.extract_keywords(chunk["content"]),
+            # 새로운 메타데이터
+            "file_hash": meta["file_hash"],
+            "file_size": meta["file_size"],
+            "doc_date": meta["doc_date"],
+            "version": meta["version"],
+            "folder_path": meta["folder_path"]
+        }
+    
     def ingest_document_intelligent(
         self,
         pdf_path: str,
@@ -364,31 +476,15 @@ class IntelligentRAGPipeline:
         print(f"문서: {pdf_path}")
         print(f"{'='*80}\n")
         
-        file_path = Path(pdf_path)
-        document_name = file_path.name
-        
-        # 폴더 경로 계산 (source_root 기준 상대 경로)
-        if source_root:
-            try:
-                folder_path = str(file_path.parent.relative_to(Path(source_root)))
-            except ValueError:
-                # 상대 경로 계산 실패 시 절대 경로 사용
-                folder_path = str(file_path.parent)
-        else:
-            folder_path = str(file_path.parent)
-        
         # 1. 파일 메타데이터 추출
         print("📊 파일 메타데이터 추출 중...")
-        file_hash = self.calculate_file_hash(pdf_path)
-        file_size = file_path.stat().st_size
-        doc_date = self.extract_date_from_filename(document_name)
-        
-        if not doc_date:
-            # 파일 최종 수정일 사용
-            mod_time = datetime.fromtimestamp(file_path.stat().st_mtime)
-            doc_date = mod_time.strftime('%Y-%m-%d')
-        
-        version = self.extract_version_from_filename(document_name)
+        meta = self.extract_file_metadata(pdf_path, source_root)
+        document_name = meta["document_name"]
+        folder_path = meta["folder_path"]
+        file_hash = meta["file_hash"]
+        file_size = meta["file_size"]
+        doc_date = meta["doc_date"]
+        version = meta["version"]
         
         print(f"  파일 해시: {file_hash[:16]}...")
         print(f"  파일 크기: {file_size:,} bytes")
@@ -458,24 +554,7 @@ class IntelligentRAGPipeline:
                 
                 # Supabase에 저장
                 for chunk, embedding in zip(batch, embeddings):
-                    keywords = self.extract_keywords(chunk["content"])
-                    
-                    record = {
-                        "document_name": chunk["document_name"],
-                        "document_category": document_category,
-                        "chunk_index": chunk["chunk_index"],
-                        "content": chunk["content"],
-                        "content_length": chunk["content_length"],
-                        "embedding": embedding,
-                        "source_page": chunk["source_page"],
-                        "keywords": keywords,
-                        # 새로운 메타데이터
-                        "file_hash": file_hash,
-                        "file_size": file_size,
-                        "doc_date": doc_date,
-                        "version": version,
-                        "folder_path": folder_path
-                    }
+                    record = self.build_record(chunk, embedding, document_category, meta)
                     
                     result = self.supabase.table("gk_knowledge_base").upsert(record).execute()
                     
@@ -515,10 +594,187 @@ class IntelligentRAGPipeline:
                 "category": document_category
             }
     
+    def ingest_files_scheduled(
+        self,
+        pdf_paths: List[str],
+        source_root: Optional[str] = None,
+        force_update: bool = False,
+        concurrency: int = 4,
+        max_batch_tokens: int = 100_000,
+        checkpoint_path: Optional[str] = None,
+        workers: Optional[int] = None,
+        file_timeout: float = 300.0
+    ) -> List[Dict]:
+        """
+        여러 PDF를 추출 → 임베딩 → 업서트 스트리밍 파이프라인으로 일괄 처리
+        
+        PDF 추출·청크 분할은 프로세스 풀(ParallelPDFExtractor)에서 병렬 수행되고,
+        완료된 파일의 청크는 곧바로 임베딩 스케줄러로 흘러가 파일 경계와 무관하게
+        토큰 상한 배치로 묶여 동시 요청된다. 완료된 청크는 체크포인트에 기록되어
+        중단 후 재실행 시 건너뛴다.
+        
+        Args:
+            pdf_paths: PDF 파일 경로 리스트
+            source_root: 소스 루트 디렉토리 (상대 경로 계산용)
+            force_update: True이면 중복 체크 무시
+            concurrency: 최대 동시 임베딩 요청 수
+            max_batch_tokens: 배치당 추정 토큰 상한
+            checkpoint_path: 체크포인트 파일 경로 (None이면 기본 경로)
+            workers: PDF 추출 워커 프로세스 수 (None이면 CPU 코어 수)
+            file_timeout: 파일당 추출 제한 시간 (초)
+        
+        Returns:
+            파일별 처리 결과 리스트 (ingest_document_intelligent 결과와 동일 형태)
+        """
+        if EmbeddingScheduler is None:
+            raise ImportError("embedding_scheduler 모듈을 불러올 수 없습니다")
+        
+        checkpoint = EmbeddingCheckpoint(checkpoint_path or self.DEFAULT_CHECKPOINT_PATH)
+        resuming_hashes = {key.split(":", 1)[0] for key in checkpoint.load()}
+        
+        results = []
+        candidates: Dict[str, Tuple[Dict, str]] = {}
+        
+        # 1. 파일별 메타데이터 / 중복 검사 (추출 전 단계, 경량)
+        for pdf_path in pdf_paths:
+            document_name = Path(pdf_path).name
+            try:
+                meta = self.extract_file_metadata(str(pdf_path), source_root)
+                category = self.classify_category(meta["document_name"], meta["folder_path"])
+                
+                # 이전 실행에서 중단된 파일은 DB에 일부 청크가 있으므로 중복 검사 생략
+                if not force_update and meta["file_hash"] not in resuming_hashes:
+                    exists, existing_record = self.check_file_exists_in_db(meta["file_hash"])
+                    if exists:
+                        print(f"⏭️  [SKIP] 중복 파일: {document_name}")
+                        results.append({
+                            "success": True,
+                            "status": "skipped",
+                            "document_name": document_name,
+                            "file_hash": meta["file_hash"],
+                            "reason": "[SKIP] 중복 파일 발견 (해시값 일치) - 임베딩 생략",
+                            "existing_record": existing_record,
+                            "cost_saved": True
+                        })
+                        continue
+                
+                candidates[str(pdf_path)] = (meta, category)
+            
+            except Exception as e:
+                print(f"❌ 문서 준비 실패: {document_name} - {str(e)}")
+                results.append(self._failed_result(document_name, str(e)))
+        
+        if not candidates:
+            return results
+        
+        # 2. 병렬 추출 → 임베딩 작업 스트림 (완료된 파일부터 즉시 임베딩 단계로 전달)
+        extractor = ParallelPDFExtractor(
+            workers=workers,
+            file_timeout=file_timeout,
+            splitter_options=self.SPLITTER_OPTIONS
+        )
+        documents = []
+        
+        async def iter_jobs():
+            stream = extractor.iter_documents(list(candidates))
+            try:
+                while True:
+                    extracted = await asyncio.to_thread(next, stream, None)
+                    if extracted is None:
+                        break
+                    
+                    meta, category = candidates[extracted.pdf_path]
+                    if not extracted.ok:
+                        print(f"❌ PDF 추출 실패: {meta['document_name']} - {extracted.error}")
+                        results.append(self._failed_result(meta["document_name"], extracted.error, category))
+                        continue
+                    
+                    chunks = [
+                        {
+                            "document_name": meta["document_name"],
+                            "chunk_index": chunk_index,
+                            "content": content,
+                            "content_length": len(content),
+                            "source_page": page_num
+                        }
+                        for chunk_index, (page_num, content) in enumerate(extracted.chunks)
+                    ]
+                    documents.append((meta, category, chunks))
+                    print(f"📄 추출 완료: {meta['document_name']} "
+                          f"({len(extracted.pages)}페이지, {len(chunks)}개 청크, {extracted.elapsed_seconds}초)")
+                    
+                    for chunk in chunks:
+                        yield EmbeddingJob(
+                            key=f"{meta['file_hash']}:{chunk['chunk_index']}",
+                            text=chunk["content"],
+                            payload={"chunk": chunk, "category": category, "meta": meta}
+                        )
+            finally:
+                await asyncio.to_thread(stream.close)
+        
+        # 3. 배치 단위 다건 upsert
+        def upsert_batch(jobs: List, embeddings: List[List[float]]):
+            records = [
+                self.build_record(job.payload["chunk"], embedding, job.payload["category"], job.payload["meta"])
+                for job, embedding in zip(jobs, embeddings)
+            ]
+            self.supabase.table("gk_knowledge_base") \
+                .upsert(records, on_conflict="document_name,chunk_index") \
+                .execute()
+        
+        scheduler = EmbeddingScheduler(
+            embed_fn=self.generate_embeddings,
+            sink_fn=upsert_batch,
+            concurrency=concurrency,
+            max_batch_tokens=max_batch_tokens,
+            checkpoint=checkpoint
+        )
+        stats = scheduler.run(iter_jobs())
+        
+        print(f"\n🧮 임베딩 스케줄러: {stats['embedded']}개 임베딩 / {stats['skipped']}개 체크포인트 재개 / "
+              f"{stats['failed']}개 실패 / 429 {stats['rate_limited']}회 / {stats['elapsed_seconds']}초")
+        
+        # 4. 파일별 결과 집계
+        failed_hashes = {key.split(":", 1)[0] for key in scheduler.failed_keys}
+        for meta, category, chunks in documents:
+            if meta["file_hash"] in failed_hashes:
+                results.append(self._failed_result(
+                    meta["document_name"],
+                    "일부 청크 임베딩 실패 (재실행 시 체크포인트부터 재개)",
+                    category
+                ))
+            else:
+                results.append({
+                    "success": True,
+                    "status": "processed",
+                    "chunks_count": len(chunks),
+                    "category": category,
+                    **meta
+                })
+        
+        if not failed_hashes:
+            checkpoint.clear()
+        
+        return results
+    
+    def _failed_result(self, document_name: str, error: str, category: Optional[str] = None) -> Dict:
+        """파일 단위 실패 결과 (ingest_document_intelligent 실패 결과와 동일 형태)"""
+        return {
+            "success": False,
+            "status": "failed",
+            "error": error,
+            "document_name": document_name,
+            "chunks_count": 0,
+            "category": category
+        }
+    
     def ingest_directory_intelligent(
         self,
         source_dir: str,
-        force_update: bool = False
+        force_update: bool = False,
+        scheduled: bool = False,
+        concurrency: int = 4,
+        workers: Optional[int] = None
     ) -> Dict:
         """
         디렉토리 내 모든 PDF 파일을 지능형 방식으로 일괄 처리
@@ -526,6 +782,9 @@ class IntelligentRAGPipeline:
         Args:
             source_dir: 소스 디렉토리 경로
             force_update: True이면 중복 체크 무시
+            scheduled: True이면 임베딩 스케줄러(배치·동시 처리·체크포인트) 사용
+            concurrency: 스케줄러 모드 최대 동시 임베딩 요청 수
+            workers: 스케줄러 모드 PDF 추출 워커 프로세스 수 (None이면 CPU 코어 수)
         
         Returns:
             상세 실행 보고서
@@ -556,26 +815,27 @@ class IntelligentRAGPipeline:
         print(f"PDF 파일 수: {len(pdf_files)}개")
         print(f"{'='*80}\n")
         
-        results = []
-        processed_count = 0
-        skipped_count = 0
-        failed_count = 0
-        
-        for pdf_file in pdf_files:
-            result = self.ingest_document_intelligent(
-                pdf_path=str(pdf_file),
+        if scheduled:
+            results = self.ingest_files_scheduled(
+                [str(pdf_file) for pdf_file in pdf_files],
+                source_root=source_dir,
                 force_update=force_update,
-                source_root=source_dir
+                concurrency=concurrency,
+                workers=workers
             )
-            
-            results.append(result)
-            
-            if result["status"] == "processed":
-                processed_count += 1
-            elif result["status"] == "skipped":
-                skipped_count += 1
-            elif result["status"] == "failed":
-                failed_count += 1
+        else:
+            results = [
+                self.ingest_document_intelligent(
+                    pdf_path=str(pdf_file),
+                    force_update=force_update,
+                    source_root=source_dir
+                )
+                for pdf_file in pdf_files
+            ]
+        
+        processed_count = sum(1 for result in results if result["status"] == "processed")
+        skipped_count = sum(1 for result in results if result["status"] == "skipped")
+        failed_count = sum(1 for result in results if result["status"] == "failed")
         
         # 상세 보고서 생성
         report = {
@@ -626,6 +886,15 @@ class IntelligentRAGPipeline:
                 print(f"  {folder}: {count}개")
             print()
         
+        if self.embedding_cache is not None:
+            cache_stats = self.embedding_cache.get_statistics()
+            report["embedding_cache"] = cache_stats
+            print("🧠 임베딩 캐시 통계:")
+            print(f"  적중: {cache_stats['hits']}개 / 미스: {cache_stats['misses']}개 "
+                  f"(적중률 {cache_stats['hit_rate']:.1%})")
+            print(f"  절감 추정 시간: {cache_stats['estimated_seconds_saved']}초")
+            print()
+        
         return report
 
 
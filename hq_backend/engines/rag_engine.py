@@ -6,6 +6,8 @@ Supabase pgvector 기반 유사도 검색 + Gemini 1.5 Pro 환각 차단 생성
 """
 from typing import List, Dict, Optional
 import os
+import time
+import threading
 
 try:
     import openai
@@ -22,12 +24,33 @@ except ImportError:
     print("[WARNING] Gemini SDK 미설치. pip install google-generativeai 실행 필요")
 
 try:
-    from supabase import create_client, Client
+    from supabase import Client
+    from supabase_pool import get_supabase_client
     _SUPABASE_OK = True
 except ImportError:
     _SUPABASE_OK = False
     print("[WARNING] Supabase 클라이언트 미설치. pip install supabase 실행 필요")
 
+try:
+    from hq_backend.services.embedding_cache import get_embedding_cache
+except ImportError:
+    try:
+        from services.embedding_cache import get_embedding_cache
+    except ImportError:
+        get_embedding_cache = None
+
+try:
+    from hq_backend.services.bm25_index import KoreanBM25Index, reciprocal_rank_fusion, is_exact_term_query
+    from hq_backend.services.query_expansion_engine import QueryExpansionEngine
+    _HYBRID_OK = True
+except ImportError:
+    try:
+        from services.bm25_index import KoreanBM25Index, reciprocal_rank_fusion, is_exact_term_query
+        from services.query_expansion_engine import QueryExpansionEngine
+        _HYBRID_OK = True
+    except ImportError:
+        _HYBRID_OK = False
+
 
 class RAGEngine:
     """RAG 검색 증강 생성 엔진"""
@@ -54,7 +77,10 @@ class RAGEngine:
         supabase_key: str,
         openai_api_key: str,
         gemini_api_key: str,
-        embedding_model: str = "text-embedding-3-small"
+        embedding_model: str = "text-embedding-3-small",
+        use_local_index: Optional[bool] = None,
+        local_index_dir: Optional[str] = None,
+        use_hybrid: Optional[bool] = None
     ):
         """
         초기화
@@ -65,6 +91,12 @@ class RAGEngine:
             openai_api_key: OpenAI API 키 (임베딩용)
             gemini_api_key: Gemini API 키 (생성용)
             embedding_model: 임베딩 모델명
+            use_local_index: 로컬 벡터 인덱스 사용 여부
+                (None이면 RAG_LOCAL_INDEX 환경변수로 결정)
+            local_index_dir: 로컬 벡터 인덱스 저장 경로
+                (None이면 RAG_LOCAL_INDEX_DIR 또는 임시 디렉터리)
+            use_hybrid: BM25 + 벡터 하이브리드 검색 사용 여부
+                (None이면 RAG_HYBRID_SEARCH 환경변수로 결정)
         """
         if not _SUPABASE_OK or not _OPENAI_OK or not _GEMINI_OK:
             raise ImportError(
@@ -73,18 +105,132 @@ class RAGEngine:
             )
         
         # Supabase 클라이언트
-        self.supabase: Client = create_client(supabase_url, supabase_key)
+        self.supabase: Client = get_supabase_client(supabase_url, supabase_key)
         
         # OpenAI 클라이언트 (임베딩)
         openai.api_key = openai_api_key
         self.embedding_model = embedding_model
         
+        # 임베딩 캐시 (인제스트 파이프라인과 공유)
+        self.embedding_cache = get_embedding_cache() if get_embedding_cache else None
+        
         # Gemini 클라이언트 (생성)
         genai.configure(api_key=gemini_api_key)
         self.gemini_model = genai.GenerativeModel('gemini-1.5-pro')
         
+        # 로컬 벡터 인덱스 (선택) - RPC 왕복 없이 프로세스 내 검색
+        if use_local_index is None:
+            use_local_index = os.getenv("RAG_LOCAL_INDEX", "").lower() in ("1", "true", "yes")
+        
+        # 로컬 인덱스 증분 재동기화 주기 (장기 실행 프로세스가 야간 인제스트 결과를 반영)
+        self.local_index_ttl = float(os.getenv("RAG_LOCAL_INDEX_TTL_MINUTES", "60")) * 60
+        self._local_index_checked = 0.0
+        self._local_index_sync_lock = threading.Lock()
+        
+        self.local_index = None
+        if use_local_index:
+            self.local_index = self._init_local_index(local_index_dir)
+        
+        # BM25 키워드 인덱스 (선택) - 정확한 용어 질의 및 RRF 결합용
+        if use_hybrid is None:
+            use_hybrid = os.getenv("RAG_HYBRID_SEARCH", "").lower() in ("1", "true", "yes")
+        
+        self.bm25_index = None
+        self.query_expander = None
+        if use_hybrid and _HYBRID_OK:
+            self.bm25_index = self._init_bm25_index()
+            self.query_expander = QueryExpansionEngine()
+        
         print("✅ RAG 엔진 초기화 완료")
     
+    def _init_local_index(self, local_index_dir: Optional[str]):
+        """
+        로컬 벡터 인덱스 로드 후 증분 동기화
+        
+        디스크 캐시가 있으면 그대로 로드하고 서명이 바뀐 문서만 다시 받는다
+        (캐시가 없으면 전체 동기화). 실패 시 None을 반환하여 Supabase RPC 검색으로 폴백
+        """
+        try:
+            try:
+                from hq_backend.services.local_vector_index import LocalVectorIndex
+            except ImportError:
+                from services.local_vector_index import LocalVectorIndex
+            
+            index = LocalVectorIndex(self.supabase, index_dir=local_index_dir)
+            index.load()
+            try:
+                index.sync()
+            except Exception as e:
+                if not index.is_ready:
+                    raise
+                print(f"⚠️ 로컬 벡터 인덱스 동기화 실패 (디스크 캐시 사용): {str(e)}")
+            self._local_index_checked = time.monotonic()
+            
+            print(f"✅ 로컬 벡터 인덱스 활성화 ({index.size}개 청크)")
+            return index
+        
+        except Exception as e:
+            print(f"⚠️ 로컬 벡터 인덱스 초기화 실패 (RPC 검색 사용): {str(e)}")
+            return None
+    
+    def _init_bm25_index(self):
+        """
+        BM25 인덱스 생성 (로컬 벡터 인덱스가 있으면 그 행을 재사용)
+        
+        실패 시 None을 반환하여 벡터 검색만 사용
+        """
+        try:
+            if self.local_index is not None and self.local_index.is_ready:
+                index = KoreanBM25Index(self.local_index.rows)
+            else:
+                index = KoreanBM25Index.from_supabase(self.supabase)
+            
+            print(f"✅ BM25 인덱스 활성화 ({index.size}개 청크)")
+            return index
+        
+        except Exception as e:
+            print(f"⚠️ BM25 인덱스 초기화 실패 (벡터 검색만 사용): {str(e)}")
+            return None
+    
+    def sync_local_index(self, force: bool = False) -> Dict:
+        """
+        로컬 벡터 인덱스를 gk_knowledge_base와 증분 동기화
+        
+        Args:
+            force: True이면 전체 재구축
+        
+        Returns:
+            동기화 통계 (로컬 인덱스 비활성 시 빈 dict)
+        """
+        if self.local_index is None:
+            return {}
+        stats = self.local_index.sync(force=force)
+        self._local_index_checked = time.monotonic()
+        if self.bm25_index is not None and (stats.get("changed") or stats.get("removed")):
+            self.bm25_index = self._init_bm25_index()
+        return stats
+    
+    def _maybe_resync_local_index(self):
+        """
+        마지막 동기화 후 local_index_ttl 이 지났으면 증분 동기화
+        
+        동시 질의 중 한 스레드만 수행하고 나머지는 기존 인덱스로 바로 검색.
+        실패해도 기존 인덱스로 계속 검색하며 다음 주기에 재시도.
+        """
+        if self.local_index is None or self.local_index_ttl <= 0:
+            return
+        if time.monotonic() - self._local_index_checked < self.local_index_ttl:
+            return
+        if not self._local_index_sync_lock.acquire(blocking=False):
+            return
+        try:
+            self.sync_local_index()
+        except Exception as e:
+            self._local_index_checked = time.monotonic()
+            print(f"⚠️ 로컬 벡터 인덱스 재동기화 실패 (기존 인덱스 사용): {str(e)}")
+        finally:
+            self._local_index_sync_lock.release()
+    
     def generate_query_embedding(self, query: str) -> List[float]:
         """
         사용자 질의를 임베딩 벡터로 변환
@@ -96,18 +242,25 @@ class RAGEngine:
             임베딩 벡터 (1536차원)
         """
         try:
-            response = openai.embeddings.create(
-                model=self.embedding_model,
-                input=query
-            )
+            if self.embedding_cache is not None:
+                return self.embedding_cache.get_or_embed(
+                    self.embedding_model, [query], self._create_embeddings
+                )[0]
             
-            embedding = response.data[0].embedding
-            return embedding
+            return self._create_embeddings([query])[0]
         
         except Exception as e:
             print(f"❌ 임베딩 생성 실패: {str(e)}")
             raise
     
+    def _create_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """OpenAI 임베딩 API 호출 (캐시 미스 경로)"""
+        response = openai.embeddings.create(
+            model=self.embedding_model,
+            input=texts
+        )
+        return [item.embedding for item in response.data]
+    
     def retrieve_relevant_documents(
         self,
         query_embedding: List[float],
@@ -138,6 +291,18 @@ class RAGEngine:
                 ]
         """
         try:
+            self._maybe_resync_local_index()
+            if self.local_index is not None and self.local_index.is_ready:
+                # 로컬 벡터 인덱스 검색 (RPC 왕복 없음)
+                documents = self.local_index.search(
+                    query_embedding,
+                    category=category,
+                    match_threshold=match_threshold,
+                    match_count=match_count
+                )
+                print(f"🔍 검색 완료 (로컬 인덱스): {len(documents)}개 문서 발견")
+                return documents
+            
             # Supabase RPC 함수 호출
             result = self.supabase.rpc(
                 'search_knowledge_base',
@@ -161,6 +326,93 @@ class RAGEngine:
             print(f"❌ 문서 검색 실패: {str(e)}")
             return []
     
+    def retrieve_hybrid(
+        self,
+        user_query: str,
+        category: Optional[str] = None,
+        match_threshold: float = 0.7,
+        match_count: int = 5,
+        rrf_k: int = 60
+    ) -> List[Dict]:
+        """
+        BM25 + 벡터 하이브리드 검색 (Reciprocal Rank Fusion)
+        
+        - 정확한 용어 질의(KCD 코드, 따옴표 용어, 짧은 명사구)는 BM25 상위 문서가
+          질의 토큰을 모두 포함하면 임베딩 호출 없이 바로 반환
+        - 그 외에는 원 질의 임베딩 검색 결과와 BM25 결과(동의어 확장 포함)를 RRF로 결합
+        
+        Args:
+            user_query: 사용자 질의
+            category: 카테고리 필터 (None이면 전체 검색)
+            match_threshold: 벡터 유사도 임계값
+            match_count: 반환할 최대 문서 수
+            rrf_k: RRF 상수
+        
+        Returns:
+            검색된 문서 리스트 (retrieve_relevant_documents와 동일 형식 + retrieval, rrf_score)
+        """
+        candidate_count = max(match_count * 4, 20)
+        
+        # 1. 정확한 용어 질의: 임베딩 없이 BM25만으로 응답
+        if is_exact_term_query(user_query):
+            exact_hits = self.bm25_index.search(
+                user_query,
+                category=category,
+                top_k=match_count,
+                min_coverage=1.0
+            )
+            if exact_hits:
+                for doc in exact_hits:
+                    doc["similarity"] = None  # 임베딩 미호출 → 벡터 유사도 없음 (coverage 로 대체하지 않음)
+                    doc["retrieval"] = "bm25"
+                print(f"🔍 검색 완료 (BM25 정확 일치): {len(exact_hits)}개 문서 발견")
+                return exact_hits
+        
+        # 2. BM25 (glossary 동의어는 낮은 가중치로 BM25에만 반영)
+        expansions = []
+        if self.query_expander is not None:
+            expansions = self.query_expander.expand_query(user_query).meta_keywords
+        
+        keyword_hits = self.bm25_index.search(
+            user_query,
+            category=category,
+            top_k=candidate_count,
+            expansions=expansions
+        )
+        
+        # 3. 벡터 검색 (원 질의 그대로 임베딩)
+        query_embedding = self.generate_query_embedding(user_query)
+        vector_hits = self.retrieve_relevant_documents(
+            query_embedding,
+            category=category,
+            match_threshold=match_threshold,
+            match_count=candidate_count
+        )
+        
+        # 4. RRF 결합 (벡터 결과 필드 우선)
+        documents = reciprocal_rank_fusion([vector_hits, keyword_hits], k=rrf_k)[:match_count]
+        keyword_only = [doc["id"] for doc in documents if "similarity" not in doc]
+        similarities = {}
+        if keyword_only and self.local_index is not None:
+            # BM25 단독 문서도 같은 질의 임베딩으로 실제 코사인 유사도 계산
+            similarities = self.local_index.similarities_for(query_embedding, keyword_only)
+        for doc in documents:
+            in_vector = "similarity" in doc
+            in_keyword = "bm25_score" in doc
+            if not in_vector:
+                doc["similarity"] = similarities.get(doc["id"])
+            doc["retrieval"] = "hybrid" if in_vector and in_keyword else ("vector" if in_vector else "bm25")
+        
+        print(f"🔍 하이브리드 검색 완료: 벡터 {len(vector_hits)}개 + BM25 {len(keyword_hits)}개 → {len(documents)}개")
+        return documents
+    
+    @staticmethod
+    def _similarity_label(doc: Dict) -> str:
+        """문맥 헤더용 유사도 표기 (벡터 유사도 없는 BM25 단독 문서는 키워드 일치로 표기)"""
+        if doc.get("similarity") is None:
+            return "키워드 일치"
+        return f"유사도: {doc['similarity']:.2f}"
+    
     def generate_answer(
         self,
         query: str,
@@ -194,7 +446,7 @@ class RAGEngine:
         
         # 문맥 구성
         context_text = "\n\n".join([
-            f"[문서: {doc['document_name']}, 페이지: {doc['source_page']}, 유사도: {doc['similarity']:.2f}]\n{doc['content']}"
+            f"[문서: {doc['document_name']}, 페이지: {doc['source_page']}, {self._similarity_label(doc)}]\n{doc['content']}"
             for doc in context_documents
         ])
         
@@ -235,7 +487,9 @@ class RAGEngine:
             ]
             
             # 신뢰도 평가 (간단한 휴리스틱)
-            avg_similarity = sum(doc['similarity'] for doc in context_documents) / len(context_documents)
+            # BM25 단독 문서(similarity=None)는 평균에서 제외, 전부 키워드 일치면 medium
+            scored = [doc['similarity'] for doc in context_documents if doc.get('similarity') is not None]
+            avg_similarity = sum(scored) / len(scored) if scored else 0.70
             if avg_similarity >= 0.85:
                 confidence = "high"
             elif avg_similarity >= 0.70:
@@ -293,19 +547,29 @@ class RAGEngine:
             print(f"카테고리 필터: {category}")
         print(f"{'='*80}\n")
         
-        # 1단계: 질의 임베딩 생성
-        print("🧠 [단계 1/3] 질의 임베딩 생성 중...")
-        query_embedding = self.generate_query_embedding(user_query)
-        print("✅ 임베딩 생성 완료")
-        
-        # 2단계: 관련 문서 검색
-        print(f"\n🔍 [단계 2/3] 벡터 유사도 검색 중...")
-        documents = self.retrieve_relevant_documents(
-            query_embedding,
-            category=category,
-            match_threshold=match_threshold,
-            match_count=match_count
-        )
+        if self.bm25_index is not None:
+            # 1~2단계: 하이브리드 검색 (정확한 용어 질의는 임베딩 생략)
+            print("🔍 [단계 1-2/3] BM25 + 벡터 하이브리드 검색 중...")
+            documents = self.retrieve_hybrid(
+                user_query,
+                category=category,
+                match_threshold=match_threshold,
+                match_count=match_count
+            )
+        else:
+            # 1단계: 질의 임베딩 생성
+            print("🧠 [단계 1/3] 질의 임베딩 생성 중...")
+            query_embedding = self.generate_query_embedding(user_query)
+            print("✅ 임베딩 생성 완료")
+            
+            # 2단계: 관련 문서 검색
+            print(f"\n🔍 [단계 2/3] 벡터 유사도 검색 중...")
+            documents = self.retrieve_relevant_documents(
+                query_embedding,
+                category=category,
+                match_threshold=match_threshold,
+                match_count=match_count
+            )
         
         # 3단계: 답변 생성
         print(f"\n💬 [단계 3/3] 답변 생성 중 (환각 차단 모드)...")
@@ -6,6 +6,16 @@ LLM 우회 100% 정확한 수학 연산
 from typing import List, Dict, Optional
 from .static_data_loader import COVERAGE_16_MAPPING, KB_TRINITY_STANDARDS
 
+try:
+    from hq_backend.services.coverage_taxonomy_resolver import get_taxonomy_resolver
+    RESOLVER_AVAILABLE = True
+except ImportError:
+    try:
+        from services.coverage_taxonomy_resolver import get_taxonomy_resolver
+        RESOLVER_AVAILABLE = True
+    except ImportError:
+        RESOLVER_AVAILABLE = False
+
 class CoverageCalculator:
     """증권 분석 및 3-Way 비교 엔진"""
     
@@ -16,6 +26,9 @@ class CoverageCalculator:
         
         if not self.mapping or not self.standards:
             raise RuntimeError("정적 데이터가 메모리에 로드되지 않았습니다. static_data_loader.load_static_data()를 먼저 실행하세요.")
+        
+        # 통합 담보 분류 리졸버 (KB·수술비 분류와 인덱스·담보명 캐시 공유)
+        self.resolver = get_taxonomy_resolver(self.mapping) if RESOLVER_AVAILABLE else None
     
     def aggregate_by_family(self, ocr_data: List[Dict]) -> Dict[str, List[Dict]]:
         """
@@ -76,13 +89,17 @@ class CoverageCalculator:
         # 16대 카테고리 초기화
         category_sums = {cat: 0 for cat in self.mapping["metadata"]["categories"]}
         
-        for coverage in coverages:
+        targets = [c for c in coverages if c.get("name", "") and c.get("amount", 0) != 0]
+        if self.resolver is not None:
+            resolved = self.resolver.resolve_many([c["name"] for c in targets], insurance_company)
+            for coverage, taxonomy in zip(targets, resolved):
+                category_sums[taxonomy.category_16] += coverage["amount"]
+            return category_sums
+        
+        for coverage in targets:
             coverage_name = coverage.get("name", "")
             coverage_amount = coverage.get("amount", 0)
             
-            if not coverage_name or coverage_amount == 0:
-                continue
-            
             # 16대 항목 중 매칭되는 카테고리 찾기
             matched = False
             
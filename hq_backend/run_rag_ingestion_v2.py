@@ -129,7 +129,10 @@ print("="*80)
 try:
     report = pipeline.ingest_directory_intelligent(
         source_dir=str(source_dir),
-        force_update=False  # 중복 파일은 자동으로 스킵
+        force_update=False,  # 중복 파일은 자동으로 스킵
+        scheduled=True,  # 배치·동시 임베딩 + 체크포인트 재개
+        concurrency=int(os.getenv("RAG_EMBEDDING_CONCURRENCY", "4")),
+        workers=int(os.getenv("RAG_EXTRACT_WORKERS", "0")) or None  # 0이면 CPU 코어 수
     )
     
     # 보고서 저장
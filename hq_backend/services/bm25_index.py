@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+"""
+Korean BM25 Index (한국어 n-gram 역색인 + BM25)
+gk_knowledge_base 청크 본문에 대한 로컬 키워드 검색
+
+작성일: 2026-10-17
+목적: KCD 코드·특약명 등 정확한 용어 질의의 재현율 향상 및
+      벡터 검색 결과와의 RRF(Reciprocal Rank Fusion) 결합
+
+토큰화 규칙:
+- 한글: 띄어쓰기를 제거한 연속 구간의 문자 bigram ("암 진단금" == "암진단금")
+- 영문/숫자: 단어 단위 소문자 토큰 (KCD 코드 "I63.9", "C18" 등은 통째로 유지)
+"""
+
+import re
+import math
+import unicodedata
+from typing import List, Dict, Optional, Tuple, Iterable
+from collections import Counter
+
+import numpy as np
+
+
+_HANGUL_SPAN = re.compile(r"[가-힣]+(?:\s+[가-힣]+)*")
+_ALNUM_TOKEN = re.compile(r"[a-z]\d{2}(?:\.\d{1,2})?|[a-z]+|\d+(?:\.\d+)?")
+# 한글·괄호에 붙은 코드("뇌경색I63.9", "(C18)")도 인식 — \b 는 한글 앞뒤에서 경계가 아님
+_KCD_CODE = re.compile(r"(?<![A-Za-z0-9])[A-Za-z]\d{2}(?:\.\d{1,2})?(?![0-9])")
+_QUOTED = re.compile(r"[\"'“”‘’「」]([^\"'“”‘’「」]+)[\"'“”‘’「」]")
+
+
+def tokenize(text: str, n: int = 2) -> List[str]:
+    """
+    한국어 n-gram + 영숫자 단어 토큰화
+
+    Args:
+        text: 원문
+        n: 한글 n-gram 길이
+
+    Returns:
+        List[str]: 토큰 리스트 (중복 포함)
+    """
+    text = unicodedata.normalize("NFKC", text or "").lower()
+    tokens = _ALNUM_TOKEN.findall(text)
+
+    for span in _HANGUL_SPAN.findall(text):
+        compact = re.sub(r"\s+", "", span)
+        if len(compact) < n:
+            tokens.append(compact)
+        else:
+            tokens.extend(compact[i:i + n] for i in range(len(compact) - n + 1))
+
+    return tokens
+
+
+def is_exact_term_query(query: str) -> bool:
+    """
+    정확한 용어 질의 여부 (임베딩 없이 BM25만으로 응답 가능한 후보)
+
+    - KCD 코드 포함 (예: "I63.9 보장돼?")
+    - 따옴표로 묶인 용어 포함 (예: "'표적항암약물허가치료비' 특약")
+    - 2어절 이하의 짧은 명사구 (예: "암 진단금")
+    """
+    if _KCD_CODE.search(query) or _QUOTED.search(query):
+        return True
+    words = query.replace("?", " ").split()
+    return 0 < len(words) <= 2 and len(query.strip()) <= 12
+
+
+class KoreanBM25Index:
+    """
+    한국어 n-gram BM25 역색인
+
+    핵심 기능:
+    1. 청크 본문 → n-gram 역색인 (term → 문서 번호/빈도 배열)
+    2. BM25 점수 + 질의 토큰 커버리지 계산 (NumPy 누적)
+    3. 카테고리 필터 (search_knowledge_base와 동일 의미)
+    """
+
+    TABLE_NAME = "gk_knowledge_base"
+    RESULT_FIELDS = ("id", "document_name", "document_category", "content", "source_page")
+    PAGE_SIZE = 1000
+
+    def __init__(self, rows: List[Dict], k1: float = 1.2, b: float = 0.75, ngram: int = 2):
+        """
+        Args:
+            rows: 청크 행 리스트 (id, document_name, document_category, content, source_page)
+            k1: BM25 용어 빈도 포화 계수
+            b: BM25 문서 길이 정규화 계수
+            ngram: 한글 n-gram 길이
+        """
+        self.rows = rows
+        self.k1 = k1
+        self.b = b
+        self.ngram = ngram
+
+        postings: Dict[str, Dict[int, int]] = {}
+        lengths = np.zeros(len(rows), dtype=np.float32)
+        category_lookup: Dict[str, int] = {}
+        categories = np.empty(len(rows), dtype=np.int32)
+
+        for doc_id, row in enumerate(rows):
+            counts = Counter(tokenize(row.get("content", ""), ngram))
+            lengths[doc_id] = sum(counts.values())
+            categories[doc_id] = category_lookup.setdefault(row.get("document_category") or "", len(category_lookup))
+            for term, tf in counts.items():
+                postings.setdefault(term, {})[doc_id] = tf
+
+        self._postings: Dict[str, Tuple[np.ndarray, np.ndarray]] = {
+            term: (
+                np.fromiter(docs.keys(), dtype=np.int32, count=len(docs)),
+                np.fromiter(docs.values(), dtype=np.float32, count=len(docs))
+            )
+            for term, docs in postings.items()
+        }
+        self._lengths = lengths
+        self._avg_length = float(lengths.mean()) if len(rows) else 0.0
+        self._categories = categories
+        self._category_lookup = category_lookup
+
+    @property
+    def size(self) -> int:
+        return len(self.rows)
+
+    @classmethod
+    def from_supabase(cls, supabase_client, **kwargs) -> "KoreanBM25Index":
+        """
+        gk_knowledge_base 본문만 페이지 단위로 조회하여 색인 생성 (임베딩 제외)
+
+        is_active=false(Hot-Swap 이전 버전) 청크는 제외 — search_knowledge_base RPC·로컬 벡터 인덱스와 동일
+        """
+        rows = []
+        start = 0
+        while True:
+            result = supabase_client.table(cls.TABLE_NAME) \
+                .select("id, document_name, document_category, content, source_page, is_active") \
+                .range(start, start + cls.PAGE_SIZE - 1) \
+                .execute()
+            page = result.data or []
+            rows.extend(row for row in page if row.get("is_active") is not False)
+            if len(page) < cls.PAGE_SIZE:
+                break
+            start += cls.PAGE_SIZE
+        return cls(rows, **kwargs)
+
+    def _idf(self, df: int) -> float:
+        n = self.size
+        return math.log(1.0 + (n - df + 0.5) / (df + 0.5))
+
+    def score(
+        self,
+        query: str,
+        expansions: Optional[Iterable[str]] = None,
+        expansion_weight: float = 0.3
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        전체 문서에 대한 BM25 점수 및 원 질의 토큰 커버리지 계산
+
+        Args:
+            query: 원 질의
+            expansions: 질의 확장 키워드 (동의어 등, 낮은 가중치로 합산)
+            expansion_weight: 확장 키워드 가중치
+
+        Returns:
+            (scores, coverage): 문서별 BM25 점수, 원 질의 고유 토큰 포함 비율(0~1)
+        """
+        scores = np.zeros(self.size, dtype=np.float32)
+        matched = np.zeros(self.size, dtype=np.float32)
+
+        weighted_terms: Dict[str, float] = {}
+        query_terms = set(tokenize(query, self.ngram))
+        for term in query_terms:
+            weighted_terms[term] = 1.0
+        for keyword in expansions or []:
+            for term in set(tokenize(keyword, self.ngram)):
+                weighted_terms.setdefault(term, expansion_weight)
+
+        norm = self.k1 * (1 - self.b + self.b * self._lengths / max(self._avg_length, 1e-6))
+
+        for term, weight in weighted_terms.items():
+            posting = self._postings.get(term)
+            if posting is None:
+                continue
+            docs, tfs = posting
+            scores[docs] += weight * self._idf(len(docs)) * tfs * (self.k1 + 1) / (tfs + norm[docs])
+            if term in query_terms:
+                matched[docs] += 1
+
+        coverage = matched / len(query_terms) if query_terms else matched
+        return scores, coverage
+
+    def search(
+        self,
+        query: str,
+        category: Optional[str] = None,
+        top_k: int = 20,
+        expansions: Optional[Iterable[str]] = None,
+        min_coverage: float = 0.0
+    ) -> List[Dict]:
+        """
+        BM25 Top-k 검색
+
+        Args:
+            query: 원 질의
+            category: 카테고리 필터 (None이면 전체)
+            top_k: 반환할 최대 문서 수
+            expansions: 질의 확장 키워드
+            min_coverage: 원 질의 토큰 최소 커버리지
+
+        Returns:
+            검색 결과 (id, document_name, document_category, content, source_page,
+            bm25_score, coverage)
+        """
+        if not self.size or top_k <= 0:
+            return []
+
+        scores, coverage = self.score(query, expansions)
+
+        valid = (scores > 0) & (coverage >= min_coverage)
+        if category is not None:
+            code = self._category_lookup.get(category)
+            if code is None:
+                return []
+            valid &= self._categories == code
+
+        candidates = np.flatnonzero(valid)
+        if len(candidates) == 0:
+            return []
+
+        k = min(top_k, len(candidates))
+        top = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        top = top[np.argsort(-scores[top])]
+
+        results = []
+        for i in top:
+            row = self.rows[int(i)]
+            result = {field: row.get(field) for field in self.RESULT_FIELDS}
+            result["bm25_score"] = float(scores[i])
+            result["coverage"] = float(coverage[i])
+            results.append(result)
+        return results
+
+
+def reciprocal_rank_fusion(ranked_lists: List[List[Dict]], k: int = 60, key: str = "id") -> List[Dict]:
+    """
+    RRF 결합 (score = Σ 1 / (k + rank))
+
+    Args:
+        ranked_lists: 순위별 결과 리스트들 (앞쪽이 상위)
+        k: RRF 상수
+        key: 문서 식별 키
+
+    Returns:
+        rrf_score 내림차순 결합 결과 (먼저 등장한 리스트의 필드 우선)
+    """
+    fused: Dict[str, Dict] = {}
+    for ranked in ranked_lists:
+        for rank, doc in enumerate(ranked, start=1):
+            doc_id = doc.get(key)
+            entry = fused.get(doc_id)
+            if entry is None:
+                entry = fused[doc_id] = {**doc, "rrf_score": 0.0}
+            else:
+                for field, value in doc.items():
+                    entry.setdefault(field, value)
+            entry["rrf_score"] += 1.0 / (k + rank)
+
+    return sorted(fused.values(), key=lambda d: d["rrf_score"], reverse=True)
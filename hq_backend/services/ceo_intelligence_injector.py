@@ -19,7 +19,8 @@ except ImportError:
     raise
 
 try:
-    from supabase import create_client, Client
+    from supabase import Client
+    from supabase_pool import get_supabase_client
 except ImportError:
     print("❌ supabase 라이브러리가 설치되어 있지 않습니다.")
     raise
@@ -61,7 +62,7 @@ class CEOIntelligenceInjector:
         if not self.supabase_url or not self.supabase_key:
             raise ValueError("SUPABASE_URL 또는 SUPABASE_SERVICE_KEY 환경 변수가 설정되지 않았습니다.")
         
-        self.supabase: Client = create_client(self.supabase_url, self.supabase_key)
+        self.supabase: Client = get_supabase_client(self.supabase_url, self.supabase_key)
         
         # 지식 데이터 로드
         self.intelligence_data = self._load_intelligence_data()
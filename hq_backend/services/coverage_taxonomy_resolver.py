@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+"""
+담보 분류 체계 통합 리졸버 (Coverage Taxonomy Resolver)
+KB 매핑 사전 · 16대 보장항목 매핑표 · 수술비 질병/상해 키워드를 하나의 인덱스로 컴파일
+
+작성일: 2026-10-17
+목적: 가족 통합 분석(증권 10건 이상)에서 같은 특약명을 kb_policy_mapper.map_coverage,
+      CoverageCalculator.map_to_16_categories, surgery_classifier 가 각자 사전을 다시 훑는 중복 제거
+
+핵심 동작:
+1. 16대 키워드 + 수술비 키워드를 단일 Aho–Corasick 오토마톤으로 컴파일 → 담보명 1회 스캔으로 두 분류 동시 판정
+2. KB 분류는 kb_policy_mapper 의 사전 컴파일 인덱스(CoverageMappingIndex) 재사용
+3. 보험사별 특약명 정확 매칭은 특약명 → 카테고리 해시맵 — 조회 시점에 적용 (캐시 항목은 보험사 무관)
+4. 담보명 → 분류 결과 영구 캐시 (JSON, 분류표 서명이 바뀌면 폐기) — 세션·프로세스 간 재사용
+   파일 기록은 새 항목이 일정 건수 쌓이거나 일정 시간이 지났을 때만 (+ 프로세스 종료 시 1회)
+"""
+
+import os
+import json
+import time
+import atexit
+import tempfile
+import threading
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    from hq_backend.services.term_automaton import TermAutomaton
+except ImportError:
+    from services.term_automaton import TermAutomaton
+
+try:
+    from engines import kb_policy_mapper, surgery_classifier
+    ENGINES_AVAILABLE = True
+except ImportError:
+    ENGINES_AVAILABLE = False
+
+MAPPING_16_PATH = Path(__file__).parent.parent / "knowledge_base" / "static" / "coverage_16_categories_mapping.json"
+CATEGORY_16_FALLBACK = "기타"
+
+_CACHE_PATH = os.environ.get("GK_TAXONOMY_CACHE_PATH", "") or os.path.join(
+    tempfile.gettempdir(), "gk_coverage_taxonomy.json")
+_CACHE_MAX_ENTRIES = int(os.environ.get("GK_TAXONOMY_CACHE_MAX", "50000"))
+_FLUSH_MIN_NEW = int(os.environ.get("GK_TAXONOMY_FLUSH_MIN_NEW", "200"))
+_FLUSH_INTERVAL = float(os.environ.get("GK_TAXONOMY_FLUSH_SECONDS", "60"))
+
+# 캐시 서명은 분류표 "데이터"(16대 매핑표·KB 사전/패턴·수술비 키워드)만 반영한다.
+# 분류 "로직"(surgery_classifier.classify_by_keyword_hits 판정 순서·확률,
+# CoverageMappingIndex.lookup 우선순위, 아래 _classify)을 바꾸면 반드시 이 값을 올릴 것.
+_CACHE_FORMAT = 1
+
+
+@dataclass(frozen=True)
+class CoverageTaxonomy:
+    """담보명 1건의 전체 분류 결과 (세 분류 체계 동시)"""
+    name: str
+    kb_category: Optional[str]          # kb_policy_mapper 카테고리 (엔진 미존재 시 None)
+    kb_weight: float
+    kb_display: str
+    category_16: Optional[str]          # 16대 보장항목 (보험사 정확 매칭 반영, 매핑표 없으면 None)
+    is_surgery: bool                    # 수술비 담보 여부 (수술/시술/절제/적출)
+    surgery_type: str                   # 키워드 1차 분류: 질병 / 상해 / 통합 / 모호
+    surgery_confidence: float
+
+
+class CoverageTaxonomyResolver:
+    """
+    세 분류 체계 통합 인덱스 + 담보명 캐시
+
+    캐시 항목: 담보명 → (kb_category, kb_weight, kb_display, 16대 키워드 카테고리 번호,
+                         수술비 여부, 수술 분류, 확률)
+    16대 카테고리는 "카테고리 순서상 처음으로 (보험사 특약명 일치 또는 키워드 포함)" 인 항목 —
+    키워드 쪽 번호만 캐시하고 보험사 일치 번호와 작은 쪽을 조회 시점에 선택.
+    """
+
+    def __init__(self, mapping_16: Optional[Dict] = None, cache_path: Optional[str] = _CACHE_PATH):
+        self.categories_16: List[str] = []
+        self._company_exact: Dict[str, Dict[str, int]] = {}
+        keyword_category: Dict[str, int] = {}
+        if mapping_16:
+            for idx, (category, data) in enumerate(mapping_16.get("mappings", {}).items()):
+                self.categories_16.append(category)
+                for company, names in data.get("insurance_companies", {}).items():
+                    exact = self._company_exact.setdefault(company, {})
+                    for coverage_name in names:
+                        exact.setdefault(coverage_name, idx)
+                for keyword in data.get("keywords", []):
+                    keyword_category.setdefault(keyword, idx)
+
+        surgery_keywords: List[str] = []
+        if ENGINES_AVAILABLE:
+            sc = surgery_classifier
+            surgery_keywords = (sc.EXPLICIT_DISEASE_KEYWORDS + sc.EXPLICIT_INJURY_KEYWORDS + sc.INTEGRATED_KEYWORDS
+                                + sc.INJURY_KEYWORDS + sc.DISEASE_KEYWORDS + sc.SURGERY_FILTER_KEYWORDS)
+
+        # 단일 오토마톤: 패턴 번호 → (16대 카테고리 번호 또는 -1, 키워드 문자열)
+        self._patterns = list(dict.fromkeys(list(keyword_category) + surgery_keywords))
+        self._pattern_category = [keyword_category.get(p, -1) for p in self._patterns]
+        self._automaton = TermAutomaton(self._patterns)
+        self._surgery_filter = set(surgery_classifier.SURGERY_FILTER_KEYWORDS) if ENGINES_AVAILABLE else set()
+
+        self.signature = TermAutomaton.signature(
+            str(_CACHE_FORMAT),
+            json.dumps(mapping_16 or {}, ensure_ascii=False, sort_keys=True),
+            json.dumps(kb_policy_mapper.KB_EXACT_MAP, ensure_ascii=False) if ENGINES_AVAILABLE else "",
+            json.dumps(kb_policy_mapper.KB_REGEX_PATTERNS, ensure_ascii=False) if ENGINES_AVAILABLE else "",
+            json.dumps(surgery_keywords, ensure_ascii=False),
+        )
+        self.cache_path = cache_path
+        self._entries: Dict[str, Tuple] = {}
+        self._dirty = 0
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        self._load_cache()
+
+    # ──────────────────────────────────────────────────────────────────────
+    # 분류
+    # ──────────────────────────────────────────────────────────────────────
+
+    def _classify(self, name: str) -> Tuple:
+        if ENGINES_AVAILABLE:
+            kb_category, kb_weight, kb_display = kb_policy_mapper._MAPPING_INDEX.lookup(name)
+        else:
+            kb_category, kb_weight, kb_display = None, 0.0, name
+
+        hits = self._automaton.find(name)
+        keyword_idx = min((self._pattern_category[i] for i in hits if self._pattern_category[i] >= 0), default=-1)
+        is_surgery = any(self._patterns[i] in self._surgery_filter for i in hits)
+
+        if ENGINES_AVAILABLE:
+            lower = name.lower()
+            lower_hits = hits if lower == name else self._automaton.find(lower)
+            found = {self._patterns[i] for i in lower_hits}
+            surgery_type, confidence = surgery_classifier.classify_by_keyword_hits(found.__contains__)
+        else:
+            surgery_type, confidence = "모호", 0.0
+        return (kb_category, kb_weight, kb_display, keyword_idx, is_surgery, surgery_type, confidence)
+
+    def _entry(self, name: str) -> Tuple:
+        entry = self._entries.get(name)
+        if entry is None:
+            entry = self._classify(name)
+            with self._lock:
+                self._entries[name] = entry
+                self._dirty += 1
+        return entry
+
+    def resolve(self, name: str, insurance_company: Optional[str] = None) -> CoverageTaxonomy:
+        """
+        담보명 → 세 분류 체계 결과 (1회 조회)
+
+        Args:
+            name: 특약명 (원문 그대로 — 각 분류 체계가 자체 정규화 규칙 적용)
+            insurance_company: 보험사명 (16대 보험사별 특약명 정확 매칭용, None이면 키워드 기준)
+        """
+        kb_category, kb_weight, kb_display, keyword_idx, is_surgery, surgery_type, confidence = self._entry(name)
+
+        category_16 = None
+        if self.categories_16:
+            idx = keyword_idx
+            exact_idx = self._company_exact.get(insurance_company, {}).get(name) if insurance_company else None
+            if exact_idx is not None and (idx < 0 or exact_idx < idx):
+                idx = exact_idx
+            category_16 = self.categories_16[idx] if idx >= 0 else CATEGORY_16_FALLBACK
+
+        return CoverageTaxonomy(
+            name=name,
+            kb_category=kb_category,
+            kb_weight=kb_weight,
+            kb_display=kb_display,
+            category_16=category_16,
+            is_surgery=is_surgery,
+            surgery_type=surgery_type,
+            surgery_confidence=confidence,
+        )
+
+    def resolve_many(self, names: Iterable[str], insurance_company: Optional[str] = None,
+                     persist: bool = True) -> List[CoverageTaxonomy]:
+        """
+        담보명 목록 일괄 분류 — 새 항목이 _FLUSH_MIN_NEW 건 이상 쌓였거나
+        마지막 기록 후 _FLUSH_INTERVAL 초가 지났으면 영구 캐시에 반영 (호출마다 전체 재기록 방지)
+        """
+        results = [self.resolve(name, insurance_company) for name in names]
+        if persist and self._dirty and (
+            self._dirty >= _FLUSH_MIN_NEW or time.monotonic() - self._last_flush >= _FLUSH_INTERVAL
+        ):
+            self.flush()
+        return results
+
+    # ──────────────────────────────────────────────────────────────────────
+    # 영구 캐시
+    # ──────────────────────────────────────────────────────────────────────
+
+    def _load_cache(self):
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("signature") != self.signature:
+                return
+            self._entries = {name: tuple(entry) for name, entry in data["entries"].items()}
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"⚠️ 담보 분류 캐시 로드 실패 (재생성): {e}")
+            self._entries = {}
+
+    def flush(self):
+        """새 항목이 있을 때만 캐시 파일 갱신 (원자적 교체, 상한 초과 시 오래된 항목부터 제거)"""
+        if not self.cache_path or not self._dirty:
+            return
+        with self._lock:
+            if len(self._entries) > _CACHE_MAX_ENTRIES:
+                excess = len(self._entries) - int(_CACHE_MAX_ENTRIES * 0.9)
+                for name in list(self._entries)[:excess]:
+                    del self._entries[name]
+            payload = {"signature": self.signature, "entries": dict(self._entries)}
+            self._dirty = 0
+            self._last_flush = time.monotonic()
+        tmp_path = f"{self.cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.cache_path)), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            print(f"⚠️ 담보 분류 캐시 저장 실패: {e}")
+
+    @property
+    def cached_count(self) -> int:
+        return len(self._entries)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# 공유 인스턴스
+# ══════════════════════════════════════════════════════════════════════════════
+
+_resolver: Optional[CoverageTaxonomyResolver] = None
+_resolver_source = None
+_resolver_lock = threading.Lock()
+
+
+def load_mapping_16(path: Path = MAPPING_16_PATH) -> Optional[Dict]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"⚠️ 16대 보장항목 매핑표 로드 실패: {e}")
+        return None
+
+
+def get_taxonomy_resolver(mapping_16: Optional[Dict] = None) -> CoverageTaxonomyResolver:
+    """
+    프로세스 공유 리졸버 (인덱스 1회 컴파일)
+    mapping_16: 16대 매핑표 (None이면 기존 인스턴스 또는 knowledge_base/static JSON)
+    """
+    global _resolver, _resolver_source
+    with _resolver_lock:
+        if _resolver is None or (mapping_16 is not None and _resolver_source is not mapping_16):
+            source = mapping_16 if mapping_16 is not None else load_mapping_16()
+            _resolver = CoverageTaxonomyResolver(source)
+            _resolver_source = source if mapping_16 is not None else None
+        return _resolver
+
+
+@atexit.register
+def _flush_shared_resolver():
+    """프로세스 종료 시 아직 기록하지 않은 분류 결과 저장"""
+    if _resolver is not None:
+        _resolver.flush()
@@ -144,6 +144,18 @@ class InsuranceDocumentProcessor:
         except Exception as e:
             raise Exception(f"PDF 텍스트 추출 실패: {e}")
         
+        return self.mask_pii(text)
+    
+    def mask_pii(self, text: str) -> str:
+        """
+        추출 텍스트에 보안 필터 적용 (PII 마스킹)
+        
+        Args:
+            text: 추출된 원문 텍스트
+        
+        Returns:
+            str: 마스킹된 텍스트
+        """
         # 보안 필터 적용 (PII 마스킹) - 절대 누락 금지
         # 개인정보 보호법 준수 및 민원 대응 정당성 유지
         raw_text = text.strip()
@@ -260,13 +272,24 @@ class InsuranceDocumentProcessor:
         """
         pdf_path = Path(pdf_path)
         
+        # PDF 텍스트 추출
+        text = self.extract_text_from_pdf(pdf_path)
+        
+        return self._chunk_extracted_text(pdf_path, text, additional_metadata)
+    
+    def _chunk_extracted_text(
+        self,
+        pdf_path: Path,
+        text: str,
+        additional_metadata: Optional[Dict] = None
+    ) -> List[Dict[str, str]]:
+        """
+        추출(마스킹)된 텍스트에 파일 메타데이터를 병합하여 Chunk 분할
+        """
         # 1. 파일명에서 메타데이터 추출
         filename_metadata = self.extract_metadata_from_filename(pdf_path.name)
         
-        # 2. PDF 텍스트 추출
-        text = self.extract_text_from_pdf(pdf_path)
-        
-        # 3. 메타데이터 병합
+        # 2. 메타데이터 병합
         metadata = {
             "document_name": pdf_path.name,
             "document_path": str(pdf_path),
@@ -276,7 +299,7 @@ class InsuranceDocumentProcessor:
         if additional_metadata:
             metadata.update(additional_metadata)
         
-        # 4. 문서 분할
+        # 3. 문서 분할
         chunks = self.split_document(text, metadata)
         
         return chunks
@@ -285,7 +308,9 @@ class InsuranceDocumentProcessor:
         self,
         directory_path: str,
         file_pattern: str = "*.pdf",
-        additional_metadata: Optional[Dict] = None
+        additional_metadata: Optional[Dict] = None,
+        workers: int = 1,
+        file_timeout: float = 300.0
     ) -> Dict[str, List[Dict[str, str]]]:
         """
         디렉토리 내 모든 PDF 파일 처리
@@ -294,6 +319,8 @@ class InsuranceDocumentProcessor:
             directory_path: 디렉토리 경로
             file_pattern: 파일 패턴 (기본값: *.pdf)
             additional_metadata: 추가 메타데이터
+            workers: PDF 추출 워커 프로세스 수 (2 이상이면 프로세스 풀 병렬 추출)
+            file_timeout: 병렬 추출 시 파일당 제한 시간 (초)
         
         Returns:
             Dict[str, List[Dict[str, str]]]: {파일명: Chunk 리스트}
@@ -302,6 +329,14 @@ class InsuranceDocumentProcessor:
         if not directory.exists():
             raise FileNotFoundError(f"디렉토리를 찾을 수 없습니다: {directory}")
         
+        if workers > 1:
+            return self._process_directory_parallel(
+                list(directory.rglob(file_pattern)),
+                additional_metadata,
+                workers,
+                file_timeout
+            )
+        
         results = {}
         
         for pdf_file in directory.rglob(file_pattern):
@@ -315,6 +350,44 @@ class InsuranceDocumentProcessor:
         
         return results
     
+    def _process_directory_parallel(
+        self,
+        pdf_files: List[Path],
+        additional_metadata: Optional[Dict],
+        workers: int,
+        file_timeout: float
+    ) -> Dict[str, List[Dict[str, str]]]:
+        """
+        프로세스 풀로 PDF 텍스트를 병렬 추출한 뒤 완료 순서대로 마스킹·분할
+        """
+        try:
+            from hq_backend.services.parallel_extractor import ParallelPDFExtractor
+        except ImportError:
+            from .parallel_extractor import ParallelPDFExtractor
+        
+        extractor = ParallelPDFExtractor(workers=workers, file_timeout=file_timeout)
+        results = {}
+        
+        for extracted in extractor.iter_documents(pdf_files):
+            pdf_file = Path(extracted.pdf_path)
+            if not extracted.ok:
+                print(f"❌ 처리 실패: {pdf_file.name} - {extracted.error}")
+                continue
+            
+            try:
+                text = "".join(
+                    f"\n\n[페이지 {page['page']}]\n{page['content']}"
+                    for page in extracted.pages
+                    if page["content"]
+                )
+                chunks = self._chunk_extracted_text(pdf_file, self.mask_pii(text), additional_metadata)
+                results[pdf_file.name] = chunks
+                print(f"✅ 처리 완료: {pdf_file.name} ({len(chunks)}개 Chunk)")
+            except Exception as e:
+                print(f"❌ 처리 실패: {pdf_file.name} - {e}")
+        
+        return results
+    
     def get_statistics(self, chunks: List[Dict[str, str]]) -> Dict:
         """
         Chunk 통계 정보 반환
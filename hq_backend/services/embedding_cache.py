@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+"""
+Embedding Cache (콘텐츠 주소 기반 임베딩 캐시)
+(모델, 정규화 텍스트 해시) → 임베딩 벡터 영구 캐시
+
+작성일: 2026-10-17
+목적: 인제스트(IntelligentRAGPipeline)와 질의(RAGEngine) 경로의
+      중복 OpenAI 임베딩 호출 제거 및 절감 효과 계측
+"""
+
+import os
+import re
+import time
+import sqlite3
+import hashlib
+import tempfile
+import threading
+import unicodedata
+from pathlib import Path
+from typing import List, Dict, Optional, Callable
+
+import numpy as np
+
+# 캐시 DB — 소스 트리 밖(임시 디렉터리) 기본, EMBEDDING_CACHE_PATH 로 재지정 (영구 볼륨 권장)
+_DEFAULT_DB_PATH = os.path.join(tempfile.gettempdir(), "gk_embedding_cache.sqlite3")
+
+
+class EmbeddingCache:
+    """
+    임베딩 캐시 (SQLite, LRU 축출)
+
+    핵심 기능:
+    1. (model, sha256(정규화 텍스트)) 키로 float32 벡터 저장
+    2. 조회 시 last_used 갱신 → max_entries 초과 시 오래된 항목부터 축출
+    3. hit/miss 카운터 및 절감 API 시간 추정치 제공
+    """
+
+    def __init__(self, db_path: Optional[str] = None, max_entries: int = 200_000):
+        """
+        Args:
+            db_path: SQLite 파일 경로 (None이면 EMBEDDING_CACHE_PATH 또는 임시 디렉터리)
+            max_entries: 최대 보관 항목 수 (초과 시 LRU 축출)
+        """
+        if db_path is None:
+            db_path = os.getenv("EMBEDDING_CACHE_PATH", "") or _DEFAULT_DB_PATH
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embedding_cache (
+                model TEXT NOT NULL,
+                text_hash TEXT NOT NULL,
+                dim INTEGER NOT NULL,
+                vector BLOB NOT NULL,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (model, text_hash)
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_embedding_cache_last_used ON embedding_cache (last_used)"
+        )
+        self._conn.commit()
+
+        # 계측 카운터 (프로세스 단위, _lock 보호)
+        self.hits = 0
+        self.misses = 0
+        self.saved_chars = 0
+        self.api_calls = 0
+        self.api_seconds = 0.0
+        self.api_texts = 0
+
+    # ──────────────────────────────────────────────────────────────────────
+    # 키 계산
+    # ──────────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def normalize_text(text: str) -> str:
+        """
+        캐시 키용 텍스트 정규화 (NFC + 공백 축약 + NULL 제거)
+        """
+        text = unicodedata.normalize("NFC", text or "").replace("\x00", "")
+        return re.sub(r"\s+", " ", text).strip()
+
+    @classmethod
+    def text_hash(cls, text: str) -> str:
+        """정규화 텍스트의 SHA-256 해시"""
+        return hashlib.sha256(cls.normalize_text(text).encode("utf-8")).hexdigest()
+
+    # ──────────────────────────────────────────────────────────────────────
+    # 조회 / 저장
+    # ──────────────────────────────────────────────────────────────────────
+
+    def get_many(self, model: str, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        텍스트 리스트의 캐시 조회 (입력 순서 유지, 미스는 None)
+
+        Args:
+            model: 임베딩 모델명
+            texts: 텍스트 리스트
+
+        Returns:
+            List[Optional[List[float]]]: 캐시된 벡터 또는 None
+        """
+        hashes = [self.text_hash(t) for t in texts]
+        found: Dict[str, List[float]] = {}
+
+        with self._lock:
+            unique = list(dict.fromkeys(hashes))
+            for start in range(0, len(unique), 500):
+                batch = unique[start:start + 500]
+                placeholders = ",".join("?" * len(batch))
+                cursor = self._conn.execute(
+                    f"SELECT text_hash, vector FROM embedding_cache "
+                    f"WHERE model = ? AND text_hash IN ({placeholders})",
+                    [model, *batch]
+                )
+                for text_hash, blob in cursor:
+                    found[text_hash] = np.frombuffer(blob, dtype=np.float32).tolist()
+
+            if found:
+                now = time.time()
+                self._conn.executemany(
+                    "UPDATE embedding_cache SET last_used = ? WHERE model = ? AND text_hash = ?",
+                    [(now, model, h) for h in found]
+                )
+                self._conn.commit()
+
+            results = []
+            for text, text_hash in zip(texts, hashes):
+                vector = found.get(text_hash)
+                if vector is None:
+                    self.misses += 1
+                else:
+                    self.hits += 1
+                    self.saved_chars += len(text)
+                results.append(vector)
+
+        return results
+
+    def put_many(self, model: str, texts: List[str], embeddings: List[List[float]]):
+        """
+        임베딩 저장 후 max_entries 초과분 LRU 축출
+
+        Args:
+            model: 임베딩 모델명
+            texts: 텍스트 리스트
+            embeddings: 텍스트별 임베딩 벡터
+        """
+        now = time.time()
+        records = []
+        for text, embedding in zip(texts, embeddings):
+            vector = np.asarray(embedding, dtype=np.float32)
+            records.append((model, self.text_hash(text), len(vector), vector.tobytes(), now))
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embedding_cache (model, text_hash, dim, vector, last_used) "
+                "VALUES (?, ?, ?, ?, ?)",
+                records
+            )
+            self._evict_locked()
+            self._conn.commit()
+
+    def _evict_locked(self):
+        count = self._conn.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM embedding_cache WHERE rowid IN ("
+                "SELECT rowid FROM embedding_cache ORDER BY last_used ASC LIMIT ?)",
+                (overflow,)
+            )
+
+    def get_or_embed(
+        self,
+        model: str,
+        texts: List[str],
+        embed_fn: Callable[[List[str]], List[List[float]]]
+    ) -> List[List[float]]:
+        """
+        캐시 우선 조회 후 미스 텍스트만 embed_fn으로 생성
+
+        Args:
+            model: 임베딩 모델명
+            texts: 텍스트 리스트
+            embed_fn: 미스 텍스트 리스트 → 임베딩 리스트 (OpenAI 호출부)
+
+        Returns:
+            List[List[float]]: 입력 순서와 동일한 임베딩 리스트
+        """
+        cached = self.get_many(model, texts)
+
+        # 동일 배치 내 중복 텍스트는 한 번만 요청
+        pending: Dict[str, str] = {}
+        for text, vector in zip(texts, cached):
+            if vector is None:
+                pending.setdefault(self.text_hash(text), text)
+
+        if pending:
+            miss_texts = list(pending.values())
+
+            started = time.perf_counter()
+            generated = embed_fn(miss_texts)
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self.api_seconds += elapsed
+                self.api_calls += 1
+                self.api_texts += len(miss_texts)
+
+            self.put_many(model, miss_texts, generated)
+            by_hash = dict(zip(pending.keys(), generated))
+
+            cached = [
+                vector if vector is not None else by_hash[self.text_hash(text)]
+                for text, vector in zip(texts, cached)
+            ]
+
+        return cached
+
+    # ──────────────────────────────────────────────────────────────────────
+    # 계측
+    # ──────────────────────────────────────────────────────────────────────
+
+    def get_statistics(self) -> Dict:
+        """
+        캐시 통계 (hit/miss, 절감 추정치)
+
+        Returns:
+            Dict: 통계 정보
+        """
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()[0]
+            hits, misses = self.hits, self.misses
+            api_calls, api_seconds, api_texts = self.api_calls, self.api_seconds, self.api_texts
+            saved_chars = self.saved_chars
+
+        lookups = hits + misses
+        seconds_per_text = api_seconds / api_texts if api_texts else 0.0
+
+        return {
+            "entries": entries,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "api_calls": api_calls,
+            "api_seconds": round(api_seconds, 3),
+            "saved_chars": saved_chars,
+            "estimated_seconds_saved": round(hits * seconds_per_text, 3)
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_default_cache: Optional[EmbeddingCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """
+    프로세스 공용 임베딩 캐시 (EMBEDDING_CACHE=0 이면 비활성)
+
+    Returns:
+        EmbeddingCache 또는 None (비활성/초기화 실패)
+    """
+    global _default_cache
+
+    if os.getenv("EMBEDDING_CACHE", "1").lower() in ("0", "false", "no"):
+        return None
+
+    with _default_cache_lock:
+        if _default_cache is None:
+            try:
+                _default_cache = EmbeddingCache()
+            except Exception as e:
+                print(f"⚠️ 임베딩 캐시 초기화 실패 (캐시 없이 진행): {e}")
+                return None
+        return _default_cache
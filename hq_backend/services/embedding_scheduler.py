@@ -0,0 +1,296 @@
+# -*- coding: utf-8 -*-
+"""
+Embedding Scheduler (배치·동시성·속도제한 인지 임베딩 스케줄러)
+여러 문서의 청크를 토큰 상한 배치로 묶어 N개 요청을 동시에 처리
+
+작성일: 2026-10-17
+목적: 디렉토리 일괄 인제스트 시 파일 단위 직렬 처리 및
+      배치 상한 초과(대형 약관 PDF) 실패 제거
+
+핵심 동작:
+1. 토큰 추정치 기준 배치 패킹 (max_batch_tokens / max_batch_items)
+2. asyncio 조건 변수로 동시 요청 수 제어 (429 발생 시 AIMD 방식 자동 축소)
+3. 지수 백오프 + 지터 재시도 (Retry-After 헤더 우선)
+4. 완료 청크 키를 체크포인트 파일에 기록 → 중단 후 재실행 시 이어서 처리
+"""
+
+import time
+import random
+import asyncio
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import List, Dict, Optional, Callable, Iterable, Set, Union, AsyncIterable
+
+
+@dataclass
+class EmbeddingJob:
+    """임베딩 대상 청크"""
+    key: str                                   # 체크포인트 키 (예: "{file_hash}:{chunk_index}")
+    text: str                                  # 임베딩할 텍스트
+    payload: Dict = field(default_factory=dict)  # 저장 단계로 전달할 레코드
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    토큰 수 보수적 추정 (UTF-8 바이트 / 3)
+
+    한글 1자 ≈ 3바이트 ≈ 1토큰, 영문은 과대 추정되므로 배치 상한 초과 방지에 안전
+    """
+    return max(1, len(text.encode("utf-8")) // 3)
+
+
+def _is_rate_limit(exc: Exception) -> bool:
+    if getattr(exc, "status_code", None) == 429:
+        return True
+    return type(exc).__name__ == "RateLimitError"
+
+
+def _retry_after_seconds(exc: Exception) -> Optional[float]:
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+class EmbeddingCheckpoint:
+    """
+    완료 청크 키 체크포인트 (append-only 텍스트 파일, 한 줄 = 한 키)
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+
+    def load(self) -> Set[str]:
+        if not self.path.exists():
+            return set()
+        with open(self.path, "r", encoding="utf-8") as f:
+            return {line.strip() for line in f if line.strip()}
+
+    def mark(self, keys: List[str]):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("".join(f"{key}\n" for key in keys))
+            f.flush()
+
+    def clear(self):
+        if self.path.exists():
+            self.path.unlink()
+
+
+class EmbeddingScheduler:
+    """
+    임베딩 스케줄러
+
+    사용 예:
+        scheduler = EmbeddingScheduler(
+            embed_fn=pipeline.generate_embeddings,
+            sink_fn=lambda jobs, vectors: upsert(jobs, vectors),
+            concurrency=4
+        )
+        stats = scheduler.run(jobs)
+    """
+
+    # OpenAI embeddings API 요청당 상한 (입력 2048개 / 300k 토큰)
+    API_MAX_ITEMS = 2048
+    API_MAX_TOKENS = 300_000
+
+    def __init__(
+        self,
+        embed_fn: Callable[[List[str]], List[List[float]]],
+        sink_fn: Optional[Callable[[List[EmbeddingJob], List[List[float]]], None]] = None,
+        max_batch_tokens: int = 100_000,
+        max_batch_items: int = 512,
+        concurrency: int = 4,
+        max_retries: int = 6,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        checkpoint: Optional[EmbeddingCheckpoint] = None
+    ):
+        """
+        Args:
+            embed_fn: 텍스트 리스트 → 임베딩 리스트 (동기 함수, 스레드에서 실행)
+            sink_fn: 배치 결과 저장 함수 (동기 함수, 스레드에서 실행)
+            max_batch_tokens: 배치당 추정 토큰 상한
+            max_batch_items: 배치당 입력 수 상한
+            concurrency: 최대 동시 요청 수
+            max_retries: 배치당 최대 재시도 횟수
+            base_delay: 백오프 기본 대기 시간 (초)
+            max_delay: 백오프 최대 대기 시간 (초)
+            checkpoint: 완료 키 체크포인트 (None이면 재개 기능 비활성)
+        """
+        self.embed_fn = embed_fn
+        self.sink_fn = sink_fn
+        self.max_batch_tokens = min(max_batch_tokens, self.API_MAX_TOKENS)
+        self.max_batch_items = min(max_batch_items, self.API_MAX_ITEMS)
+        self.concurrency = max(1, concurrency)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.checkpoint = checkpoint
+
+        self._reset_state()
+
+    def _reset_state(self):
+        self.stats = {
+            "jobs": 0,
+            "skipped": 0,
+            "embedded": 0,
+            "failed": 0,
+            "batches": 0,
+            "rate_limited": 0,
+            "retries": 0,
+            "elapsed_seconds": 0.0
+        }
+        self.failed_keys: List[str] = []
+        self._limit = self.concurrency
+        self._in_flight = 0
+        self._success_streak = 0
+        self._condition: Optional[asyncio.Condition] = None
+
+    # ──────────────────────────────────────────────────────────────────────
+    # 적응형 동시성 제어 (AIMD)
+    # ──────────────────────────────────────────────────────────────────────
+
+    async def _acquire(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self._limit)
+            self._in_flight += 1
+
+    async def _release(self):
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    async def _on_success(self):
+        async with self._condition:
+            self._success_streak += 1
+            if self._limit < self.concurrency and self._success_streak >= self._limit:
+                self._limit += 1
+                self._success_streak = 0
+                self._condition.notify_all()
+
+    async def _on_rate_limit(self):
+        async with self._condition:
+            self.stats["rate_limited"] += 1
+            self._limit = max(1, self._limit // 2)
+            self._success_streak = 0
+
+    def _backoff(self, attempt: int, exc: Exception) -> float:
+        retry_after = _retry_after_seconds(exc)
+        if retry_after is not None:
+            return min(self.max_delay, retry_after)
+        delay = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return delay * (0.5 + random.random() / 2)
+
+    # ──────────────────────────────────────────────────────────────────────
+    # 실행
+    # ──────────────────────────────────────────────────────────────────────
+
+    async def _process_batch(self, batch: List[EmbeddingJob]):
+        texts = [job.text for job in batch]
+
+        for attempt in range(self.max_retries + 1):
+            await self._acquire()
+            try:
+                embeddings = await asyncio.to_thread(self.embed_fn, texts)
+                if self.sink_fn is not None:
+                    await asyncio.to_thread(self.sink_fn, batch, embeddings)
+            except Exception as e:
+                await self._release()
+
+                if _is_rate_limit(e):
+                    await self._on_rate_limit()
+                if attempt >= self.max_retries:
+                    print(f"❌ 배치 처리 최종 실패 ({len(batch)}개 청크): {e}")
+                    self.stats["failed"] += len(batch)
+                    self.failed_keys.extend(job.key for job in batch)
+                    return
+
+                self.stats["retries"] += 1
+                delay = self._backoff(attempt, e)
+                print(f"⚠️ 배치 재시도 {attempt + 1}/{self.max_retries} ({delay:.1f}초 후): {e}")
+                await asyncio.sleep(delay)
+                continue
+
+            await self._release()
+            await self._on_success()
+
+            if self.checkpoint is not None:
+                self.checkpoint.mark([job.key for job in batch])
+            self.stats["embedded"] += len(batch)
+            self.stats["batches"] += 1
+            return
+
+    async def _iterate(self, jobs) -> AsyncIterable[EmbeddingJob]:
+        if hasattr(jobs, "__aiter__"):
+            async for job in jobs:
+                yield job
+        else:
+            for job in jobs:
+                yield job
+
+    async def run_async(self, jobs: Union[Iterable[EmbeddingJob], AsyncIterable[EmbeddingJob]]) -> Dict:
+        """
+        임베딩 작업 실행 (동기/비동기 이터러블 모두 지원, 스트리밍 패킹)
+
+        Args:
+            jobs: EmbeddingJob 이터러블
+
+        Returns:
+            Dict: 실행 통계
+        """
+        self._reset_state()
+        self._condition = asyncio.Condition()
+        started = time.perf_counter()
+
+        done = self.checkpoint.load() if self.checkpoint is not None else set()
+        tasks: Set[asyncio.Task] = set()
+
+        batch: List[EmbeddingJob] = []
+        batch_tokens = 0
+
+        def dispatch(current: List[EmbeddingJob]):
+            task = asyncio.create_task(self._process_batch(current))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+        async for job in self._iterate(jobs):
+            self.stats["jobs"] += 1
+            if job.key in done:
+                self.stats["skipped"] += 1
+                continue
+
+            tokens = estimate_tokens(job.text)
+            if batch and (batch_tokens + tokens > self.max_batch_tokens or len(batch) >= self.max_batch_items):
+                dispatch(batch)
+                batch, batch_tokens = [], 0
+                # 대기 중인 배치가 과도하게 쌓이지 않도록 생산 속도 조절
+                while len(tasks) >= self.concurrency * 2:
+                    await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+
+            batch.append(job)
+            batch_tokens += tokens
+
+        if batch:
+            dispatch(batch)
+        if tasks:
+            await asyncio.gather(*list(tasks))
+
+        self.stats["elapsed_seconds"] = round(time.perf_counter() - started, 3)
+        return dict(self.stats)
+
+    def run(self, jobs: Iterable[EmbeddingJob]) -> Dict:
+        """
+        run_async 동기 래퍼
+
+        Args:
+            jobs: EmbeddingJob 이터러블
+
+        Returns:
+            Dict: 실행 통계
+        """
+        return asyncio.run(self.run_async(jobs))
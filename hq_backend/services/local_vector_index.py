@@ -0,0 +1,549 @@
+# -*- coding: utf-8 -*-
+"""
+Local Vector Index (로컬 벡터 인덱스 캐시)
+gk_knowledge_base 임베딩을 디스크에 memmap으로 보관하고 프로세스 내에서 검색
+
+작성일: 2026-10-17
+목적: 질의마다 발생하는 search_knowledge_base RPC 왕복 제거
+      (지식베이스는 야간 인제스트 시에만 변경되므로 로컬 복제본으로 충분)
+
+저장 구조 (index_dir):
+    vectors.f32     정규화된 float32 임베딩 행렬 (N x dim, np.memmap)
+    rows.json       행 메타데이터 (id, 문서명, 카테고리, 본문, 페이지 등)
+    manifest.json   문서별 동기화 서명 (file_hash + version + updated_at)
+    ivf.npz         (선택) IVF 클러스터 중심점 및 행 할당
+"""
+
+import os
+import json
+import hashlib
+import tempfile
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple
+from datetime import datetime
+
+import numpy as np
+
+
+class LocalVectorIndex:
+    """
+    로컬 벡터 인덱스
+
+    핵심 기능:
+    1. gk_knowledge_base 전체 임베딩을 디스크에 memmap 형태로 캐시
+    2. file_hash / version / updated_at 기반 문서 단위 증분 동기화
+    3. search_knowledge_base RPC와 동일한 카테고리 필터·임계값 의미의 Top-k 검색
+    4. (선택) IVF 조대 양자화 계층으로 후보 축소
+    """
+
+    TABLE_NAME = "gk_knowledge_base"
+
+    # 동기화 서명 계산용 컬럼 (인제스트 파이프라인이 기록하는 컬럼)
+    MANIFEST_COLUMNS = "document_name, file_hash, version, updated_at"
+
+    # 검색 결과로 돌려줄 메타데이터 컬럼 (RPC 반환 형태와 동일)
+    RESULT_FIELDS = ("id", "document_name", "document_category", "content", "source_page")
+
+    PAGE_SIZE = 1000
+
+    def __init__(
+        self,
+        supabase_client,
+        index_dir: Optional[str] = None,
+        dim: int = 1536,
+        use_ivf: bool = False,
+        ivf_lists: Optional[int] = None,
+        ivf_nprobe: int = 8
+    ):
+        """
+        Args:
+            supabase_client: Supabase 클라이언트 (동기화 시에만 사용)
+            index_dir: 인덱스 저장 디렉토리 (None이면 RAG_LOCAL_INDEX_DIR 또는 임시 디렉터리)
+            dim: 임베딩 차원 (text-embedding-3-small: 1536)
+            use_ivf: IVF 계층 사용 여부 (수만 청크 이상일 때 권장)
+            ivf_lists: IVF 클러스터 수 (None이면 sqrt(N))
+            ivf_nprobe: 검색 시 탐색할 클러스터 수
+        """
+        self.supabase = supabase_client
+
+        if index_dir is None:
+            # 소스 트리 밖 기본 경로 (RAG_LOCAL_INDEX_DIR 로 영구 볼륨 지정 가능)
+            index_dir = os.getenv("RAG_LOCAL_INDEX_DIR", "") or os.path.join(
+                tempfile.gettempdir(), "gk_rag_local_index"
+            )
+        self.index_dir = Path(index_dir)
+
+        self.dim = dim
+        self.use_ivf = use_ivf
+        self.ivf_lists = ivf_lists
+        self.ivf_nprobe = ivf_nprobe
+
+        self.vectors: Optional[np.ndarray] = None
+        self.rows: List[Dict] = []
+        self.documents: Dict[str, str] = {}
+        self.synced_at: Optional[str] = None
+
+        # 카테고리 필터용 코드 배열 (행 단위)
+        self._category_codes: Optional[np.ndarray] = None
+        self._category_lookup: Dict[str, int] = {}
+
+        # 문서 id → 행 번호 (similarities_for 조회용)
+        self._id_positions: Dict = {}
+
+        # IVF 계층
+        self._centroids: Optional[np.ndarray] = None
+        self._assignments: Optional[np.ndarray] = None
+
+    # ──────────────────────────────────────────────────────────────────────
+    # 상태
+    # ──────────────────────────────────────────────────────────────────────
+
+    @property
+    def is_ready(self) -> bool:
+        """검색 가능 여부"""
+        return self.vectors is not None and len(self.rows) > 0
+
+    @property
+    def size(self) -> int:
+        """인덱싱된 청크 수"""
+        return len(self.rows)
+
+    @property
+    def _vectors_path(self) -> Path:
+        return self.index_dir / "vectors.f32"
+
+    @property
+    def _rows_path(self) -> Path:
+        return self.index_dir / "rows.json"
+
+    @property
+    def _manifest_path(self) -> Path:
+        return self.index_dir / "manifest.json"
+
+    @property
+    def _ivf_path(self) -> Path:
+        return self.index_dir / "ivf.npz"
+
+    # ──────────────────────────────────────────────────────────────────────
+    # 디스크 로드 / 저장
+    # ──────────────────────────────────────────────────────────────────────
+
+    def load(self) -> bool:
+        """
+        디스크에 저장된 인덱스 로드 (임베딩 행렬은 memmap, 복사 없음)
+
+        Returns:
+            bool: 로드 성공 여부
+        """
+        if not self._manifest_path.exists() or not self._rows_path.exists():
+            return False
+
+        try:
+            with open(self._manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            with open(self._rows_path, "r", encoding="utf-8") as f:
+                rows = json.load(f)
+
+            count = int(manifest.get("count", 0))
+            dim = int(manifest.get("dim", self.dim))
+
+            if count != len(rows):
+                print(f"⚠️ 로컬 인덱스 불일치 (rows={len(rows)}, manifest={count}) → 재동기화 필요")
+                return False
+
+            if count > 0:
+                vectors = np.memmap(self._vectors_path, dtype=np.float32, mode="r", shape=(count, dim))
+            else:
+                vectors = np.zeros((0, dim), dtype=np.float32)
+
+            self.dim = dim
+            self.vectors = vectors
+            self.rows = rows
+            self.documents = manifest.get("documents", {})
+            self.synced_at = manifest.get("synced_at")
+            self._rebuild_category_codes()
+            self._load_ivf()
+            return True
+
+        except Exception as e:
+            print(f"⚠️ 로컬 벡터 인덱스 로드 실패: {e}")
+            return False
+
+    def _save(self, vectors: np.ndarray, rows: List[Dict], documents: Dict[str, str]):
+        """
+        인덱스를 임시 파일에 기록한 뒤 원자적으로 교체
+        """
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+
+        # 기존 memmap 핸들 해제 (Windows에서 파일 교체 실패 방지)
+        self.vectors = None
+
+        tmp_vectors = self._vectors_path.with_suffix(".f32.tmp")
+        vectors.astype(np.float32, copy=False).tofile(tmp_vectors)
+        os.replace(tmp_vectors, self._vectors_path)
+
+        tmp_rows = self._rows_path.with_suffix(".json.tmp")
+        with open(tmp_rows, "w", encoding="utf-8") as f:
+            json.dump(rows, f, ensure_ascii=False)
+        os.replace(tmp_rows, self._rows_path)
+
+        manifest = {
+            "dim": self.dim,
+            "count": len(rows),
+            "documents": documents,
+            "synced_at": datetime.now().isoformat()
+        }
+        tmp_manifest = self._manifest_path.with_suffix(".json.tmp")
+        with open(tmp_manifest, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_manifest, self._manifest_path)
+
+    # ──────────────────────────────────────────────────────────────────────
+    # 증분 동기화
+    # ──────────────────────────────────────────────────────────────────────
+
+    def _fetch_all(self, columns: str, document_name: Optional[str] = None) -> List[Dict]:
+        """
+        gk_knowledge_base 페이지 단위 조회 (PostgREST 1000행 제한 대응)
+        """
+        rows = []
+        start = 0
+
+        while True:
+            query = self.supabase.table(self.TABLE_NAME).select(columns)
+            if document_name is not None:
+                query = query.eq("document_name", document_name)
+            result = query.range(start, start + self.PAGE_SIZE - 1).execute()
+
+            page = result.data or []
+            rows.extend(page)
+
+            if len(page) < self.PAGE_SIZE:
+                break
+            start += self.PAGE_SIZE
+
+        return rows
+
+    def fetch_remote_signatures(self) -> Dict[str, str]:
+        """
+        원격 문서별 동기화 서명 조회 (임베딩 제외 경량 조회)
+
+        Returns:
+            Dict[str, str]: {document_name: signature}
+        """
+        grouped: Dict[str, List[str]] = {}
+
+        for row in self._fetch_all(self.MANIFEST_COLUMNS):
+            name = row.get("document_name")
+            if not name:
+                continue
+            grouped.setdefault(name, []).append(
+                f"{row.get('file_hash') or ''}|{row.get('version') or ''}|{row.get('updated_at') or ''}"
+            )
+
+        signatures = {}
+        for name, parts in grouped.items():
+            digest = hashlib.sha256("\n".join(sorted(parts)).encode("utf-8")).hexdigest()
+            signatures[name] = digest
+
+        return signatures
+
+    def _parse_embedding(self, value) -> Optional[np.ndarray]:
+        """
+        pgvector 값 파싱 (PostgREST는 '[0.1,0.2,...]' 문자열로 반환)
+        """
+        if value is None:
+            return None
+        if isinstance(value, str):
+            value = json.loads(value)
+
+        vector = np.asarray(value, dtype=np.float32)
+        if vector.shape != (self.dim,):
+            return None
+        return vector
+
+    def sync(self, force: bool = False) -> Dict:
+        """
+        gk_knowledge_base와 증분 동기화
+
+        변경되지 않은 문서의 임베딩은 로컬 행렬에서 그대로 재사용하고,
+        서명이 바뀐 문서만 원격에서 다시 내려받는다.
+
+        Args:
+            force: True이면 로컬 캐시를 무시하고 전체 재구축
+
+        Returns:
+            Dict: 동기화 통계
+        """
+        if self.vectors is None and not force:
+            self.load()
+
+        remote = self.fetch_remote_signatures()
+        local = {} if force else dict(self.documents)
+
+        changed = [name for name, sig in remote.items() if local.get(name) != sig]
+        removed = [name for name in local if name not in remote]
+
+        stats = {
+            "documents": len(remote),
+            "changed": len(changed),
+            "removed": len(removed),
+            "fetched_chunks": 0,
+            "total_chunks": self.size
+        }
+
+        if not changed and not removed and self.vectors is not None:
+            print(f"✅ 로컬 벡터 인덱스 최신 상태 ({self.size}개 청크)")
+            return stats
+
+        # 1. 유지할 기존 행 (변경/삭제되지 않은 문서)
+        drop = set(changed) | set(removed)
+        keep_idx = [i for i, row in enumerate(self.rows) if row["document_name"] not in drop]
+
+        kept_rows = [self.rows[i] for i in keep_idx]
+        if self.vectors is not None and keep_idx:
+            kept_vectors = np.asarray(self.vectors[keep_idx], dtype=np.float32)
+        else:
+            kept_vectors = np.zeros((0, self.dim), dtype=np.float32)
+
+        # 2. 변경 문서만 재조회
+        new_rows = []
+        new_vectors = []
+        for name in changed:
+            for record in self._fetch_all("*", document_name=name):
+                if record.get("is_active") is False:
+                    continue
+
+                vector = self._parse_embedding(record.get("embedding"))
+                if vector is None:
+                    continue
+
+                new_vectors.append(vector)
+                new_rows.append({
+                    "id": record.get("id"),
+                    "document_name": record.get("document_name"),
+                    "document_category": record.get("document_category"),
+                    "chunk_index": record.get("chunk_index"),
+                    "content": record.get("content", ""),
+                    "source_page": record.get("source_page")
+                })
+
+        if new_vectors:
+            fetched = self._normalize(np.vstack(new_vectors))
+        else:
+            fetched = np.zeros((0, self.dim), dtype=np.float32)
+
+        vectors = np.vstack([kept_vectors, fetched])
+        rows = kept_rows + new_rows
+
+        # 3. 디스크 기록 후 memmap 재로드
+        self._save(vectors, rows, remote)
+        self.load()
+
+        if self.use_ivf:
+            self.build_ivf()
+
+        stats["fetched_chunks"] = len(new_rows)
+        stats["total_chunks"] = self.size
+
+        print(
+            f"✅ 로컬 벡터 인덱스 동기화 완료: 변경 {len(changed)}개 / 삭제 {len(removed)}개 문서, "
+            f"총 {self.size}개 청크"
+        )
+        return stats
+
+    # ──────────────────────────────────────────────────────────────────────
+    # IVF 계층 (선택)
+    # ──────────────────────────────────────────────────────────────────────
+
+    def build_ivf(self, iterations: int = 10, seed: int = 42):
+        """
+        구면 k-means로 IVF 클러스터 학습 후 ivf.npz에 저장
+
+        Args:
+            iterations: k-means 반복 횟수
+            seed: 초기 중심점 샘플링 시드
+        """
+        if not self.is_ready:
+            return
+
+        n = self.size
+        lists = self.ivf_lists or max(1, int(np.sqrt(n)))
+        lists = min(lists, n)
+
+        rng = np.random.default_rng(seed)
+        data = np.asarray(self.vectors)
+        centroids = data[rng.choice(n, size=lists, replace=False)].copy()
+
+        for _ in range(iterations):
+            assignments = np.argmax(data @ centroids.T, axis=1)
+            for c in range(lists):
+                members = data[assignments == c]
+                if len(members):
+                    centroids[c] = members.sum(axis=0)
+            centroids = self._normalize(centroids)
+
+        assignments = np.argmax(data @ centroids.T, axis=1).astype(np.int32)
+
+        np.savez(self._ivf_path, centroids=centroids, assignments=assignments)
+        self._centroids = centroids
+        self._assignments = assignments
+
+    def _load_ivf(self):
+        self._centroids = None
+        self._assignments = None
+
+        if not self.use_ivf or not self._ivf_path.exists():
+            return
+
+        data = np.load(self._ivf_path)
+        if len(data["assignments"]) == self.size:
+            self._centroids = data["centroids"]
+            self._assignments = data["assignments"]
+
+    # ──────────────────────────────────────────────────────────────────────
+    # 검색
+    # ──────────────────────────────────────────────────────────────────────
+
+    def _normalize(self, matrix: np.ndarray) -> np.ndarray:
+        """행 단위 L2 정규화 (영벡터는 그대로 유지)"""
+        matrix = np.asarray(matrix, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+    def _rebuild_category_codes(self):
+        lookup: Dict[str, int] = {}
+        codes = np.empty(len(self.rows), dtype=np.int32)
+        for i, row in enumerate(self.rows):
+            codes[i] = lookup.setdefault(row.get("document_category") or "", len(lookup))
+        self._category_lookup = lookup
+        self._category_codes = codes
+        self._id_positions = {row.get("id"): i for i, row in enumerate(self.rows)}
+
+    def _candidate_indices(self, query: np.ndarray, category: Optional[str]) -> Optional[np.ndarray]:
+        """
+        카테고리 필터 + IVF 탐색 범위로 후보 행 인덱스 계산
+
+        Returns:
+            None이면 전체 행, 빈 배열이면 후보 없음
+        """
+        mask = None
+
+        if category is not None:
+            code = self._category_lookup.get(category)
+            if code is None:
+                return np.zeros(0, dtype=np.int64)
+            mask = self._category_codes == code
+
+        if self._centroids is not None:
+            nprobe = min(self.ivf_nprobe, len(self._centroids))
+            probes = np.argpartition(-(self._centroids @ query), nprobe - 1)[:nprobe]
+            ivf_mask = np.isin(self._assignments, probes)
+            mask = ivf_mask if mask is None else (mask & ivf_mask)
+
+        if mask is None:
+            return None
+        return np.flatnonzero(mask)
+
+    def search(
+        self,
+        query_embedding: List[float],
+        category: Optional[str] = None,
+        match_threshold: float = 0.7,
+        match_count: int = 5
+    ) -> List[Dict]:
+        """
+        코사인 유사도 Top-k 검색 (search_knowledge_base RPC와 동일한 의미)
+
+        Args:
+            query_embedding: 쿼리 임베딩 벡터
+            category: 카테고리 필터 (None이면 전체 검색)
+            match_threshold: 유사도 임계값 (초과하는 문서만 반환)
+            match_count: 반환할 최대 문서 수
+
+        Returns:
+            검색된 문서 리스트 (id, document_name, document_category,
+            content, source_page, similarity)
+        """
+        if not self.is_ready or match_count <= 0:
+            return []
+
+        query = self._normalize(np.asarray(query_embedding, dtype=np.float32))
+
+        candidates = self._candidate_indices(query, category)
+        if candidates is None:
+            similarities = self.vectors @ query
+            candidates = np.arange(self.size)
+        elif len(candidates) == 0:
+            return []
+        else:
+            similarities = self.vectors[candidates] @ query
+
+        passed = similarities > match_threshold
+        similarities = similarities[passed]
+        candidates = candidates[passed]
+
+        if len(similarities) == 0:
+            return []
+
+        k = min(match_count, len(similarities))
+        top = np.argpartition(-similarities, k - 1)[:k]
+        top = top[np.argsort(-similarities[top])]
+
+        results = []
+        for i in top:
+            row = self.rows[int(candidates[i])]
+            result = {field: row.get(field) for field in self.RESULT_FIELDS}
+            result["similarity"] = float(similarities[i])
+            results.append(result)
+
+        return results
+
+    def similarities_for(self, query_embedding: List[float], ids: List) -> Dict:
+        """
+        지정 문서들의 코사인 유사도 (임계값·Top-k 없이)
+
+        하이브리드 검색에서 BM25로만 잡힌 문서에 실제 벡터 유사도를 부여할 때 사용
+
+        Returns:
+            Dict: {id: similarity} (인덱스에 없는 id 제외)
+        """
+        if not self.is_ready:
+            return {}
+        found = [(doc_id, self._id_positions[doc_id]) for doc_id in ids if doc_id in self._id_positions]
+        if not found:
+            return {}
+        query = self._normalize(np.asarray(query_embedding, dtype=np.float32))
+        similarities = np.asarray(self.vectors[[pos for _, pos in found]]) @ query
+        return {doc_id: float(sim) for (doc_id, _), sim in zip(found, similarities)}
+
+
+def main():
+    """
+    로컬 벡터 인덱스 동기화 (야간 인제스트 이후 실행)
+    """
+    from supabase_pool import get_supabase_client
+
+    supabase_url = os.getenv("SUPABASE_URL")
+    supabase_key = os.getenv("SUPABASE_SERVICE_KEY", os.getenv("SUPABASE_KEY"))
+
+    if not supabase_url or not supabase_key:
+        print("❌ 환경변수 미설정: SUPABASE_URL, SUPABASE_SERVICE_KEY")
+        return
+
+    index = LocalVectorIndex(
+        get_supabase_client(supabase_url, supabase_key),
+        use_ivf=os.getenv("RAG_LOCAL_INDEX_IVF", "").lower() in ("1", "true", "yes")
+    )
+    stats = index.sync()
+
+    print("=" * 70)
+    print("📦 로컬 벡터 인덱스 동기화 결과")
+    print("=" * 70)
+    for key, value in stats.items():
+        print(f"  {key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
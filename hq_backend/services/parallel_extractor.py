@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+"""
+Parallel PDF Extractor (프로세스 풀 PDF 추출·청크 분할 단계)
+여러 PDF의 텍스트 추출과 청크 분할을 워커 프로세스에 분산
+
+작성일: 2026-10-17
+목적: 인제스트 파이프라인의 PDF 추출 단계가 단일 코어에 묶이는 문제 해소
+
+핵심 동작:
+1. N개 워커 프로세스가 파일 단위로 추출 + 청크 분할 수행
+2. 결과는 크기 제한 큐(queue_size)로 전달 → 임베딩/업서트 단계가 느리면 워커가 대기 (역압)
+3. 파일별 타임아웃 초과 또는 워커 비정상 종료 시 해당 워커만 교체하고 계속 진행
+   (손상된 PDF 하나가 전체 실행을 멈추지 않음)
+4. 워커가 시작 신호 전송 전에 죽어 결과가 유실된 파일은 진행 없음 대기(lost_timeout) 후 실패로 반환
+   (입력 파일 수만큼 결과를 보장 — 무한 대기 없음)
+"""
+
+import os
+import time
+import queue
+import multiprocessing
+from dataclasses import dataclass, field
+from typing import List, Dict, Optional, Callable, Iterator, Iterable, Tuple
+
+
+@dataclass
+class ExtractedDocument:
+    """파일 단위 추출 결과"""
+    pdf_path: str
+    pages: List[Dict] = field(default_factory=list)          # [{"page": 1, "content": "..."}]
+    chunks: Optional[List[Tuple[int, str]]] = None            # [(source_page, chunk_text)]
+    error: Optional[str] = None
+    elapsed_seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def extract_pdf_pages(pdf_path: str) -> List[Dict]:
+    """
+    pypdf 페이지별 텍스트 추출 (PyPDFLoader / PyPDF2와 동일한 추출 엔진)
+
+    Args:
+        pdf_path: PDF 파일 경로
+
+    Returns:
+        List[Dict]: [{"page": 페이지 번호(1부터), "content": 텍스트}]
+    """
+    from pypdf import PdfReader
+
+    reader = PdfReader(pdf_path)
+    return [
+        {"page": i + 1, "content": page.extract_text() or ""}
+        for i, page in enumerate(reader.pages)
+    ]
+
+
+def _make_splitter(splitter_options: Optional[Dict]):
+    if not splitter_options:
+        return None
+    try:
+        from langchain_text_splitters import RecursiveCharacterTextSplitter
+    except ImportError:
+        from langchain.text_splitter import RecursiveCharacterTextSplitter
+    return RecursiveCharacterTextSplitter(length_function=len, **splitter_options)
+
+
+def _worker_main(task_queue, result_queue, extract_fn, splitter_options):
+    """워커 프로세스 루프 (None 수신 시 종료)"""
+    splitter = None
+    splitter_error = None
+    try:
+        splitter = _make_splitter(splitter_options)
+    except Exception as e:
+        splitter_error = f"{type(e).__name__}: {e}"
+
+    while True:
+        task = task_queue.get()
+        if task is None:
+            break
+
+        task_id, pdf_path = task
+        result_queue.put(("start", task_id, os.getpid()))
+        started = time.perf_counter()
+
+        try:
+            if splitter_error:
+                raise RuntimeError(splitter_error)
+
+            pages = extract_fn(pdf_path)
+            chunks = None
+            if splitter is not None:
+                chunks = [
+                    (page["page"], text.replace("\x00", ""))
+                    for page in pages
+                    for text in splitter.split_text(page["content"])
+                ]
+            result_queue.put(("done", task_id, pages, chunks, None, time.perf_counter() - started))
+        except Exception as e:
+            result_queue.put(("done", task_id, None, None, f"{type(e).__name__}: {e}", time.perf_counter() - started))
+
+
+class ParallelPDFExtractor:
+    """
+    프로세스 풀 PDF 추출기
+
+    사용 예:
+        extractor = ParallelPDFExtractor(workers=8, file_timeout=120,
+                                         splitter_options={"chunk_size": 1500, "chunk_overlap": 200})
+        for doc in extractor.iter_documents(pdf_paths):
+            if doc.ok:
+                ...  # doc.chunks → 임베딩 단계로 전달
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        file_timeout: float = 300.0,
+        queue_size: int = 16,
+        splitter_options: Optional[Dict] = None,
+        extract_fn: Callable[[str], List[Dict]] = extract_pdf_pages,
+        lost_timeout: float = 30.0
+    ):
+        """
+        Args:
+            workers: 워커 프로세스 수 (None이면 CPU 코어 수)
+            file_timeout: 파일당 최대 처리 시간 (초, 초과 시 워커 교체 후 실패 처리)
+            queue_size: 결과 큐 크기 (소비 단계가 느리면 워커 대기)
+            splitter_options: RecursiveCharacterTextSplitter 인자 (None이면 페이지 텍스트만 반환)
+            extract_fn: 페이지 추출 함수 (모듈 최상위 함수여야 함)
+            lost_timeout: 처리 중 파일 없이 결과 수신이 끊긴 상태 허용 시간 (초, 초과 시 남은 파일 유실 처리)
+        """
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.file_timeout = file_timeout
+        self.queue_size = max(1, queue_size)
+        self.splitter_options = splitter_options
+        self.extract_fn = extract_fn
+        self.lost_timeout = lost_timeout
+
+    def _spawn(self, ctx, task_queue, result_queue):
+        process = ctx.Process(
+            target=_worker_main,
+            args=(task_queue, result_queue, self.extract_fn, self.splitter_options),
+            daemon=True
+        )
+        process.start()
+        return process
+
+    def iter_documents(self, pdf_paths: Iterable[str]) -> Iterator[ExtractedDocument]:
+        """
+        완료 순서대로 추출 결과 스트리밍
+
+        Args:
+            pdf_paths: PDF 파일 경로 이터러블
+
+        Yields:
+            ExtractedDocument: 파일 단위 결과 (실패/타임아웃 포함, 입력 파일 수만큼)
+        """
+        paths = [str(p) for p in pdf_paths]
+        if not paths:
+            return
+
+        ctx = multiprocessing.get_context()
+        task_queue = ctx.Queue()
+        result_queue = ctx.Queue(maxsize=self.queue_size)
+
+        for task_id, path in enumerate(paths):
+            task_queue.put((task_id, path))
+
+        worker_count = min(self.workers, len(paths))
+        processes = {}
+        for _ in range(worker_count):
+            process = self._spawn(ctx, task_queue, result_queue)
+            processes[process.pid] = process
+
+        # task_id → (pid, 시작 시각, 시작 시점의 누적 일시정지 시간)
+        running: Dict[int, Tuple[int, float, float]] = {}
+        finished = set()
+        # 소비자가 결과를 처리하는 동안(yield 중)은 타임아웃 시간에서 제외
+        paused_total = 0.0
+        # 마지막 진행(메시지 수신·워커 교체·yield 복귀) 시각 — 결과 유실 감지용
+        last_progress = time.monotonic()
+
+        try:
+            while len(finished) < len(paths):
+                try:
+                    message = result_queue.get(timeout=0.5)
+                except queue.Empty:
+                    message = None
+
+                result = None
+                if message is not None:
+                    last_progress = time.monotonic()
+                if message is not None and message[1] not in finished:
+                    if message[0] == "start":
+                        _, task_id, pid = message
+                        running[task_id] = (pid, time.monotonic(), paused_total)
+                    else:
+                        _, task_id, pages, chunks, error, elapsed = message
+                        running.pop(task_id, None)
+                        finished.add(task_id)
+                        result = ExtractedDocument(
+                            pdf_path=paths[task_id],
+                            pages=pages or [],
+                            chunks=chunks,
+                            error=error,
+                            elapsed_seconds=round(elapsed, 3)
+                        )
+
+                if result is None:
+                    result = self._reap_stuck_worker(ctx, task_queue, result_queue, processes, running, finished, paths, paused_total)
+
+                if result is not None:
+                    paused_at = time.monotonic()
+                    yield result
+                    paused_total += time.monotonic() - paused_at
+                    last_progress = time.monotonic()
+                elif not running and time.monotonic() - last_progress > self.lost_timeout:
+                    # 처리 중 파일 없음 + 결과 수신 끊김 → 시작 신호 전 종료된 워커가 가져간 작업
+                    for result in self._lost_documents(paths, finished):
+                        yield result
+                    last_progress = time.monotonic()
+
+        finally:
+            for _ in processes:
+                task_queue.put(None)
+            deadline = time.monotonic() + 5
+            for process in processes.values():
+                process.join(timeout=max(0.0, deadline - time.monotonic()))
+                if process.is_alive():
+                    process.terminate()
+            task_queue.cancel_join_thread()
+            result_queue.cancel_join_thread()
+
+    def _lost_documents(self, paths, finished) -> List[ExtractedDocument]:
+        """
+        결과가 돌아오지 않는 남은 파일을 실패로 확정 (이후 늦게 도착한 메시지는 무시)
+        """
+        lost = [task_id for task_id in range(len(paths)) if task_id not in finished]
+        finished.update(lost)
+        error = f"WorkerLost: {self.lost_timeout:.0f}초 동안 결과 없음"
+        for task_id in lost:
+            print(f"⚠️ PDF 추출 실패 (결과 유실): {os.path.basename(paths[task_id])} - {error}")
+        return [ExtractedDocument(pdf_path=paths[task_id], error=error) for task_id in lost]
+
+    def _reap_stuck_worker(self, ctx, task_queue, result_queue, processes, running, finished, paths, paused_total):
+        """
+        타임아웃 초과 또는 비정상 종료된 워커를 교체하고 해당 파일을 실패로 반환
+        """
+        now = time.monotonic()
+
+        for task_id, (pid, started, paused_at_start) in list(running.items()):
+            process = processes.get(pid)
+            elapsed = now - started - (paused_total - paused_at_start)
+
+            if process is not None and process.is_alive() and elapsed <= self.file_timeout:
+                continue
+
+            if process is not None and process.is_alive():
+                process.kill()
+                process.join(timeout=5)
+                error = f"TimeoutError: {self.file_timeout:.0f}초 초과"
+            else:
+                error = f"WorkerCrashed: exitcode={getattr(process, 'exitcode', None)}"
+
+            processes.pop(pid, None)
+            replacement = self._spawn(ctx, task_queue, result_queue)
+            processes[replacement.pid] = replacement
+
+            running.pop(task_id, None)
+            finished.add(task_id)
+            print(f"⚠️ PDF 추출 실패 (워커 교체): {os.path.basename(paths[task_id])} - {error}")
+
+            return ExtractedDocument(
+                pdf_path=paths[task_id],
+                error=error,
+                elapsed_seconds=round(elapsed, 3)
+            )
+
+        # 작업 없이 종료된 워커도 교체 (워커 수 유지)
+        busy = {pid for pid, _, _ in running.values()}
+        for pid, process in list(processes.items()):
+            if pid not in busy and not process.is_alive() and process.exitcode not in (0, None):
+                processes.pop(pid)
+                replacement = self._spawn(ctx, task_queue, result_queue)
+                processes[replacement.pid] = replacement
+
+        return None
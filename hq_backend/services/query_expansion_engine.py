@@ -10,10 +10,20 @@ Query Expansion Engine (질의 확장 엔진)
 import os
 import json
 import re
+import tempfile
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 
+try:
+    from hq_backend.services.term_automaton import TermAutomaton
+except ImportError:
+    from services.term_automaton import TermAutomaton
+
+# 용어 오토마톤 디스크 캐시 — 소스 트리 밖(임시 디렉터리) 기본, 환경변수로 재지정
+_AUTOMATON_CACHE_PATH = os.environ.get("GK_GLOSSARY_AUTOMATON_CACHE_PATH", "") or os.path.join(
+    tempfile.gettempdir(), "gk_glossary.automaton.json")
+
 
 @dataclass
 class ExpandedQuery:
@@ -60,10 +70,12 @@ class QueryExpansionEngine:
         "세금 아끼는": ["절세", "세액공제", "소득공제"]
     }
     
-    def __init__(self, glossary_path: Optional[str] = None):
+    def __init__(self, glossary_path: Optional[str] = None, automaton_cache_path: Optional[str] = None):
         """
         Args:
             glossary_path: glossary.json 파일 경로
+            automaton_cache_path: 용어 오토마톤 캐시 경로
+                (None이면 _AUTOMATON_CACHE_PATH — 임시 디렉터리 / GK_GLOSSARY_AUTOMATON_CACHE_PATH)
         """
         # glossary.json 경로 설정
         if glossary_path is None:
@@ -77,6 +89,11 @@ class QueryExpansionEngine:
         
         # 용어 인덱스 생성 (빠른 검색용)
         self.term_index = self._build_term_index()
+        
+        # 용어 + 구어체 다중 패턴 오토마톤 (질의 1회 스캔)
+        if automaton_cache_path is None:
+            automaton_cache_path = _AUTOMATON_CACHE_PATH
+        self.term_automaton = self._build_term_automaton(Path(automaton_cache_path))
     
     def _load_glossary(self) -> List[Dict]:
         """
@@ -117,29 +134,70 @@ class QueryExpansionEngine:
         
         return index
     
-    def extract_terms_from_query(self, query: str) -> List[Dict[str, str]]:
+    def _build_term_automaton(self, cache_path: Path) -> TermAutomaton:
         """
-        쿼리에서 용어 추출
+        glossary 용어/동의어 + 구어체 표현 오토마톤 생성
+        
+        glossary.json 내용 또는 구어체 매핑이 바뀐 경우에만 재컴파일하고
+        그 외에는 디스크 캐시를 로드
+        
+        Returns:
+            TermAutomaton: 패턴 번호 = [term_index 키..., 구어체 키...] 순서
+        """
+        self._term_keys = list(self.term_index)
+        self._colloquial_keys = list(self.COLLOQUIAL_MAPPING)
+        patterns = self._term_keys + [key.lower() for key in self._colloquial_keys]
+        
+        glossary_bytes = self.glossary_path.read_bytes() if self.glossary_path.exists() else b""
+        signature = TermAutomaton.signature(
+            glossary_bytes,
+            json.dumps(self.COLLOQUIAL_MAPPING, ensure_ascii=False, sort_keys=True)
+        )
+        
+        return TermAutomaton.load_or_build(patterns, signature, cache_path)
+    
+    def match_query(self, query: str) -> Tuple[List[Dict[str, str]], List[str]]:
+        """
+        질의 1회 스캔으로 glossary 용어와 구어체 확장을 동시에 추출
         
         Args:
             query: 사용자 질문
         
         Returns:
-            List[Dict[str, str]]: 매칭된 용어 리스트
+            Tuple: (매칭된 용어 리스트, 확장된 전문 용어 리스트)
         """
         matched_terms = []
-        query_lower = query.lower()
+        expanded_terms = []
+        term_count = len(self._term_keys)
         
-        # glossary 용어 매칭
-        for term, entry in self.term_index.items():
-            if term in query_lower:
+        # 패턴 번호 순 = term_index / COLLOQUIAL_MAPPING 정의 순
+        for pattern_id in sorted(self.term_automaton.find(query.lower())):
+            if pattern_id < term_count:
+                term = self._term_keys[pattern_id]
+                entry = self.term_index[term]
                 matched_terms.append({
                     "matched_text": term,
                     "standard_term": entry["term"],
                     "definition": entry["definition"],
                     "synonyms": entry.get("synonyms", [])
                 })
+            else:
+                colloquial = self._colloquial_keys[pattern_id - term_count]
+                expanded_terms.extend(self.COLLOQUIAL_MAPPING[colloquial])
         
+        return matched_terms, expanded_terms
+    
+    def extract_terms_from_query(self, query: str) -> List[Dict[str, str]]:
+        """
+        쿼리에서 용어 추출
+        
+        Args:
+            query: 사용자 질문
+        
+        Returns:
+            List[Dict[str, str]]: 매칭된 용어 리스트
+        """
+        matched_terms, _ = self.match_query(query)
         return matched_terms
     
     def expand_colloquial_terms(self, query: str) -> List[str]:
@@ -152,12 +210,7 @@ class QueryExpansionEngine:
         Returns:
             List[str]: 확장된 전문 용어 리스트
         """
-        expanded_terms = []
-        
-        for colloquial, professional_terms in self.COLLOQUIAL_MAPPING.items():
-            if colloquial in query:
-                expanded_terms.extend(professional_terms)
-        
+        _, expanded_terms = self.match_query(query)
         return expanded_terms
     
     def extract_meta_keywords(
@@ -201,11 +254,8 @@ class QueryExpansionEngine:
         Returns:
             ExpandedQuery: 확장된 쿼리 결과
         """
-        # 1. glossary 용어 매칭
-        matched_terms = self.extract_terms_from_query(query)
-        
-        # 2. 구어체 → 전문 용어 확장
-        colloquial_expansions = self.expand_colloquial_terms(query)
+        # 1~2. glossary 용어 매칭 + 구어체 → 전문 용어 확장 (1회 스캔)
+        matched_terms, colloquial_expansions = self.match_query(query)
         
         # 3. 메타 키워드 추출
         meta_keywords = self.extract_meta_keywords(matched_terms, colloquial_expansions)
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""
+Term Automaton (Aho–Corasick 다중 패턴 매칭)
+glossary 용어·동의어 및 구어체 표현을 한 번의 질의 스캔으로 모두 찾기
+
+작성일: 2026-10-17
+목적: 용어 사전 크기와 무관하게 질의 길이에 비례하는 용어 추출 비용 확보
+
+핵심 동작:
+1. 패턴 집합 → goto/fail/output 테이블 컴파일 (최초 1회)
+2. 컴파일 결과를 JSON으로 디스크 캐시, 서명(원본 해시)이 바뀔 때만 재생성
+3. find(text) 한 번으로 겹치는 매칭까지 모두 반환
+"""
+
+import json
+import hashlib
+from pathlib import Path
+from collections import deque
+from typing import List, Dict, Optional, Union
+
+
+class TermAutomaton:
+    """
+    Aho–Corasick 오토마톤
+
+    사용 예:
+        automaton = TermAutomaton(["특약", "특별약관", "갱신형"])
+        automaton.find("특별약관 갱신형")  # → [1, 2] (패턴 번호, 등장 순서)
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, patterns: List[str]):
+        """
+        Args:
+            patterns: 검색할 패턴 리스트 (번호 = 리스트 인덱스)
+        """
+        self.patterns = list(patterns)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        self._compile()
+
+    def _compile(self):
+        # 1. 트라이 구성
+        for pattern_id, pattern in enumerate(self.patterns):
+            if not pattern:
+                continue
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = next_state
+            self._out[state].append(pattern_id)
+
+        # 2. BFS로 실패 링크 계산 + 출력 병합
+        pending = deque(self._goto[0].values())
+        while pending:
+            state = pending.popleft()
+            for char, next_state in self._goto[state].items():
+                pending.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._out[next_state] = self._out[next_state] + self._out[self._fail[next_state]]
+
+    @property
+    def state_count(self) -> int:
+        return len(self._goto)
+
+    def find(self, text: str) -> List[int]:
+        """
+        텍스트에 등장하는 패턴 번호 (중복 제거, 최초 등장 순서)
+
+        Args:
+            text: 검색 대상 문자열
+
+        Returns:
+            List[int]: 매칭된 패턴 번호 리스트
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        found: Dict[int, None] = {}
+        state = 0
+
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for pattern_id in out[state]:
+                found.setdefault(pattern_id, None)
+
+        return list(found)
+
+    # ──────────────────────────────────────────────────────────────────────
+    # 디스크 캐시
+    # ──────────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def signature(*sources: Union[str, bytes]) -> str:
+        """원본 데이터(파일 내용 등)로부터 캐시 서명 생성"""
+        digest = hashlib.sha256(str(TermAutomaton.FORMAT_VERSION).encode())
+        for source in sources:
+            digest.update(source if isinstance(source, bytes) else source.encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    def save(self, path: Union[str, Path], signature: str):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "signature": signature,
+            "patterns": self.patterns,
+            "goto": self._goto,
+            "fail": self._fail,
+            "out": self._out
+        }
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path], signature: str) -> Optional["TermAutomaton"]:
+        """
+        캐시 로드 (파일 없음/서명 불일치/손상 시 None)
+        """
+        path = Path(path)
+        if not path.exists():
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("signature") != signature:
+                return None
+            automaton = cls.__new__(cls)
+            automaton.patterns = data["patterns"]
+            automaton._goto = data["goto"]
+            automaton._fail = data["fail"]
+            automaton._out = data["out"]
+            return automaton
+        except (OSError, ValueError, KeyError) as e:
+            print(f"⚠️ 용어 오토마톤 캐시 로드 실패 (재생성): {e}")
+            return None
+
+    @classmethod
+    def load_or_build(
+        cls,
+        patterns: List[str],
+        signature: str,
+        cache_path: Optional[Union[str, Path]] = None
+    ) -> "TermAutomaton":
+        """
+        캐시가 유효하면 로드, 아니면 컴파일 후 캐시 저장
+
+        Args:
+            patterns: 패턴 리스트
+            signature: 원본 서명 (TermAutomaton.signature)
+            cache_path: 캐시 파일 경로 (None이면 캐시 미사용)
+        """
+        if cache_path is not None:
+            cached = cls.load(cache_path, signature)
+            if cached is not None and cached.patterns == list(patterns):
+                return cached
+
+        automaton = cls(patterns)
+        if cache_path is not None:
+            try:
+                automaton.save(cache_path, signature)
+            except OSError as e:
+                print(f"⚠️ 용어 오토마톤 캐시 저장 실패: {e}")
+        return automaton
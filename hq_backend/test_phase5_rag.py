@@ -142,7 +142,9 @@ def test_rag_engine():
             if result["sources"]:
                 print(f"\n출처:")
                 for source in result["sources"]:
-                    print(f"  - {source['document']} (페이지 {source['page']}, 유사도: {source['similarity']:.2f})")
+                    sim = source['similarity']
+                    sim_text = f"유사도: {sim:.2f}" if sim is not None else "키워드 일치"
+                    print(f"  - {source['document']} (페이지 {source['page']}, {sim_text})")
             
             results.append(result)
         
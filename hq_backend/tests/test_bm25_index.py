@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+Korean BM25 Index 테스트
+n-gram 토큰화, 카테고리 필터, RRF 결합, 정확 용어 질의 판별, 비활성 청크 제외 검증
+
+작성일: 2026-10-17
+목적: 하이브리드 검색의 키워드 경로 정확성 보장
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from hq_backend.services.bm25_index import (
+    KoreanBM25Index,
+    tokenize,
+    reciprocal_rank_fusion,
+    is_exact_term_query
+)
+
+
+ROWS = [
+    {"id": "1", "document_name": "뇌혈관.pdf", "document_category": "상해보험", "source_page": 3,
+     "content": "뇌경색증(I63.9) 진단 시 뇌혈관질환 진단비를 지급합니다."},
+    {"id": "2", "document_name": "암보험.pdf", "document_category": "암보험", "source_page": 1,
+     "content": "결장암(C18)으로 진단 확정 시 암진단금을 지급합니다. 유사암은 제외됩니다."},
+    {"id": "3", "document_name": "암보험.pdf", "document_category": "암보험", "source_page": 7,
+     "content": "표적항암약물허가치료비 특약은 갱신형으로 운영됩니다."},
+    {"id": "4", "document_name": "법인.pdf", "document_category": "법인컨설팅", "source_page": 2,
+     "content": "가업승계 시 상속세 절세 방안과 임원 퇴직금 규정을 정비합니다."},
+]
+
+
+def test_tokenize_is_spacing_insensitive_and_keeps_codes():
+    """띄어쓰기와 무관한 한글 bigram, KCD 코드는 통째로 유지"""
+    assert tokenize("암 진단금") == tokenize("암진단금") == ["암진", "진단", "단금"]
+    assert "i63.9" in tokenize("뇌경색(I63.9)")
+    assert "c18" in tokenize("C18 결장암")
+
+
+def test_search_ranks_exact_code_and_filters_category():
+    """코드 질의 최상위 일치 + 카테고리 필터 적용"""
+    index = KoreanBM25Index(ROWS)
+
+    hits = index.search("I63.9", top_k=3)
+    assert hits[0]["id"] == "1" and hits[0]["coverage"] == 1.0
+
+    hits = index.search("암 진단금", category="암보험")
+    assert hits[0]["id"] == "2"
+    assert all(h["document_category"] == "암보험" for h in hits)
+    assert index.search("암 진단금", category="없는카테고리") == []
+
+
+def test_expansion_terms_recall_without_query_overlap():
+    """원 질의에 없는 용어도 확장 키워드로 낮은 가중치 검색"""
+    index = KoreanBM25Index(ROWS)
+
+    assert index.search("세금 아끼는 법") == []
+    hits = index.search("세금 아끼는 법", expansions=["절세"])
+    assert hits[0]["id"] == "4" and hits[0]["coverage"] == 0.0
+
+
+def test_reciprocal_rank_fusion_merges_lists():
+    """양쪽 목록에 모두 등장한 문서가 상위로 결합"""
+    vector = [{"id": "a", "similarity": 0.9}, {"id": "b", "similarity": 0.8}]
+    keyword = [{"id": "b", "bm25_score": 5.0}, {"id": "c", "bm25_score": 3.0}]
+
+    fused = reciprocal_rank_fusion([vector, keyword])
+
+    assert [d["id"] for d in fused] == ["b", "a", "c"]
+    assert fused[0]["similarity"] == 0.8 and fused[0]["bm25_score"] == 5.0
+
+
+def test_exact_term_query_detection():
+    assert is_exact_term_query("I63.9 보장돼?")
+    assert is_exact_term_query("'표적항암약물허가치료비' 특약 갱신 주기가 어떻게 되나요")
+    assert is_exact_term_query("암 진단금")
+    assert not is_exact_term_query("법인 대표가 퇴직할 때 세금을 줄이는 방법이 있을까요")
+
+
+def test_kcd_code_detected_next_to_hangul_but_not_inside_tokens():
+    """한글·괄호에 붙은 KCD 코드 인식, 영숫자 중간·긴 숫자열은 코드 아님"""
+    assert is_exact_term_query("뇌경색I63.9 진단 시 보험금 지급 기준이 궁금합니다")
+    assert is_exact_term_query("결장암(C18)도 일반암으로 분류되어 보장받을 수 있나요")
+    assert not is_exact_term_query("증권번호 AB123 계약 해지 환급금을 알려주세요")
+    assert not is_exact_term_query("상품코드 C1234 계약 해지 환급금을 알려주세요")
+
+
+class _FakeQuery:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def select(self, columns):
+        return self
+
+    def range(self, start, end):
+        self.window = (start, end)
+        return self
+
+    def execute(self):
+        start, end = self.window
+        return type("R", (), {"data": self.rows[start:end + 1]})()
+
+
+def test_from_supabase_skips_inactive_chunks():
+    """is_active=false(이전 버전) 청크 제외 — NULL(마이그레이션 전)은 활성으로 간주"""
+    rows = [dict(r, is_active=flag) for r, flag in zip(ROWS, (True, False, None, True))]
+    fake = type("SB", (), {"table": lambda self, _name: _FakeQuery(rows)})()
+    index = KoreanBM25Index.from_supabase(fake)
+    assert [r["id"] for r in index.rows] == ["1", "3", "4"]
+    assert index.search("결장암") == []
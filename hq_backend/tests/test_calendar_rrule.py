@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""
+반복 일정(RRULE 마스터 1행) 지연 전개 테스트
+회차 전개가 dateutil.rrule 과 같은지, EXDATE·ICS 회차 수정본(RECURRENCE-ID)이 반영되는지,
+db_utils 일정 로더(월간 뷰·오늘 브리핑)가 DTSTART 이후 회차를 돌려주는지,
+ICS TZID 시각 변환·미지원 반복 규칙 제외·재가져오기 시 생성일(created_at) 유지 검증
+
+작성일: 2026-10-17
+목적: 반복 일정 저장 방식을 회차별 행 → 마스터 1행으로 바꾼 뒤에도 모든 조회 경로의 결과가 동일함을 보장
+"""
+
+import sys
+import random
+import datetime
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import calendar_engine as ce
+import db_utils
+
+rrule_mod = pytest.importorskip("dateutil.rrule")
+
+_FREQS = {"DAILY": rrule_mod.DAILY, "WEEKLY": rrule_mod.WEEKLY,
+          "MONTHLY": rrule_mod.MONTHLY, "YEARLY": rrule_mod.YEARLY}
+_DAYS = [rrule_mod.MO, rrule_mod.TU, rrule_mod.WE, rrule_mod.TH, rrule_mod.FR, rrule_mod.SA, rrule_mod.SU]
+
+
+def _random_rule(rng):
+    freq = rng.choice(list(_FREQS))
+    parts = [f"FREQ={freq}", f"INTERVAL={rng.randint(1, 4)}"]
+    byday = []
+    if freq == "WEEKLY" and rng.random() < 0.6:
+        byday = sorted(rng.sample(range(7), rng.randint(1, 3)))
+        parts.append("BYDAY=" + ",".join(ce._BYDAY[d] for d in byday))
+    roll = rng.random()
+    count = until = None
+    if roll < 0.35:
+        count = rng.randint(1, 40)
+        parts.append(f"COUNT={count}")
+    elif roll < 0.7:
+        until = datetime.date(2026, 1, 1) + datetime.timedelta(days=rng.randint(0, 900))
+        parts.append("UNTIL=" + until.strftime("%Y%m%d"))
+    return ";".join(parts), freq, byday, count, until
+
+
+def test_expansion_matches_dateutil():
+    """무작위 RRULE × 조회 창 — 전개 회차가 dateutil 과 동일 (월·연 반복은 말일 보정 없는 1~28일 시작)"""
+    rng = random.Random(7)
+    for _ in range(1500):
+        rule, freq, byday, count, until = _random_rule(rng)
+        dtstart = datetime.date(2025, rng.randint(1, 12), rng.randint(1, 28))
+        ws = dtstart + datetime.timedelta(days=rng.randint(-30, 700))
+        we = ws + datetime.timedelta(days=rng.randint(0, 120))
+
+        expected = rrule_mod.rrule(
+            _FREQS[freq], dtstart=datetime.datetime.combine(dtstart, datetime.time()),
+            interval=int(rule.split("INTERVAL=")[1].split(";")[0]), count=count,
+            until=datetime.datetime.combine(until, datetime.time()) if until else None,
+            byweekday=[_DAYS[d] for d in byday] or None, wkst=rrule_mod.MO,
+        ).between(datetime.datetime.combine(ws, datetime.time()),
+                  datetime.datetime.combine(we, datetime.time()), inc=True)
+
+        row = {"schedule_id": "s1", "date": dtstart.isoformat(), "rrule": rule}
+        got = [r["date"] for r in ce._expand_series(row, ws.isoformat(), we.isoformat())]
+        assert got == [d.date().isoformat() for d in expected], (rule, dtstart, ws, we)
+
+
+def test_month_end_clamp_and_exdates():
+    """31일 월 반복은 말일 보정, EXDATE 회차 제외, 회차 ID = 마스터ID@날짜"""
+    row = {"schedule_id": "m1", "date": "2026-01-31", "rrule": "FREQ=MONTHLY;COUNT=4",
+           "exdates": ["2026-03-31"]}
+    got = ce._expand_series(row, "2026-01-01", "2026-12-31")
+    assert [r["date"] for r in got] == ["2026-01-31", "2026-02-28", "2026-04-30"]
+    assert got[1]["schedule_id"] == "m1@2026-02-28" and got[1]["series_id"] == "m1"
+    assert ce._rrule_until("FREQ=MONTHLY;COUNT=4", "2026-01-31") == "2026-04-30"
+
+
+def test_ics_override_replaces_occurrence(monkeypatch):
+    """RECURRENCE-ID 수정본은 단건으로, 원래 회차는 마스터 exdates 로 제외"""
+    monkeypatch.setattr(ce, "_get_sb", lambda: None)
+    monkeypatch.setattr(ce.st, "session_state", {}, raising=False)
+    ics = [
+        "BEGIN:VCALENDAR",
+        "BEGIN:VEVENT", "UID:weekly-1", "SUMMARY:주간 회의",
+        "DTSTART:20260105T010000Z", "DTEND:20260105T020000Z",
+        "RRULE:FREQ=WEEKLY;COUNT=4", "EXDATE:20260119T010000Z", "END:VEVENT",
+        "BEGIN:VEVENT", "UID:weekly-1", "SUMMARY:주간 회의 (변경)",
+        "RECURRENCE-ID:20260112T010000Z",
+        "DTSTART:20260113T050000Z", "DTEND:20260113T060000Z", "END:VEVENT",
+        "END:VCALENDAR",
+    ]
+    report = ce.cal_import_ics("a1", iter(ics))
+    assert report["events"] == 2
+
+    got = [(e["date"], e["title"], e["start_time"]) for e in ce.cal_load_range("a1", "2026-01-01", "2026-01-31")]
+    assert got == [("2026-01-05", "주간 회의", "10:00"),
+                   ("2026-01-13", "주간 회의 (변경)", "14:00"),
+                   ("2026-01-26", "주간 회의", "10:00")]
+
+
+class _FakeScheduleQuery:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def __getattr__(self, _name):
+        return lambda *a, **k: self
+
+    def execute(self):
+        return type("R", (), {"data": [dict(r) for r in self.rows]})()
+
+
+def test_db_utils_loaders_expand_series(monkeypatch):
+    """월간 뷰(load_schedules_range)·오늘 브리핑(load_schedules) 모두 DTSTART 이후 회차 포함"""
+    rows = [
+        {"schedule_id": "m1", "date": "2026-03-02", "start_time": "09:00", "title": "주간 점검",
+         "rrule": "FREQ=WEEKLY;BYDAY=MO,TH", "rrule_until": None, "exdates": ["2026-03-12"]},
+        {"schedule_id": "s1", "date": "2026-03-16", "start_time": "08:00", "title": "단건", "rrule": None},
+    ]
+    fake = type("SB", (), {"table": lambda self, _name: _FakeScheduleQuery(rows)})()
+    monkeypatch.setattr(db_utils, "_get_sb", lambda: fake)
+
+    month = db_utils.load_schedules_range("a1", "2026-03-01", "2026-03-16")
+    assert [(r["date"], r["schedule_id"]) for r in month] == [
+        ("2026-03-02", "m1@2026-03-02"), ("2026-03-05", "m1@2026-03-05"),
+        ("2026-03-09", "m1@2026-03-09"), ("2026-03-16", "s1"), ("2026-03-16", "m1@2026-03-16"),
+    ]
+    assert [r["schedule_id"] for r in db_utils.load_schedules("a1", "2026-03-19")] == ["m1@2026-03-19"]
+
+
+def test_ics_tzid_converted_and_unsupported_rrule_skipped(monkeypatch):
+    """TZID 현지 시각 → KST 변환, 재현 불가 RRULE 시리즈는 단건으로 남기지 않음"""
+    monkeypatch.setattr(ce, "_get_sb", lambda: None)
+    monkeypatch.setattr(ce.st, "session_state", {}, raising=False)
+    ics = [
+        "BEGIN:VCALENDAR",
+        "BEGIN:VEVENT", "UID:ny-1", "SUMMARY:뉴욕 미팅",
+        "DTSTART;TZID=America/New_York:20260105T200000",
+        "DTEND;TZID=America/New_York:20260105T210000", "END:VEVENT",
+        "BEGIN:VEVENT", "UID:monthly-1", "SUMMARY:둘째 화요일",
+        "DTSTART;TZID=Asia/Seoul:20260113T090000", "RRULE:FREQ=MONTHLY;BYDAY=2TU", "END:VEVENT",
+        "BEGIN:VEVENT", "UID:win-1", "SUMMARY:윈도우 표기",
+        "DTSTART;TZID=Korea Standard Time:20260107T090000", "END:VEVENT",
+        "END:VCALENDAR",
+    ]
+    stats: dict = {}
+    got = [(e["uid"], e["date"], e["start_time"], e["end_time"]) for e in ce.iter_ics_events(iter(ics), "a1", stats)]
+    assert got == [("ny-1", "2026-01-06", "10:00", "11:00"), ("win-1", "2026-01-07", "09:00", "09:00")]
+    assert stats["unsupported_rrule"] == 1
+
+
+class _FakeScheduleTable:
+    """gk_schedules upsert / select.in_ 최소 구현 (schedule_id 키 저장소)"""
+
+    def __init__(self, store):
+        self.store, self.op, self.payload, self.ids = store, "select", None, []
+
+    def select(self, *_):
+        return self
+
+    def in_(self, _col, ids):
+        self.ids = ids
+        return self
+
+    def upsert(self, rows, **_):
+        self.op, self.payload = "upsert", rows
+        return self
+
+    def execute(self):
+        if self.op == "upsert":
+            for r in self.payload:
+                self.store[r["schedule_id"]] = dict(self.store.get(r["schedule_id"], {}), **r)
+            return type("R", (), {"data": []})()
+        return type("R", (), {"data": [dict(self.store[i]) for i in self.ids if i in self.store]})()
+
+
+def test_ics_reimport_keeps_created_at(monkeypatch):
+    """같은 .ics 재가져오기 — 결정적 schedule_id 행의 created_at 은 최초 가져오기 값 유지"""
+    store: dict = {}
+    fake = type("SB", (), {"table": lambda self, _name: _FakeScheduleTable(store)})()
+    monkeypatch.setattr(ce, "_get_sb", lambda: fake)
+    monkeypatch.setattr(db_utils, "_get_sb", lambda: fake)
+    monkeypatch.setattr(ce.st, "session_state", {}, raising=False)
+    ics = ["BEGIN:VCALENDAR", "BEGIN:VEVENT", "UID:once-1", "SUMMARY:상담",
+           "DTSTART:20260105T010000Z", "END:VEVENT", "END:VCALENDAR"]
+
+    assert ce.cal_import_ics("a1", iter(ics))["written"] == 1
+    (sid, row), = store.items()
+    row["created_at"] = "2026-01-01T00:00:00"
+
+    assert ce.cal_import_ics("a1", iter(ics))["written"] == 1
+    assert store[sid]["created_at"] == "2026-01-01T00:00:00"
+    assert store[sid]["updated_at"] > "2026-01-01T00:00:00"
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+Coverage Taxonomy Resolver 테스트
+통합 인덱스 1회 조회 결과가 세 엔진(KB 매핑·16대 매핑·수술비 키워드)의 개별 결과와 같은지,
+영구 캐시가 세션 간 재사용되고 분류표 변경 시 폐기되는지, 파일 기록이 묶음 단위로 이뤄지는지 검증
+
+작성일: 2026-10-17
+목적: 가족 통합 분석의 담보명 분류를 단일 리졸버로 대체해도 결과가 동일함을 보장
+"""
+
+import sys
+import json
+import random
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from engines import kb_policy_mapper, surgery_classifier
+from hq_backend.services import coverage_taxonomy_resolver as ctr
+from hq_backend.services.coverage_taxonomy_resolver import (
+    CoverageTaxonomyResolver,
+    load_mapping_16,
+)
+
+
+def legacy_category_16(mapping, name, company):
+    """기존 CoverageCalculator.map_to_16_categories 카테고리 선택 (카테고리 × 보험사 × 키워드 순차)"""
+    for category, data in mapping["mappings"].items():
+        if name in data["insurance_companies"].get(company, []):
+            return category
+        if any(keyword in name for keyword in data["keywords"]):
+            return category
+    return "기타"
+
+
+def _corpus(mapping, size=2000):
+    names = set(kb_policy_mapper._EXACT_DICT)
+    names.update(surgery_classifier.INJURY_KEYWORDS + surgery_classifier.DISEASE_KEYWORDS)
+    for data in mapping["mappings"].values():
+        names.update(data["keywords"])
+        for company_names in data["insurance_companies"].values():
+            names.update(company_names)
+    names = sorted(names)
+    rng = random.Random(11)
+    suffixes = ["", "수술비", "(갱신형)", " Death", "상해", "진단비"]
+    return names + [rng.choice(names) + rng.choice(suffixes) for _ in range(size)]
+
+
+def test_single_lookup_matches_each_engine():
+    """KB·16대·수술비 분류 모두 기존 개별 함수와 동일"""
+    mapping = load_mapping_16()
+    resolver = CoverageTaxonomyResolver(mapping, cache_path=None)
+    companies = list(next(iter(mapping["mappings"].values()))["insurance_companies"]) + ["미등록보험사", None]
+
+    for name in _corpus(mapping):
+        taxonomy = resolver.resolve(name)
+        assert (taxonomy.kb_category, taxonomy.kb_weight, taxonomy.kb_display) == kb_policy_mapper.map_coverage(name)
+        assert (taxonomy.surgery_type, taxonomy.surgery_confidence) == surgery_classifier.classify_by_keyword(name)
+        assert taxonomy.is_surgery == any(kw in name for kw in surgery_classifier.SURGERY_FILTER_KEYWORDS)
+        for company in companies:
+            expected = legacy_category_16(mapping, name, company or "")
+            assert resolver.resolve(name, company).category_16 == expected, (name, company)
+
+
+def test_persistent_cache_reused_and_invalidated():
+    """새 프로세스(인스턴스)에서 캐시 재사용, 매핑표 변경 시 폐기"""
+    mapping = load_mapping_16()
+    names = ["일반암진단비", "질병수술비", "상해입원일당", "미등록담보"]
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = str(Path(tmp) / "taxonomy.json")
+
+        first = CoverageTaxonomyResolver(mapping, cache_path=cache_path)
+        expected = first.resolve_many(names)
+        first.flush()   # 종료 시(atexit) 기록과 동일
+        assert json.loads(Path(cache_path).read_text(encoding="utf-8"))["entries"].keys() == set(names)
+
+        second = CoverageTaxonomyResolver(mapping, cache_path=cache_path)
+        assert second.cached_count == len(names)
+        assert second.resolve_many(names) == expected
+
+        changed = json.loads(json.dumps(mapping))
+        first_category = next(iter(changed["mappings"]))
+        changed["mappings"][first_category]["keywords"].append("미등록")
+        third = CoverageTaxonomyResolver(changed, cache_path=cache_path)
+        assert third.cached_count == 0
+        assert third.resolve("미등록담보").category_16 == first_category
+
+
+def test_flush_is_batched(monkeypatch):
+    """resolve_many 마다 전체 재기록하지 않음 — 새 항목 건수 또는 경과 시간 기준으로만 기록"""
+    monkeypatch.setattr(ctr, "_FLUSH_MIN_NEW", 3)
+    monkeypatch.setattr(ctr, "_FLUSH_INTERVAL", 3600)
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = Path(tmp) / "taxonomy.json"
+        resolver = CoverageTaxonomyResolver(load_mapping_16(), cache_path=str(cache_path))
+
+        resolver.resolve_many(["일반암진단비", "질병수술비"])
+        assert not cache_path.exists()
+
+        resolver.resolve_many(["질병수술비", "상해입원일당"])
+        assert len(json.loads(cache_path.read_text(encoding="utf-8"))["entries"]) == 3
+
+        monkeypatch.setattr(ctr, "_FLUSH_INTERVAL", 0)
+        cache_path.write_text("{}", encoding="utf-8")
+        resolver.resolve_many(["상해입원일당"])   # 새 항목 없음 → 기록 생략
+        assert cache_path.read_text(encoding="utf-8") == "{}"
+        resolver.resolve_many(["미등록담보"])
+        assert len(json.loads(cache_path.read_text(encoding="utf-8"))["entries"]) == 4
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+고객 목록 키셋 페이지 순회 테스트
+CRM 고객 목록(HEAD API·db_utils 폴백)이 next_cursor 를 끝까지 따라가 200건에서 잘리지 않는지 검증
+
+작성일: 2026-10-17
+목적: 서버측 검색 도입 후에도 201번째 이후 고객이 고객 선택·캘린더·브리핑에서 사라지지 않음을 보장
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import db_utils
+import head_api_client
+import crm_data_fetchers
+
+PEOPLE = [{"person_id": f"p{i:04d}", "name": f"고객{i:04d}", "management_tier": 1} for i in range(730)]
+
+
+def _page(limit, cursor):
+    start = int(cursor["offset"]) if cursor else 0
+    items = PEOPLE[start:start + limit]
+    nxt = {"offset": start + limit} if start + limit < len(PEOPLE) else None
+    return items, nxt
+
+
+class _FakeRpc:
+    def __init__(self, calls):
+        self.calls = calls
+
+    def rpc(self, _name, params):
+        self.calls.append(params["p_limit"])
+        items, nxt = _page(params["p_limit"], params["p_cursor"])
+        data = {"items": items, "total_count": len(PEOPLE), "next_cursor": nxt}
+        return type("Q", (), {"execute": lambda self: type("R", (), {"data": data})()})()
+
+
+def test_api_listing_follows_next_cursor(monkeypatch):
+    """HEAD API 경로 — 페이지를 끝까지 모아 전체 고객 반환"""
+    calls = []
+
+    def fake_list(*, user_id, query, include_deleted, limit, cursor):
+        calls.append(cursor)
+        items, nxt = _page(limit, cursor)
+        return {"ok": True, "items": items, "next_cursor": nxt}
+
+    monkeypatch.setattr(head_api_client, "list_customer_records", fake_list)
+    rows = crm_data_fetchers.fetch_customers_for_agent("a1")
+    assert [r["person_id"] for r in rows] == [p["person_id"] for p in PEOPLE]
+    assert len(calls) == 2
+
+
+def test_api_failure_mid_listing_falls_back_to_full_db_listing(monkeypatch):
+    """두 번째 페이지 실패 시 부분 목록 대신 db_utils 전체 조회로 폴백"""
+    def flaky_list(*, user_id, query, include_deleted, limit, cursor):
+        if cursor:
+            return {"ok": False, "error": "timeout"}
+        items, nxt = _page(limit, cursor)
+        return {"ok": True, "items": items, "next_cursor": nxt}
+
+    calls = []
+    monkeypatch.setattr(head_api_client, "list_customer_records", flaky_list)
+    monkeypatch.setattr(db_utils, "_get_sb", lambda: _FakeRpc(calls))
+    rows = crm_data_fetchers.fetch_customers_for_agent("a1")
+    assert len(rows) == len(PEOPLE)
+    assert calls == [500, 500]
+
+
+def test_load_customers_limit_kept_by_default(monkeypatch):
+    """limit 지정(기본 200) 호출은 기존처럼 1페이지"""
+    calls = []
+    monkeypatch.setattr(db_utils, "_get_sb", lambda: _FakeRpc(calls))
+    assert len(db_utils.load_customers("a1")) == 200
+    assert calls == [200]
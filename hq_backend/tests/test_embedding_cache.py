@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+Embedding Cache 테스트
+콘텐츠 주소 기반 임베딩 캐시 재사용 및 LRU 축출 검증
+
+작성일: 2026-10-17
+목적: 동일 텍스트 재임베딩 방지 (OpenAI 호출 비용 절감)
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from hq_backend.services.embedding_cache import EmbeddingCache
+
+
+def _fake_embed(calls):
+    def embed(texts):
+        calls.append(list(texts))
+        return [[float(len(t)), 1.0, 0.5] for t in texts]
+    return embed
+
+
+def test_cache_reuses_normalized_text():
+    """정규화 후 동일한 텍스트는 API 재호출 없이 재사용"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = EmbeddingCache(db_path=str(Path(tmp) / "cache.sqlite3"))
+        calls = []
+
+        first = cache.get_or_embed("m", ["암 진단금", "특약"], _fake_embed(calls))
+        second = cache.get_or_embed("m", ["암  진단금 ", "특약", "갱신형"], _fake_embed(calls))
+
+        assert calls == [["암 진단금", "특약"], ["갱신형"]]
+        assert second[0] == first[0] and second[1] == first[1]
+
+        stats = cache.get_statistics()
+        assert stats["hits"] == 2 and stats["misses"] == 3
+        assert stats["entries"] == 3
+
+        # 모델이 다르면 별도 키
+        cache.get_or_embed("other-model", ["특약"], _fake_embed(calls))
+        assert calls[-1] == ["특약"]
+        cache.close()
+
+
+def test_cache_persists_and_evicts_lru():
+    """디스크 영속성 및 LRU 축출"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "cache.sqlite3")
+        cache = EmbeddingCache(db_path=path, max_entries=2)
+        calls = []
+
+        cache.get_or_embed("m", ["a"], _fake_embed(calls))
+        cache.get_or_embed("m", ["b"], _fake_embed(calls))
+        cache.get_many("m", ["a"])  # a 최근 사용
+        cache.get_or_embed("m", ["c"], _fake_embed(calls))  # b 축출
+        cache.close()
+
+        reopened = EmbeddingCache(db_path=path, max_entries=2)
+        assert reopened.get_many("m", ["a", "b", "c"])[1] is None
+        assert reopened.get_many("m", ["a"])[0] is not None
+        reopened.close()
+
+
+def test_default_path_is_outside_source_tree(monkeypatch):
+    """기본 캐시 DB 는 저장소 밖, EMBEDDING_CACHE_PATH 로 재지정"""
+    from hq_backend.services import embedding_cache as ec
+
+    monkeypatch.delenv("EMBEDDING_CACHE_PATH", raising=False)
+    assert not Path(ec._DEFAULT_DB_PATH).resolve().is_relative_to(project_root.resolve())
+
+    with tempfile.TemporaryDirectory() as tmp:
+        monkeypatch.setenv("EMBEDDING_CACHE_PATH", str(Path(tmp) / "env.sqlite3"))
+        cache = ec.EmbeddingCache()
+        assert cache.db_path == Path(tmp) / "env.sqlite3"
+        cache.close()
+
+
+def test_counters_are_consistent_under_concurrency():
+    """여러 스레드가 동시에 조회해도 hit/miss 합계가 조회 건수와 일치"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = EmbeddingCache(db_path=str(Path(tmp) / "cache.sqlite3"))
+        cache.put_many("m", ["a", "b"], [[1.0], [2.0]])
+        texts = ["a", "b", "c", "d"] * 50
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda _i: cache.get_many("m", texts), range(40)))
+
+        stats = cache.get_statistics()
+        assert stats["hits"] == 40 * 100
+        assert stats["misses"] == 40 * 100
+        cache.close()
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+Embedding Scheduler 테스트
+토큰 상한 배치 패킹, 429 재시도, 체크포인트 재개 검증
+
+작성일: 2026-10-17
+목적: 디렉토리 일괄 인제스트 안정성 확보
+"""
+
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from hq_backend.services.embedding_scheduler import (
+    EmbeddingScheduler,
+    EmbeddingCheckpoint,
+    EmbeddingJob,
+    estimate_tokens
+)
+
+
+class RateLimitError(Exception):
+    """openai.RateLimitError 대역 (클래스명으로 판별)"""
+
+
+def _jobs(doc_count, chunks_per_doc, text="보험약관" * 10):
+    return [
+        EmbeddingJob(key=f"doc{d}:{c}", text=text, payload={"doc": d})
+        for d in range(doc_count)
+        for c in range(chunks_per_doc)
+    ]
+
+
+def test_packs_across_documents_within_token_budget():
+    """문서 경계와 무관하게 토큰 상한 내로 배치 패킹"""
+    batches = []
+    lock = threading.Lock()
+
+    def embed(texts):
+        with lock:
+            batches.append(len(texts))
+        return [[0.0]] * len(texts)
+
+    jobs = _jobs(doc_count=5, chunks_per_doc=3)
+    per_job = estimate_tokens(jobs[0].text)
+
+    scheduler = EmbeddingScheduler(embed, max_batch_tokens=per_job * 4, concurrency=3)
+    stats = scheduler.run(jobs)
+
+    assert stats["embedded"] == 15 and stats["failed"] == 0
+    assert max(batches) == 4 and sum(batches) == 15
+    assert stats["batches"] == 4
+
+
+def test_rate_limit_backs_off_and_retries():
+    """429 발생 시 동시성 축소 후 재시도하여 성공"""
+    calls = {"n": 0}
+    lock = threading.Lock()
+
+    def embed(texts):
+        with lock:
+            calls["n"] += 1
+            if calls["n"] <= 2:
+                raise RateLimitError("429 Too Many Requests")
+        return [[1.0]] * len(texts)
+
+    stored = []
+    scheduler = EmbeddingScheduler(
+        embed,
+        sink_fn=lambda jobs, vectors: stored.extend(job.key for job in jobs),
+        max_batch_items=2,
+        concurrency=2,
+        base_delay=0.001
+    )
+    stats = scheduler.run(_jobs(doc_count=2, chunks_per_doc=2))
+
+    assert stats["rate_limited"] == 2
+    assert stats["embedded"] == 4 and stats["failed"] == 0
+    assert sorted(stored) == ["doc0:0", "doc0:1", "doc1:0", "doc1:1"]
+
+
+def test_checkpoint_resumes_interrupted_run():
+    """최종 실패 배치는 체크포인트에 남지 않고 재실행 시 나머지만 처리"""
+    with tempfile.TemporaryDirectory() as tmp:
+        checkpoint = EmbeddingCheckpoint(Path(tmp) / "checkpoint.txt")
+
+        def flaky(texts):
+            if any("실패" in t for t in texts):
+                raise RuntimeError("upstream error")
+            return [[1.0]] * len(texts)
+
+        jobs = _jobs(doc_count=1, chunks_per_doc=2) + [EmbeddingJob(key="doc9:0", text="실패")]
+        first = EmbeddingScheduler(flaky, max_batch_items=2, max_retries=1, base_delay=0.001, checkpoint=checkpoint)
+        stats = first.run(jobs)
+        assert stats["embedded"] == 2 and first.failed_keys == ["doc9:0"]
+
+        seen = []
+        second = EmbeddingScheduler(
+            lambda texts: seen.extend(texts) or [[1.0]] * len(texts),
+            checkpoint=checkpoint
+        )
+        stats = second.run(jobs)
+        assert stats["skipped"] == 2 and seen == ["실패"]
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+KB 담보 매핑 인덱스 테스트
+
+작성일: 2026-10-17
+목적: CoverageMappingIndex(해시맵 + 오토마톤 + 단일 정규식)가 기존 담보명별 순차 탐색
+      map_coverage 와 모든 입력에서 같은 (카테고리, 가중치, 표시명)을 돌려주는지 검증
+"""
+
+import re
+import sys
+import random
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from engines import kb_policy_mapper as kpm
+
+_STRIP = r"[\s\-_\(\)（）\[\]「」]"
+
+
+def legacy_map_coverage(name, exact=None, patterns=None):
+    """기존 map_coverage (사전 키마다 re.sub + 패턴 순차 탐색) — 비교 기준"""
+    exact = kpm._EXACT_DICT if exact is None else exact
+    patterns = kpm.KB_REGEX_PATTERNS if patterns is None else patterns
+    key = name.strip()
+    if key in exact:
+        return exact[key]
+    clean = re.sub(_STRIP, "", name)
+    for raw_key, val in exact.items():
+        if re.sub(_STRIP, "", raw_key) == clean:
+            return val
+    for raw_key, val in exact.items():
+        stripped = re.sub(_STRIP, "", raw_key)
+        if stripped in clean or clean in stripped:
+            return val
+    for pattern, cat, weight, display in patterns:
+        if re.search(pattern, name, re.IGNORECASE):
+            return (cat, weight, display)
+    return (kpm.CAT_OTHER, 0.30, name)
+
+
+def _corpus(seed=7, rows=3000):
+    """사전 키 원형·변형·일부 절단·정규식 대상·미매핑 명칭·경계값"""
+    rng = random.Random(seed)
+    keys = list(kpm._EXACT_DICT)
+    prefixes = ["", "(무)", "무배당 ", "[기본계약] ", "(갱신형) ", "KB ", " "]
+    suffixes = ["", "(갱신형)", " 특약", "(20년갱신)", "_II", "[최초1회한]", "  "]
+    regex_names = [
+        "표적항암약물허가치료비", "갑상선암 진단", "뇌경색증진단", "지주막하출혈 진단",
+        "관상동맥우회술", "교통사고 벌금(대인)", "3종 수술", "질병 입원 일당(1일이상)",
+        "가족일상생활 배상 책임", "상해사망 보험금", "장기 요양 진단", "제자리암 진단비",
+    ]
+    unmapped = ["보험료 납입지원", "특정감염병진단", "독감치료비", "대상포진진단", "ABC특약"]
+
+    names = list(keys) + ["", "   ", "()", "[ ]", "암", "진단", "SEARCH", "search"]
+    for _ in range(rows):
+        roll = rng.random()
+        if roll < 0.5:
+            names.append(rng.choice(prefixes) + rng.choice(keys) + rng.choice(suffixes))
+        elif roll < 0.7:
+            names.append(rng.choice(regex_names) + rng.choice(suffixes))
+        elif roll < 0.85:
+            key = rng.choice(keys)
+            cut = rng.randint(1, max(1, len(key) - 1))
+            names.append(key[:cut] if rng.random() < 0.5 else key[-cut:])
+        else:
+            names.append(rng.choice(prefixes) + rng.choice(unmapped) + f" {rng.randint(1, 500)}형")
+    return names
+
+
+@pytest.mark.parametrize("automaton", [True, False])
+def test_mapping_index_matches_legacy_mapper(monkeypatch, automaton):
+    monkeypatch.setattr(kpm, "AUTOMATON_AVAILABLE", automaton and kpm.AUTOMATON_AVAILABLE)
+    index = kpm.CoverageMappingIndex(kpm._EXACT_DICT, kpm.KB_REGEX_PATTERNS)
+
+    mismatches = [
+        (name, legacy_map_coverage(name), index.lookup(name))
+        for name in _corpus()
+        if legacy_map_coverage(name) != index.lookup(name)
+    ]
+    assert mismatches == []
+
+
+def test_mapping_index_keeps_first_key_order_on_ties():
+    """같은 정규화 키·여러 포함 후보·패턴 순서가 겹쳐도 기존 순차 탐색의 첫 일치를 유지"""
+    exact = {
+        "암 진단": ("A", 1.0, "암 진단"),
+        "암진단": ("B", 1.0, "암진단(중복 정규화 키)"),
+        "유사암 진단": ("C", 0.5, "유사암"),
+        "진단": ("D", 0.2, "진단"),
+        "( )": ("E", 0.1, "빈 키"),
+    }
+    patterns = [(r"골절", "F", 0.9, "골절"), (r"골절\s*진단", "G", 0.8, "골절진단")]
+    index = kpm.CoverageMappingIndex(exact, patterns)
+
+    for name in ["암진단", " 암 진단 ", "유사암진단비", "진단", "골절진단", "", "무관한 담보", "( )"]:
+        assert index.lookup(name) == legacy_map_coverage(name, exact, patterns), name
+
+
+def test_map_coverage_uses_index():
+    kpm.map_coverage.cache_clear()
+    for name in _corpus(seed=11, rows=300):
+        assert kpm.map_coverage(name) == legacy_map_coverage(name)
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+"""
+Local Vector Index 테스트
+로컬 벡터 인덱스 검색 의미 및 증분 동기화 검증
+
+작성일: 2026-10-17
+목적: search_knowledge_base RPC와 동일한 필터/임계값 동작 보장
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from hq_backend.services.local_vector_index import LocalVectorIndex
+
+
+DIM = 8
+
+
+class _FakeResult:
+    def __init__(self, data):
+        self.data = data
+
+
+class _FakeQuery:
+    """supabase-py 체이닝 API 최소 구현 (select / eq / range / execute)"""
+
+    def __init__(self, table, columns):
+        self.table = table
+        self.columns = columns
+        self.filters = {}
+        self.bounds = None
+
+    def eq(self, column, value):
+        self.filters[column] = value
+        return self
+
+    def range(self, start, end):
+        self.bounds = (start, end)
+        return self
+
+    def execute(self):
+        rows = [r for r in self.table.rows if all(r.get(k) == v for k, v in self.filters.items())]
+        if self.bounds:
+            rows = rows[self.bounds[0]:self.bounds[1] + 1]
+        self.table.calls.append((self.columns, dict(self.filters)))
+        return _FakeResult([dict(r) for r in rows])
+
+
+class _FakeTable:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    def select(self, columns):
+        return _FakeQuery(self, columns)
+
+
+class _FakeSupabase:
+    def __init__(self, rows):
+        self._table = _FakeTable(rows)
+
+    def table(self, name):
+        return self._table
+
+
+def _row(doc, idx, category, vector, file_hash="h1"):
+    return {
+        "id": f"{doc}-{idx}",
+        "document_name": doc,
+        "document_category": category,
+        "chunk_index": idx,
+        "content": f"{doc} chunk {idx}",
+        "source_page": idx + 1,
+        "embedding": "[" + ",".join(str(v) for v in vector) + "]",
+        "file_hash": file_hash,
+        "version": "v1.0",
+        "updated_at": "2026-10-01T00:00:00"
+    }
+
+
+def _unit(i):
+    v = np.zeros(DIM)
+    v[i] = 1.0
+    return v.tolist()
+
+
+def test_search_matches_rpc_semantics():
+    """카테고리 필터 / 임계값 / 정렬 검증"""
+    rows = [
+        _row("화재.pdf", 0, "화재보험", _unit(0)),
+        _row("화재.pdf", 1, "화재보험", (np.array(_unit(0)) + np.array(_unit(1))).tolist()),
+        _row("법인.pdf", 0, "법인", _unit(0)),
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index = LocalVectorIndex(_FakeSupabase(rows), index_dir=tmp, dim=DIM)
+        index.sync()
+
+        results = index.search(_unit(0), match_threshold=0.5, match_count=5)
+        assert [r["id"] for r in results][:2] in (["화재.pdf-0", "법인.pdf-0"], ["법인.pdf-0", "화재.pdf-0"])
+        assert results[-1]["id"] == "화재.pdf-1"
+        assert abs(results[-1]["similarity"] - 1 / np.sqrt(2)) < 1e-5
+
+        filtered = index.search(_unit(0), category="화재보험", match_threshold=0.5, match_count=5)
+        assert {r["document_category"] for r in filtered} == {"화재보험"}
+
+        strict = index.search(_unit(0), match_threshold=0.8, match_count=5)
+        assert "화재.pdf-1" not in [r["id"] for r in strict]
+
+        assert index.search(_unit(0), category="없는카테고리") == []
+
+        # 임계값 미달 문서도 id 지정 시 실제 유사도 반환 (하이브리드 BM25 단독 결과용)
+        sims = index.similarities_for(_unit(1), ["화재.pdf-1", "법인.pdf-0", "없는-id"])
+        assert set(sims) == {"화재.pdf-1", "법인.pdf-0"}
+        assert abs(sims["화재.pdf-1"] - 1 / np.sqrt(2)) < 1e-5 and abs(sims["법인.pdf-0"]) < 1e-6
+
+
+def test_incremental_sync_fetches_only_changed_documents():
+    """변경된 문서만 재조회하는지 검증"""
+    rows = [
+        _row("A.pdf", 0, "약관", _unit(0)),
+        _row("B.pdf", 0, "약관", _unit(1)),
+    ]
+    client = _FakeSupabase(rows)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index = LocalVectorIndex(client, index_dir=tmp, dim=DIM)
+        first = index.sync()
+        assert first["changed"] == 2 and index.size == 2
+
+        # B 문서만 재인제스트 (해시 변경), A는 유지
+        client._table.rows = [rows[0], _row("B.pdf", 0, "약관", _unit(2), file_hash="h2")]
+        client._table.calls.clear()
+
+        second = index.sync()
+        assert second["changed"] == 1 and second["fetched_chunks"] == 1
+        fetched_docs = [f.get("document_name") for cols, f in client._table.calls if cols == "*"]
+        assert fetched_docs == ["B.pdf"]
+
+        assert index.search(_unit(2), match_threshold=0.9)[0]["id"] == "B.pdf-0"
+        assert index.search(_unit(1), match_threshold=0.9) == []
+
+        # 삭제 반영 + 디스크 재로드
+        client._table.rows = [rows[0]]
+        index.sync()
+        reloaded = LocalVectorIndex(client, index_dir=tmp, dim=DIM)
+        assert reloaded.load() and reloaded.size == 1
+
+
+def test_ivf_layer_returns_nearest():
+    """IVF 계층 사용 시에도 최근접 문서 반환"""
+    rng = np.random.default_rng(0)
+    rows = [_row(f"D{i}.pdf", 0, "매뉴얼", rng.normal(size=DIM).tolist()) for i in range(64)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index = LocalVectorIndex(_FakeSupabase(rows), index_dir=tmp, dim=DIM, use_ivf=True, ivf_nprobe=8)
+        index.sync()
+
+        target = np.array(index.vectors[10])
+        results = index.search(target.tolist(), match_threshold=0.0, match_count=1)
+        assert results[0]["id"] == index.rows[10]["id"]
+
+
+def _bare_engine(client, ttl=3600.0):
+    """RAGEngine 의 로컬 인덱스 경로만 사용 (외부 API 클라이언트 초기화 생략)"""
+    import threading
+    from hq_backend.engines.rag_engine import RAGEngine
+
+    engine = RAGEngine.__new__(RAGEngine)
+    engine.supabase = client
+    engine.bm25_index = None
+    engine.local_index_ttl = ttl
+    engine._local_index_checked = 0.0
+    engine._local_index_sync_lock = threading.Lock()
+    return engine
+
+
+def test_engine_resyncs_loaded_index_and_on_ttl():
+    """디스크 캐시를 로드해도 원격 변경을 반영하고, TTL 경과 시 다시 증분 동기화"""
+    rows = [_row("A.pdf", 0, "약관", _unit(0))]
+    client = _FakeSupabase(rows)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        LocalVectorIndex(client, index_dir=tmp, dim=DIM).sync()
+
+        # 캐시 생성 후 야간 인제스트로 B 문서 추가
+        client._table.rows = rows + [_row("B.pdf", 0, "약관", _unit(1))]
+        engine = _bare_engine(client)
+        engine.local_index = engine._init_local_index(tmp)
+        assert engine.local_index.size == 2
+
+        # TTL 이내 → 재동기화 없음
+        client._table.rows = client._table.rows + [_row("C.pdf", 0, "약관", _unit(2))]
+        client._table.calls.clear()
+        engine._maybe_resync_local_index()
+        assert client._table.calls == [] and engine.local_index.size == 2
+
+        # TTL 경과 → 변경 문서만 증분 동기화
+        engine._local_index_checked -= engine.local_index_ttl + 1
+        engine._maybe_resync_local_index()
+        assert engine.local_index.size == 3
+        fetched_docs = [f.get("document_name") for cols, f in client._table.calls if cols == "*"]
+        assert fetched_docs == ["C.pdf"]
+
+
+def test_default_index_dir_is_outside_source_tree(monkeypatch):
+    monkeypatch.delenv("RAG_LOCAL_INDEX_DIR", raising=False)
+    index = LocalVectorIndex(_FakeSupabase([]), dim=DIM)
+    assert not index.index_dir.resolve().is_relative_to(project_root.resolve())
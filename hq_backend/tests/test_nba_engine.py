@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+NBA 엔진 신호 점수화 테스트
+유형 우선순위(만기 > 휴면 > 공백)와 보장 공백 상태(status) 필터 검증
+
+작성일: 2026-10-17
+목적: 벡터 점수화 후에도 고객별 대표 유형·공백 대상이 기존 순차 스캔과 같음을 보장
+"""
+
+import sys
+import datetime
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from nba_engine import score_customer_signals
+
+TODAY = datetime.date(2026, 10, 17)
+
+
+def test_type_follows_fixed_priority_not_score():
+    """만기 30일 전(낮은 만기 점수) + 장기 휴면(높은 휴면 점수) 고객도 대표 유형은 만기"""
+    rows = [
+        {"person_id": "p1", "name": "가", "management_tier": 2, "status": "lead",
+         "last_contact": "2024-01-01", "next_expiry": "2026-11-16"},
+        {"person_id": "p2", "name": "나", "management_tier": 2, "status": "lead",
+         "last_contact": "2024-01-01"},
+    ]
+    actions = {a["person_id"]: a for a in score_customer_signals(rows, today=TODAY)}
+    assert actions["p1"]["nba_type"] == "expiry"
+    assert actions["p1"]["signals"] == ["expiry", "dormant"]
+    assert actions["p2"]["nba_type"] == "dormant"
+
+
+def test_equal_scores_tiebreak_by_priority():
+    """동점이면 유형 우선순위 순 (이름 순보다 우선)"""
+    cfg = {"weights": {"expiry": 40.0, "dormant": 40.0, "gap": 40.0}}
+    rows = [
+        {"person_id": "g", "name": "가", "management_tier": 1, "status": "lead", "last_contact": "2026-10-10"},
+        {"person_id": "d", "name": "나", "management_tier": 2, "status": "contracted", "last_contact": None},
+    ]
+    actions = score_customer_signals(rows, cfg, today=TODAY)
+    assert [(a["person_id"], a["nba_type"]) for a in actions] == [("d", "dormant"), ("g", "gap")]
+    assert actions[0]["nba_score"] == actions[1]["nba_score"]
+
+
+def test_gap_excludes_null_status():
+    """status NULL 고객은 보장 공백 대상 아님 (계약 완료 고객도 제외)"""
+    rows = [
+        {"person_id": "n", "name": "가", "management_tier": 1, "status": None, "last_contact": "2026-10-10"},
+        {"person_id": "c", "name": "나", "management_tier": 1, "status": "contracted", "last_contact": "2026-10-10"},
+        {"person_id": "l", "name": "다", "management_tier": 1, "status": "lead", "last_contact": "2026-10-10"},
+    ]
+    assert [a["person_id"] for a in score_customer_signals(rows, {"signals": ["gap"]}, today=TODAY)] == ["l"]
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+NBA 사전 계산 결과 재사용 로직 테스트
+
+작성일: 2026-10-17
+목적: 신선도 판정(_is_fresh)·만기 알림 재필터(filter_expiry_alerts)·
+      유형별 한도(apply_type_limits) 가 실시간 경로와 같은 결과를 내는지 검증
+"""
+
+import datetime
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import nba_precompute as nba
+
+TODAY = datetime.date(2026, 10, 17)
+
+
+def test_is_fresh_requires_today_and_seq_caught_up():
+    rec = {"computed_for": TODAY.isoformat(), "computed_seq": 3, "change_seq": 3}
+    assert nba._is_fresh(rec, TODAY)
+    assert not nba._is_fresh({**rec, "change_seq": 4}, TODAY)
+    assert not nba._is_fresh({**rec, "computed_for": "2026-10-16"}, TODAY)
+    assert not nba._is_fresh({}, TODAY)
+    # 계산 중 변경(computed_seq 가 더 큼)도 신선
+    assert nba._is_fresh({**rec, "computed_seq": 5}, TODAY)
+
+
+def test_filter_expiry_alerts_recomputes_dday_and_priority():
+    def on(days):
+        return (TODAY + datetime.timedelta(days=days)).isoformat()
+
+    alerts = [
+        {"policy_id": "p30", "expiry_date": on(30)},
+        {"policy_id": "p14", "expiry_date": on(14)},
+        {"policy_id": "p20", "expiry_date": on(20)},
+        {"policy_id": "past", "expiry_date": on(-1)},
+        {"policy_id": "far", "expiry_date": on(45)},
+        {"policy_id": "bad", "expiry_date": "미정"},
+    ]
+    out = nba.filter_expiry_alerts(alerts, today=TODAY)
+    assert [a["policy_id"] for a in out] == ["p14", "p30"]
+    assert [a["alert_priority"] for a in out] == [2, 1]
+    assert [a["days_until_expiry"] for a in out] == [14, 30]
+
+    everything = nba.filter_expiry_alerts(alerts, priority_only=False, today=TODAY)
+    assert [a["policy_id"] for a in everything] == ["p14", "p20", "p30"]
+    assert everything[1]["alert_priority"] == 0
+
+    assert [a["policy_id"] for a in nba.filter_expiry_alerts(alerts, days_range=15, today=TODAY)] == ["p14"]
+
+
+def test_apply_type_limits_keeps_order_and_caps_each_type():
+    actions = [
+        {"id": 1, "nba_type": "expiry"},
+        {"id": 2, "nba_type": "birthday"},
+        {"id": 3, "nba_type": "expiry"},
+        {"id": 4, "nba_type": "expiry"},
+        {"id": 5, "nba_type": "claim"},
+    ]
+    out = nba.apply_type_limits(actions, {"expiry": 2, "claim": 0, "birthday": None})
+    assert [a["id"] for a in out] == [1, 2, 3]
+    assert nba.apply_type_limits(actions, {}) == actions
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+Parallel PDF Extractor 테스트
+프로세스 풀 추출, 손상 PDF 격리, 파일별 타임아웃, 워커 급사 시 결과 유실 처리 검증
+
+작성일: 2026-10-17
+목적: 손상된 PDF 하나가 전체 인제스트를 멈추지 않도록 보장
+"""
+
+import os
+import sys
+import time
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from reportlab.pdfgen import canvas
+
+from hq_backend.services.parallel_extractor import ParallelPDFExtractor, extract_pdf_pages
+
+
+def _write_pdf(path: Path, pages: int):
+    c = canvas.Canvas(str(path))
+    for i in range(pages):
+        c.drawString(72, 720, f"Terms page {i + 1}")
+        c.showPage()
+    c.save()
+
+
+def _slow_extract(pdf_path):
+    """'hang' 이 포함된 파일은 응답하지 않는 PDF를 흉내냄"""
+    if "hang" in pdf_path:
+        time.sleep(60)
+    return extract_pdf_pages(pdf_path)
+
+
+def _crashing_extract(pdf_path):
+    """'crash' 가 포함된 파일은 워커 프로세스를 즉시 종료 (시작 신호 전송 전 급사 흉내)"""
+    if "crash" in pdf_path:
+        os._exit(1)
+    return extract_pdf_pages(pdf_path)
+
+
+def test_extracts_pages_and_isolates_malformed_pdf():
+    """정상 PDF는 페이지별 추출, 손상 PDF는 개별 실패 처리"""
+    with tempfile.TemporaryDirectory() as tmp:
+        good_a = Path(tmp) / "a.pdf"
+        good_b = Path(tmp) / "b.pdf"
+        broken = Path(tmp) / "broken.pdf"
+        _write_pdf(good_a, 3)
+        _write_pdf(good_b, 1)
+        broken.write_bytes(b"version https://git-lfs.github.com/spec/v1\n")
+
+        docs = {
+            Path(d.pdf_path).name: d
+            for d in ParallelPDFExtractor(workers=2).iter_documents([good_a, broken, good_b])
+        }
+
+        assert set(docs) == {"a.pdf", "b.pdf", "broken.pdf"}
+        assert [p["page"] for p in docs["a.pdf"].pages] == [1, 2, 3]
+        assert "Terms page 2" in docs["a.pdf"].pages[1]["content"]
+        assert docs["b.pdf"].ok and not docs["broken.pdf"].ok
+
+
+def test_file_timeout_replaces_stuck_worker():
+    """응답 없는 파일은 타임아웃 후 실패 처리되고 나머지는 계속 진행"""
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for name in ("hang.pdf", "x.pdf", "y.pdf"):
+            path = Path(tmp) / name
+            _write_pdf(path, 1)
+            paths.append(path)
+
+        extractor = ParallelPDFExtractor(workers=1, file_timeout=1.0, extract_fn=_slow_extract)
+        started = time.monotonic()
+        docs = {Path(d.pdf_path).name: d for d in extractor.iter_documents(paths)}
+
+        assert time.monotonic() - started < 20
+        assert docs["hang.pdf"].error.startswith("TimeoutError")
+        assert docs["x.pdf"].ok and docs["y.pdf"].ok
+
+
+def test_worker_crash_yields_error_without_blocking():
+    """워커가 결과 없이 죽어도 해당 파일은 실패로 반환되고 반복은 끝까지 종료"""
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for name in ("crash.pdf", "x.pdf", "y.pdf"):
+            path = Path(tmp) / name
+            _write_pdf(path, 1)
+            paths.append(path)
+
+        extractor = ParallelPDFExtractor(workers=1, file_timeout=30.0, lost_timeout=2.0,
+                                         extract_fn=_crashing_extract)
+        started = time.monotonic()
+        docs = {Path(d.pdf_path).name: d for d in extractor.iter_documents(paths)}
+
+        assert time.monotonic() - started < 20
+        assert set(docs) == {"crash.pdf", "x.pdf", "y.pdf"}
+        assert docs["crash.pdf"].error.startswith(("WorkerCrashed", "WorkerLost"))
+        assert docs["x.pdf"].ok and docs["y.pdf"].ok
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+페이지 병렬 PDF 추출 캐시 테스트
+디스크 캐시에 PII 원문이 남지 않는지, 캐시 적중 시 PII 건수가 보존되는지, TTL·구형식 캐시가 폐기되는지 검증
+
+작성일: 2026-10-17
+목적: 공용 임시 디렉터리의 페이지 캐시가 개인정보 원문 저장소가 되지 않음을 보장
+"""
+
+import io
+import os
+import re
+import sys
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+pytest.importorskip("pypdf")
+canvas = pytest.importorskip("reportlab.pdfgen.canvas")
+
+from modules import pdf_page_extractor as ppe
+
+_PHONE = r"01[016789]-\d{3,4}-\d{4}"
+
+
+def _mask(text):
+    hits = re.findall(_PHONE, text)
+    return re.sub(_PHONE, "***전화번호***", text), ({"***전화번호***": len(hits)} if hits else {})
+
+
+def _pdf(lines):
+    buf = io.BytesIO()
+    c = canvas.Canvas(buf)
+    for line in lines:
+        c.drawString(72, 720, line)
+        c.showPage()
+    c.save()
+    return buf.getvalue()
+
+
+def _cached_files(root):
+    return [os.path.join(d, n) for d, _, names in os.walk(root) for n in names]
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(ppe, "_CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_cache_stores_masked_text_and_keeps_counts(cache_dir):
+    """캐시 파일에 원문 번호 없음 + 재스캔(캐시 적중)에도 같은 마스킹 텍스트·PII 건수 반환"""
+    pdf = _pdf(["Tel 010-1234-5678", "plain page"])
+    first = ppe.extract_pdf_pages_parallel(pdf, "pypdf", workers=1, mask_fn=_mask)
+    assert "010-1234-5678" not in first["text"]
+    assert first["pii"] == {"***전화번호***": 1} and first["cached_pages"] == 0
+
+    files = _cached_files(cache_dir)
+    assert files and not any("010-1234-5678" in open(f, encoding="utf-8").read() for f in files)
+
+    second = ppe.extract_pdf_pages_parallel(pdf, "pypdf", workers=1, mask_fn=_mask)
+    assert second["cached_pages"] == 2
+    assert second["text"] == first["text"] and second["pii"] == first["pii"]
+
+
+def test_no_mask_fn_means_no_disk_cache(cache_dir):
+    """마스킹 함수 없이 호출하면 원문을 디스크에 쓰지 않음"""
+    result = ppe.extract_pdf_pages_parallel(_pdf(["Tel 010-1234-5678"]), "pypdf", workers=1)
+    assert "010-1234-5678" in result["text"]
+    assert _cached_files(cache_dir) == []
+
+
+def test_expired_and_legacy_entries_are_dropped(cache_dir, monkeypatch):
+    """TTL 경과 문서·형식 표시 없는 구(원문) 캐시는 재사용하지 않고 삭제"""
+    pdf = _pdf(["Tel 010-1234-5678"])
+    file_hash = ppe.file_sha256(pdf)
+    ppe.extract_pdf_pages_parallel(pdf, "pypdf", workers=1, mask_fn=_mask)
+
+    meta_path = os.path.join(ppe._doc_dir(file_hash), "meta.json")
+    with open(meta_path, encoding="utf-8") as f:
+        meta = json.load(f)
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump(dict(meta, created=time.time() - ppe._CACHE_TTL_SECONDS - 1), f)
+    assert ppe.extract_pdf_pages_parallel(pdf, "pypdf", workers=1, mask_fn=_mask)["cached_pages"] == 0
+
+    legacy = os.path.join(str(cache_dir), "ab", "ab" * 32)
+    os.makedirs(os.path.join(legacy, "pypdf"))
+    with open(os.path.join(legacy, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump({"pages": 1}, f)
+    ppe._prune_cache()
+    assert not os.path.exists(legacy)
+    assert os.path.isdir(ppe._doc_dir(file_hash))
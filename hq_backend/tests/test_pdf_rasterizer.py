@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+PDF 래스터라이저 테스트
+
+작성일: 2026-10-17
+목적: iter_pdf_rasters 가 넘긴 페이지 배열이 제너레이터를 진행(이전 픽스맵 해제)한 뒤에도
+      유효한 메모리를 가리키는지 검증
+"""
+
+import io
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+pytest.importorskip("fitz")
+canvas = pytest.importorskip("reportlab.pdfgen.canvas")
+
+from modules.pdf_rasterizer import iter_pdf_rasters
+
+
+def _pdf(pages):
+    """페이지마다 가로 막대 개수가 다른 PDF (페이지 구분용)"""
+    buf = io.BytesIO()
+    c = canvas.Canvas(buf)
+    for bars in pages:
+        for k in range(bars):
+            c.rect(72, 700 - k * 60, 300, 30, fill=1)
+        c.showPage()
+    c.save()
+    return buf.getvalue()
+
+
+@pytest.mark.parametrize("grayscale", [True, False])
+def test_yielded_image_survives_generator_advance(grayscale):
+    gen = iter_pdf_rasters(_pdf([1, 4, 2]), grayscale=grayscale, dpi=72)
+    first = next(gen)
+    image = first["image"]
+    snapshot = image.copy()
+
+    rest = list(gen)   # 이후 페이지 래스터화 → 이전 픽스맵 해제
+    assert len(rest) == 2
+
+    owner = image if image.base is None else image.base
+    assert owner.flags.owndata   # 픽스맵 버퍼 뷰가 아닌 독립 배열
+    assert np.array_equal(image, snapshot)
+    assert (image < 128).any()
+    assert not np.array_equal(image, rest[0]["image"])
+    image[:] = 0   # 보관한 배열은 수정해도 안전
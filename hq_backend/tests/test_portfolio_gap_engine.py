@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""
+Portfolio Gap Engine 테스트
+DB 담보 금액(원 단위) 변환, 고객별 AnalysisHub 결과와의 일치, 설계사 내 순위·이전 순위 정리 검증
+
+작성일: 2026-10-17
+목적: 일괄 벡터 채점이 화면 분석(AnalysisHub)과 같은 결과를 내고, 소액 특약이 단위 추정으로 부풀려지지 않음을 보장
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from engines.analysis_hub import AnalysisHub
+from engines.portfolio_gap_engine import fetch_portfolio, save_portfolio_gaps, score_portfolio
+
+
+class _FakeQuery:
+    """supabase-py 체이닝 최소 구현 (eq / order / range / upsert / delete / lt)"""
+
+    def __init__(self, db, table):
+        self.db, self.table, self.filters, self.op, self.payload = db, table, [], "select", None
+
+    def select(self, *_):
+        return self
+
+    def eq(self, col, val):
+        self.filters.append(lambda r: r.get(col) == val)
+        return self
+
+    def lt(self, col, val):
+        self.filters.append(lambda r: r.get(col) < val)
+        return self
+
+    def order(self, *_, **__):
+        return self
+
+    def range(self, start, end):
+        self.window = (start, end)
+        return self
+
+    def upsert(self, rows, on_conflict=""):
+        self.op, self.payload = "upsert", rows
+        return self
+
+    def delete(self):
+        self.op = "delete"
+        return self
+
+    def execute(self):
+        rows = self.db.setdefault(self.table, [])
+        if self.op == "upsert":
+            keys = {(r["agent_id"], r["person_id"]) for r in self.payload}
+            rows[:] = [r for r in rows if (r["agent_id"], r["person_id"]) not in keys] + list(self.payload)
+            return type("R", (), {"data": self.payload})
+        matched = [r for r in rows if all(f(r) for f in self.filters)]
+        if self.op == "delete":
+            rows[:] = [r for r in rows if r not in matched]
+            return type("R", (), {"data": matched})
+        start, end = getattr(self, "window", (0, len(matched)))
+        return type("R", (), {"data": matched[start:end + 1]})
+
+
+class _FakeSupabase:
+    def __init__(self, db):
+        self.db = db
+
+    def table(self, name):
+        return _FakeQuery(self.db, name)
+
+
+def _insured(person_id, policy_id, agent_id="a1"):
+    return {"role_id": f"r-{policy_id}", "policy_id": policy_id, "person_id": person_id,
+            "role": "피보험자", "agent_id": agent_id, "is_deleted": False}
+
+
+def _coverage(policy_id, name, amount_won, agent_id="a1"):
+    return {"coverage_id": f"{policy_id}-{name}", "policy_id": policy_id, "coverage_name": name,
+            "coverage_amount": amount_won, "is_active": True, "agent_id": agent_id, "is_deleted": False}
+
+
+def test_db_coverage_amounts_are_won():
+    """gk_policy_coverages 원 단위 금액 → 만원 고정 변환 (소액 입원일당·수술비가 만원으로 오인되지 않음)"""
+    db = {
+        "gk_people": [{"person_id": "p1", "agent_id": "a1", "name": "김고객", "birth_date": "1981-03-02",
+                       "gender": "남", "is_deleted": False}],
+        "gk_policy_roles": [_insured("p1", "pol1")],
+        "gk_policy_coverages": [
+            _coverage("pol1", "일반암진단비", 30_000_000),
+            _coverage("pol1", "상해입원일당", 30_000),
+            _coverage("pol1", "질병수술비", 500_000),
+        ],
+        "gk_trinity_analysis": [],
+    }
+    customers, coverages = fetch_portfolio(_FakeSupabase(db), "a1")
+    assert sorted(coverages["amount_man"]) == [3.0, 50.0, 3000.0]
+
+    result = score_portfolio(customers, coverages).iloc[0]
+    report = AnalysisHub(
+        coverages=[{"name": c["coverage_name"], "amount": c["coverage_amount"] / 10_000}
+                   for c in db["gk_policy_coverages"]],
+        nhis_premium=0,
+        age=int(result["age"]),
+    ).run()
+    assert result["kb_grade"] == report.kb.grade == "D"
+    assert result["kb_pct"] == round(report.kb.overall_pct, 1)
+    assert result["kb_pct"] < 10
+    assert result["score_hosp_daily"] < 10 and result["score_surgery"] < 100
+
+
+def test_scores_match_analysis_hub_and_rank_by_gap():
+    """고객별 AnalysisHub 결과와 일치 + 설계사별 (건보료 입력 우선, 암 공백 큰 순) 순위"""
+    customers = pd.DataFrame([
+        {"person_id": "p1", "agent_id": "a1", "name": "가", "age": 45, "gender": "남", "nhis_premium": 150_000},
+        {"person_id": "p2", "agent_id": "a1", "name": "나", "age": 38, "gender": "여", "nhis_premium": 300_000},
+        {"person_id": "p3", "agent_id": "a1", "name": "다", "age": 52, "gender": "남", "nhis_premium": 0},
+        {"person_id": "p4", "agent_id": "a2", "name": "라", "age": 61, "gender": "여", "nhis_premium": 90_000,
+         "employment_type": "지역", "ltc_included": True},
+    ])
+    coverages = pd.DataFrame([
+        {"person_id": "p1", "name": "일반암진단비", "amount": "3,000만"},
+        {"person_id": "p1", "name": "뇌혈관질환진단비", "amount": 20_000_000},
+        {"person_id": "p2", "name": "일반암진단비", "amount": 1000},
+        {"person_id": "p3", "name": "질병사망", "amount": "1억"},
+        {"person_id": "p4", "name": "일반암진단비", "amount": 5000},
+    ])
+    result = score_portfolio(customers, coverages).set_index("person_id")
+
+    for c in customers.to_dict("records"):
+        report = AnalysisHub(
+            coverages=coverages[coverages["person_id"] == c["person_id"]][["name", "amount"]].to_dict("records"),
+            nhis_premium=c["nhis_premium"], age=c["age"], gender=c["gender"],
+            employment_type=c.get("employment_type") if isinstance(c.get("employment_type"), str) else "직장",
+            ltc_included=c.get("ltc_included") is True,
+        ).run()
+        row = result.loc[c["person_id"]]
+        assert row["kb_grade"] == report.kb.grade
+        assert abs(row["kb_pct"] - report.kb.overall_pct) <= 0.1
+        assert abs(row["golden_time_fund"] - report.gap.golden_time_fund) <= 0.1
+        assert abs(row["income_gap"] - report.gap.income_gap) <= 0.1
+        assert row["risk_level"] == report.gap.risk_level
+
+    ranks = result.sort_values(["agent_id", "gap_rank"])
+    assert list(ranks.index) == ["p2", "p1", "p3", "p4"]
+    assert list(ranks["gap_rank"]) == [1, 2, 3, 1]
+
+
+def test_save_removes_stale_rows_for_agents_without_customers():
+    """전 설계사 계산: 고객이 0명이 된 설계사의 이전 순위도 삭제 / 설계사 지정 계산: 다른 설계사 행 유지"""
+    old = {"computed_at": "2000-01-01T00:00:00+00:00"}
+    db = {"gk_portfolio_gaps": [{"agent_id": "gone", "person_id": "x", **old},
+                                {"agent_id": "a1", "person_id": "moved", **old}]}
+    sb = _FakeSupabase(db)
+    customers = pd.DataFrame([{"person_id": "p1", "agent_id": "a1", "name": "가"}])
+    coverages = pd.DataFrame(columns=["person_id", "name", "amount_man"])
+    scored = score_portfolio(customers, coverages)
+
+    save_portfolio_gaps(sb, scored, agent_id="a1")
+    assert {(r["agent_id"], r["person_id"]) for r in db["gk_portfolio_gaps"]} == {("gone", "x"), ("a1", "p1")}
+
+    save_portfolio_gaps(sb, scored)
+    assert {(r["agent_id"], r["person_id"]) for r in db["gk_portfolio_gaps"]} == {("a1", "p1")}
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+스캔 작업 러너 동작 테스트
+
+작성일: 2026-10-17
+목적: 파일 간 단계 중첩(파이프라인)·단계별 동시성 한도, 유한 대기열 포화 시 queue.Full,
+      단계 예외/실패 결과의 작업 상태·collect() 전파 검증
+      (scan_engine 단계 함수는 기록용 대역으로 교체)
+"""
+
+import sys
+import time
+import queue
+import threading
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import modules
+from modules.scan_job_runner import ScanJobRunner
+
+IDENT = {"person_id": "p1", "agent_id": "a1"}
+
+
+class _FakeScanEngine:
+    """단계별 (파일명, 단계, 시작, 종료) 구간 기록 + 선택적 지연·예외·실패 결과"""
+
+    def __init__(self, delays=None, raise_in=None, fail_in=None, gate=None):
+        self.delays = delays or {}
+        self.raise_in = raise_in or {}
+        self.fail_in = fail_in or {}
+        self.gate = gate
+        self.intervals = []
+        self._lock = threading.Lock()
+        for stage in ("prepare", "backup", "extract", "classify", "publish"):
+            setattr(self, f"scan_stage_{stage}", self._stage(stage))
+
+    def _stage(self, name):
+        def run(state):
+            start = time.perf_counter()
+            if self.gate is not None:
+                self.gate.wait(5)
+            time.sleep(self.delays.get(name, 0.0))
+            with self._lock:
+                self.intervals.append((state["filename"], name, start, time.perf_counter()))
+            if self.raise_in.get(state["filename"]) == name:
+                raise ValueError(f"{name} 단계 오류")
+            if self.fail_in.get(state["filename"]) == name:
+                return {"success": False, "error": f"{name} 실패"}
+            return None
+        return run
+
+    def new_scan_state(self, **kw):
+        return dict(kw)
+
+    def scan_stage_result(self, state):
+        return {"success": True, "filename": state["filename"]}
+
+    def unified_scan_interface(self, file_bytes, filename, **kw):
+        return {"success": False, "error": "인물 식별 필요"}
+
+    def stages_of(self, filename):
+        return {stage for f, stage, _s, _e in self.intervals if f == filename}
+
+    def interval(self, filename, stage):
+        return next((s, e) for f, st, s, e in self.intervals if f == filename and st == stage)
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    def install(**kw):
+        se = _FakeScanEngine(**kw)
+        monkeypatch.setitem(sys.modules, "modules.scan_engine", se)
+        monkeypatch.setattr(modules, "scan_engine", se, raising=False)
+        return se
+    return install
+
+
+def _overlaps(a, b):
+    return a[0] < b[1] and b[0] < a[1]
+
+
+def test_stages_overlap_across_files_within_limits(engine):
+    se = engine(delays={"prepare": 0.05, "backup": 0.15, "extract": 0.15})
+    runner = ScanJobRunner(stage_limits={s: 1 for s in ("prepare", "backup", "extract", "classify", "publish")})
+    try:
+        ids = [runner.submit(b"%PDF", f"f{i}.pdf", **IDENT) for i in range(3)]
+        results = [runner.collect(j, timeout=10) for j in ids]
+    finally:
+        runner.shutdown()
+
+    assert [r["filename"] for r in results] == ["f0.pdf", "f1.pdf", "f2.pdf"]
+    # 같은 파일: 백업 ∥ 추출 동시 진행
+    assert _overlaps(se.interval("f0.pdf", "backup"), se.interval("f0.pdf", "extract"))
+    # 다른 파일: 앞 파일 추출 중 다음 파일 준비 단계 진행 (파이프라인)
+    assert any(
+        _overlaps(se.interval(a, "extract"), se.interval(b, "prepare"))
+        for a in ("f0.pdf", "f1.pdf", "f2.pdf") for b in ("f0.pdf", "f1.pdf", "f2.pdf") if a != b
+    )
+    # 단계 한도 1 → 같은 단계 구간은 서로 겹치지 않음
+    for stage in ("prepare", "backup", "extract", "classify", "publish"):
+        spans = sorted((s, e) for _f, st, s, e in se.intervals if st == stage)
+        assert all(prev[1] <= nxt[0] for prev, nxt in zip(spans, spans[1:])), stage
+
+
+def test_bounded_queue_raises_full_then_recovers(engine):
+    gate = threading.Event()
+    engine(gate=gate)
+    runner = ScanJobRunner(max_pending=2)
+    try:
+        first = [runner.submit(b"%PDF", f"f{i}.pdf", **IDENT) for i in range(2)]
+        with pytest.raises(queue.Full):
+            runner.submit(b"%PDF", "overflow.pdf", **IDENT)
+        with pytest.raises(queue.Full):
+            runner.submit_files([{"name": "drop.pdf", "data": b"%PDF"}], **IDENT)
+        assert runner.pending_count() == 2
+
+        gate.set()
+        for j in first:
+            assert runner.wait(j, timeout=10)["status"] == "done"
+        assert runner.pending_count() == 0
+        again = runner.submit(b"%PDF", "later.pdf", **IDENT)
+        assert runner.wait(again, timeout=10)["status"] == "done"
+    finally:
+        gate.set()
+        runner.shutdown()
+
+
+def test_stage_exception_fails_job_and_stops_pipeline(engine):
+    se = engine(raise_in={"bad.pdf": "extract"})
+    runner = ScanJobRunner()
+    try:
+        bad = runner.submit(b"%PDF", "bad.pdf", **IDENT)
+        good = runner.submit(b"%PDF", "good.pdf", **IDENT)
+        snap = runner.wait(bad, timeout=10)
+        with pytest.raises(RuntimeError, match="extract 단계 오류"):
+            runner.collect(bad, timeout=10)
+        assert runner.collect(good, timeout=10)["success"] is True
+    finally:
+        runner.shutdown()
+
+    assert snap["status"] == "failed"
+    assert "extract 단계 오류" in snap["error"]
+    assert "classify" not in se.stages_of("bad.pdf") and "publish" not in se.stages_of("bad.pdf")
+    assert runner.pending_count() == 0
+
+
+def test_stage_failure_result_is_returned_without_later_stages(engine):
+    se = engine(fail_in={"scan.pdf": "classify"})
+    runner = ScanJobRunner()
+    try:
+        job_id = runner.submit(b"%PDF", "scan.pdf", **IDENT)
+        result = runner.collect(job_id, timeout=10)
+        snap = runner.snapshot(job_id)
+    finally:
+        runner.shutdown()
+
+    assert snap["status"] == "done" and snap["message"] == "classify 실패"
+    assert result["success"] is False and result["error"] == "classify 실패"
+    assert result["master_approved"] is False
+    assert "publish" not in se.stages_of("scan.pdf")
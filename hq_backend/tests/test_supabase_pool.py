@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+공유 Supabase 클라이언트 팩토리 테스트
+
+작성일: 2026-10-17
+목적: get_supabase_client 가 공유 전송 계층으로 인증 헤더·기본/호출별 타임아웃을 실어 보내고,
+      재시도 규칙(연결 실패는 전 메서드, 5xx·429 는 멱등 메서드만)을 지키는지 검증
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("supabase")
+
+import supabase_pool as sp
+
+URL, KEY = "https://example.supabase.co", "sb_secret_testkey"
+
+
+@pytest.fixture
+def wire(monkeypatch):
+    """실제 네트워크 대신 MockTransport — 요청 기록 후 responses 순서대로 응답"""
+    seen, responses = [], []
+
+    def handler(request):
+        seen.append(request)
+        nxt = responses.pop(0) if responses else httpx.Response(200, json=[])
+        if isinstance(nxt, Exception):
+            raise nxt
+        return nxt
+
+    monkeypatch.setattr(sp.httpx, "HTTPTransport", lambda **kw: httpx.MockTransport(handler))
+    monkeypatch.setenv("SUPABASE_MAX_RETRIES", "2")
+    monkeypatch.setattr(sp._PooledTransport, "_sleep", lambda self, attempt: None)
+    sp.reset_clients()
+    yield seen, responses
+    sp.reset_clients()
+
+
+def test_client_sends_auth_headers_and_default_timeouts(wire, monkeypatch):
+    seen, _ = wire
+    monkeypatch.setenv("SUPABASE_CONNECT_TIMEOUT", "4")
+    monkeypatch.setenv("SUPABASE_READ_TIMEOUT", "12")
+
+    sb = sp.get_supabase_client(URL, KEY)
+    assert sp.get_supabase_client(URL, KEY) is sb   # url/key/schema 별 싱글턴
+    sb.table("gk_people").select("*").execute()
+
+    req = seen[-1]
+    assert req.url.host == "example.supabase.co"
+    assert req.headers["apikey"] == KEY
+    assert req.headers["authorization"] == f"Bearer {KEY}"
+    assert req.extensions["timeout"] == {"connect": 4.0, "read": 12.0, "write": 12.0, "pool": 4.0}
+
+
+def test_call_timeout_overrides_per_request(wire):
+    seen, _ = wire
+    sb = sp.get_supabase_client(URL, KEY)
+    with sp.call_timeout(3):
+        sb.table("gk_people").select("*").execute()
+    sb.table("gk_people").select("*").execute()
+
+    assert seen[0].extensions["timeout"] == httpx.Timeout(3).as_dict()
+    assert seen[1].extensions["timeout"]["read"] != 3
+
+
+def test_idempotent_requests_retry_on_503(wire):
+    seen, responses = wire
+    responses += [httpx.Response(503), httpx.Response(200, json=[{"id": 1}])]
+    sb = sp.get_supabase_client(URL, KEY)
+    before = sp.get_pool_metrics()["retries"]
+
+    assert sb.table("gk_people").select("*").execute().data == [{"id": 1}]
+    assert len(seen) == 2
+    assert sp.get_pool_metrics()["retries"] == before + 1
+
+
+def test_writes_do_not_retry_on_503_but_retry_unsent_requests(wire):
+    seen, responses = wire
+    sb = sp.get_supabase_client(URL, KEY)
+
+    responses.append(httpx.Response(503, json={"message": "unavailable"}))
+    with pytest.raises(Exception):
+        sb.table("gk_people").insert({"name": "홍길동"}).execute()
+    assert len(seen) == 1
+
+    # 연결 실패 = 서버 미도달 → POST 도 재시도
+    responses += [httpx.ConnectError("refused"), httpx.Response(201, json=[{"id": 2}])]
+    assert sb.table("gk_people").insert({"name": "홍길동"}).execute().data == [{"id": 2}]
+    assert len(seen) == 3
+
+
+def test_retries_stop_at_limit(wire):
+    seen, responses = wire
+    responses += [httpx.ConnectError("refused")] * 5
+    sb = sp.get_supabase_client(URL, KEY)
+
+    with pytest.raises(Exception):
+        sb.table("gk_people").select("*").execute()
+    assert len(seen) == 3   # 최초 1회 + SUPABASE_MAX_RETRIES(2)
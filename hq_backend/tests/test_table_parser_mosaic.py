@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+결정론적 테이블 파서 — 모자이크 OCR 분할 테스트
+
+작성일: 2026-10-17
+목적: 긴 표의 셀 모자이크가 Tesseract 이미지 높이 한도(32767px)를 넘지 않게 나뉘고,
+      묶음 OCR 실패 시 셀별 OCR 로 폴백해 빈 결과가 조용히 반환되지 않는지 검증
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import modules.deterministic_table_parser as dtp
+
+TESSERACT_MAX = 32767
+ROWS, CELL_H, CELL_W = 1200, 40, 200   # 48,000px — 한 장 모자이크로는 한도 초과
+
+
+def _tall_table():
+    """셀 i 의 글자 영역을 명도 i % 120 으로 칠한 1열 표 (명도 = 셀 식별자)"""
+    cells = np.zeros(ROWS, dtype=dtp.CELL_DTYPE)
+    cells["row"] = np.arange(ROWS)
+    cells["y"] = np.arange(ROWS) * CELL_H
+    cells["width"], cells["height"], cells["ink"] = CELL_W, CELL_H, 1
+    gray = np.full((ROWS * CELL_H, CELL_W), 255, dtype=np.uint8)
+    for i in range(ROWS):
+        gray[i * CELL_H + 10:i * CELL_H + 30, 20:120] = i % 120
+    return cells, gray
+
+
+class _FakeTesseract:
+    """글자 픽셀 행 구간마다 그 명도를 단어로 돌려주는 image_to_data 대역"""
+
+    class Output:
+        DICT = "dict"
+
+    def __init__(self, fail_mosaic=False):
+        self.fail_mosaic = fail_mosaic
+        self.heights = []
+        self.single_calls = 0
+
+    def image_to_data(self, image, lang, config, output_type):
+        self.heights.append(image.shape[0])
+        if image.shape[0] > TESSERACT_MAX or self.fail_mosaic:
+            raise RuntimeError("Image too large")
+        ink_rows = np.flatnonzero((image < 128).any(axis=1))
+        runs = np.split(ink_rows, np.flatnonzero(np.diff(ink_rows) > 1) + 1)
+        data = {k: [] for k in ("text", "top", "height", "block_num", "par_num", "line_num")}
+        for n, run in enumerate(runs):
+            data["text"].append(str(int(image[run].min())))
+            data["top"].append(int(run[0]))
+            data["height"].append(int(run.size))
+            data["block_num"].append(1)
+            data["par_num"].append(1)
+            data["line_num"].append(n)
+        return data
+
+    def image_to_string(self, image, lang, config):
+        self.single_calls += 1
+        return str(int(image.min()))
+
+
+def _run(monkeypatch, fake):
+    monkeypatch.setattr(dtp, "TESSERACT_AVAILABLE", True)
+    monkeypatch.setattr(dtp, "pytesseract", fake, raising=False)
+    cells, gray = _tall_table()
+    return dtp.DeterministicTableParser()._extract_cells_text(gray, cells)
+
+
+def test_tall_table_is_split_under_tesseract_limit(monkeypatch):
+    fake = _FakeTesseract()
+    texts = _run(monkeypatch, fake)
+
+    assert len(fake.heights) >= 2
+    assert max(fake.heights) <= TESSERACT_MAX
+    assert texts == [str(i % 120) for i in range(ROWS)]
+
+
+def test_failed_mosaic_falls_back_to_per_cell_ocr(monkeypatch):
+    fake = _FakeTesseract(fail_mosaic=True)
+    texts = _run(monkeypatch, fake)
+
+    assert fake.single_calls == ROWS
+    assert texts == [str(i % 120) for i in range(ROWS)]
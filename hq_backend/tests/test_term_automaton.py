@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+Term Automaton 테스트
+Aho–Corasick 매칭 정확성 및 glossary 변경 시 캐시 재생성 검증
+
+작성일: 2026-10-17
+목적: 질의 확장 용어 추출을 단일 스캔으로 대체해도 결과가 동일함을 보장
+"""
+
+import sys
+import json
+import random
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from hq_backend.services.term_automaton import TermAutomaton
+from hq_backend.services.query_expansion_engine import QueryExpansionEngine
+
+
+def test_matches_equal_naive_substring_scan():
+    """겹치는/포함 관계 패턴까지 단순 부분 문자열 검사와 동일한 결과"""
+    patterns = ["갱신형", "비갱신형", "갱신", "신형", "암", "암 진단금", "he", "she", "hers"]
+    automaton = TermAutomaton(patterns)
+
+    rng = random.Random(7)
+    alphabet = list("갱신비형암 진단금hers")
+    for _ in range(500):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 20)))
+        expected = {i for i, p in enumerate(patterns) if p in text}
+        assert set(automaton.find(text)) == expected, text
+
+
+def test_engine_rebuilds_cache_only_when_glossary_changes():
+    """glossary.json 변경 시에만 오토마톤 재생성"""
+    with tempfile.TemporaryDirectory() as tmp:
+        glossary_path = Path(tmp) / "glossary.json"
+        cache_path = Path(tmp) / "glossary.automaton.json"
+        glossary_path.write_text(json.dumps([
+            {"term": "특약", "definition": "특별약관", "synonyms": ["Rider"]}
+        ], ensure_ascii=False), encoding="utf-8")
+
+        engine = QueryExpansionEngine(str(glossary_path), str(cache_path))
+        first_mtime = cache_path.stat().st_mtime_ns
+        assert [t["standard_term"] for t in engine.extract_terms_from_query("rider 추가?")] == ["특약"]
+
+        QueryExpansionEngine(str(glossary_path), str(cache_path))
+        assert cache_path.stat().st_mtime_ns == first_mtime
+
+        glossary_path.write_text(json.dumps([
+            {"term": "특약", "definition": "특별약관", "synonyms": ["Rider"]},
+            {"term": "해지환급금", "definition": "해지 시 돌려받는 금액", "synonyms": []}
+        ], ensure_ascii=False), encoding="utf-8")
+
+        engine = QueryExpansionEngine(str(glossary_path), str(cache_path))
+        matched, expanded = engine.match_query("중간에 해지하면 해지환급금 얼마야?")
+        assert [t["standard_term"] for t in matched] == ["해지환급금"]
+        assert expanded == ["중도해지", "해약", "해지환급금"]
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+Zephyr TTS 오디오 캐시 테스트
+
+작성일: 2026-10-17
+목적: 콘텐츠 주소 캐시 키·적중·용량 초과 축출과 캐시 파일 권한(0700/0600) 검증
+"""
+
+import os
+import sys
+import stat
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import voice_engine as ve
+
+MODEL = "gemini-tts-test"
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    d = tmp_path / "tts"
+    monkeypatch.setattr(ve, "_TTS_CACHE_DIR", str(d))
+    monkeypatch.setattr(ve, "_tts_cache_bytes", -1)
+    return d
+
+
+def _pcm(seed, n=4000):
+    t = np.arange(n)
+    return (np.sin(t / (5 + seed)) * 8000).astype("<i2").tobytes()
+
+
+def test_cache_key_depends_on_text_model_and_voice():
+    key = ve._tts_cache_key("안녕하세요.", MODEL)
+    assert key == ve._tts_cache_key("안녕하세요.", MODEL)
+    assert len(key) == 64
+    assert key != ve._tts_cache_key("안녕하세요!", MODEL)
+    assert key != ve._tts_cache_key("안녕하세요.", "other-model")
+    assert key != ve._tts_cache_key("안녕하세요.", MODEL, voice="Puck")
+    assert ve._tts_plain_text("**안녕**하세요") == "안녕하세요"
+
+
+def test_cache_hit_returns_same_audio_and_files_are_private(cache_dir):
+    pcm = _pcm(1)
+    assert ve._tts_cache_get("인사", MODEL) is None
+
+    ve._tts_cache_put("인사", MODEL, pcm)
+    wav = ve._tts_cache_get("인사", MODEL)
+
+    assert wav == ve._pcm_to_wav(pcm)
+    assert ve._tts_cache_get("인사", "other-model") is None
+
+    path = ve._tts_cache_path(ve._tts_cache_key("인사", MODEL))
+    if os.name != "nt":
+        assert stat.S_IMODE(os.stat(cache_dir).st_mode) == 0o700
+        assert stat.S_IMODE(os.stat(os.path.dirname(path)).st_mode) == 0o700
+        assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+
+def test_eviction_removes_least_recently_used(cache_dir, monkeypatch):
+    ve._tts_cache_put("first", MODEL, _pcm(1))
+    entry = ve._tts_cache_entries()[0][1]
+    # 3개는 넘고 2개는 들어가는 한도 — 3번째 쓰기에서 90% 목표까지 축출
+    monkeypatch.setattr(ve, "_TTS_CACHE_MAX_BYTES", int(entry * 2.5))
+
+    ve._tts_cache_put("second", MODEL, _pcm(1))
+    old = time.time() - 3600
+    os.utime(ve._tts_cache_path(ve._tts_cache_key("second", MODEL)), (old, old))
+    os.utime(ve._tts_cache_path(ve._tts_cache_key("first", MODEL)), (old + 60, old + 60))
+    assert ve._tts_cache_get("first", MODEL) is not None   # 적중 = 최근 사용 갱신
+
+    ve._tts_cache_put("third", MODEL, _pcm(1))
+
+    assert ve._tts_cache_get("second", MODEL) is None
+    assert ve._tts_cache_get("first", MODEL) is not None
+    assert ve._tts_cache_get("third", MODEL) is not None
+    assert ve._tts_cache_bytes <= ve._TTS_CACHE_MAX_BYTES
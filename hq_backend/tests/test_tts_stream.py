@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+Zephyr TTS 스트리밍 합성 테스트
+
+작성일: 2026-10-17
+목적: 세그먼트 분할 규칙, 동시 합성 결과의 순서 보장, 전체 음성 캐시 저장,
+      플레이어 대기 한도와 서버 세그먼트 한도 정합성 검증
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import voice_engine as ve
+
+TEXT = (
+    "안녕하세요, 오늘의 브리핑입니다. 김철수 고객님의 자동차보험이 다음 주 만기입니다. "
+    "이영희 고객님은 실손 청구 서류가 도착했습니다. 박민수 고객님 생일이 내일입니다! "
+    "오후 세 시 상담 일정이 있습니다. 좋은 하루 보내세요."
+)
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(ve, "_TTS_CACHE_DIR", str(tmp_path / "tts"))
+    monkeypatch.setattr(ve, "_tts_cache_bytes", -1)
+    return tmp_path / "tts"
+
+
+def _fake_synth(delays=None, fail=()):
+    """세그먼트 i → 2바이트 PCM(i) WAV. delays[i] 초 지연, fail 에 든 세그먼트는 None."""
+    def synth(seg, api_key):
+        i = synth.segments.index(seg)
+        time.sleep((delays or {}).get(i, 0))
+        return None if i in fail else ve._pcm_to_wav(bytes([i, 0]))
+    return synth
+
+
+def test_split_first_segment_is_single_sentence_and_rest_fit():
+    segs = ve.split_tts_segments(TEXT, max_chars=40)
+    assert segs[0] == "안녕하세요, 오늘의 브리핑입니다."
+    assert all(len(s) <= 40 for s in segs[1:])
+    assert " ".join(segs) == ve._tts_plain_text(TEXT)
+    assert ve.split_tts_segments("") == []
+    assert ve.split_tts_segments("한 문장뿐입니다.") == ["한 문장뿐입니다."]
+
+
+def test_split_keeps_overlong_sentence_whole():
+    long_sentence = "가" * 100 + "."
+    segs = ve.split_tts_segments(f"인사. {long_sentence} 끝.", max_chars=40)
+    assert segs == ["인사.", long_sentence, "끝."]
+
+
+def test_stream_yields_in_segment_order_even_if_later_segments_finish_first(cache_dir, monkeypatch):
+    segs = ve.split_tts_segments(TEXT, max_chars=40)
+    synth = _fake_synth(delays={0: 0.2, 1: 0.1})
+    synth.segments = segs
+    monkeypatch.setattr(ve, "synthesize_zephyr", synth)
+
+    out = list(ve.synthesize_zephyr_stream(segs, "key", workers=len(segs), text=TEXT))
+
+    assert [i for i, _w in out] == list(range(len(segs)))
+    assert [ve._wav_to_pcm(w) for _i, w in out] == [bytes([i, 0]) for i in range(len(segs))]
+    # 전 세그먼트 성공 → 원문 키로 이어 붙인 음성 캐시
+    assert ve.is_zephyr_cached(TEXT)
+    cached = ve._tts_cache_get(ve._tts_plain_text(TEXT), ve._tts_model_ok or ve._ZEPHYR_MODEL)
+    assert ve._wav_to_pcm(cached) == b"".join(bytes([i, 0]) for i in range(len(segs)))
+
+
+def test_stream_failed_segment_yields_none_and_skips_full_cache(cache_dir, monkeypatch):
+    segs = ve.split_tts_segments(TEXT, max_chars=40)
+    synth = _fake_synth(fail={1})
+    synth.segments = segs
+    monkeypatch.setattr(ve, "synthesize_zephyr", synth)
+
+    out = dict(ve.synthesize_zephyr_stream(segs, "key", text=TEXT))
+
+    assert out[1] is None
+    assert all(out[i] for i in out if i != 1)
+    assert not ve.is_zephyr_cached(TEXT)
+
+
+def test_player_waits_at_least_as_long_as_server_timeout():
+    html = ve._build_player_html("[]", "ko-KR", {"icon": "🎙️"}, "k", "false", stream_id="sid")
+    assert f"var waitMax = {ve._STREAM_WAIT_MS};" in html
+    assert ve._STREAM_WAIT_MS >= ve._STREAM_TIMEOUT * 1000
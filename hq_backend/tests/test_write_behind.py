@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+write-behind 로그 큐 테스트
+
+작성일: 2026-10-17
+목적: 큐 포화·기록 실패 시 행이 스필 파일(0700 디렉터리 · 0600 파일)로 우회되고,
+      백엔드 복구 후 재전송되며, log_consulting 이 실제 적재 결과를 반환하는지 검증
+"""
+
+import os
+import sys
+import json
+import stat
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import write_behind
+from write_behind import WriteBehindQueue
+
+
+class _FakeClient:
+    """sb.table(t).insert(rows).execute() 대역 — fail=True 면 예외"""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.rows = []
+
+    def table(self, name):
+        client = self
+
+        class _Q:
+            def insert(self, rows):
+                self._rows = rows
+                return self
+
+            def upsert(self, rows, on_conflict=""):
+                return self.insert(rows)
+
+            def execute(self):
+                if client.fail:
+                    raise RuntimeError("backend down")
+                client.rows.extend((name, r) for r in self._rows)
+
+        return _Q()
+
+
+def _queue(tmp_path, client, **kw):
+    kw.setdefault("flush_interval", 60.0)
+    kw.setdefault("batch_size", 100)
+    return WriteBehindQueue(
+        client_getter=lambda: client, max_retries=0,
+        spill_path=str(tmp_path / "wb" / "spill.jsonl"), **kw,
+    )
+
+
+def _spilled(wb):
+    with open(wb.spill_path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_queue_overflow_spills_and_reports_false(tmp_path):
+    client = _FakeClient()
+    wb = _queue(tmp_path, client, max_queue=2)
+    try:
+        assert wb.enqueue("gk_consulting_logs", {"n": 1})
+        assert wb.enqueue("gk_consulting_logs", {"n": 2})
+        assert not wb.enqueue("gk_consulting_logs", {"n": 3})
+
+        assert [r["row"] for r in _spilled(wb)] == [{"n": 3}]
+        assert wb.stats["spilled"] == 1
+        assert wb.flush() == 2
+    finally:
+        wb.close()
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX 권한 비트")
+def test_spill_file_is_private(tmp_path):
+    wb = _queue(tmp_path, _FakeClient(fail=True))
+    try:
+        wb.enqueue("gk_consulting_logs", {"content": "고객 상담 원문"})
+        assert wb.flush() == 0
+    finally:
+        wb.close()
+
+    assert stat.S_IMODE(os.stat(os.path.dirname(wb.spill_path)).st_mode) == 0o700
+    assert stat.S_IMODE(os.stat(wb.spill_path).st_mode) == 0o600
+    assert _spilled(wb)[0]["row"] == {"content": "고객 상담 원문"}
+
+
+def test_replay_resends_spilled_rows_after_recovery(tmp_path):
+    client = _FakeClient(fail=True)
+    wb = _queue(tmp_path, client)
+    try:
+        for n in range(3):
+            wb.enqueue("gk_consulting_logs", {"n": n})
+        wb.flush()
+        assert len(_spilled(wb)) == 3
+
+        client.fail = False
+        assert wb.replay_spill() == 3
+        assert [r for _t, r in client.rows] == [{"n": 0}, {"n": 1}, {"n": 2}]
+        assert not os.path.exists(wb.spill_path)
+        assert not os.path.exists(wb.spill_path + ".replay")
+    finally:
+        wb.close()
+
+
+def test_log_consulting_returns_enqueue_result(monkeypatch):
+    import db_utils
+
+    monkeypatch.setattr(write_behind, "enqueue_row", lambda *a, **k: False)
+    assert db_utils.log_consulting("agent", "person", "manual", "메모") is False
+
+    monkeypatch.setattr(write_behind, "enqueue_row", lambda *a, **k: True)
+    assert db_utils.log_consulting("agent", "person", "manual", "메모") is True
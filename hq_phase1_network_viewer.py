@@ -118,6 +118,9 @@ def _render_tag_detail(person_id: str, agent_id: str, tag_type: str, color: str,
     
     st.markdown(f"**총 {len(tags)}건의 {tag_type} 관계**")
     
+    # [GP-BATCH] 관계 대상 고객 조회를 in_() 1회로 합침
+    du.prime_customer_cards([t.get("related_person_id", "") for t in tags], agent_id)
+    
     for tag in tags:
         related_pid = tag.get("related_person_id", "")
         memo = tag.get("memo", "")
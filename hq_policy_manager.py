@@ -55,7 +55,7 @@ def auto_schedule_expiry_reminder(
         return []
     
     try:
-        from db_utils import _get_sb
+        from db_utils import _get_sb, bulk_upsert_schedules
         sb = _get_sb()
         if not sb:
             return []
@@ -82,7 +82,7 @@ def auto_schedule_expiry_reminder(
                 if f"#증권_{policy_id}" in schedule.get("tags", []):
                     return []
         
-        created_schedule_ids = []
+        schedule_payloads = []
         
         # 자동차 보험: 4주 전, 2주 전 (총 2건)
         if policy_category == "자동차":
@@ -132,12 +132,10 @@ def auto_schedule_expiry_reminder(
                 "is_deleted": False
             }
             
-            # gk_schedules에 삽입
-            result = sb.table("gk_schedules").insert(schedule_data).execute()
-            
-            if result and result.data:
-                schedule_id = result.data[0].get("schedule_id")
-                created_schedule_ids.append(schedule_id)
+            schedule_payloads.append(schedule_data)
+        
+        # gk_schedules 다중 행 upsert 1회
+        created_schedule_ids = bulk_upsert_schedules(schedule_payloads)["written"]
         
         return created_schedule_ids
     except Exception as e:
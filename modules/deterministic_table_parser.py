@@ -5,15 +5,42 @@ Bounding Box 기반 담보명-금액 1:1 매칭
 
 작성일: 2026-03-31
 목적: LLM 추론 의존도 최소화, 좌표 기반 정확한 데이터 추출
+
+[2026-10-17] 격자 재구성 엔진
+  셀 감지를 윤곽선(RETR_TREE) 탐색 → 괘선 마스크 투영 프로파일로 교체.
+  행/열 경계를 NumPy 로 직접 복원하고 셀은 구조화 배열(CELL_DTYPE)로 유지,
+  OCR 은 셀 이미지를 한 장으로 이어 붙여 표당 1회 호출.
 """
 
 import cv2
+import logging
 import numpy as np
 from typing import Dict, List, Optional, Tuple
 from PIL import Image
-import pytesseract
 import re
 
+try:
+    import pytesseract
+    TESSERACT_AVAILABLE = True
+except ImportError:
+    TESSERACT_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+# 셀 구조화 배열 — 행/열 번호·병합 범위·표 내부 좌표(px)
+CELL_DTYPE = np.dtype([
+    ("row",      np.int16),
+    ("col",      np.int16),
+    ("row_span", np.int16),
+    ("col_span", np.int16),
+    ("x",        np.int32),
+    ("y",        np.int32),
+    ("width",    np.int32),
+    ("height",   np.int32),
+    ("ink",      np.int32),   # 괘선 제외 글자 픽셀 수 (0 이면 빈 셀 → OCR 생략)
+])
+
 
 class DeterministicTableParser:
     """
@@ -31,6 +58,16 @@ class DeterministicTableParser:
         self.min_cell_width = 50
         self.min_cell_height = 20
         self.table_confidence_threshold = 0.7
+        
+        # 격자 재구성
+        self.line_ratio = 0.3         # 경계선 판정: 직교 축 길이 대비 괘선 픽셀 비율
+        self.separator_ratio = 0.5    # 셀 구간 내 경계선 점유율 미만이면 병합 셀
+        self.min_gap = 15             # 괘선 없는 축의 열/행 공백 최소 폭 (px, 단어 간격보다 넓게)
+        
+        # 일괄 OCR 모자이크
+        self.mosaic_padding = 12      # 셀 띠 사이 여백 (px)
+        self.cell_inset = 2           # 셀 테두리 안쪽 여백 (px)
+        self.mosaic_max_height = 30000  # 모자이크 1장 최대 높이 (Tesseract 한도 32767px 미만)
     
     def parse_insurance_table(self, image: np.ndarray) -> Dict:
         """
@@ -130,23 +167,25 @@ class DeterministicTableParser:
         # 1. 테이블 영역 추출
         x, y, w, h = region["x"], region["y"], region["width"], region["height"]
         table_image = image[y:y+h, x:x+w]
+        gray = self._to_gray(table_image)
         
-        # 2. 셀 감지
-        cells = self._detect_cells(table_image)
+        # 2. 격자 재구성 (셀 구조화 배열)
+        cells, text_gray = self._detect_cells(gray)
         
-        if not cells:
+        if cells.size == 0:
             return None
         
-        # 3. 각 셀의 텍스트 추출
-        cell_data = []
-        for cell in cells:
-            text = self._extract_cell_text(table_image, cell)
-            cell_data.append({
-                "bbox": cell,
+        # 3. 셀 텍스트 일괄 추출 (표당 OCR 1회)
+        texts = self._extract_cells_text(text_gray, cells)
+        cell_data = [
+            {
+                "bbox": self._cell_bbox(cell),
                 "text": text,
-                "row": cell["row"],
-                "col": cell["col"]
-            })
+                "row": int(cell["row"]),
+                "col": int(cell["col"])
+            }
+            for cell, text in zip(cells, texts)
+        ]
         
         # 4. 행/열 구조화
         structured_data = self._structure_table_data(cell_data)
@@ -157,118 +196,348 @@ class DeterministicTableParser:
             "structured": structured_data
         }
     
-    def _detect_cells(self, table_image: np.ndarray) -> List[Dict]:
+    # ── 격자 재구성 ─────────────────────────────────────────────────────────
+    
+    @staticmethod
+    def _to_gray(image: np.ndarray) -> np.ndarray:
+        if len(image.shape) == 3:
+            return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        return image
+    
+    @staticmethod
+    def _cell_bbox(cell: np.void) -> Dict:
+        """구조화 배열 원소 → 기존 bbox dict 형식 (JSON 출력용)"""
+        x, y, w, h = int(cell["x"]), int(cell["y"]), int(cell["width"]), int(cell["height"])
+        return {
+            "x": x,
+            "y": y,
+            "width": w,
+            "height": h,
+            "center_x": x + w // 2,
+            "center_y": y + h // 2,
+            "row": int(cell["row"]),
+            "col": int(cell["col"]),
+            "row_span": int(cell["row_span"]),
+            "col_span": int(cell["col_span"])
+        }
+    
+    @staticmethod
+    def _line_runs(mask_1d: np.ndarray, merge_gap: int = 3) -> np.ndarray:
         """
-        테이블 셀 감지
+        참/거짓 1차원 프로파일 → 연속 구간 [(시작, 끝)] (끝 포함)
+        merge_gap 이하로 떨어진 구간은 하나로 병합 (이중 괘선·안티앨리어싱)
+        """
+        idx = np.flatnonzero(mask_1d)
+        if idx.size == 0:
+            return np.empty((0, 2), dtype=np.int64)
+        breaks = np.flatnonzero(np.diff(idx) > merge_gap)
+        starts = idx[np.r_[0, breaks + 1]]
+        ends = idx[np.r_[breaks, idx.size - 1]]
+        return np.stack([starts, ends], axis=1)
+    
+    def _boundaries(self, line_profile: np.ndarray, ink_profile: np.ndarray,
+                    length: int, span: int, min_size: int) -> Tuple[np.ndarray, bool]:
+        """
+        한 축의 셀 경계 좌표 복원
         
         Args:
-            table_image: 테이블 영역 이미지
+            line_profile: 괘선 마스크 투영 (경계선 위치별 괘선 픽셀 수)
+            ink_profile: 글자 픽셀 투영 (괘선 없는 표의 공백 간격 탐지용)
+            length: 축 길이 (px)
+            span: 직교 축 길이 — 괘선 판정 기준 (span × line_ratio 이상)
+            min_size: 최소 셀 크기 (이보다 좁은 구간은 괘선 잔여물로 간주)
         
         Returns:
-            셀 리스트 (Bounding Box + 행/열 정보)
+            (경계 좌표 배열 — 양 끝 포함, 괘선 기반 여부)
         """
-        # 1. 그레이스케일 변환
-        if len(table_image.shape) == 3:
-            gray = cv2.cvtColor(table_image, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = table_image.copy()
+        runs = self._line_runs(line_profile >= span * self.line_ratio)
+        cuts = (runs[:, 0] + runs[:, 1]) // 2
+        # 내부 괘선이 하나라도 있어야 괘선 기반 (바깥 테두리만 있는 표 제외)
+        from_lines = len(runs) >= 3
+        if not from_lines:
+            # 내부 괘선 없는 축 — 글자 투영의 내부 공백 구간 중앙을 경계로 추가
+            gaps = self._line_runs(ink_profile == 0, merge_gap=1)
+            gaps = gaps[
+                ((gaps[:, 1] - gaps[:, 0] + 1) >= self.min_gap)
+                & (gaps[:, 0] > 0) & (gaps[:, 1] < length - 1)
+            ]
+            cuts = np.union1d(cuts, (gaps[:, 0] + gaps[:, 1]) // 2)
+        
+        # 바깥 경계 밖에 글자가 있으면 이미지 끝을 경계로 보충 (테두리 없는 표)
+        inked = np.flatnonzero(ink_profile)
+        if cuts.size == 0 or (inked.size and inked[0] < cuts[0] - min_size // 2):
+            cuts = np.r_[0, cuts]
+        if cuts[-1] < length - 1 and inked.size and inked[-1] > cuts[-1] + min_size // 2:
+            cuts = np.r_[cuts, length - 1]
+        if cuts.size < 2:
+            cuts = np.r_[cuts, length - 1]
+        
+        # 최소 크기 미만 구간 제거 (인접 경계 병합)
+        keep = np.r_[True, np.diff(cuts) >= min_size]
+        return cuts[keep], from_lines
+    
+    @staticmethod
+    def _separator_coverage(line_mask: np.ndarray, cuts: np.ndarray,
+                            spans: np.ndarray, band: int = 2) -> np.ndarray:
+        """
+        내부 경계선별·직교 구간별 괘선 점유율 (팽창 + 누적합, 반복문 없음)
         
-        # 2. 이진화
+        Args:
+            line_mask: (span축 × cut축) 괘선 마스크 — 수직선은 그대로, 수평선은 전치해서 전달
+            cuts: 내부 경계 좌표 (cut축)
+            spans: 직교 축 경계 좌표 (구간 수 + 1)
+        
+        Returns:
+            (len(spans) - 1, len(cuts)) 점유율 0~1
+        """
+        if cuts.size == 0:
+            return np.ones((len(spans) - 1, 0))
+        # 경계선 주변 ±band 열 중 하나라도 괘선이면 점유
+        widened = cv2.dilate(line_mask, cv2.getStructuringElement(cv2.MORPH_RECT, (2 * band + 1, 1)))
+        on = widened[:, cuts] > 0                               # (span축, len(cuts))
+        on_cs = np.concatenate([np.zeros((1, on.shape[1]), dtype=np.int32),
+                                np.cumsum(on, axis=0, dtype=np.int32)], axis=0)
+        y0, y1 = spans[:-1], spans[1:]
+        return (on_cs[y1] - on_cs[y0]) / np.maximum(y1 - y0, 1)[:, None]
+    
+    @staticmethod
+    def _merge_labels(open_right: np.ndarray, open_down: np.ndarray) -> np.ndarray:
+        """
+        병합 셀 라벨링 — 경계선이 끊긴 인접 격자칸을 같은 라벨로 전파 (최솟값 전파)
+        
+        Args:
+            open_right: (R, C-1) 칸 (r, c) 와 (r, c+1) 사이 수직선 없음
+            open_down: (R-1, C) 칸 (r, c) 와 (r+1, c) 사이 수평선 없음
+        """
+        n_rows, n_cols = open_right.shape[0], open_down.shape[1]
+        labels = np.arange(n_rows * n_cols).reshape(n_rows, n_cols)
+        if not (open_right.any() or open_down.any()):
+            return labels
+        while True:
+            prev = labels.copy()
+            m = np.minimum(labels[:, :-1], labels[:, 1:])
+            labels[:, :-1] = np.where(open_right, m, labels[:, :-1])
+            labels[:, 1:] = np.where(open_right, m, labels[:, 1:])
+            m = np.minimum(labels[:-1, :], labels[1:, :])
+            labels[:-1, :] = np.where(open_down, m, labels[:-1, :])
+            labels[1:, :] = np.where(open_down, m, labels[1:, :])
+            if np.array_equal(prev, labels):
+                return labels
+    
+    def _detect_cells(self, gray: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        테이블 셀 감지 — 괘선 마스크 + 투영 프로파일 격자 재구성
+        
+        Args:
+            gray: 테이블 영역 그레이스케일 이미지
+        
+        Returns:
+            (셀 구조화 배열 CELL_DTYPE — 행 우선 정렬,
+             괘선을 지운 그레이스케일 이미지 — OCR 입력)
+        """
+        h, w = gray.shape[:2]
+        
+        # 1. 이진화
         _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
         
-        # 3. 윤곽선 검출
-        contours, _ = cv2.findContours(
-            binary, cv2.RETR_TREE, cv2.CHAIN_APPROX_SIMPLE
+        # 2. 괘선 마스크 (표 크기에 비례한 커널 — 글자 획은 통과하지 못함)
+        h_len = max(40, w // 30)
+        v_len = max(self.min_cell_height, min(40, h // 10))
+        h_mask = cv2.morphologyEx(
+            binary, cv2.MORPH_OPEN, cv2.getStructuringElement(cv2.MORPH_RECT, (h_len, 1))
         )
+        v_mask = cv2.morphologyEx(
+            binary, cv2.MORPH_OPEN, cv2.getStructuringElement(cv2.MORPH_RECT, (1, v_len))
+        )
+        line_mask = cv2.bitwise_or(h_mask, v_mask)
+        ink = cv2.bitwise_and(binary, cv2.bitwise_not(line_mask))
+        
+        # 3. 투영 프로파일 → 행/열 경계
+        ink_bool = ink > 0
+        ys, rows_ruled = self._boundaries(
+            np.count_nonzero(h_mask, axis=1), np.count_nonzero(ink_bool, axis=1),
+            h, w, max(4, self.min_cell_height // 2)
+        )
+        xs, cols_ruled = self._boundaries(
+            np.count_nonzero(v_mask, axis=0), np.count_nonzero(ink_bool, axis=0),
+            w, h, max(4, self.min_cell_width // 2)
+        )
+        n_rows, n_cols = len(ys) - 1, len(xs) - 1
+        if n_rows < 1 or n_cols < 1:
+            return np.empty(0, dtype=CELL_DTYPE), gray
         
-        # 4. 셀 후보 필터링
-        cells = []
-        for contour in contours:
-            x, y, w, h = cv2.boundingRect(contour)
-            
-            # 최소 크기 필터
-            if w > self.min_cell_width and h > self.min_cell_height:
-                cells.append({
-                    "x": x,
-                    "y": y,
-                    "width": w,
-                    "height": h,
-                    "center_x": x + w // 2,
-                    "center_y": y + h // 2
-                })
-        
-        # 5. 행/열 정보 추가
-        cells = self._assign_row_col(cells)
+        # 4. 병합 셀 — 괘선으로 복원한 축만 내부 경계선 끊김을 병합으로 해석
+        if cols_ruled:
+            open_right = self._separator_coverage(v_mask, xs[1:-1], ys) < self.separator_ratio
+        else:
+            open_right = np.zeros((n_rows, n_cols - 1), dtype=bool)
+        if rows_ruled:
+            open_down = (self._separator_coverage(np.ascontiguousarray(h_mask.T), ys[1:-1], xs) < self.separator_ratio).T
+        else:
+            open_down = np.zeros((n_rows - 1, n_cols), dtype=bool)
+        labels = self._merge_labels(open_right, open_down).ravel()
+        
+        # 5. 라벨별 행/열 범위 → 셀 배열
+        rr, cc = np.divmod(np.arange(n_rows * n_cols), n_cols)
+        uniq, inv = np.unique(labels, return_inverse=True)
+        r0 = np.full(uniq.size, n_rows); np.minimum.at(r0, inv, rr)
+        c0 = np.full(uniq.size, n_cols); np.minimum.at(c0, inv, cc)
+        r1 = np.zeros(uniq.size, dtype=np.int64); np.maximum.at(r1, inv, rr)
+        c1 = np.zeros(uniq.size, dtype=np.int64); np.maximum.at(c1, inv, cc)
+        
+        cells = np.empty(uniq.size, dtype=CELL_DTYPE)
+        cells["row"], cells["col"] = r0, c0
+        cells["row_span"], cells["col_span"] = r1 - r0 + 1, c1 - c0 + 1
+        cells["x"], cells["y"] = xs[c0], ys[r0]
+        cells["width"], cells["height"] = xs[c1 + 1] - xs[c0], ys[r1 + 1] - ys[r0]
+        
+        # 셀별 글자 픽셀 수 — 적분 영상으로 일괄 계산
+        integral = cv2.integral(ink_bool.view(np.uint8))
+        x0, y0 = cells["x"], cells["y"]
+        x1, y1 = x0 + cells["width"], y0 + cells["height"]
+        cells["ink"] = integral[y1, x1] - integral[y0, x1] - integral[y1, x0] + integral[y0, x0]
+        
+        cells = cells[np.lexsort((cells["col"], cells["row"]))]
+        
+        # OCR 입력 — 괘선 픽셀을 배경색으로 지운 원본
+        text_gray = gray.copy()
+        text_gray[line_mask > 0] = 255
+        return cells, text_gray
+    
+    # ── 일괄 OCR ────────────────────────────────────────────────────────────
+    
+    def _cell_text_height(self, cells: np.ndarray) -> np.ndarray:
+        """셀 안쪽 글자 영역 높이 (모자이크 한 장을 넘지 않도록 상한)"""
+        cap = self.mosaic_max_height - 3 * self.mosaic_padding
+        return np.minimum(np.maximum(cells["height"] - 2 * self.cell_inset, 1), cap)
+    
+    def _mosaic_chunks(self, cells: np.ndarray) -> List[np.ndarray]:
+        """
+        글자가 있는 셀을 모자이크 높이 한도(mosaic_max_height) 이하 묶음으로 분할
         
-        return cells
+        Returns:
+            묶음별 셀 인덱스 배열 리스트 (셀 순서 유지)
+        """
+        pad = self.mosaic_padding
+        strip_h = self._cell_text_height(cells) + pad
+        chunks: List[np.ndarray] = []
+        current: List[int] = []
+        used = 2 * pad
+        for i in np.flatnonzero(cells["ink"] > 0):
+            if current and used + strip_h[i] > self.mosaic_max_height:
+                chunks.append(np.asarray(current))
+                current, used = [], 2 * pad
+            current.append(int(i))
+            used += int(strip_h[i])
+        if current:
+            chunks.append(np.asarray(current))
+        return chunks
     
-    def _assign_row_col(self, cells: List[Dict]) -> List[Dict]:
+    def _build_cell_mosaic(self, text_gray: np.ndarray, cells: np.ndarray,
+                           members: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
         """
-        셀에 행/열 번호 할당
+        글자가 있는 셀만 세로로 이어 붙인 단일 OCR 이미지
         
         Args:
-            cells: 셀 리스트
+            members: 모자이크에 넣을 셀 인덱스 (None 이면 글자가 있는 모든 셀)
         
         Returns:
-            행/열 정보가 추가된 셀 리스트
+            (모자이크 이미지, 셀별 띠 시작 y — 빈 셀·묶음 밖 셀은 -1)
         """
-        # Y 좌표 기준 정렬 (행)
-        cells_sorted_y = sorted(cells, key=lambda c: c["center_y"])
-        
-        # 행 그룹핑 (Y 좌표 유사도 기반)
-        rows = []
-        current_row = []
-        prev_y = -1000
-        
-        for cell in cells_sorted_y:
-            if abs(cell["center_y"] - prev_y) < 30:  # 같은 행
-                current_row.append(cell)
-            else:  # 새로운 행
-                if current_row:
-                    rows.append(current_row)
-                current_row = [cell]
-            prev_y = cell["center_y"]
-        
-        if current_row:
-            rows.append(current_row)
-        
-        # 각 행 내에서 X 좌표 기준 정렬 (열)
-        for row_idx, row in enumerate(rows):
-            row_sorted_x = sorted(row, key=lambda c: c["center_x"])
-            for col_idx, cell in enumerate(row_sorted_x):
-                cell["row"] = row_idx
-                cell["col"] = col_idx
-        
-        return cells
+        pad = self.mosaic_padding
+        inset = self.cell_inset
+        w = np.maximum(cells["width"] - 2 * inset, 1)
+        h = self._cell_text_height(cells)
+        filled = cells["ink"] > 0
+        if members is not None:
+            filled &= np.isin(np.arange(len(cells)), members)
+        strip_h = np.where(filled, h + pad, 0)
+        tops = np.cumsum(np.r_[pad, strip_h[:-1]])
+        
+        canvas = np.full(
+            (int(tops[-1] + strip_h[-1]) + pad, int(w[filled].max(initial=1)) + 2 * pad),
+            255, dtype=np.uint8
+        )
+        for i in np.flatnonzero(filled):
+            x, y = cells["x"][i] + inset, cells["y"][i] + inset
+            top = tops[i]
+            canvas[top:top + h[i], pad:pad + w[i]] = text_gray[y:y + h[i], x:x + w[i]]
+        return canvas, np.where(filled, tops, -1)
     
-    def _extract_cell_text(self, table_image: np.ndarray, cell: Dict) -> str:
+    def _extract_cells_text(self, text_gray: np.ndarray, cells: np.ndarray) -> List[str]:
         """
-        셀 텍스트 추출 (OCR)
+        셀 텍스트 일괄 추출 (모자이크 묶음당 OCR 1회)
+        
+        셀 이미지를 한 장으로 이어 붙여 image_to_data 를 호출하고,
+        단어 중심 y 좌표를 셀 띠 시작 좌표와 대조해 셀로 되돌린다.
+        긴 표는 Tesseract 이미지 높이 한도를 넘지 않도록 여러 장으로 나누고,
+        묶음 OCR 이 실패하면 그 묶음만 셀별 OCR 로 재시도한다.
         
         Args:
-            table_image: 테이블 이미지
-            cell: 셀 정보
+            text_gray: 괘선을 지운 테이블 이미지
+            cells: 셀 구조화 배열
         
         Returns:
-            추출된 텍스트
+            셀 순서와 같은 텍스트 리스트 (빈 셀·OCR 실패는 "")
         """
-        # 1. 셀 영역 추출
-        x, y, w, h = cell["x"], cell["y"], cell["width"], cell["height"]
-        cell_image = table_image[y:y+h, x:x+w]
-        
-        # 2. 전처리
-        if len(cell_image.shape) == 3:
-            gray = cv2.cvtColor(cell_image, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = cell_image.copy()
-        
-        # 3. OCR
+        texts = [""] * len(cells)
+        if not TESSERACT_AVAILABLE or not np.any(cells["ink"] > 0):
+            return texts
+        
+        for members in self._mosaic_chunks(cells):
+            mosaic, tops = self._build_cell_mosaic(text_gray, cells, members)
+            try:
+                data = pytesseract.image_to_data(
+                    mosaic, lang='kor+eng', config='--psm 6',
+                    output_type=pytesseract.Output.DICT
+                )
+            except Exception as e:
+                logger.warning(
+                    f"[GP-TABLE] 모자이크 OCR 실패({mosaic.shape[0]}px, 셀 {members.size}개) → 셀별 OCR: {e}"
+                )
+                for i in members:
+                    texts[i] = self._ocr_single_cell(text_gray, cells[i])
+                continue
+            self._assign_words(data, tops, texts)
+        return texts
+    
+    @staticmethod
+    def _assign_words(data: Dict, tops: np.ndarray, texts: List[str]) -> None:
+        """image_to_data 결과 단어를 띠 시작 y 로 셀에 배정 (texts 제자리 갱신)"""
+        words = np.array([t.strip() for t in data["text"]], dtype=object)
+        valid = words != ""
+        if not valid.any():
+            return
+        center_y = (np.asarray(data["top"]) + np.asarray(data["height"]) // 2)[valid]
+        line_key = (
+            np.asarray(data["block_num"]) * 1_000_000
+            + np.asarray(data["par_num"]) * 1_000
+            + np.asarray(data["line_num"])
+        )[valid]
+        
+        # 단어 → 셀 (띠 시작 y 오름차순 정렬 후 이진 탐색)
+        filled = np.flatnonzero(tops >= 0)
+        strip_of = np.searchsorted(tops[filled], center_y, side="right") - 1
+        owner = filled[np.clip(strip_of, 0, filled.size - 1)]
+        
+        lines: Dict[int, Dict[int, List[str]]] = {}
+        for cell_idx, key, word in zip(owner, line_key, words[valid]):
+            lines.setdefault(int(cell_idx), {}).setdefault(int(key), []).append(word)
+        for cell_idx, by_line in lines.items():
+            texts[cell_idx] = "\n".join(" ".join(ws) for ws in by_line.values())
+    
+    def _ocr_single_cell(self, text_gray: np.ndarray, cell: np.void) -> str:
+        """셀 1개 OCR (모자이크 실패 시 폴백, 실패는 "")"""
+        inset = self.cell_inset
+        x, y = int(cell["x"]) + inset, int(cell["y"]) + inset
+        w = max(int(cell["width"]) - 2 * inset, 1)
+        h = min(max(int(cell["height"]) - 2 * inset, 1), self.mosaic_max_height)
         try:
-            text = pytesseract.image_to_string(
-                gray, lang='kor+eng', config='--psm 6'
-            )
-            return text.strip()
-        except Exception:
+            return pytesseract.image_to_string(
+                text_gray[y:y + h, x:x + w], lang='kor+eng', config='--psm 6'
+            ).strip()
+        except Exception as e:
+            logger.warning(f"[GP-TABLE] 셀 OCR 실패 (row={cell['row']}, col={cell['col']}): {e}")
             return ""
     
     def _structure_table_data(self, cell_data: List[Dict]) -> Dict:
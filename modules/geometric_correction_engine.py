@@ -253,73 +253,123 @@ class GeometricCorrectionEngine:
         
         return result
     
-    def mesh_grid_dewarp(self, image: np.ndarray, grid_size: int = 20) -> np.ndarray:
+    def _mesh_displacement(self, rows: int, cols: int) -> np.ndarray:
+        """
+        메쉬 그리드 노드별 Y축 보정량 (rows+1, cols+1) — NumPy 브로드캐스팅
+
+        중앙에서 멀어질수록 보정 강도 감소, 중앙 띠 영역만 위로 볼록한 굴곡 펴기 (-10px × 강도)
+        """
+        center_row = rows // 2
+        center_col = cols // 2
+        max_dist = np.sqrt(center_row ** 2 + center_col ** 2)
+        dy = np.zeros((rows + 1, cols + 1), dtype=np.float32)
+        if max_dist == 0:
+            return dy
+
+        i = np.arange(rows + 1, dtype=np.float64)[:, None]
+        j = np.arange(cols + 1, dtype=np.float64)[None, :]
+        correction_factor = 1 - np.sqrt((i - center_row) ** 2 + (j - center_col) ** 2) / max_dist
+        band = (i > center_row * 0.3) & (i < center_row * 1.7)
+        dy[:] = np.where(band, -10 * correction_factor, 0.0)
+        return dy
+
+    @staticmethod
+    def _interp_matrix(n_out: int, n_nodes: int, step: int) -> np.ndarray:
+        """
+        노드 간격 step 의 1차원 선형 보간 가중치 행렬 (n_out, n_nodes)
+        노드 k 는 픽셀 k*step 에 위치, 마지막 노드 이후는 끝값 유지
+        """
+        pos = np.minimum(np.arange(n_out, dtype=np.float32) / step, n_nodes - 1)
+        lo = np.minimum(pos.astype(np.int32), max(n_nodes - 2, 0))
+        frac = pos - lo
+        weights = np.zeros((n_out, n_nodes), dtype=np.float32)
+        rows_idx = np.arange(n_out)
+        weights[rows_idx, lo] = 1 - frac
+        if n_nodes > 1:
+            weights[rows_idx, lo + 1] += frac
+        return weights
+
+    def mesh_grid_dewarp(
+        self,
+        image: np.ndarray,
+        grid_size: int = 20,
+        method: str = "remap",
+    ) -> np.ndarray:
         """
         Mesh-grid 기반 AI De-warping (두꺼운 증권 굴곡 보정)
-        
+
+        method="remap" (기본): 코스 그리드 변위장을 보간 행렬로 업샘플 → cv2.remap 1회
+            12MP 기준 1초 미만, 메모리 O(H×W) float32 맵 2장
+        method="tps": 기존 Thin Plate Spline 경로 (제어점 수³ 비용 — 고해상도에서 수 분 소요)
+
         Args:
             image: 입력 이미지
             grid_size: 메쉬 그리드 크기
-        
+            method: "remap" | "tps"
+
         Returns:
             보정된 이미지
         """
         h, w = image.shape[:2]
-        
-        # 1. 메쉬 그리드 생성
+
+        # 1. 메쉬 그리드 + 노드별 보정량
         rows = h // grid_size
         cols = w // grid_size
-        
-        # 2. 소스 포인트 (원본 그리드)
-        src_points = []
-        for i in range(rows + 1):
-            for j in range(cols + 1):
-                src_points.append([j * grid_size, i * grid_size])
-        src_points = np.float32(src_points)
-        
-        # 3. 목적지 포인트 (평평한 그리드)
+        dy = self._mesh_displacement(rows, cols)
+
+        if method == "tps":
+            return self._mesh_grid_dewarp_tps(image, grid_size, dy)
+
+        # 2. 변위장 업샘플 (H, W) = Wy @ dy @ Wx.T
+        field = (
+            self._interp_matrix(h, rows + 1, grid_size)
+            @ dy
+            @ self._interp_matrix(w, cols + 1, grid_size).T
+        )
+
+        # 3. 역매핑: 출력 (x, y) ← 입력 (x, y - dy)
+        map_x = np.broadcast_to(np.arange(w, dtype=np.float32)[None, :], (h, w)).copy()
+        map_y = np.arange(h, dtype=np.float32)[:, None] - field
+        del field
+
+        return cv2.remap(
+            image, map_x, map_y,
+            interpolation=cv2.INTER_LINEAR,
+            borderMode=cv2.BORDER_REPLICATE
+        )
+
+    def _mesh_grid_dewarp_tps(
+        self,
+        image: np.ndarray,
+        grid_size: int,
+        dy: np.ndarray,
+    ) -> np.ndarray:
+        """TPS (Thin Plate Spline) 변환 — 그리드 노드 전체를 제어점으로 사용"""
+        rows, cols = dy.shape[0] - 1, dy.shape[1] - 1
+
+        # 소스 포인트 (원본 그리드) / 목적지 포인트 (평평한 그리드)
+        gy, gx = np.mgrid[0:rows + 1, 0:cols + 1]
+        src_points = np.stack([gx * grid_size, gy * grid_size], axis=-1).reshape(-1, 2).astype(np.float32)
         dst_points = src_points.copy()
-        
-        # 4. 중앙 영역 굴곡 보정 (두꺼운 증권의 중앙 굴곡)
-        center_row = rows // 2
-        center_col = cols // 2
-        
-        for i in range(rows + 1):
-            for j in range(cols + 1):
-                idx = i * (cols + 1) + j
-                
-                # 중앙에서 멀어질수록 보정 강도 감소
-                dist_from_center = np.sqrt(
-                    (i - center_row) ** 2 + (j - center_col) ** 2
-                )
-                max_dist = np.sqrt(center_row ** 2 + center_col ** 2)
-                
-                if max_dist > 0:
-                    correction_factor = 1 - (dist_from_center / max_dist)
-                    
-                    # 중앙 영역 Y축 보정 (위로 볼록한 굴곡 펴기)
-                    if i > center_row * 0.3 and i < center_row * 1.7:
-                        y_offset = -10 * correction_factor
-                        dst_points[idx][1] += y_offset
-        
-        # 5. TPS (Thin Plate Spline) 변환 적용
+        dst_points[:, 1] += dy.reshape(-1)
+
         try:
             # OpenCV TPS 변환
             tps = cv2.createThinPlateSplineShapeTransformer()
             matches = [cv2.DMatch(i, i, 0) for i in range(len(src_points))]
-            
+
             src_shape = src_points.reshape(1, -1, 2)
             dst_shape = dst_points.reshape(1, -1, 2)
-            
+
             tps.estimateTransformation(dst_shape, src_shape, matches)
             result = tps.warpImage(image)
-            
+
         except Exception:
             # TPS 실패 시 Perspective Transform 폴백
             result = self.dewarp_document(image)
-        
+
         return result
-    
+
     def auto_correct(self, image: np.ndarray, high_fi: bool = True) -> Tuple[np.ndarray, dict]:
         """
         자동 기하학적 보정 (All-in-One) + High-Fi Scanning
@@ -341,8 +391,9 @@ class GeometricCorrectionEngine:
         
         # 2. Mesh-grid De-warp (AI 굴곡 보정)
         try:
-            corrected = self.mesh_grid_dewarp(corrected)
+            corrected = self.mesh_grid_dewarp(corrected, method="remap")
             correction_info["mesh_dewarp_applied"] = True
+            correction_info["mesh_dewarp_method"] = "remap"
         except Exception:
             corrected = self.dewarp_document(corrected)
             correction_info["dewarp_applied"] = True
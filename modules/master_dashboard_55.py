@@ -601,7 +601,7 @@ def process_file_pipeline(
             return False, None, None, None
         
         # [3단계] RAG 검색
-        from supabase import create_client
+        from supabase_pool import get_supabase_client
         import os
         
         _sb_url = os.getenv("SUPABASE_URL")
@@ -610,7 +610,7 @@ def process_file_pipeline(
         if not _sb_url or not _sb_key:
             return False, None, None, None
         
-        _sb = create_client(_sb_url, _sb_key)
+        _sb = get_supabase_client(_sb_url, _sb_key)
         
         # 간단한 RAG 검색 (실제로는 임베딩 기반 검색 필요)
         _rag_query = _sb.table("gk_knowledge_base").select(
@@ -304,11 +304,11 @@ def zero_trust_news_pipeline(url: str) -> None:
             try:
                 # Supabase 저장
                 from shared_components import get_env_secret
-                from supabase import create_client
+                from supabase_pool import get_supabase_client
                 
                 supabase_url = get_env_secret("SUPABASE_URL")
                 supabase_key = get_env_secret("SUPABASE_KEY")
-                supabase = create_client(supabase_url, supabase_key)
+                supabase = get_supabase_client(supabase_url, supabase_key)
                 
                 # 저장 데이터 준비
                 save_data = {
@@ -388,11 +388,11 @@ def render_news_crawler_ui():
     
     try:
         from shared_components import get_env_secret
-        from supabase import create_client
+        from supabase_pool import get_supabase_client
         
         supabase_url = get_env_secret("SUPABASE_URL")
         supabase_key = get_env_secret("SUPABASE_KEY")
-        supabase = create_client(supabase_url, supabase_key)
+        supabase = get_supabase_client(supabase_url, supabase_key)
         
         # 최근 뉴스 10개 조회
         response = supabase.table("gk_news")\
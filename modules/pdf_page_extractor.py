@@ -0,0 +1,357 @@
+# -*- coding: utf-8 -*-
+"""
+페이지 병렬 PDF 추출 엔진 (Page-parallel PDF Extractor)
+scan_engine.extract_text 의 pdfplumber / pypdf 단계를 페이지 샤드 단위로 프로세스 풀에 분산
+
+작성일: 2026-10-17
+목적: 200페이지 약관 PDF가 Streamlit 워커를 장시간 점유하는 문제 해소 +
+      동일 문서 재업로드·재분석 시 페이지 추출 결과 재사용
+
+핵심 동작:
+1. 페이지를 shard_size 단위 샤드로 나눠 워커 프로세스가 샤드마다 PDF를 1회 열어 추출
+2. 완료 순서와 무관하게 페이지 순서대로 스트리밍 (앞 페이지가 준비되는 즉시 방출)
+3. (파일 SHA-256, 페이지, 엔진) 단위 디스크 캐시 — 재스캔 시 미캐시 페이지만 추출
+   · 캐시에는 PII 마스킹된 텍스트·표만 기록 (mask_fn 미지정 시 캐시 사용 안 함)
+   · 생성 후 TTL(기본 24시간) 경과 문서는 삭제, 용량 한도 초과 시 오래된 순 삭제
+4. 소형 문서(샤드 1개)·프로세스 풀 장애 시 현재 프로세스에서 순차 추출 (결과 동일)
+"""
+
+import os
+import json
+import time
+import shutil
+import hashlib
+import logging
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger("scan_engine")
+
+ENGINES = ("pdfplumber", "pypdf")
+
+# (원문) → (마스킹 텍스트, {PII 유형: 건수}) — scan_engine._mask_pii_counts
+MaskFn = Callable[[str], Tuple[str, Dict[str, int]]]
+
+_CACHE_DIR = os.environ.get("GK_SCAN_PAGE_CACHE_DIR", "") or os.path.join(
+    tempfile.gettempdir(), "gk_scan_page_cache")
+_CACHE_MAX_BYTES = int(float(os.environ.get("GK_SCAN_PAGE_CACHE_MAX_MB", "500")) * 1024 * 1024)
+_CACHE_TTL_SECONDS = float(os.environ.get("GK_SCAN_PAGE_CACHE_TTL_HOURS", "24")) * 3600
+_CACHE_FORMAT = 2   # 2: PII 마스킹 텍스트 + 페이지별 PII 건수 (1 이하 원문 캐시는 무효)
+_WORKERS = int(os.environ.get("GK_SCAN_PAGE_WORKERS", "0")) or min(4, os.cpu_count() or 1)
+_SHARD_SIZE = int(os.environ.get("GK_SCAN_PAGE_SHARD", "8"))
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# 1. 워커 — 샤드 단위 추출 (모듈 최상위 함수: 프로세스 풀 pickle 대상)
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _extract_shard(pdf_path: str, engine: str, page_numbers: List[int]) -> List[Dict]:
+    """
+    샤드 페이지 추출 — PDF 는 샤드당 1회만 연다.
+
+    Returns:
+        [{"page": 페이지 번호(1부터), "text": str, "tables": [{"page", "headers", "rows"}]}]
+    """
+    results = []
+    if engine == "pdfplumber":
+        import pdfplumber
+        with pdfplumber.open(pdf_path) as pdf:
+            for pn in page_numbers:
+                page = pdf.pages[pn - 1]
+                tables = [
+                    {"page": pn, "headers": [t[0]], "rows": t[1:]}
+                    for t in (page.extract_tables() or [])
+                    if t and len(t) > 1
+                ]
+                results.append({"page": pn, "text": page.extract_text() or "", "tables": tables})
+                if hasattr(page, "flush_cache"):
+                    page.flush_cache()  # 페이지 객체 캐시 해제 → 샤드 메모리 상한 유지
+    elif engine == "pypdf":
+        import pypdf
+        reader = pypdf.PdfReader(pdf_path)
+        for pn in page_numbers:
+            results.append({"page": pn, "text": reader.pages[pn - 1].extract_text() or "", "tables": []})
+    else:
+        raise ValueError(f"지원하지 않는 추출 엔진: {engine}")
+    return results
+
+
+def count_pdf_pages(pdf_path: str) -> int:
+    import pypdf
+    return len(pypdf.PdfReader(pdf_path).pages)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# 2. 페이지 캐시 — {cache_dir}/{sha[:2]}/{sha}/{engine}/{page:05d}.json
+# ══════════════════════════════════════════════════════════════════════════════
+
+def file_sha256(file_bytes: bytes) -> str:
+    return hashlib.sha256(file_bytes).hexdigest()
+
+
+def _doc_dir(file_hash: str) -> str:
+    return os.path.join(_CACHE_DIR, file_hash[:2], file_hash)
+
+
+def _page_path(file_hash: str, engine: str, page: int) -> str:
+    return os.path.join(_doc_dir(file_hash), engine, f"{page:05d}.json")
+
+
+def _write_json(path: str, payload) -> None:
+    """원자적 기록 — 디렉터리 0700 · 파일 0600 (공용 임시 디렉터리의 다른 계정 열람 차단)."""
+    try:
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.debug(f"[GP190] 페이지 캐시 저장 실패: {e}")
+
+
+def _read_json(path: str):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def load_cached_page(file_hash: str, engine: str, page: int) -> Optional[Dict]:
+    hit = _read_json(_page_path(file_hash, engine, page))
+    return hit if hit and hit.get("format") == _CACHE_FORMAT else None
+
+
+def store_cached_page(file_hash: str, engine: str, result: Dict) -> None:
+    _write_json(_page_path(file_hash, engine, result["page"]), dict(result, format=_CACHE_FORMAT))
+
+
+def _meta_is_live(meta: Optional[Dict], now: float) -> bool:
+    """현재 형식(마스킹 캐시)이고 생성 후 TTL 이내인 문서만 유효."""
+    return bool(meta) and meta.get("format") == _CACHE_FORMAT and \
+        now - float(meta.get("created", 0)) <= _CACHE_TTL_SECONDS
+
+
+def _cached_page_count(file_hash: str) -> Optional[int]:
+    doc_dir = _doc_dir(file_hash)
+    meta = _read_json(os.path.join(doc_dir, "meta.json"))
+    if meta is not None and not _meta_is_live(meta, time.time()):
+        shutil.rmtree(doc_dir, ignore_errors=True)   # 만료·구형식(원문) 캐시 즉시 폐기
+        return None
+    return int(meta["pages"]) if meta and "pages" in meta else None
+
+
+def _prune_cache() -> None:
+    """만료·구형식 문서 삭제 후, 문서 디렉터리 단위로 최근 사용(mtime) 오래된 순 삭제 — 용량 한도의 90%까지."""
+    now = time.time()
+    docs = []
+    total = 0
+    for prefix in os.listdir(_CACHE_DIR) if os.path.isdir(_CACHE_DIR) else []:
+        prefix_dir = os.path.join(_CACHE_DIR, prefix)
+        for file_hash in os.listdir(prefix_dir) if os.path.isdir(prefix_dir) else []:
+            doc_dir = os.path.join(prefix_dir, file_hash)
+            if not _meta_is_live(_read_json(os.path.join(doc_dir, "meta.json")), now):
+                shutil.rmtree(doc_dir, ignore_errors=True)
+                continue
+            size = sum(
+                os.path.getsize(os.path.join(root, name))
+                for root, _, names in os.walk(doc_dir) for name in names
+            )
+            docs.append((os.path.getmtime(doc_dir), doc_dir, size))
+            total += size
+    if total <= _CACHE_MAX_BYTES:
+        return
+    for _, doc_dir, size in sorted(docs):
+        if total <= _CACHE_MAX_BYTES * 0.9:
+            break
+        shutil.rmtree(doc_dir, ignore_errors=True)
+        total -= size
+
+
+def _mask_page(result: Dict, mask_fn: MaskFn) -> Dict:
+    """페이지 텍스트·표 셀 PII 마스킹 — 건수는 본문 기준 (표 셀은 본문과 중복 집계 방지)."""
+    text, counts = mask_fn(result["text"])
+
+    def _cell(value):
+        return mask_fn(value)[0] if isinstance(value, str) else value
+
+    tables = [
+        dict(t, headers=[[_cell(c) for c in row] for row in t["headers"]],
+             rows=[[_cell(c) for c in row] for row in t["rows"]])
+        for t in result["tables"]
+    ]
+    return dict(result, text=text, tables=tables, pii=counts)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# 3. 프로세스 풀
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _get_pool(workers: int) -> Optional[ProcessPoolExecutor]:
+    global _pool
+    if workers <= 1:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=workers)
+        return _pool
+
+
+def _reset_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# 4. 페이지 순서 스트리밍
+# ══════════════════════════════════════════════════════════════════════════════
+
+def iter_pdf_page_results(
+    file_bytes: bytes,
+    engine: str = "pdfplumber",
+    workers: Optional[int] = None,
+    shard_size: int = _SHARD_SIZE,
+    use_cache: bool = True,
+    mask_fn: Optional[MaskFn] = None,
+) -> Iterator[Dict]:
+    """
+    페이지 결과를 페이지 순서대로 yield — 미캐시 페이지만 샤드로 나눠 프로세스 풀에서 추출.
+
+    mask_fn: 지정 시 추출 직후 텍스트·표를 마스킹해 캐시·반환 (pii = 페이지별 유형 건수).
+             미지정 시 원문이 디스크에 남지 않도록 캐시를 쓰지 않는다.
+
+    Yields:
+        {"page": int, "text": str, "tables": list, "cached": bool, "total": int[, "pii": dict]}
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"지원하지 않는 추출 엔진: {engine}")
+    use_cache = use_cache and mask_fn is not None
+    workers = _WORKERS if workers is None else workers
+    file_hash = file_sha256(file_bytes)
+
+    tmp_path = ""
+    try:
+        total = _cached_page_count(file_hash) if use_cache else None
+        if total is None:
+            fd, tmp_path = tempfile.mkstemp(suffix=".pdf")
+            with os.fdopen(fd, "wb") as f:
+                f.write(file_bytes)
+            total = count_pdf_pages(tmp_path)
+            if use_cache:
+                _write_json(os.path.join(_doc_dir(file_hash), "meta.json"),
+                            {"pages": total, "format": _CACHE_FORMAT, "created": time.time()})
+
+        ready: Dict[int, Dict] = {}
+        missing = []
+        for pn in range(1, total + 1):
+            hit = load_cached_page(file_hash, engine, pn) if use_cache else None
+            if hit is not None:
+                ready[pn] = dict(hit, cached=True)
+            else:
+                missing.append(pn)
+
+        if use_cache and total:
+            try:
+                os.utime(_doc_dir(file_hash))  # LRU 터치
+            except OSError:
+                pass
+
+        if missing and not tmp_path:
+            fd, tmp_path = tempfile.mkstemp(suffix=".pdf")
+            with os.fdopen(fd, "wb") as f:
+                f.write(file_bytes)
+
+        shards = [missing[i:i + max(1, shard_size)] for i in range(0, len(missing), max(1, shard_size))]
+        next_page = 1
+
+        def _accept(results: List[Dict]):
+            for r in results:
+                if mask_fn is not None:
+                    r = _mask_page(r, mask_fn)
+                if use_cache:
+                    store_cached_page(file_hash, engine, r)
+                ready[r["page"]] = dict(r, cached=False)
+
+        def _drain():
+            nonlocal next_page
+            while next_page in ready:
+                yield dict(ready.pop(next_page), total=total)
+                next_page += 1
+
+        yield from _drain()
+
+        pool = _get_pool(workers) if len(shards) > 1 else None
+        if pool is not None:
+            try:
+                futures = {pool.submit(_extract_shard, tmp_path, engine, shard): shard for shard in shards}
+                for fut in as_completed(futures):
+                    _accept(fut.result())
+                    yield from _drain()
+                shards = []
+            except BrokenProcessPool as e:
+                logger.warning(f"[GP190] 페이지 추출 프로세스 풀 장애 → 순차 추출: {e}")
+                _reset_pool()
+                shards = [[pn for pn in shard if pn not in ready and pn >= next_page] for shard in shards]
+
+        for shard in shards:
+            if shard:
+                _accept(_extract_shard(tmp_path, engine, shard))
+                yield from _drain()
+
+        if use_cache and missing:
+            _prune_cache()
+    finally:
+        if tmp_path:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+def extract_pdf_pages_parallel(
+    file_bytes: bytes,
+    engine: str = "pdfplumber",
+    on_page: Optional[Callable[[Dict], None]] = None,
+    workers: Optional[int] = None,
+    mask_fn: Optional[MaskFn] = None,
+) -> Dict:
+    """
+    scan_engine 추출 결과 형식으로 반환 (+ page_texts, cached_pages, pii).
+    on_page: 페이지가 순서대로 준비될 때마다 호출 (청크 분할 등 후속 단계 스트리밍용)
+    mask_fn: PII 마스킹 함수 — 지정 시 텍스트·표가 마스킹된 상태로 반환되고 페이지 캐시 사용
+    """
+    started = time.perf_counter()
+    page_texts, tables = [], []
+    pii: Dict[str, int] = {}
+    cached = 0
+    for result in iter_pdf_page_results(file_bytes, engine, workers=workers, mask_fn=mask_fn):
+        page_texts.append(result["text"])
+        tables.extend(result["tables"])
+        for label, n in result.get("pii", {}).items():
+            pii[label] = pii.get(label, 0) + n
+        cached += 1 if result["cached"] else 0
+        if on_page:
+            on_page(dict(result, engine=engine))
+    logger.info(
+        f"[GP190§4] 페이지 병렬 추출({engine}): {len(page_texts)}P "
+        f"(캐시 {cached}P) {time.perf_counter() - started:.2f}s"
+    )
+    return {
+        "text":         "\n".join(page_texts),
+        "tables":       tables,
+        "engine":       f"pdfplumber ({len(tables)}표)" if engine == "pdfplumber" else engine,
+        "pages":        len(page_texts),
+        "page_texts":   page_texts,
+        "cached_pages": cached,
+        "pii":          pii,
+    }
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+"""
+메모리 상한 PDF 페이지 래스터라이저 (Memory-bounded PDF Rasterizer)
+PyMuPDF 픽스맵 샘플을 NumPy 배열로 1회 복사 후 픽스맵 즉시 해제 → OpenCV 보정 단계에 직접 전달
+
+작성일: 2026-10-17
+목적: 대용량 스캔 의무기록 PDF 처리 시 페이지마다 JPEG 인코딩 → 디코딩이 반복되고
+      배치 단위로 이미지가 누적되어 컨테이너 RAM 이 급증하는 문제 해소
+
+핵심 동작:
+1. 페이지별 DPI 자동 선택 — 텍스트 레이어 밀도로 스캔본/전자문서 판별
+   (스캔본은 OCR 품질을 위해 고해상도, 전자문서는 기존 120 DPI, 작은 글씨 밀집 페이지는 중간)
+2. 메모리 예산(GK_RASTER_BUDGET_MB) — 픽스맵 + 보정 작업 버퍼 합계가 예산을 넘지 않도록 DPI 상한 적용
+3. 한 번에 픽스맵 1장만 유지 — 배열로 옮긴 직후 픽스맵 해제 + 페이지마다 MuPDF 저장소(store) 축소
+4. RasterWorkspace — CLAHE·Canny·회전 결과를 재사용 버퍼에 기록 (페이지마다 새 배열 할당 없음)
+"""
+
+import os
+import math
+import logging
+from typing import Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger("scan_engine")
+
+_BUDGET_MB   = float(os.environ.get("GK_RASTER_BUDGET_MB", "192"))
+DEFAULT_DPI  = 120      # 전자문서(텍스트 레이어 있음) — 기존 iter_pdf_pages 해상도
+DENSE_DPI    = 150      # 작은 글씨가 빽빽한 약관·표 페이지
+SCAN_DPI     = 200      # 텍스트 레이어 없는 스캔본 (OCR 대상)
+MIN_DPI      = 72
+
+# 페이지 분류 기준 (1제곱인치당 문자 수)
+_SCAN_CHARS_PER_IN2  = 2.0
+_DENSE_CHARS_PER_IN2 = 60.0
+
+# 픽스맵 외 보정 작업 버퍼 배수 (CLAHE 출력 + 에지 + 회전 출력)
+_WORK_BUFFERS = 3
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# 1. 페이지별 DPI 선택
+# ══════════════════════════════════════════════════════════════════════════════
+
+def budget_dpi(width_pt: float, height_pt: float, channels: int, budget_bytes: int,
+               work_buffers: int = _WORK_BUFFERS) -> int:
+    """예산 내 최대 DPI — 픽스맵(channels) + 그레이 작업 버퍼(work_buffers장) 합계 기준."""
+    bytes_per_px = channels + work_buffers
+    area_in2 = max(width_pt * height_pt / (72.0 * 72.0), 1e-6)
+    return int(math.sqrt(budget_bytes / (bytes_per_px * area_in2)))
+
+
+def choose_page_dpi(page, channels: int = 1, budget_bytes: Optional[int] = None) -> Tuple[int, Dict]:
+    """
+    텍스트 레이어 밀도 기반 DPI 선택 + 메모리 예산 상한.
+    반환: (dpi, {"text_chars", "chars_per_in2", "scanned", "budget_capped"})
+    """
+    budget_bytes = int(_BUDGET_MB * 1024 * 1024) if budget_bytes is None else budget_bytes
+    rect = page.rect
+    area_in2 = max(rect.width * rect.height / (72.0 * 72.0), 1e-6)
+    text_chars = len("".join(page.get_text("text").split()))
+    density = text_chars / area_in2
+    scanned = density < _SCAN_CHARS_PER_IN2
+    if scanned:
+        dpi = SCAN_DPI
+    elif density >= _DENSE_CHARS_PER_IN2:
+        dpi = DENSE_DPI
+    else:
+        dpi = DEFAULT_DPI
+    cap = budget_dpi(rect.width, rect.height, channels, budget_bytes)
+    info = {
+        "text_chars":    text_chars,
+        "chars_per_in2": round(density, 1),
+        "scanned":       scanned,
+        "budget_capped": cap < dpi,
+    }
+    return max(MIN_DPI, min(dpi, cap)), info
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# 2. 페이지 래스터 스트리밍
+# ══════════════════════════════════════════════════════════════════════════════
+
+def pdf_page_count(file_bytes: bytes) -> int:
+    import fitz
+    with fitz.open(stream=file_bytes, filetype="pdf") as doc:
+        return len(doc)
+
+
+def iter_pdf_rasters(
+    file_bytes: bytes,
+    grayscale: bool = True,
+    budget_mb: Optional[float] = None,
+    dpi: Optional[int] = None,
+    pages: Optional[range] = None,
+) -> Iterator[Dict]:
+    """
+    PDF 페이지를 순서대로 래스터화해 yield.
+
+    Yields:
+        {"index": 0부터 페이지 번호, "dpi": int, "image": np.ndarray (H×W 또는 H×W×3, uint8),
+         "text_chars": int, "scanned": bool, "budget_capped": bool}
+
+    "image" 는 픽스맵과 독립된 배열 — 다음 페이지로 넘어간 뒤에도 안전하게 보관·수정 가능
+    (픽스맵 버퍼 뷰를 넘기면 픽스맵 해제 후 해제된 메모리를 읽게 됨).
+    컬러는 RGB 순서 (OpenCV 사용 시 cv2.COLOR_RGB2BGR).
+    dpi 지정 시 자동 선택 대신 고정 DPI (예산 상한은 동일 적용).
+    """
+    import fitz
+
+    budget_bytes = int((_BUDGET_MB if budget_mb is None else budget_mb) * 1024 * 1024)
+    channels = 1 if grayscale else 3
+    colorspace = fitz.csGRAY if grayscale else fitz.csRGB
+
+    with fitz.open(stream=file_bytes, filetype="pdf") as doc:
+        for i in pages if pages is not None else range(len(doc)):
+            page = doc[i]
+            page_dpi, info = choose_page_dpi(page, channels, budget_bytes)
+            if dpi is not None:
+                cap = budget_dpi(page.rect.width, page.rect.height, channels, budget_bytes)
+                page_dpi = max(MIN_DPI, min(dpi, cap))
+                info["budget_capped"] = cap < dpi
+            zoom = page_dpi / 72.0
+            pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), colorspace=colorspace, alpha=False)
+            samples = np.frombuffer(pix.samples_mv, dtype=np.uint8).reshape(pix.h, pix.stride)
+            image = np.array(samples[:, :pix.w * pix.n])   # 픽스맵 버퍼 → 독립 배열 (stride 여백 제외)
+            if pix.n > 1:
+                image = image.reshape(pix.h, pix.w, pix.n)
+            del samples, pix, page
+            fitz.TOOLS.store_shrink(100)   # 디코딩된 스캔 이미지·폰트 캐시 해제
+            yield dict(info, index=i, dpi=page_dpi, image=image)
+            del image
+
+
+def encode_jpeg(image: np.ndarray, quality: int = 85, rgb: bool = True) -> bytes:
+    """래스터 배열 → JPEG 바이트 (Vision API 전송용 단일 인코딩)."""
+    import cv2
+    if image.ndim == 3 and rgb:
+        image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
+    ok, buf = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    if not ok:
+        raise ValueError("JPEG 인코딩 실패")
+    return buf.tobytes()
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# 3. 재사용 작업 버퍼
+# ══════════════════════════════════════════════════════════════════════════════
+
+class RasterWorkspace:
+    """
+    그레이스케일 보정 단계용 재사용 버퍼 풀.
+    take(name, shape) 는 같은 이름의 평탄 버퍼를 재사용해 (H, W) 뷰를 반환 —
+    더 큰 페이지가 오면 그때만 재할당. 결과 배열은 다음 take(name) 전까지만 유효.
+    """
+
+    def __init__(self):
+        self._buffers: Dict[str, np.ndarray] = {}
+
+    def take(self, name: str, shape: Tuple[int, ...], dtype=np.uint8) -> np.ndarray:
+        size = int(np.prod(shape))
+        buf = self._buffers.get(name)
+        if buf is None or buf.size < size or buf.dtype != dtype:
+            buf = np.empty(size, dtype=dtype)
+            self._buffers[name] = buf
+        return buf[:size].reshape(shape)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(b.nbytes for b in self._buffers.values())
+
+    def release(self) -> None:
+        self._buffers.clear()
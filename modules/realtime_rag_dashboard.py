@@ -77,13 +77,13 @@ def upload_and_analyze_realtime(
             result["gcs_path"] = gcs_result
         
         # [2단계] RAG 검색 (1초)
-        from supabase import create_client
+        from supabase_pool import get_supabase_client
         
         supabase_url = os.getenv("SUPABASE_URL")
         supabase_key = os.getenv("SUPABASE_SERVICE_KEY")
         
         if supabase_url and supabase_key:
-            supabase = create_client(supabase_url, supabase_key)
+            supabase = get_supabase_client(supabase_url, supabase_key)
             
             # 관련 약관/지침 검색
             search_query = f"{analysis_type} {customer_name}"
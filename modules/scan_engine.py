@@ -47,6 +47,10 @@ _GCS_PUBLIC_PREFIX    = "public_assets"   # 약관·설명서 등 공적 자산
 _GCS_PRIVATE_PREFIX   = "private_data"    # 개인자료 (RAG 인덱싱 금지)
 _GCS_KNOWLEDGE_PREFIX = "knowledge"       # know_pipe 지식베이스 전용
 
+# 본사 지식 파이프라인(know_pipe 약관·리플렛 일괄 등록) 전용 person_id
+# 특정 고객에 연결되지 않는 공적 자산 — GCS 경로는 공적 자산 prefix 유지, gk_scan_files 기록 제외
+HQ_KNOWLEDGE_PERSON_ID = "hq_knowledge"
+
 # 대용량 문서 분할 기준 (GP190 §4)
 _CHUNK_PAGE_THRESHOLD = 50    # 50페이지 이상이면 분할 분석
 _CHUNK_CHAR_SIZE      = 3000  # 청크당 최대 문자수
@@ -161,26 +165,42 @@ def resize_image_bytes(img_bytes: bytes, filename: str = "") -> bytes:
 def iter_pdf_pages(file_bytes: bytes, batch_size: int = 5):
     """
     [GP196 §3] PDF를 batch_size 페이지 단위로 나눠 yield하는 Generator.
-    각 항목: (page_indices: list[int], page_image_bytes: bytes)
+    각 항목: (page_indices: list[int], page_image_bytes: list[bytes])
     PyMuPDF(fitz) 미설치 시 [(None, file_bytes)] 단일 반환.
+
+    페이지는 modules.pdf_rasterizer 로 1장씩 래스터화(텍스트 밀도별 DPI + 메모리 예산)되어
+    JPEG 로 1회 인코딩 — 배치에는 인코딩된 바이트만 남는다.
     """
     try:
-        import fitz as _fitz
-        doc = _fitz.open(stream=file_bytes, filetype="pdf")
-        total = len(doc)
-        for start in range(0, total, batch_size):
-            end = min(start + batch_size, total)
-            indices = list(range(start, end))
-            # 배치 페이지들을 하나의 이미지 시트로 결합
-            page_imgs = []
-            for i in indices:
-                pix = doc[i].get_pixmap(dpi=120)
-                page_imgs.append(pix.tobytes("jpeg"))
+        from modules.pdf_rasterizer import iter_pdf_rasters, encode_jpeg
+        indices, page_imgs = [], []
+        for raster in iter_pdf_rasters(file_bytes, grayscale=False):
+            indices.append(raster["index"])
+            page_imgs.append(encode_jpeg(raster["image"]))
+            if len(indices) == batch_size:
+                yield indices, page_imgs
+                indices, page_imgs = [], []
+        if indices:
             yield indices, page_imgs
     except Exception:
         yield [None], [file_bytes]
 
 
+def iter_preprocessed_pdf_pages(file_bytes: bytes, budget_mb: Optional[float] = None,
+                                pages: Optional[list] = None):
+    """
+    [GP194] PDF 페이지를 그레이스케일 배열로 래스터화 → 대비 최적화 + Deskew 를 배열 그대로 적용.
+    각 항목: {"index", "dpi", "image"(보정된 H×W uint8), "angle", "scanned", ...}
+    "image" 는 재사용 작업 버퍼의 뷰 — 다음 페이지 요청 전까지만 유효 (보관 시 .copy()).
+    pages: 0부터 페이지 번호 목록 (None 이면 전체 — 예: 텍스트 레이어 없는 페이지만 OCR)
+    """
+    from modules.pdf_rasterizer import iter_pdf_rasters, RasterWorkspace
+    workspace = RasterWorkspace()
+    for raster in iter_pdf_rasters(file_bytes, grayscale=True, budget_mb=budget_mb, pages=pages):
+        enhanced, angle = enhance_and_deskew(raster["image"], workspace)
+        yield dict(raster, image=enhanced, angle=angle)
+
+
 def detect_file_type(filename: str, mime_type: str = "") -> dict:
     """
     파일명·MIME 타입으로 문서 형식을 감지합니다.
@@ -243,37 +263,11 @@ def preprocess_image(file_bytes: bytes, filename: str) -> bytes:
         import cv2
         import numpy as np
         img_array = np.frombuffer(file_bytes, dtype=np.uint8)
-        img = cv2.imdecode(img_array, cv2.IMREAD_COLOR)
-        if img is None:
+        gray = cv2.imdecode(img_array, cv2.IMREAD_GRAYSCALE)
+        if gray is None:
             return file_bytes
 
-        # ── 대비 최적화 (CLAHE) ─────────────────────────────────────────
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-        enhanced = clahe.apply(gray)
-
-        # ── 수평 보정 (Deskew via Hough Transform) ──────────────────────
-        edges = cv2.Canny(enhanced, 50, 150, apertureSize=3)
-        lines = cv2.HoughLines(edges, 1, np.pi / 180, threshold=100)
-        angle = 0.0
-        if lines is not None:
-            angles = []
-            for rho, theta in lines[:20, 0]:
-                a = np.degrees(theta) - 90
-                if abs(a) < 45:
-                    angles.append(a)
-            if angles:
-                angle = float(np.median(angles))
-
-        if abs(angle) > 0.5:
-            h, w = enhanced.shape
-            center = (w // 2, h // 2)
-            M = cv2.getRotationMatrix2D(center, angle, 1.0)
-            enhanced = cv2.warpAffine(
-                enhanced, M, (w, h),
-                flags=cv2.INTER_CUBIC,
-                borderMode=cv2.BORDER_REPLICATE,
-            )
+        enhanced, angle = enhance_and_deskew(gray)
 
         # ── 재인코딩 ─────────────────────────────────────────────────────
         _, buf = cv2.imencode(".png", enhanced)
@@ -288,19 +282,70 @@ def preprocess_image(file_bytes: bytes, filename: str) -> bytes:
         return file_bytes
 
 
+def enhance_and_deskew(gray, workspace=None):
+    """
+    그레이스케일 배열 → (대비 최적화 + 수평 보정 배열, 보정 각도).
+    workspace(pdf_rasterizer.RasterWorkspace) 제공 시 중간·결과 배열을 재사용 버퍼에 기록.
+    """
+    import cv2
+    import numpy as np
+
+    def _buf(name):
+        return workspace.take(name, gray.shape) if workspace is not None else None
+
+    # ── 대비 최적화 (CLAHE) ─────────────────────────────────────────
+    clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+    enhanced = clahe.apply(gray, _buf("clahe"))
+
+    # ── 수평 보정 (Deskew via Hough Transform) ──────────────────────
+    edges = cv2.Canny(enhanced, 50, 150, _buf("edges"), apertureSize=3)
+    lines = cv2.HoughLines(edges, 1, np.pi / 180, threshold=100)
+    angle = 0.0
+    if lines is not None:
+        angles = []
+        for rho, theta in lines[:20, 0]:
+            a = np.degrees(theta) - 90
+            if abs(a) < 45:
+                angles.append(a)
+        if angles:
+            angle = float(np.median(angles))
+
+    if abs(angle) > 0.5:
+        h, w = enhanced.shape
+        center = (w // 2, h // 2)
+        M = cv2.getRotationMatrix2D(center, angle, 1.0)
+        enhanced = cv2.warpAffine(
+            enhanced, M, (w, h),
+            dst=_buf("rotated"),
+            flags=cv2.INTER_CUBIC,
+            borderMode=cv2.BORDER_REPLICATE,
+        )
+    return enhanced, angle
+
+
 def mask_pii(text: str) -> tuple[str, list[str]]:
     """
     GP190 §2 / GP194 §2 — 텍스트 내 PII(개인정보) 자동 마스킹.
     반환: (마스킹된 텍스트, 감지된 PII 유형 목록)
     """
+    masked, counts = _mask_pii_counts(text)
+    return masked, _pii_labels(counts)
+
+
+def _mask_pii_counts(text: str) -> tuple[str, dict[str, int]]:
+    """mask_pii 본체 — 유형별 건수 반환 (페이지 단위 마스킹 결과 합산용)."""
     masked = text
-    detected: list[str] = []
+    counts: dict[str, int] = {}
     for pattern, label in _PII_PATTERNS:
         hits = re.findall(pattern, masked)
         if hits:
-            detected.append(f"{label}({len(hits)}건)")
+            counts[label] = counts.get(label, 0) + len(hits)
             masked = re.sub(pattern, label, masked)
-    return masked, detected
+    return masked, counts
+
+
+def _pii_labels(counts: dict[str, int]) -> list[str]:
+    return [f"{label}({n}건)" for label, n in counts.items()]
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -353,31 +398,67 @@ def verify_kcd10(text: str) -> dict:
 # GP190 §4 — 대용량 문서 분할 분석 (50P+ Chunking)
 # ══════════════════════════════════════════════════════════════════════════════
 
+class AnalysisChunker:
+    """
+    GP190 §4 — 스트리밍 청크 분할기. 페이지 텍스트를 순서대로 feed() 하면 확정된 청크를 즉시 반환.
+    결과는 전체 텍스트("\n".join(페이지))에 chunk_text_for_analysis 를 적용한 것과 동일.
+    """
+
+    def __init__(self, pages: int, chunk_size: int = _CHUNK_CHAR_SIZE):
+        self.pages      = pages
+        self.chunk_size = chunk_size
+        self.chunks: list[dict] = []
+        self._buf       = ""   # 아직 청크로 확정되지 않은 텍스트
+        self._offset    = 0    # _buf 시작 위치 (전체 텍스트 기준)
+        self._fed       = False
+        # 50P 이하 문서는 총 길이가 chunk_size*50 을 넘기 전까지 단일 청크 후보
+        self._split     = pages > _CHUNK_PAGE_THRESHOLD
+
+    def feed(self, text: str, sep: str = "\n") -> list[dict]:
+        self._buf += (sep if self._fed else "") + text
+        self._fed = True
+        if not self._split and self._offset + len(self._buf) > self.chunk_size * 50:
+            self._split = True
+        return self._emit(final=False) if self._split else []
+
+    def close(self) -> list[dict]:
+        if not self._split:
+            self.chunks = [{"chunk_idx": 0, "text": self._buf, "char_start": 0, "char_end": len(self._buf)}]
+            self._buf = ""
+            return list(self.chunks)
+        out = self._emit(final=True)
+        if len(self.chunks) > 1:
+            logger.info(f"[GP190§4] 대용량 분할: {self.pages}P → {len(self.chunks)}청크")
+        return out
+
+    def _emit(self, final: bool) -> list[dict]:
+        out = []
+        size = self.chunk_size
+        # 청크 끝은 [start, start+size) 구간만 보고 결정 — size 초과분이 들어와야 확정 가능
+        while self._buf and (final or len(self._buf) > size):
+            end = min(size, len(self._buf))
+            if end < len(self._buf):
+                boundary = self._buf.rfind("\n", 0, end)
+                if boundary > size // 2:
+                    end = boundary + 1
+            chunk = {"chunk_idx": len(self.chunks), "text": self._buf[:end],
+                     "char_start": self._offset, "char_end": self._offset + end}
+            self.chunks.append(chunk)
+            out.append(chunk)
+            self._buf = self._buf[end:]
+            self._offset += end
+        return out
+
+
 def chunk_text_for_analysis(text: str, pages: int, chunk_size: int = _CHUNK_CHAR_SIZE) -> list[dict]:
     """
     GP190 §4 — 50페이지 초과 또는 150,000자 초과 문서를 청크로 분할.
     반환: [{"chunk_idx": int, "text": str, "char_start": int, "char_end": int}]
     """
-    if pages <= _CHUNK_PAGE_THRESHOLD and len(text) <= chunk_size * 50:
-        return [{"chunk_idx": 0, "text": text, "char_start": 0, "char_end": len(text)}]
-
-    chunks = []
-    start = 0
-    idx = 0
-    while start < len(text):
-        end = min(start + chunk_size, len(text))
-        # 단어 경계 보정
-        if end < len(text):
-            boundary = text.rfind("\n", start, end)
-            if boundary > start + chunk_size // 2:
-                end = boundary + 1
-        chunks.append({"chunk_idx": idx, "text": text[start:end],
-                        "char_start": start, "char_end": end})
-        start = end
-        idx += 1
-
-    logger.info(f"[GP190§4] 대용량 분할: {pages}P → {len(chunks)}청크")
-    return chunks
+    chunker = AnalysisChunker(pages, chunk_size)
+    chunker.feed(text)
+    chunker.close()
+    return chunker.chunks
 
 
 
@@ -404,7 +485,7 @@ def backup_to_gcs(
     
     [GP-IDENTITY §3] GCS 경로에 person_id + agent_id 태깅 강제:
       person_id/agent_id 제공 시 → scans/{agent_id}/{person_id}_{filename} 경로 사용
-      미제공 시 → 기존 경로 유지 (공적 자산 등)
+      미제공 시 / HQ_KNOWLEDGE_PERSON_ID → 기존 경로 유지 (공적 자산 등)
 
     반환: {"success": bool, "gcs_uri": str, "blob_name": str,
            "is_public_asset": bool, "error": str}
@@ -419,7 +500,7 @@ def backup_to_gcs(
     safe_name = filename.replace(" ", "_")
     
     # [GP-IDENTITY §3] person_id/agent_id 기반 경로 구조 강제
-    if person_id and agent_id:
+    if person_id and agent_id and person_id != HQ_KNOWLEDGE_PERSON_ID:
         blob_name = f"scans/{agent_id}/{person_id}_{uid}_{safe_name}"
         logger.info(f"[GP-4TIER] GCS 경로 person_id 태깅: {blob_name}")
     else:
@@ -481,11 +562,14 @@ def extract_text(
     dai_location: str = "us",
     dai_processor_id: str = "",
     gcs_credentials=None,
+    on_page: Optional[Callable[[dict], None]] = None,
 ) -> dict:
     """
     GP190 §2, GP191 §2 — PDF/이미지에서 텍스트 추출.
     우선순위: Document AI → pdfplumber → pypdf → 빈 문자열
     반환: {"text": str, "tables": list, "engine": str, "pages": int}
+    on_page: pdfplumber/pypdf 페이지 병렬 추출 시 페이지 순서대로 호출
+             ({"page", "text", "tables", "engine", "total", "cached"} — engine 이 바뀌면 폴백 재시작)
     """
     file_info = detect_file_type(filename)
 
@@ -504,7 +588,7 @@ def extract_text(
     # ── 2차: pdfplumber (PDF 텍스트·표 추출) ──────────────────────────────
     if file_info["is_pdf"]:
         try:
-            result = _extract_via_pdfplumber(file_bytes)
+            result = _extract_via_pdfplumber(file_bytes, on_page)
             if result.get("text"):
                 return result
         except Exception as e:
@@ -512,7 +596,7 @@ def extract_text(
 
         # ── 3차: pypdf 폴백 ────────────────────────────────────────────────
         try:
-            result = _extract_via_pypdf(file_bytes)
+            result = _extract_via_pypdf(file_bytes, on_page)
             if result.get("text"):
                 return result
         except Exception as e:
@@ -582,33 +666,16 @@ def _extract_via_documentai(
     }
 
 
-def _extract_via_pdfplumber(file_bytes: bytes) -> dict:
-    import pdfplumber
-    tables, pages_text = [], []
-    with pdfplumber.open(io.BytesIO(file_bytes)) as pdf:
-        for pn, page in enumerate(pdf.pages, 1):
-            pages_text.append(page.extract_text() or "")
-            for t in (page.extract_tables() or []):
-                if t and len(t) > 1:
-                    tables.append({"page": pn, "headers": [t[0]], "rows": t[1:]})
-    return {
-        "text":   "\n".join(pages_text),
-        "tables": tables,
-        "engine": f"pdfplumber ({len(tables)}표)",
-        "pages":  len(pages_text),
-    }
+def _extract_via_pdfplumber(file_bytes: bytes, on_page=None) -> dict:
+    # 페이지 샤드 프로세스 풀 추출 + (파일 해시, 페이지, 엔진) 캐시 — modules/pdf_page_extractor.py
+    # 캐시에는 PII 마스킹본만 기록 → 텍스트·표는 마스킹된 상태로 반환 (건수: result["pii"])
+    from modules.pdf_page_extractor import extract_pdf_pages_parallel
+    return extract_pdf_pages_parallel(file_bytes, "pdfplumber", on_page=on_page, mask_fn=_mask_pii_counts)
 
 
-def _extract_via_pypdf(file_bytes: bytes) -> dict:
-    import pypdf
-    reader = pypdf.PdfReader(io.BytesIO(file_bytes))
-    text   = "\n".join(p.extract_text() or "" for p in reader.pages)
-    return {
-        "text":   text,
-        "tables": [],
-        "engine": "pypdf",
-        "pages":  len(reader.pages),
-    }
+def _extract_via_pypdf(file_bytes: bytes, on_page=None) -> dict:
+    from modules.pdf_page_extractor import extract_pdf_pages_parallel
+    return extract_pdf_pages_parallel(file_bytes, "pypdf", on_page=on_page, mask_fn=_mask_pii_counts)
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -895,19 +962,30 @@ def run_scan_pipeline(
       person_id: 현재 상담 중인 계약자/피보험자 ID (필수)
       agent_id: 로그인 설계사 ID (필수)
       customer_name: 고객 이름 (선택, UI 표시용)
+
+    단계별 함수(scan_stage_*)를 순차 실행 — 비동기 배치 실행은 modules/scan_job_runner.py
     """
-    log = []
-    
-    # ── [GP-IDENTITY §1] 인물 식별 무결성 검증 ─────────────────────────────
-    if not person_id or not agent_id:
-        logger.error(f"[GP-4TIER] run_scan_pipeline 호출 시 person_id/agent_id 필수: {filename}")
-        return {
-            "success": False,
-            "error": "[GP-IDENTITY] 고객 정보 필수. person_id와 agent_id를 제공해야 합니다.",
-            "filename": filename,
-            "doc_type": doc_type,
-            "log": ["[ERROR] person_id 또는 agent_id 누락 — 스캔 차단"],
-        }
+    state = new_scan_state(**{k: v for k, v in locals().items()})
+    if state.get("failed"):
+        return state["failed"]
+    for stage in (scan_stage_prepare, scan_stage_backup, scan_stage_extract,
+                  scan_stage_classify, scan_stage_publish):
+        failed = stage(state)
+        if failed:
+            return failed
+    return scan_stage_result(state)
+
+
+# ── 파이프라인 단계 (state dict 공유) ────────────────────────────────────────
+# prepare → backup ∥ extract → classify → publish (backup 은 publish 전까지만 완료되면 됨,
+# 단 Document AI 사용 시 extract 가 GCS URI 를 요구하므로 backup 이후 실행)
+
+def new_scan_state(**kwargs) -> dict:
+    """run_scan_pipeline 인자 → 단계 공유 state. 인물 식별 실패 시 state["failed"] 에 결과."""
+    state = dict(kwargs)
+    state["log"] = log = []
+    filename = state["filename"]
+    progress_callback = state.get("progress_callback")
 
     def _progress(step: str, pct: float, msg: str):
         log.append(f"[{step}] {msg}")
@@ -917,8 +995,28 @@ def run_scan_pipeline(
             except Exception:
                 pass
 
+    state["_progress"] = _progress
+
+    # ── [GP-IDENTITY §1] 인물 식별 무결성 검증 ─────────────────────────────
+    if not state.get("person_id") or not state.get("agent_id"):
+        logger.error(f"[GP-4TIER] run_scan_pipeline 호출 시 person_id/agent_id 필수: {filename}")
+        state["failed"] = {
+            "success": False,
+            "error": "[GP-IDENTITY] 고객 정보 필수. person_id와 agent_id를 제공해야 합니다.",
+            "filename": filename,
+            "doc_type": state.get("doc_type", ""),
+            "log": ["[ERROR] person_id 또는 agent_id 누락 — 스캔 차단"],
+        }
+    return state
+
+
+def scan_stage_prepare(state: dict) -> Optional[dict]:
+    """P0 전처리 + P1 파일 감지·문서 유형 분류."""
+    _progress = state["_progress"]
+    filename  = state["filename"]
+
     # ── Step P0: Pre-process (GP190 §2 / GP194) ──────────────────────────
-    if not skip_preprocess:
+    if not state.get("skip_preprocess"):
         _p0_file_info = detect_file_type(filename)
         if _p0_file_info.get("ext", "").lower() == "pdf":
             _progress(
@@ -928,32 +1026,48 @@ def run_scan_pipeline(
                 "텍스트 추출 정확도가 저하될 수 있습니다."
             )
         _progress("P0", 0.05, "이미지 보정(Deskew) + 대비 최적화 중...")
-        file_bytes = preprocess_image(file_bytes, filename)
+        state["file_bytes"] = preprocess_image(state["file_bytes"], filename)
         _progress("P0", 0.08, "이미지 보정 완료")
 
     # ── Step P1: 파일 감지 ────────────────────────────────────────────────
     _progress("P1", 0.1, f"파일 감지: {filename}")
     file_info = detect_file_type(filename)
+    state["file_info"] = file_info
     if not file_info["supported"]:
         err = f"지원하지 않는 파일 형식: .{file_info['ext']}"
         _progress("P1", 0.1, f"오류: {err}")
-        return _fail_result(filename, doc_type, err, log)
+        return _fail_result(filename, state.get("doc_type", ""), err, state["log"])
+
+    state["doc_type"] = classify_doc_type(filename, state.get("doc_type", ""))
+    _progress("P1", 0.2, f"문서 유형 감지: {state['doc_type']}")
 
-    doc_type = classify_doc_type(filename, doc_type)
-    _progress("P1", 0.2, f"문서 유형 감지: {doc_type}")
+    state["gcs_uri"]         = f"local://{filename}"
+    state["is_public_asset"] = state["doc_type"] in PUBLIC_ASSET_TYPES
+    return None
+
+
+def scan_stage_backup(state: dict) -> Optional[dict]:
+    """P2 GCS 백업 + P2b Supabase 메타데이터 기록."""
+    _progress   = state["_progress"]
+    filename    = state["filename"]
+    doc_type    = state["doc_type"]
+    file_bytes  = state["file_bytes"]
+    gcs_client  = state.get("gcs_client")
+    gcs_bucket  = state.get("gcs_bucket", "")
+    person_id   = state.get("person_id", "")
+    agent_id    = state.get("agent_id", "")
+    customer_name = state.get("customer_name", "")
 
     # ── Step P2: GCS 백업 ────────────────────────────────────────────────
     gcs_uri = f"local://{filename}"
-    is_public_asset = doc_type in PUBLIC_ASSET_TYPES
-
     if gcs_client and gcs_bucket:
         _progress("P2", 0.3, "GCS 즉시 격리 백업 중...")
         gcs_result = backup_to_gcs(
             file_bytes, filename, doc_type, gcs_client, gcs_bucket,
             person_id=person_id, agent_id=agent_id, customer_name=customer_name
         )
-        gcs_uri         = gcs_result["gcs_uri"]
-        is_public_asset = gcs_result["is_public_asset"]
+        gcs_uri                  = gcs_result["gcs_uri"]
+        state["is_public_asset"] = gcs_result["is_public_asset"]
         if gcs_result["success"]:
             _progress("P2", 0.40, f"GCS 백업 완료: {gcs_uri}")
             logger.info(f"[GP-4TIER] GCS 저장 완료: person_id={person_id}, agent_id={agent_id}, gcs_uri={gcs_uri}")
@@ -962,9 +1076,11 @@ def run_scan_pipeline(
             logger.warning(f"[GP-4TIER] GCS 저장 실패: {gcs_result['error']}")
     else:
         _progress("P2", 0.40, "GCS 클라이언트 미연결 — 로컬 처리 모드")
+    state["gcs_uri"] = gcs_uri
     
     # ── Step P2b: Supabase 메타데이터 기록 (GP-IDENTITY §2 — 4-Tier Integration) ──
-    if gcs_uri and gcs_uri != f"local://{filename}" and person_id and agent_id:
+    if (gcs_uri and gcs_uri != f"local://{filename}" and person_id and agent_id
+            and person_id != HQ_KNOWLEDGE_PERSON_ID):
         _progress("P2b", 0.42, "Supabase 메타데이터 기록 중...")
         try:
             import db_utils as du
@@ -976,7 +1092,7 @@ def run_scan_pipeline(
                 file_name=filename,
                 gcs_bucket=gcs_bucket,
                 file_size_bytes=len(file_bytes),
-                mime_type=file_info.get("mime", "application/octet-stream"),
+                mime_type=state["file_info"].get("mime", "application/octet-stream"),
                 tags=[doc_type, customer_name] if customer_name else [doc_type],
                 category="scan_analysis",
             )
@@ -987,12 +1103,36 @@ def run_scan_pipeline(
             _progress("P2b", 0.45, f"⚠️ Supabase 기록 실패: {e}")
     else:
         _progress("P2b", 0.45, "Supabase 기록 건너뜀 (GCS 미연결 또는 person_id 없음)")
+    return None
+
+
+def scan_stage_extract(state: dict) -> Optional[dict]:
+    """P3 텍스트 추출 + P3a PII 마스킹 + P3b 분할 + P3c KCD-10 검증."""
+    _progress = state["_progress"]
 
     # ── Step P3: 텍스트 추출 ─────────────────────────────────────────────
     _progress("P3", 0.50, "AI 마스터가 정밀 분석 중입니다...")
+
+    # 페이지가 순서대로 준비되는 즉시 PII 마스킹 + 청크 분할 (추출 완료 후 재처리 없음)
+    _stream: dict = {"engine": None, "chunker": None, "texts": [], "pii": {}}
+
+    def _on_page(page: dict) -> None:
+        if page["engine"] != _stream["engine"]:   # pdfplumber → pypdf 폴백 시 재시작
+            _stream.update(engine=page["engine"], chunker=AnalysisChunker(page["total"]), texts=[], pii={})
+        masked, found = page["text"], page["pii"]   # 추출기에서 마스킹 완료 (캐시 적중 페이지 포함)
+        _stream["texts"].append(masked)
+        for label, n in found.items():
+            _stream["pii"][label] = _stream["pii"].get(label, 0) + n
+        _stream["chunker"].feed(masked)
+        if page["page"] % 10 == 0 or page["page"] == page["total"]:
+            _progress("P3", 0.50 + 0.12 * page["page"] / max(page["total"], 1),
+                      f"페이지 추출 {page['page']}/{page['total']}P")
+
     extract_result = extract_text(
-        file_bytes, filename, gcs_uri,
-        dai_project, dai_location, dai_processor_id, gcs_credentials,
+        state["file_bytes"], state["filename"], state.get("gcs_uri", ""),
+        state.get("dai_project", ""), state.get("dai_location", "us"),
+        state.get("dai_processor_id", ""), state.get("gcs_credentials"),
+        on_page=_on_page,
     )
     raw_text       = extract_result.get("text", "")
     tables         = extract_result.get("tables", [])
@@ -1001,14 +1141,31 @@ def run_scan_pipeline(
     _progress("P3", 0.62, f"텍스트 추출 완료: {len(raw_text)}자, {len(tables)}표, {pages}P ({extract_engine})")
 
     # ── Step P3a: PII 마스킹 (GP194 §2) ──────────────────────────────────
-    text, pii_detected = mask_pii(raw_text)
+    _streamed = (
+        _stream["chunker"] is not None
+        and extract_result.get("page_texts") is not None
+        and len(_stream["texts"]) == pages
+        and extract_result.get("engine", "").startswith(_stream["engine"])
+    )
+    if _streamed:
+        text = "\n".join(_stream["texts"])
+        pii_detected = _pii_labels(_stream["pii"])
+    else:
+        text, found = _mask_pii_counts(raw_text)
+        for label, n in extract_result.get("pii", {}).items():   # PDF 추출기 선마스킹분
+            found[label] = found.get(label, 0) + n
+        pii_detected = _pii_labels(found)
     if pii_detected:
         _progress("P3a", 0.64, f"PII 마스킹 완료: {', '.join(pii_detected)}")
     else:
         _progress("P3a", 0.64, "PII 감지 없음")
 
     # ── Step P3b: 대용량 분할 분석 (GP190 §4, 50P+) ───────────────────────
-    chunks = chunk_text_for_analysis(text, pages)
+    if _streamed:
+        _stream["chunker"].close()
+        chunks = _stream["chunker"].chunks
+    else:
+        chunks = chunk_text_for_analysis(text, pages)
     is_chunked = len(chunks) > 1
     if is_chunked:
         _progress("P3b", 0.66, f"대용량 문서 분할: {pages}P → {len(chunks)}청크 (각 {_CHUNK_CHAR_SIZE}자)")
@@ -1027,6 +1184,20 @@ def run_scan_pipeline(
             f"미확인 {len(kcd_result['unverified'])}건 (커버율 {kcd_result['coverage_pct']}%)"
         )
 
+    state.update(
+        text=text, tables=tables, extract_engine=extract_engine, pages=pages,
+        pii_detected=pii_detected, chunks=chunks, is_chunked=is_chunked,
+        analysis_text=analysis_text, kcd=kcd_result,
+    )
+    return None
+
+
+def scan_stage_classify(state: dict) -> Optional[dict]:
+    """P4 GP192 Core-8 정밀 AI 추출 (공적 자산만)."""
+    _progress = state["_progress"]
+    text      = state["text"]
+    ai_call_fn = state.get("ai_call_fn")
+
     # ── Step P4: GP192 정밀 AI 추출 (공적 자산만) ────────────────────────
     classification: dict = {
         "doc_class": "기타", "insurer": "미확인", "product_name": "미확인",
@@ -1036,9 +1207,9 @@ def run_scan_pipeline(
         "terminology": [], "issue_date": "미확인",
         "summary_1st_person": "", "sales_pitch": "",
     }
-    if is_public_asset and text and ai_call_fn:
+    if state["is_public_asset"] and text and ai_call_fn:
         _progress("P4", 0.72, "GP192 Core-8 정밀 추출 중 — 용어·지급기준·판매주기·특장점...")
-        classification = classify_document(analysis_text, ai_call_fn)
+        classification = classify_document(state["analysis_text"], ai_call_fn)
         n_terms  = len(classification.get("terminology", []))
         n_covers = len(classification.get("key_coverages", []))
         n_highs  = len(classification.get("product_highlights", []))
@@ -1049,47 +1220,65 @@ def run_scan_pipeline(
         )
     else:
         _progress("P4", 0.84, "AI 정밀 추출 생략 (개인자료 또는 AI 미연결)")
+    state["classification"] = classification
+    return None
+
+
+def scan_stage_publish(state: dict) -> Optional[dict]:
+    """P4b 정밀 JSON → GCS 저장 + P5 RAG 인덱싱 (backup 완료 후 실행)."""
+    _progress      = state["_progress"]
+    classification = state["classification"]
+    gcs_client     = state.get("gcs_client")
+    gcs_bucket     = state.get("gcs_bucket", "")
 
     # ── Step P4b: GP192 정밀 JSON → GCS 저장 ────────────────────────────
     json_gcs_uri = ""
-    if is_public_asset and gcs_client and gcs_bucket and classification.get("product_name") != "미확인":
+    if state["is_public_asset"] and gcs_client and gcs_bucket and classification.get("product_name") != "미확인":
         _progress("P4b", 0.88, "GP192 정밀 데이터 JSON → GCS 저장 중...")
         _json_result = save_precision_json_to_gcs(
-            classification, filename, doc_type, gcs_client, gcs_bucket, gcs_uri
+            classification, state["filename"], state["doc_type"], gcs_client, gcs_bucket, state["gcs_uri"]
         )
         json_gcs_uri = _json_result.get("json_uri", "")
         if _json_result["success"]:
             _progress("P4b", 0.91, f"JSON 저장 완료: {json_gcs_uri}")
         else:
             _progress("P4b", 0.91, f"JSON 저장 실패: {_json_result['error']}")
+    state["json_gcs_uri"] = json_gcs_uri
 
     # ── Step P5: RAG 인덱싱 (GP190 §6: Master Approval 대기) ─────────────
     _progress("P5", 0.94, "RAG 지식베이스 등록 중...")
-    rag_result = index_to_rag(text, filename, doc_type, classification, rag_add_fn)
+    rag_result = index_to_rag(state["text"], state["filename"], state["doc_type"],
+                              classification, state.get("rag_add_fn"))
     if rag_result["indexed"]:
         _progress("P5", 1.0, f"RAG 등록 완료: {rag_result['chunks']}청크 | 마스터 승인 대기")
     else:
         _progress("P5", 1.0, f"RAG 등록 생략: {rag_result['skipped_reason']}")
+    state["rag"] = rag_result
+    return None
 
+
+def scan_stage_result(state: dict) -> dict:
+    classification = state["classification"]
+    text           = state["text"]
     return {
         "success":            True,
-        "filename":           filename,
-        "doc_type":           doc_type,
-        "is_public_asset":    is_public_asset,
-        "gcs_uri":            gcs_uri,
-        "json_gcs_uri":       json_gcs_uri,
+        "filename":           state["filename"],
+        "doc_type":           state["doc_type"],
+        "is_public_asset":    state["is_public_asset"],
+        "gcs_uri":            state["gcs_uri"],
+        "json_gcs_uri":       state["json_gcs_uri"],
         "text_length":        len(text),
-        "tables_count":       len(tables),
-        "extract_engine":     extract_engine,
-        "pages":              pages,
-        "is_chunked":         is_chunked,
-        "chunks_count":       len(chunks),
-        "pii_detected":       pii_detected,
-        "kcd":                kcd_result,
+        "tables_count":       len(state["tables"]),
+        "extract_engine":     state["extract_engine"],
+        "pages":              state["pages"],
+        "is_chunked":         state["is_chunked"],
+        "chunks_count":       len(state["chunks"]),
+        "pii_detected":       state["pii_detected"],
+        "kcd":                state["kcd"],
         "classification":     classification,
-        "rag":                rag_result,
+        "rag":                state["rag"],
         "error":              "",
-        "pipeline_log":       log,
+        "pipeline_log":       state["log"],
         "master_approved":    False,
         "_raw_text_for_rag":  text,          # 마스터 승인 후 RAG 등록에 사용 (결함1 수정)
         "summary_1st_person": classification.get("summary_1st_person", ""),
@@ -1126,9 +1315,19 @@ def render_scan_progress_ui(result: dict) -> None:
     GP190 §4 / GP192 §4 — 스캔 결과를 Streamlit에 렌더링하는 표준 UI 함수.
     성공 시: GP192 분석완료 알림 + Core-8 추출 수치 + 1인칭 요약 + 세일즈 멘트.
     실패 시: 적색 카드 + 1인칭 복구 안내.
+    scan_job_runner 작업 snapshot 전달 시: 대기·진행 중이면 단계별 진행 카드, 종료 시 결과 렌더링.
     """
     import streamlit as st
 
+    if "job_id" in result and "status" in result:
+        if result["status"] in ("queued", "running"):
+            _render_scan_job_card(result)
+            return
+        if result["status"] == "failed" or not result.get("result"):
+            result = {"success": False, "filename": result["filename"], "error": result.get("error", "")}
+        else:
+            result = result["result"]
+
     if result["success"]:
         cls_data  = result.get("classification", {})
         rag_data  = result.get("rag", {})
@@ -1196,6 +1395,75 @@ def render_scan_progress_ui(result: dict) -> None:
 </div>""", unsafe_allow_html=True)
 
 
+_JOB_STAGE_LABELS = {
+    "prepare":  "전처리",
+    "backup":   "GCS 백업",
+    "extract":  "텍스트 추출",
+    "classify": "AI 분류",
+    "publish":  "저장·RAG",
+}
+
+
+def _render_scan_job_card(job: dict) -> None:
+    """scan_job_runner 작업 진행 카드 — 단계 칩(대기/진행/완료) + 파스텔 프로그레스 바."""
+    import streamlit as st
+
+    pct_int = int(job.get("pct", 0.0) * 100)
+    chips = ""
+    for stage, label in _JOB_STAGE_LABELS.items():
+        state = job.get("stages", {}).get(stage, "waiting")
+        bg, color, icon = {
+            "running": ("#dbeafe", "#1e40af", "⏳"),
+            "done":    ("#dcfce7", "#166534", "✓"),
+        }.get(state, ("#f1f5f9", "#94a3b8", "·"))
+        chips += (f'<span style="background:{bg};color:{color};border-radius:20px;'
+                  f'padding:2px 9px;font-size:0.70rem;font-weight:700;">{icon} {label}</span>')
+    status = "대기열" if job["status"] == "queued" else f"{pct_int}%"
+    st.markdown(f"""
+<div style="background:#f8fafc;border:1.5px solid #bfdbfe;border-radius:10px;
+  padding:10px 14px;margin:6px 0;font-size:0.80rem;">
+  <div style="font-weight:800;color:#1e3a8a;">📄 {job['filename']} &nbsp;
+    <span style="color:#64748b;font-weight:600;">{status}</span></div>
+  <div style="display:flex;flex-wrap:wrap;gap:6px;margin:6px 0;">{chips}</div>
+  <div class="gk-scan-progress-bar"><div class="gk-scan-progress-fill" style="width:{pct_int}%;"></div></div>
+  <div style="color:#64748b;font-size:0.74rem;">{job.get('message', '')}</div>
+</div>""", unsafe_allow_html=True)
+
+
+def render_scan_jobs_ui(job_ids: list, session_state=None, poll_seconds: float = 1.0) -> list:
+    """
+    scan_job_runner 배치 작업 폴링 UI.
+    진행 중 작업이 있으면 st.fragment(run_every) 로 해당 영역만 주기 갱신,
+    전부 종료되면 팩트 시트 동기화 후 앱 1회 재실행 (이후 폴링 중단).
+
+    반환: 작업 snapshot 목록 (제출 순서)
+    """
+    import streamlit as st
+    from modules.scan_job_runner import get_scan_job_runner
+
+    runner = get_scan_job_runner()
+    snaps = runner.snapshots(job_ids)
+    active = any(s["status"] in ("queued", "running") for s in snaps)
+
+    def _body():
+        current = runner.snapshots(job_ids)
+        st.markdown(f"<style>{get_uploader_css()}</style>", unsafe_allow_html=True)
+        for snap in current:
+            render_scan_progress_ui(snap)
+        if active and not any(s["status"] in ("queued", "running") for s in current):
+            for snap in current:
+                runner.sync_session(snap["job_id"], session_state)
+            st.rerun()
+
+    if active and hasattr(st, "fragment"):
+        st.fragment(_body, run_every=poll_seconds)()
+    else:
+        for snap in snaps:
+            runner.sync_session(snap["job_id"], session_state)
+        _body()
+    return snaps
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # 8. GP193 전역 지식 동기화 — Universal Ingest Hook
 # ══════════════════════════════════════════════════════════════════════════════
@@ -1632,55 +1900,71 @@ def unified_scan_interface(
     result["master_approved"] = False
 
     # ── GP193 §3: 임시 팩트 시트 저장 (master_approved=False 상태) ───────────
-    if session_state is not None and result.get("success"):
-        cls = result.get("classification", {})
-        fact_sheet = {
-            "ingest_id":          ingest_id,
-            "source_tab":         source_tab,
-            "filename":           filename,
-            "doc_type":           result.get("doc_type", ""),
-            "person_id":          person_id,              # [GP-4TIER] 추가
-            "agent_id":           agent_id,               # [GP-4TIER] 추가
-            "customer_name":      customer_name,          # [GP-4TIER] 추가
-            "ingested_at":        datetime.datetime.now().strftime("%Y-%m-%d %H:%M"),
-            "product_name":       cls.get("product_name", "미확인"),
-            "insurer":            cls.get("insurer", "미확인"),
-            "sale_start_date":    cls.get("sale_start_date", "미확인"),
-            "sale_end_date":      cls.get("sale_end_date", "현재판매중"),
-            "key_coverages":      cls.get("key_coverages", []),
-            "payout_logic":       cls.get("payout_logic", ""),
-            "coverage_limits":    cls.get("coverage_limits", ""),
-            "risk_factors":       cls.get("risk_factors", []),
-            "product_highlights": cls.get("product_highlights", []),
-            "terminology":        cls.get("terminology", []),
-            "summary_1st_person": cls.get("summary_1st_person", ""),
-            "sales_pitch":        cls.get("sales_pitch", ""),
-            "gcs_uri":            result.get("gcs_uri", ""),
-            "json_gcs_uri":       result.get("json_gcs_uri", ""),
-            "rag_indexed":        False,
-            "rag_chunks":         0,
-            "text_length":        result.get("text_length", 0),
-            "kcd":                result.get("kcd", {}),
-            "pii_detected":       result.get("pii_detected", []),
-            "master_approved":    False,
-        }
-        # 임시 팩트 시트를 선두에 삽입 (최대 20건)
-        _live = session_state.get("gp193_live_context", [])
-        _live.insert(0, fact_sheet)
-        session_state["gp193_live_context"] = _live[:20]
-        session_state["gp193_latest_fact"]  = fact_sheet
-        # 마스터 검수용 텍스트 임시 저장
-        session_state[f"_pending_scan_text_{filename[:20]}"] = result.get("_raw_text_for_rag", "")
-
-        logger.info(
-            f"[GP195] 전역 동기화 완료 (승인 대기): {filename} | "
-            f"{cls.get('product_name','?')} | "
-            f"담보 {len(cls.get('key_coverages',[]))}건"
-        )
+    sync_scan_fact_sheet(result, session_state, person_id, agent_id, customer_name)
 
     return result
 
 
+def sync_scan_fact_sheet(
+    result: dict,
+    session_state,
+    person_id: str = "",
+    agent_id: str = "",
+    customer_name: str = "",
+) -> None:
+    """
+    [GP193 §3] 승인 대기 스캔 결과 → 임시 팩트 시트 저장 (master_approved=False).
+    session_state 는 Streamlit 스크립트 스레드에서만 전달 (scan_job_runner 는 collect() 시점에 호출).
+    """
+    if session_state is None or not result.get("success"):
+        return
+    filename = result.get("filename", "")
+    cls = result.get("classification", {})
+    fact_sheet = {
+        "ingest_id":          result.get("ingest_id", ""),
+        "source_tab":         result.get("source_tab", "unknown"),
+        "filename":           filename,
+        "doc_type":           result.get("doc_type", ""),
+        "person_id":          person_id,              # [GP-4TIER] 추가
+        "agent_id":           agent_id,               # [GP-4TIER] 추가
+        "customer_name":      customer_name,          # [GP-4TIER] 추가
+        "ingested_at":        datetime.datetime.now().strftime("%Y-%m-%d %H:%M"),
+        "product_name":       cls.get("product_name", "미확인"),
+        "insurer":            cls.get("insurer", "미확인"),
+        "sale_start_date":    cls.get("sale_start_date", "미확인"),
+        "sale_end_date":      cls.get("sale_end_date", "현재판매중"),
+        "key_coverages":      cls.get("key_coverages", []),
+        "payout_logic":       cls.get("payout_logic", ""),
+        "coverage_limits":    cls.get("coverage_limits", ""),
+        "risk_factors":       cls.get("risk_factors", []),
+        "product_highlights": cls.get("product_highlights", []),
+        "terminology":        cls.get("terminology", []),
+        "summary_1st_person": cls.get("summary_1st_person", ""),
+        "sales_pitch":        cls.get("sales_pitch", ""),
+        "gcs_uri":            result.get("gcs_uri", ""),
+        "json_gcs_uri":       result.get("json_gcs_uri", ""),
+        "rag_indexed":        False,
+        "rag_chunks":         0,
+        "text_length":        result.get("text_length", 0),
+        "kcd":                result.get("kcd", {}),
+        "pii_detected":       result.get("pii_detected", []),
+        "master_approved":    False,
+    }
+    # 임시 팩트 시트를 선두에 삽입 (최대 20건)
+    _live = session_state.get("gp193_live_context", [])
+    _live.insert(0, fact_sheet)
+    session_state["gp193_live_context"] = _live[:20]
+    session_state["gp193_latest_fact"]  = fact_sheet
+    # 마스터 검수용 텍스트 임시 저장
+    session_state[f"_pending_scan_text_{filename[:20]}"] = result.get("_raw_text_for_rag", "")
+
+    logger.info(
+        f"[GP195] 전역 동기화 완료 (승인 대기): {filename} | "
+        f"{cls.get('product_name','?')} | "
+        f"담보 {len(cls.get('key_coverages',[]))}건"
+    )
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # 11. unified_scan_component — 통합 Streamlit UI 컴포넌트 (GP195 §3)
 # ══════════════════════════════════════════════════════════════════════════════
@@ -1701,6 +1985,9 @@ def unified_scan_component(
     rag_add_fn=None,
     session_state=None,
     uploader_key: str = "unified_scan",
+    person_id: str = "",
+    agent_id: str = "",
+    customer_name: str = "",
 ) -> dict | None:
     """
     [GP195 §3] 통합 스캔 Streamlit 컴포넌트.
@@ -1783,9 +2070,9 @@ def unified_scan_component(
             filename=filename,
             source_tab=source_tab,
             doc_type=doc_type,
-            person_id="",           # [GP-IDENTITY] TODO: 호출부에서 전달 필요
-            agent_id="",            # [GP-IDENTITY] TODO: 호출부에서 전달 필요
-            customer_name="",       # [GP-IDENTITY] TODO: 호출부에서 전달 필요
+            person_id=person_id,         # [GP-IDENTITY] 호출부 전달
+            agent_id=agent_id,           # [GP-IDENTITY] 호출부 전달
+            customer_name=customer_name, # [GP-IDENTITY] 호출부 전달
             gcs_client=gcs_client,
             gcs_bucket=gcs_bucket,
             dai_project=dai_project,
@@ -1854,6 +2141,98 @@ def unified_scan_component(
     return result
 
 
+def unified_scan_batch_component(
+    label: str = "📦 복수 문서 일괄 업로드 (PDF/JPG/PNG)",
+    source_tab: str = "unknown",
+    doc_type: str = "",
+    accept_types: list = None,
+    person_id: str = "",
+    agent_id: str = "",
+    customer_name: str = "",
+    gcs_client=None,
+    gcs_bucket: str = "",
+    dai_project: str = "",
+    dai_location: str = "us",
+    dai_processor_id: str = "",
+    gcs_credentials=None,
+    ai_call_fn=None,
+    session_state=None,
+    uploader_key: str = "unified_scan_batch",
+    use_tablet_dropzone: bool = True,
+) -> list:
+    """
+    [GP195 §3] 복수 파일 일괄 스캔 컴포넌트 (scan_job_runner 비동기 작업).
+
+    태블릿 드롭존(모듈 사용 가능 시) 또는 복수 file_uploader 로 파일을 받아
+    [일괄 분석 시작] 시 파일별 작업을 공유 러너에 등록 → render_scan_jobs_ui 로 진행 폴링.
+    단계가 파일 간 중첩 실행되므로 N개 파일이 순차 합계가 아니라 가장 느린 단계 수준에 완료.
+    완료 결과는 팩트 시트(승인 대기)로 동기화 — 마스터 검수는 단건 컴포넌트와 동일하게 별도 진행.
+
+    반환: 작업 snapshot 목록 (등록 작업 없으면 [])
+    """
+    import queue
+    import streamlit as st
+    from modules.scan_job_runner import get_scan_job_runner, _file_payload
+
+    if accept_types is None:
+        accept_types = ["pdf", "jpg", "jpeg", "png"]
+    jobs_key = f"{uploader_key}_jobs"
+
+    st.markdown(f"<style>{get_uploader_css()}</style>", unsafe_allow_html=True)
+
+    files = None
+    if use_tablet_dropzone:
+        try:
+            from modules.tablet_dropzone import render_tablet_dropzone
+            _mimes = ["application/pdf" if t == "pdf" else f"image/{t}" for t in accept_types]
+            files = render_tablet_dropzone(key=f"{uploader_key}_drop", accept_types=_mimes,
+                                           max_file_size_mb=_MAX_FILE_BYTES // (1024 * 1024))
+        except Exception as e:
+            logger.warning(f"[GP195] 태블릿 드롭존 사용 불가 — file_uploader 폴백: {e}")
+            files = None
+    if files is None:
+        files = st.file_uploader(label, type=accept_types, accept_multiple_files=True, key=uploader_key)
+
+    # ── [GP-IDENTITY §1] 고객 미선택 시 등록 차단 ─────────────────────────
+    if files and (not person_id or not agent_id):
+        st.warning("[GP-IDENTITY] 고객을 먼저 선택해 주세요. 스캔 결과는 반드시 특정 고객에게 연결되어야 합니다.")
+    elif files and st.button(f"🚀 {len(files)}건 일괄 분석 시작", key=f"{uploader_key}_start",
+                             use_container_width=True, type="primary"):
+        runner  = get_scan_job_runner()
+        job_ids = []
+        for f in files:
+            name, data = _file_payload(f)
+            _size_ok, _size_msg = check_file_size(data, name)      # [GP196 §1]
+            if not _size_ok:
+                st.warning(_size_msg)
+                continue
+            try:
+                job_ids.append(runner.submit(
+                    resize_image_bytes(data, name), name,          # [GP196 §2]
+                    source_tab=source_tab,
+                    doc_type=doc_type,
+                    person_id=person_id,
+                    agent_id=agent_id,
+                    customer_name=customer_name,
+                    gcs_client=gcs_client,
+                    gcs_bucket=gcs_bucket,
+                    dai_project=dai_project,
+                    dai_location=dai_location,
+                    dai_processor_id=dai_processor_id,
+                    gcs_credentials=gcs_credentials,
+                    ai_call_fn=ai_call_fn,
+                ))
+            except queue.Full as e:
+                st.warning(str(e))
+                break
+        st.session_state[jobs_key] = job_ids
+
+    job_ids = st.session_state.get(jobs_key, [])
+    if not job_ids:
+        return []
+    return render_scan_jobs_ui(job_ids, session_state=session_state)
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # 12. GP195 자동 상속 레지스트리 — 신규 스캔 모듈 강제 등록
 # ══════════════════════════════════════════════════════════════════════════════
@@ -1908,6 +2287,9 @@ def gp195_render(
     ai_call_fn=None,
     rag_add_fn=None,
     session_state=None,
+    person_id: str = "",
+    agent_id: str = "",
+    customer_name: str = "",
 ) -> dict | None:
     """
     [GP195 §3] 등록된 스캔 모듈을 unified_scan_component로 자동 렌더링.
@@ -1937,6 +2319,9 @@ def gp195_render(
         rag_add_fn=rag_add_fn,
         session_state=session_state,
         uploader_key=f"gp195_{module_id}",
+        person_id=person_id,
+        agent_id=agent_id,
+        customer_name=customer_name,
     )
 
 
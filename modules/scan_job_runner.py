@@ -0,0 +1,340 @@
+# -*- coding: utf-8 -*-
+"""
+비동기 스캔 작업 러너 (Scan Job Runner)
+scan_engine 파이프라인 단계(scan_stage_*)를 파일 단위 작업으로 큐잉하고 단계별 동시성 제한으로 중첩 실행
+
+작성일: 2026-10-17
+목적: 배치 업로드(태블릿 드롭존·지식 파이프라인 복수 파일)가 파일 수 × 전 단계 합계가 아니라
+      가장 느린 단계 시간 수준에 끝나도록 + 진행 상태를 UI 폴링(render_scan_progress_ui)에 노출
+
+핵심 동작:
+1. submit() — 유한 대기열(max_pending). 가득 차면 queue.Full (호출자가 안내 후 재시도)
+2. 작업 1건: prepare → [backup ∥ extract] → classify → publish
+   - GCS 백업 + Supabase 메타데이터(P2/P2b)는 I/O 풀에서 추출과 동시 진행
+   - classify 는 백업이 확정한 is_public_asset 을 읽으므로 백업 완료 후 실행
+   - Document AI 사용 시 추출이 GCS URI 를 요구하므로 백업 완료 후 추출
+   - publish(P4b JSON 저장 + P5 RAG)는 백업 완료 후 실행 (gcs_uri 필요)
+3. 단계별 BoundedSemaphore — 서로 다른 파일의 단계가 파이프라인처럼 겹쳐 실행
+4. 작업 상태는 잠금 하에 갱신, snapshot() 은 사본 반환 (Streamlit 스레드에서 안전하게 폴링)
+5. 워커 스레드는 st.* / session_state 를 건드리지 않음 — 팩트 시트 동기화는 collect() 에서 호출 스레드가 수행
+"""
+
+import os
+import time
+import uuid
+import queue
+import base64
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger("scan_engine")
+
+STAGES = ("prepare", "backup", "extract", "classify", "publish")
+
+# 단계별 동시 실행 한도 — backup/publish 는 네트워크 대기 위주, extract 는 CPU(페이지 풀 별도)
+DEFAULT_STAGE_LIMITS: Dict[str, int] = {
+    "prepare":  2,
+    "backup":   4,
+    "extract":  2,
+    "classify": 2,
+    "publish":  4,
+}
+
+_MAX_PENDING = int(os.environ.get("GK_SCAN_JOB_MAX_PENDING", "32"))
+_MAX_ACTIVE  = int(os.environ.get("GK_SCAN_JOB_MAX_ACTIVE", "8"))
+_KEEP_FINISHED = 200
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# 1. 러너
+# ══════════════════════════════════════════════════════════════════════════════
+
+class ScanJobRunner:
+    """
+    프로세스 공유 스캔 작업 러너 — get_scan_job_runner() 싱글턴으로 사용.
+
+    작업 상태 dict:
+        job_id, filename, source_tab, status(queued|running|done|failed),
+        stage, stages{단계: waiting|running|done}, pct, message, log,
+        result, error, submitted_at, started_at, finished_at, stage_times{단계: 초}
+    """
+
+    def __init__(
+        self,
+        max_pending: int = _MAX_PENDING,
+        stage_limits: Optional[Dict[str, int]] = None,
+        max_active: int = _MAX_ACTIVE,
+    ):
+        limits = dict(DEFAULT_STAGE_LIMITS, **(stage_limits or {}))
+        self.max_pending = max_pending
+        self._sems = {s: threading.BoundedSemaphore(max(1, limits[s])) for s in STAGES}
+        self._jobs_pool = ThreadPoolExecutor(max_workers=max(1, max_active), thread_name_prefix="gk-scan-job")
+        self._io_pool   = ThreadPoolExecutor(max_workers=max(1, limits["backup"]), thread_name_prefix="gk-scan-io")
+        self._lock = threading.Lock()
+        self._jobs: "OrderedDict[str, dict]" = OrderedDict()
+        self._pending = 0
+        self._closed = False
+
+    # ── 제출 ──────────────────────────────────────────────────────────────
+    def submit(self, file_bytes: bytes, filename: str, source_tab: str = "unknown", **scan_kwargs) -> str:
+        """
+        스캔 작업 등록 → job_id. scan_kwargs 는 unified_scan_interface 와 동일
+        (session_state / progress_callback 제외 — 워커 스레드에서 사용 불가).
+        """
+        scan_kwargs.pop("session_state", None)
+        scan_kwargs.pop("progress_callback", None)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("ScanJobRunner 종료됨")
+            if self._pending >= self.max_pending:
+                raise queue.Full(f"스캔 대기열 포화 ({self.max_pending}건) — 잠시 후 다시 시도해 주세요.")
+            job_id = uuid.uuid4().hex[:12]
+            self._jobs[job_id] = {
+                "job_id":       job_id,
+                "filename":     filename,
+                "source_tab":   source_tab,
+                "status":       "queued",
+                "stage":        "",
+                "stages":       {s: "waiting" for s in STAGES},
+                "pct":          0.0,
+                "message":      "대기 중",
+                "log":          [],
+                "result":       None,
+                "error":        "",
+                "submitted_at": time.time(),
+                "started_at":   None,
+                "finished_at":  None,
+                "stage_times":  {},
+                "synced":       False,
+                "_identity": {
+                    "person_id":     scan_kwargs.get("person_id", ""),
+                    "agent_id":      scan_kwargs.get("agent_id", ""),
+                    "customer_name": scan_kwargs.get("customer_name", ""),
+                },
+            }
+            self._pending += 1
+            self._trim_finished()
+        self._jobs_pool.submit(self._run_job, job_id, file_bytes, filename, source_tab, scan_kwargs)
+        logger.info(f"[GP190] 스캔 작업 등록: {job_id} {filename} (대기 {self._pending}/{self.max_pending})")
+        return job_id
+
+    def submit_files(self, files: Iterable, source_tab: str = "unknown", **scan_kwargs) -> List[str]:
+        """
+        복수 파일 일괄 등록. files: Streamlit UploadedFile 또는 tablet_dropzone dict({'name', 'data'(base64)}).
+        대기열 포화 시 이미 등록된 작업은 유지하고 queue.Full 전파.
+        """
+        job_ids = []
+        for f in files:
+            name, data = _file_payload(f)
+            job_ids.append(self.submit(data, name, source_tab, **scan_kwargs))
+        return job_ids
+
+    # ── 조회 ──────────────────────────────────────────────────────────────
+    def snapshot(self, job_id: str) -> Optional[dict]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            snap = {k: v for k, v in job.items() if not k.startswith("_")}
+            snap["stages"]      = dict(job["stages"])
+            snap["stage_times"] = dict(job["stage_times"])
+            snap["log"]         = list(job["log"])
+            return snap
+
+    def snapshots(self, job_ids: Iterable[str]) -> List[dict]:
+        return [s for s in (self.snapshot(j) for j in job_ids) if s is not None]
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return self._pending
+
+    def wait(
+        self,
+        job_id: str,
+        timeout: Optional[float] = None,
+        poll_seconds: float = 0.25,
+        on_poll: Optional[Callable[[dict], None]] = None,
+    ) -> Optional[dict]:
+        """작업 종료(done|failed)까지 대기 → 최종 snapshot. on_poll(snapshot) 은 호출 스레드에서 실행."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            snap = self.snapshot(job_id)
+            if snap is None:
+                return None
+            if on_poll:
+                on_poll(snap)
+            if snap["status"] in ("done", "failed"):
+                return snap
+            if deadline is not None and time.monotonic() >= deadline:
+                return snap
+            time.sleep(poll_seconds)
+
+    def collect(self, job_id: str, session_state=None, **wait_kwargs) -> dict:
+        """
+        작업 완료 대기 후 unified_scan_interface 와 동일한 결과 dict 반환.
+        session_state 제공 시 GP193 임시 팩트 시트 동기화(작업당 1회). 작업 예외는 RuntimeError.
+        """
+        snap = self.wait(job_id, **wait_kwargs)
+        if snap is None:
+            raise KeyError(f"스캔 작업 없음: {job_id}")
+        if snap["status"] == "failed":
+            raise RuntimeError(snap["error"] or "스캔 작업 실패")
+        if snap["status"] != "done":
+            raise TimeoutError(f"스캔 작업 미완료: {snap['filename']} ({snap['stage']})")
+        result = snap["result"]
+        self.sync_session(job_id, session_state)
+        return result
+
+    def sync_session(self, job_id: str, session_state) -> bool:
+        """완료 작업의 팩트 시트를 session_state 에 반영 (호출 스레드 = Streamlit 스크립트 스레드)."""
+        if session_state is None:
+            return False
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if not job or job["status"] != "done" or job["synced"]:
+                return False
+            job["synced"] = True
+            result, ident = job["result"], dict(job["_identity"])
+        from modules.scan_engine import sync_scan_fact_sheet
+        sync_scan_fact_sheet(result, session_state, **ident)
+        return True
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            self._closed = True
+        self._jobs_pool.shutdown(wait=wait, cancel_futures=not wait)
+        self._io_pool.shutdown(wait=wait, cancel_futures=not wait)
+
+    # ── 내부 ──────────────────────────────────────────────────────────────
+    def _trim_finished(self) -> None:
+        finished = [j for j, job in self._jobs.items() if job["status"] in ("done", "failed")]
+        for j in finished[:max(0, len(finished) - _KEEP_FINISHED)]:
+            del self._jobs[j]
+
+    def _update(self, job_id: str, **fields) -> None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                job.update(fields)
+
+    def _progress_cb(self, job_id: str):
+        def _cb(step: str, pct: float, msg: str):
+            with self._lock:
+                job = self._jobs.get(job_id)
+                if job is None:
+                    return
+                job["log"].append(f"[{step}] {msg}")
+                # backup ∥ extract 동시 진행 — 진행률은 단조 증가로 표시
+                job["pct"]     = max(job["pct"], float(pct))
+                job["message"] = msg
+        return _cb
+
+    def _run_stage(self, job_id: str, name: str, fn: Callable[[dict], Optional[dict]], state: dict):
+        with self._sems[name]:
+            with self._lock:
+                job = self._jobs[job_id]
+                job["stages"][name] = "running"
+                job["stage"] = name
+            started = time.perf_counter()
+            try:
+                return fn(state)
+            finally:
+                with self._lock:
+                    job["stages"][name] = "done"
+                    job["stage_times"][name] = round(time.perf_counter() - started, 3)
+
+    def _run_job(self, job_id: str, file_bytes: bytes, filename: str, source_tab: str, kwargs: dict) -> None:
+        from modules import scan_engine as se
+
+        self._update(job_id, status="running", started_at=time.time(), message="분석 시작")
+        try:
+            result = self._run_stages(job_id, se, file_bytes, filename, source_tab, kwargs)
+            self._update(job_id, status="done", result=result, pct=1.0,
+                         message="완료" if result.get("success") else result.get("error", "실패"))
+        except Exception as e:
+            logger.exception(f"[GP190] 스캔 작업 실패: {job_id} {filename}")
+            self._update(job_id, status="failed", error=str(e)[:500], message=f"오류: {e}")
+        finally:
+            with self._lock:
+                self._pending -= 1
+                if job_id in self._jobs:
+                    self._jobs[job_id]["finished_at"] = time.time()
+
+    def _run_stages(self, job_id: str, se, file_bytes: bytes, filename: str, source_tab: str, kwargs: dict) -> dict:
+        ingest_id = f"{uuid.uuid4().hex[:6]}_{filename[:20].replace(' ','_')}"
+        if not kwargs.get("person_id") or not kwargs.get("agent_id"):
+            # 인물 식별 실패 — unified_scan_interface 의 차단 결과를 그대로 사용 (파이프라인 미실행)
+            return se.unified_scan_interface(file_bytes, filename, source_tab=source_tab, **kwargs)
+
+        state = se.new_scan_state(
+            file_bytes=file_bytes,
+            filename=filename,
+            doc_type=kwargs.get("doc_type", ""),
+            person_id=kwargs["person_id"],
+            agent_id=kwargs["agent_id"],
+            customer_name=kwargs.get("customer_name", ""),
+            gcs_client=kwargs.get("gcs_client"),
+            gcs_bucket=kwargs.get("gcs_bucket", ""),
+            dai_project=kwargs.get("dai_project", ""),
+            dai_location=kwargs.get("dai_location", "us"),
+            dai_processor_id=kwargs.get("dai_processor_id", ""),
+            gcs_credentials=kwargs.get("gcs_credentials"),
+            ai_call_fn=kwargs.get("ai_call_fn"),
+            rag_add_fn=None,                 # RAG는 마스터 승인 후에만 반영 (GP195)
+            progress_callback=self._progress_cb(job_id),
+            skip_preprocess=kwargs.get("skip_preprocess", False),
+        )
+
+        failed = self._run_stage(job_id, "prepare", se.scan_stage_prepare, state)
+        if not failed:
+            backup = self._io_pool.submit(self._run_stage, job_id, "backup", se.scan_stage_backup, state)
+            if state.get("dai_processor_id") and state.get("gcs_client") and state.get("gcs_bucket"):
+                backup.result()              # Document AI 는 gs:// URI 필요
+            # classify 는 backup 이 확정한 is_public_asset 을 읽음 → backup 완료 후 실행
+            failed = (
+                self._run_stage(job_id, "extract", se.scan_stage_extract, state)
+                or backup.result()
+                or self._run_stage(job_id, "classify", se.scan_stage_classify, state)
+                or self._run_stage(job_id, "publish", se.scan_stage_publish, state)
+            )
+        result = failed or se.scan_stage_result(state)
+        result["source_tab"]      = source_tab
+        result["ingest_id"]       = ingest_id
+        result["master_approved"] = False
+        return result
+
+
+def _file_payload(f) -> tuple:
+    """UploadedFile / tablet_dropzone dict → (파일명, bytes)"""
+    if isinstance(f, dict):
+        data = f.get("data", b"")
+        if isinstance(data, str):
+            data = base64.b64decode(data.split(",", 1)[-1])
+        return f.get("name", "upload"), data
+    if hasattr(f, "getvalue"):
+        return f.name, f.getvalue()
+    return f.name, f.read()
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# 2. 프로세스 공유 싱글턴
+# ══════════════════════════════════════════════════════════════════════════════
+
+_runner: Optional[ScanJobRunner] = None
+_runner_lock = threading.Lock()
+
+
+def get_scan_job_runner() -> ScanJobRunner:
+    global _runner
+    with _runner_lock:
+        if _runner is None:
+            _runner = ScanJobRunner()
+        return _runner
+
+
+def submit_scan_files(files: Iterable, source_tab: str = "unknown", **scan_kwargs) -> List[str]:
+    """공유 러너에 복수 파일 등록 → job_id 목록 (render_scan_jobs_ui 로 폴링)."""
+    return get_scan_job_runner().submit_files(files, source_tab, **scan_kwargs)
@@ -15,7 +15,8 @@ import cv2
 import numpy as np
 from PIL import Image
 import os
-from supabase import create_client, Client
+from supabase import Client
+from supabase_pool import get_supabase_client
 import openai
 
 
@@ -49,7 +50,7 @@ class TrafficAccidentAnalyzer:
                 openai_key = os.getenv("OPENAI_API_KEY")
                 
                 if supabase_url and supabase_key:
-                    self.supabase = create_client(supabase_url, supabase_key)
+                    self.supabase = get_supabase_client(supabase_url, supabase_key)
                 else:
                     self.supabase = None
                     self.use_rag = False
@@ -5,6 +5,7 @@ nba_engine.py — 선제적 영업 제안 (Next Best Action) 엔진
 
 Pipeline:
   [1] DB 스캔  — 만기 30일 / 휴면 3개월 / 보장 공백 고위험 고객 자동 선별
+                 (고객별 신호 RPC 1회 집계 → pandas 벡터 점수화, nba_scanner_schema.sql)
   [2] 성향 분류 — Logical / Emotional (DB personality_type + 메모 키워드)
   [3] 콘텐츠 생성 — 카톡 템플릿 + AI 가이드 텍스트 (성향별 분기)
   [4] 위젯 렌더  — "🤖 AI 비서의 오늘 영업 제안" 카드 뉴스
@@ -27,8 +28,23 @@ _NBA_TYPES = {
 }
 
 # ══════════════════════════════════════════════════════════════════════════════
-# [2] DB 스캔 함수
+# [2] DB 스캔 — 집합 기반 스캐너 (고객별 신호 1회 집계 → 벡터 점수화)
 # ══════════════════════════════════════════════════════════════════════════════
+# 점수·한도 설정 — get_all_nba_actions(agent_id, config={...}) 로 부분 재정의
+#   limits[type] / total_limit 을 None 으로 두면 설계사 전체 고객을 순위화
+NBA_SCAN_CONFIG: dict = {
+    "signals":        ["expiry", "dormant", "gap"],
+    "expiry_days":    30,         # 만기 임박 판정 (오늘~N일)
+    "dormant_months": 3,          # 휴면 판정 (최근 일정이 N개월 이전)
+    "dormant_tiers":  [1, 2],     # 휴면 스캔 대상 관리 등급
+    "gap_tiers":      [1],        # 보장 공백 스캔 대상 관리 등급
+    "gap_exclude_status": ["contracted"],
+    "weights": {"expiry": 100.0, "dormant": 60.0, "gap": 40.0},
+    "limits":  {"expiry": 10, "dormant": 5, "gap": 5},
+    "total_limit": None,
+}
+
+
 def _get_sb():
     try:
         from db_utils import _get_sb as _sb
@@ -37,147 +53,253 @@ def _get_sb():
         return None
 
 
+def _merge_config(config: Optional[dict]) -> dict:
+    cfg = {**NBA_SCAN_CONFIG, **(config or {})}
+    for key in ("weights", "limits"):
+        cfg[key] = {**NBA_SCAN_CONFIG[key], **((config or {}).get(key) or {})}
+    return cfg
+
+
+def _fetch_all(query_fn, page: int = 1000) -> list[dict]:
+    """PostgREST max-rows 우회 페이지 조회."""
+    rows, offset = [], 0
+    while True:
+        chunk = query_fn().range(offset, offset + page - 1).execute().data or []
+        rows.extend(chunk)
+        if len(chunk) < page:
+            return rows
+        offset += page
+
+
+def fetch_customer_signals(agent_id: Optional[str], expiry_days: int = 30) -> list[dict]:
+    """
+    설계사 전체 고객의 (최근 소통일, 임박 만기 일정) 1회 집계.
+    agent_id=None 이면 전 설계사 고객 (야간 사전 계산 배치, 행마다 agent_id 포함).
+    1순위: RPC nba_customer_signals (nba_scanner_schema.sql) — 1회 왕복
+    폴백 : gk_people + gk_schedules 일괄 조회 후 Python 집계 — 2회(+페이지) 왕복
+    """
+    sb = _get_sb()
+    if not sb or agent_id == "":
+        return []
+    today = datetime.date.today()
+    try:
+        data = sb.rpc("nba_customer_signals", {
+            "p_agent_id":    agent_id,
+            "p_expiry_days": expiry_days,
+            "p_today":       today.isoformat(),
+        }).execute().data
+        if isinstance(data, list) and len(data) == 1 and isinstance(data[0], dict) \
+                and "nba_customer_signals" in data[0]:
+            data = data[0]["nba_customer_signals"]
+        if isinstance(data, list):
+            return data
+    except Exception:
+        pass  # RPC 미배포 → 폴백
+
+    def _scoped(q):
+        return q if agent_id is None else q.eq("agent_id", agent_id)
+
+    try:
+        people = _fetch_all(lambda: _scoped(
+            sb.table("gk_people")
+            .select("agent_id,person_id,name,memo,personality_type,management_tier,status")
+            .eq("is_deleted", False)
+        ).order("person_id"))
+        scheds = _fetch_all(lambda: _scoped(
+            sb.table("gk_schedules").select("schedule_id,person_id,date,memo")
+            .eq("is_deleted", False)
+        ).order("schedule_id"))
+    except Exception:
+        return []
+
+    today_str = today.isoformat()
+    threshold = (today + datetime.timedelta(days=expiry_days)).isoformat()
+    last_contact: dict = {}
+    next_expiry: dict = {}
+    for s in scheds:
+        pid, d = s.get("person_id"), (s.get("date") or "")[:10]
+        if not pid or not d:
+            continue
+        if d > last_contact.get(pid, ""):
+            last_contact[pid] = d
+        if today_str <= d <= threshold and "#보험만기" in (s.get("memo") or "") \
+                and (pid not in next_expiry or d < next_expiry[pid][0]):
+            next_expiry[pid] = (d, s.get("schedule_id", ""))
+    for p in people:
+        pid = p.get("person_id")
+        p["last_contact"] = last_contact.get(pid)
+        p["next_expiry"], p["expiry_schedule_id"] = next_expiry.get(pid, (None, None))
+    return people
+
+
+def score_customer_signals(rows: list[dict], config: Optional[dict] = None,
+                           today: Optional[datetime.date] = None) -> list[dict]:
+    """
+    고객별 집계 행 → 만기/휴면/공백 신호 판정 + 점수화 (pandas 벡터 연산 1회).
+    고객당 1건 — 유형은 만기 > 휴면 > 공백 우선순위, 점수는 신호 합계
+    (점수 내림차순·동점 시 유형 우선순위, 유형별 한도 적용).
+    """
+    return [action for _agent, action in _score_signals(rows, config, today, by_agent=False)]
+
+
+def score_signals_by_agent(rows: list[dict], config: Optional[dict] = None,
+                           today: Optional[datetime.date] = None) -> dict[str, list[dict]]:
+    """전 설계사 고객 행(agent_id 포함) → 설계사별 NBA 액션 (단일 벡터 패스, 한도는 설계사별)."""
+    grouped: dict[str, list[dict]] = {}
+    for agent, action in _score_signals(rows, config, today, by_agent=True):
+        grouped.setdefault(agent, []).append(action)
+    return grouped
+
+
+def _score_signals(rows: list[dict], config: Optional[dict], today: Optional[datetime.date],
+                   by_agent: bool) -> list[tuple[str, dict]]:
+    import numpy as np
+    import pandas as pd
+
+    if not rows:
+        return []
+    cfg   = _merge_config(config)
+    today = today or datetime.date.today()
+    w     = cfg["weights"]
+
+    df = pd.DataFrame(rows)
+    for col in ("agent_id", "person_id", "name", "memo", "personality_type", "status",
+                "last_contact", "next_expiry", "expiry_schedule_id", "management_tier"):
+        if col not in df:
+            df[col] = None
+    df["_agent"] = df["agent_id"].fillna("").astype(str) if by_agent else ""
+    df = df[df["person_id"].notna() & (df["person_id"] != "")].drop_duplicates(["_agent", "person_id"])
+    if df.empty:
+        return []
+
+    now    = pd.Timestamp(today)
+    tier   = pd.to_numeric(df["management_tier"], errors="coerce")
+    last   = pd.to_datetime(df["last_contact"].astype("string").str[:10], format="%Y-%m-%d", errors="coerce")
+    expiry = pd.to_datetime(df["next_expiry"].astype("string").str[:10], format="%Y-%m-%d", errors="coerce")
+
+    days_left    = (expiry - now).dt.days
+    dormant_days = (now - last).dt.days
+    dormant_span = cfg["dormant_months"] * 30
+
+    is_expiry  = days_left.between(0, cfg["expiry_days"])
+    is_dormant = tier.isin(cfg["dormant_tiers"]) & (last.isna() | (dormant_days > dormant_span))
+    # status NULL 고객은 제외 (기존 PostgREST neq("status", …) 의 SQL NULL 비교 결과와 동일)
+    is_gap     = tier.isin(cfg["gap_tiers"]) & df["status"].notna() & ~df["status"].isin(cfg["gap_exclude_status"])
+
+    # 신호별 점수: 만기는 임박할수록, 휴면은 오래될수록(최대 3배 구간) 가산
+    span = max(cfg["expiry_days"], 1)
+    expiry_score  = (w["expiry"] * (1.5 - days_left.clip(0, span) / span)).where(is_expiry, 0.0)
+    dormant_ratio = (dormant_days / max(dormant_span, 1)).clip(upper=3.0).fillna(3.0)
+    dormant_score = (w["dormant"] * (0.5 + dormant_ratio / 6)).where(is_dormant, 0.0)
+    gap_score     = pd.Series(w["gap"], index=df.index).where(is_gap, 0.0)
+
+    scores = pd.DataFrame({"expiry": expiry_score, "dormant": dormant_score, "gap": gap_score})
+    scores = scores[[t for t in scores.columns if t in cfg["signals"]]]
+    if scores.empty or scores.shape[1] == 0:
+        return []
+    # 대표 유형은 고정 우선순위 만기 > 휴면 > 공백 (열 순서) 중 첫 신호 — 점수 크기와 무관
+    hits = scores > 0
+    df["nba_score"] = scores.sum(axis=1).round(1)
+    df["nba_type"]  = hits.idxmax(axis=1)
+    df["_days_left"]    = days_left
+    df["_dormant_days"] = dormant_days
+    df = df[df["nba_score"] > 0]
+    # 점수 내림차순 → 동점은 유형 우선순위 → 이름
+    priority = df["nba_type"].map({t: i for i, t in enumerate(scores.columns)})
+    df = df.iloc[np.lexsort((df["name"].fillna("").astype(str).to_numpy(),
+                             priority.to_numpy(), -df["nba_score"].to_numpy()))]
+
+    # 설계사별 유형 한도 → 전체 한도 (행 단위 루프는 최종 선정분만)
+    rank  = df.groupby(["_agent", "nba_type"]).cumcount()
+    limit = df["nba_type"].map(cfg["limits"]).astype("float").fillna(float("inf"))
+    df = df[rank < limit]
+    if cfg["total_limit"] is not None:
+        df = df[df.groupby("_agent").cumcount() < cfg["total_limit"]]
+    hits = hits.loc[df.index]
+    df = df.assign(_signals=[[t for t, hit in zip(hits.columns, row) if hit] for row in hits.to_numpy()])
+
+    actions: list[tuple[str, dict]] = []
+    for r in df.to_dict("records"):
+        nba_type = r["nba_type"]
+        action = {
+            "nba_type":         nba_type,
+            "person_id":        r["person_id"],
+            "name":             r["name"] or "",
+            "memo":             r["memo"] or "",
+            "personality_type": r["personality_type"] or "",
+            "nba_score":        float(r["nba_score"]),
+            "signals":          r["_signals"],
+        }
+        if nba_type == "expiry":
+            action["detail"] = f"만기 {int(r['_days_left'])}일 후 ({str(r['next_expiry'])[:10]})"
+            action["schedule_id"] = r["expiry_schedule_id"] or ""
+            action["expiry_date"] = str(r["next_expiry"])[:10]
+        elif nba_type == "dormant":
+            action["detail"] = (f"{int(r['_dormant_days'])}일 째 소통 없음"
+                                if pd.notna(r["_dormant_days"]) else "기록 없음")
+            action["last_date"] = str(r["last_contact"] or "")[:10]
+        else:
+            action["detail"] = "가처분 소득 대비 보장 공백 고위험"
+        actions.append((r["_agent"], action))
+    return actions
+
+
+def scan_customers(agent_id: str, config: Optional[dict] = None) -> list[dict]:
+    """집합 기반 NBA 스캔 — 신호 집계 1회 + 벡터 점수화."""
+    cfg = _merge_config(config)
+    try:
+        return score_customer_signals(fetch_customer_signals(agent_id, cfg["expiry_days"]), cfg)
+    except Exception:
+        return []
+
+
 def scan_expiry_soon(agent_id: str, days: int = 30) -> list[dict]:
     """만기 30일 이내 고객 — gk_schedules #보험만기 태그 + 자동갱신월 임박."""
-    today     = datetime.date.today()
-    threshold = (today + datetime.timedelta(days=days)).isoformat()
-    today_str = today.isoformat()
-    results   = []
-    sb = _get_sb()
-    if sb:
-        try:
-            rows = (
-                sb.table("gk_schedules").select("*, gk_people(name,memo,personality_type)")
-                .eq("is_deleted", False).eq("agent_id", agent_id)
-                .ilike("memo", "%#보험만기%")
-                .gte("date", today_str).lte("date", threshold)
-                .order("date").limit(10).execute().data or []
-            )
-            for r in rows:
-                p = r.get("gk_people") or {}
-                d_str = r.get("date","")
-                try:
-                    dl = (datetime.date.fromisoformat(d_str) - today).days
-                except Exception:
-                    dl = 0
-                results.append({
-                    "nba_type":    "expiry",
-                    "person_id":   r.get("person_id",""),
-                    "name":        p.get("name","") or r.get("customer_name",""),
-                    "memo":        p.get("memo",""),
-                    "personality_type": p.get("personality_type",""),
-                    "detail":      f"만기 {dl}일 후 ({d_str})",
-                    "schedule_id": r.get("schedule_id",""),
-                })
-        except Exception:
-            pass
-    return results
+    cfg = {"signals": ["expiry"], "expiry_days": days}
+    return scan_customers(agent_id, cfg)
 
 
 def scan_dormant_customers(agent_id: str, months: int = 3) -> list[dict]:
     """3개월간 소통 없는 휴면 고객 자동 감지."""
-    cutoff = (datetime.date.today() - datetime.timedelta(days=months * 30)).isoformat()
-    results = []
-    sb = _get_sb()
-    if sb:
-        try:
-            # 고객 목록에서 최근 일정이 cutoff 이전인 고객 찾기
-            # gk_people 조회 후 gk_schedules MAX(date) 로 비교
-            people = (
-                sb.table("gk_people").select("person_id,name,memo,personality_type,management_tier")
-                .eq("is_deleted", False).eq("agent_id", agent_id)
-                .in_("management_tier", [1, 2])   # 관리 등급 1·2 우선
-                .limit(100).execute().data or []
-            )
-            for p in people:
-                pid = p.get("person_id","")
-                if not pid:
-                    continue
-                scheds = (
-                    sb.table("gk_schedules").select("date")
-                    .eq("is_deleted", False).eq("agent_id", agent_id)
-                    .eq("person_id", pid)
-                    .order("date", desc=True).limit(1)
-                    .execute().data or []
-                )
-                last_date = scheds[0]["date"] if scheds else ""
-                if last_date < cutoff:
-                    dormant_days = ""
-                    if last_date:
-                        try:
-                            dd = (datetime.date.today() - datetime.date.fromisoformat(last_date)).days
-                            dormant_days = f"{dd}일 째 소통 없음"
-                        except Exception:
-                            dormant_days = "오래 전"
-                    else:
-                        dormant_days = "기록 없음"
-                    results.append({
-                        "nba_type":    "dormant",
-                        "person_id":   pid,
-                        "name":        p.get("name",""),
-                        "memo":        p.get("memo",""),
-                        "personality_type": p.get("personality_type",""),
-                        "detail":      dormant_days,
-                        "last_date":   last_date,
-                    })
-                if len(results) >= 5:
-                    break
-        except Exception:
-            pass
-    return results
+    cfg = {"signals": ["dormant"], "dormant_months": months}
+    return scan_customers(agent_id, cfg)
 
 
 def scan_high_risk_gap(agent_id: str) -> list[dict]:
     """보장 공백 고위험 — management_tier=1 + 상태 미완료 고객."""
-    results = []
-    sb = _get_sb()
-    if sb:
-        try:
-            rows = (
-                sb.table("gk_people").select("person_id,name,memo,personality_type,management_tier,status")
-                .eq("is_deleted", False).eq("agent_id", agent_id)
-                .eq("management_tier", 1)
-                .neq("status", "contracted")
-                .order("name").limit(5).execute().data or []
-            )
-            for r in rows:
-                results.append({
-                    "nba_type":    "gap",
-                    "person_id":   r.get("person_id",""),
-                    "name":        r.get("name",""),
-                    "memo":        r.get("memo",""),
-                    "personality_type": r.get("personality_type",""),
-                    "detail":      "가처분 소득 대비 보장 공백 고위험",
-                })
-        except Exception:
-            pass
-    return results
+    cfg = {"signals": ["gap"]}
+    return scan_customers(agent_id, cfg)
 
 
-def get_all_nba_actions(agent_id: str) -> list[dict]:
-    """NBA 전체 스캔 — 세션 캐시(TTL 5분) 적용."""
+def get_all_nba_actions(agent_id: str, config: Optional[dict] = None) -> list[dict]:
+    """
+    NBA 전체 스캔 — 세션 캐시(TTL 5분) 적용. 고객당 1건, 점수 내림차순.
+    기본 설정은 gk_agent_actions 사전 계산 결과 사용, config 지정 시 실시간 스캔.
+    """
     cache_key = f"_nba_cache_{agent_id}"
     cache_ts  = f"_nba_cache_ts_{agent_id}"
     now       = datetime.datetime.now()
     cached    = st.session_state.get(cache_key)
     cached_at = st.session_state.get(cache_ts)
-    if cached and cached_at and (now - cached_at).seconds < 300:
+    if config is None and cached and cached_at and (now - cached_at).seconds < 300:
         return cached
 
-    actions = []
-    actions += scan_expiry_soon(agent_id)
-    actions += scan_dormant_customers(agent_id)
-    actions += scan_high_risk_gap(agent_id)
-
-    # 중복 제거 (동일 person_id)
-    seen, unique = set(), []
-    for a in actions:
-        if a["person_id"] not in seen:
-            seen.add(a["person_id"])
-            unique.append(a)
+    unique = None
+    if config is None:
+        # [GP-NBA] 야간 사전 계산 테이블 우선 (설계사 1행 PK 조회, 변경 시 증분 재계산)
+        try:
+            from nba_precompute import load_agent_actions, apply_type_limits
+            rec = load_agent_actions(agent_id)
+            if rec is not None:
+                unique = apply_type_limits(rec.get("nba_actions") or [], NBA_SCAN_CONFIG["limits"])
+        except Exception:
+            unique = None
+    if unique is None:
+        unique = scan_customers(agent_id, config)
 
-    st.session_state[cache_key] = unique
-    st.session_state[cache_ts]  = now
+    if config is None:
+        st.session_state[cache_key] = unique
+        st.session_state[cache_ts]  = now
     return unique
 
 
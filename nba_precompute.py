@@ -0,0 +1,242 @@
+"""
+nba_precompute.py — 설계사별 NBA / 만기 알림 사전 계산 (gk_agent_actions)
+[GP-NBA] Goldkey AI Masters 2026
+
+  - precompute_all()      : 전 설계사 1회 패스 (신호 RPC 1회 + 만기 뷰 페이지 조회 → 벡터 점수화 → 배치 upsert)
+  - load_agent_actions()  : 설계사 1행 PK 조회 (O(1)) — 변경(change_seq)·날짜 경과 시 해당 설계사만 증분 재계산
+  - filter_expiry_alerts(): 저장된 만기 알림을 오늘 기준 D-day·우선순위로 재계산 후 필터
+
+야간 실행: python run_nba_precompute.py  (run_daily_rag_automation.py 마지막 단계에서도 호출)
+스키마   : nba_precompute_schema.sql
+"""
+from __future__ import annotations
+
+import time
+import datetime
+import logging
+from typing import Optional, Iterable
+
+logger = logging.getLogger(__name__)
+
+TABLE = "gk_agent_actions"
+
+# 저장은 넉넉히(유형 한도 없음, 설계사당 상위 100건), 화면 한도는 읽기 시 NBA_SCAN_CONFIG 적용
+NBA_PRECOMPUTE_CONFIG: dict = {
+    "limits":      {"expiry": None, "dormant": None, "gap": None},
+    "total_limit": 100,
+}
+
+# 테이블 미배포 시 매 조회마다 실패 쿼리를 보내지 않도록 일정 시간 비활성
+_TABLE_RETRY_SEC = 600
+_table_missing_until = 0.0
+
+
+def _get_sb():
+    try:
+        from db_utils import _get_sb as _sb
+        return _sb()
+    except Exception:
+        return None
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# [1] 원천 조회
+# ══════════════════════════════════════════════════════════════════════════════
+def _fetch_expiry_alerts(sb, agent_id: Optional[str] = None) -> list[dict]:
+    """v_expiry_alerts (D-0 ~ D-30) — agent_id=None 이면 전 설계사."""
+    from nba_engine import _fetch_all
+
+    def _query():
+        q = sb.table("v_expiry_alerts").select("*")
+        if agent_id is not None:
+            q = q.eq("agent_id", agent_id)
+        return q.order("expiry_date").order("id")
+
+    try:
+        return _fetch_all(_query)
+    except Exception as e:
+        logger.warning(f"[GP-NBA] 만기 알림 조회 실패: {e}")
+        return []
+
+
+def _fetch_seq(sb, agent_id: Optional[str] = None) -> dict[str, dict]:
+    """gk_agent_actions 의 (change_seq, computed_seq, computed_for) 스냅샷."""
+    from nba_engine import _fetch_all
+
+    def _query():
+        q = sb.table(TABLE).select("agent_id,change_seq,computed_seq,computed_for")
+        if agent_id is not None:
+            q = q.eq("agent_id", agent_id)
+        return q.order("agent_id")
+
+    return {r["agent_id"]: r for r in _fetch_all(_query)}
+
+
+def _is_fresh(rec: dict, today: datetime.date) -> bool:
+    return (
+        str(rec.get("computed_for") or "") == today.isoformat()
+        and int(rec.get("computed_seq") or 0) >= int(rec.get("change_seq") or 0)
+    )
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# [2] 계산 + 저장
+# ══════════════════════════════════════════════════════════════════════════════
+def _compute_rows(
+    agents: Iterable[str],
+    signals: list[dict],
+    alerts: list[dict],
+    seqs: dict[str, dict],
+    today: datetime.date,
+) -> list[dict]:
+    from nba_engine import score_signals_by_agent
+
+    actions_by_agent = score_signals_by_agent(signals, NBA_PRECOMPUTE_CONFIG, today)
+    alerts_by_agent: dict[str, list[dict]] = {}
+    for a in alerts:
+        alerts_by_agent.setdefault(a.get("agent_id") or "", []).append(a)
+
+    now = datetime.datetime.now(datetime.timezone.utc).isoformat()
+    return [
+        {
+            "agent_id":      agent,
+            "nba_actions":   actions_by_agent.get(agent, []),
+            "expiry_alerts": alerts_by_agent.get(agent, []),
+            "computed_for":  today.isoformat(),
+            "computed_seq":  int((seqs.get(agent) or {}).get("change_seq") or 0),
+            "computed_at":   now,
+        }
+        for agent in agents if agent
+    ]
+
+
+def _upsert(sb, rows: list[dict], batch_size: int = 200) -> int:
+    for start in range(0, len(rows), batch_size):
+        sb.table(TABLE).upsert(rows[start:start + batch_size], on_conflict="agent_id").execute()
+    return len(rows)
+
+
+def precompute_all(dirty_only: bool = False, batch_size: int = 200) -> dict:
+    """
+    전 설계사 NBA·만기 알림 1회 패스 계산.
+    dirty_only=True 이면 변경(change_seq)·날짜 경과된 설계사만 저장.
+    """
+    from nba_engine import fetch_customer_signals, NBA_SCAN_CONFIG
+
+    sb = _get_sb()
+    if not sb:
+        return {"ok": False, "error": "db_unavailable"}
+    today   = datetime.date.today()
+    started = time.perf_counter()
+
+    # change_seq 스냅샷을 원천 조회보다 먼저 읽어야 계산 중 변경분이 다음 회차에 반영됨
+    seqs    = _fetch_seq(sb)
+    signals = fetch_customer_signals(None, NBA_SCAN_CONFIG["expiry_days"])
+    alerts  = _fetch_expiry_alerts(sb)
+
+    if not signals:
+        # 신호 조회 실패([])로 전 설계사 결과를 비우지 않도록 중단
+        return {"ok": False, "error": "no_signals", "elapsed_s": round(time.perf_counter() - started, 2)}
+
+    agents = set(seqs) | {r.get("agent_id") for r in signals} | {a.get("agent_id") for a in alerts}
+    agents.discard(None)
+    agents.discard("")
+    if dirty_only:
+        agents = {a for a in agents if a not in seqs or not _is_fresh(seqs[a], today)}
+
+    rows = _compute_rows(sorted(agents), signals, alerts, seqs, today)
+    written = _upsert(sb, rows, batch_size)
+    return {
+        "ok":        True,
+        "agents":    written,
+        "customers": len(signals),
+        "alerts":    len(alerts),
+        "elapsed_s": round(time.perf_counter() - started, 2),
+    }
+
+
+def refresh_agent(agent_id: str) -> Optional[dict]:
+    """설계사 1명 증분 재계산 + 저장 (원천 변경 감지 시)."""
+    from nba_engine import fetch_customer_signals, NBA_SCAN_CONFIG
+
+    sb = _get_sb()
+    if not sb or not agent_id:
+        return None
+    today   = datetime.date.today()
+    seqs    = _fetch_seq(sb, agent_id)
+    signals = [dict(r, agent_id=agent_id)
+               for r in fetch_customer_signals(agent_id, NBA_SCAN_CONFIG["expiry_days"])]
+    alerts  = _fetch_expiry_alerts(sb, agent_id)
+    rows = _compute_rows([agent_id], signals, alerts, seqs, today)
+    if not signals and not alerts:
+        return rows[0]  # 조회 실패와 구분 불가 → 저장하지 않고 다음 조회 시 재계산
+    try:
+        _upsert(sb, rows)
+    except Exception as e:
+        logger.warning(f"[GP-NBA] 사전 계산 저장 실패 ({agent_id}): {e}")
+    return rows[0]
+
+
+def load_agent_actions(agent_id: str) -> Optional[dict]:
+    """
+    설계사 사전 계산 행 조회 (PK 1회).
+    오래됐거나 원천 변경이 있으면 해당 설계사만 재계산. 테이블 미배포 시 None.
+    """
+    global _table_missing_until
+    if not agent_id or time.monotonic() < _table_missing_until:
+        return None
+    sb = _get_sb()
+    if not sb:
+        return None
+    try:
+        rows = (
+            sb.table(TABLE).select("*").eq("agent_id", agent_id)
+            .limit(1).execute().data or []
+        )
+    except Exception as e:
+        logger.info(f"[GP-NBA] {TABLE} 조회 불가 → 실시간 스캔 사용: {e}")
+        _table_missing_until = time.monotonic() + _TABLE_RETRY_SEC
+        return None
+
+    if rows and _is_fresh(rows[0], datetime.date.today()):
+        return rows[0]
+    return refresh_agent(agent_id)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# [3] 읽기 시 후처리
+# ══════════════════════════════════════════════════════════════════════════════
+def apply_type_limits(actions: list[dict], limits: dict) -> list[dict]:
+    """점수순 액션 목록에 유형별 한도 적용 (None = 무제한)."""
+    taken: dict[str, int] = {}
+    out = []
+    for a in actions:
+        t = a.get("nba_type", "")
+        cap = limits.get(t)
+        if cap is not None and taken.get(t, 0) >= cap:
+            continue
+        taken[t] = taken.get(t, 0) + 1
+        out.append(a)
+    return out
+
+
+def filter_expiry_alerts(
+    alerts: list[dict],
+    days_range: int = 30,
+    priority_only: bool = True,
+    today: Optional[datetime.date] = None,
+) -> list[dict]:
+    """저장된 만기 알림 → 오늘 기준 D-day·우선순위 재계산 후 get_expiry_alerts 와 동일 필터."""
+    today = today or datetime.date.today()
+    out = []
+    for a in alerts:
+        try:
+            d = (datetime.date.fromisoformat(str(a.get("expiry_date"))[:10]) - today).days
+        except ValueError:
+            continue
+        priority = 1 if 26 <= d <= 30 else 2 if 12 <= d <= 16 else 0
+        if not 0 <= d <= days_range or (priority_only and priority not in (1, 2)):
+            continue
+        out.append({**a, "days_until_expiry": d, "alert_priority": priority})
+    out.sort(key=lambda a: str(a.get("expiry_date")))
+    return out
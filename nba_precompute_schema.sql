@@ -0,0 +1,156 @@
+-- ============================================================
+-- 설계사별 NBA / 만기 알림 사전 계산 테이블 (gk_agent_actions)
+-- [GP-NBA] Goldkey AI Masters 2026
+--
+-- 목적: 세션·디바이스마다 반복되던 NBA 스캔 / v_expiry_alerts 조회를
+--       야간 배치(run_nba_precompute.py) 1회 계산 → 설계사당 1행 PK 조회로 대체
+--
+-- 증분 갱신:
+--   gk_schedules / gk_policies / gk_people 변경 시 문장 단위(FOR EACH STATEMENT) 트리거가
+--   변경된 행의 설계사별로 change_seq 를 +1 (대량 가져오기 1문장 = 설계사당 upsert 1회)
+--   → change_seq > computed_seq 인 설계사는 다음 조회 시 해당 설계사만 재계산
+--   (배치가 읽기 시점의 change_seq 를 computed_seq 로 기록 → 계산 중 변경도 누락 없음)
+--
+-- 보안: 고객명·메모·만기 알림을 담으므로 RLS 적용 (service_role 전체 / 설계사 본인 행)
+--
+-- 선행: nba_scanner_schema.sql, insurance_expiry_automation.sql (v_expiry_alerts)
+-- Supabase SQL Editor에서 1회 실행하세요.
+-- ============================================================
+
+-- ──────────────────────────────────────────────────────────
+-- 1. 사전 계산 테이블
+-- ──────────────────────────────────────────────────────────
+CREATE TABLE IF NOT EXISTS gk_agent_actions (
+    agent_id      TEXT PRIMARY KEY,
+    nba_actions   JSONB NOT NULL DEFAULT '[]'::jsonb,   -- 점수순 NBA 액션 (고객당 1건)
+    expiry_alerts JSONB NOT NULL DEFAULT '[]'::jsonb,   -- v_expiry_alerts 행 (D-0 ~ D-30)
+    computed_for  DATE,                                 -- 계산 기준일 (날짜 경과 시 재계산)
+    computed_seq  BIGINT NOT NULL DEFAULT 0,            -- 계산 시점 change_seq
+    change_seq    BIGINT NOT NULL DEFAULT 0,            -- 원천 데이터 변경 카운터 (트리거 전용)
+    computed_at   TIMESTAMPTZ
+);
+
+COMMENT ON TABLE gk_agent_actions IS
+    '[GP-NBA] 설계사별 NBA·만기 알림 사전 계산 결과 (야간 배치 + 변경 시 증분 갱신)';
+
+-- ──────────────────────────────────────────────────────────
+-- 2. 변경 감지 트리거 (원천 테이블 → change_seq +1, 문장 단위)
+-- ──────────────────────────────────────────────────────────
+CREATE OR REPLACE FUNCTION public.gk_agent_actions_bump(p_agents TEXT[])
+RETURNS VOID
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+    INSERT INTO public.gk_agent_actions (agent_id, change_seq)
+    SELECT DISTINCT a, 1
+      FROM unnest(p_agents) AS a
+     WHERE a IS NOT NULL AND a <> ''
+    ON CONFLICT (agent_id)
+    DO UPDATE SET change_seq = public.gk_agent_actions.change_seq + 1;
+$$;
+
+-- 전이 테이블(new_rows / old_rows)의 설계사 목록 — 담당 설계사 변경 시 이전 설계사 포함
+CREATE OR REPLACE FUNCTION public.gk_agent_actions_touch()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM public.gk_agent_actions_bump(ARRAY(SELECT agent_id FROM new_rows));
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM public.gk_agent_actions_bump(ARRAY(SELECT agent_id FROM old_rows));
+    ELSE
+        PERFORM public.gk_agent_actions_bump(ARRAY(
+            SELECT agent_id FROM new_rows UNION SELECT agent_id FROM old_rows));
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+-- gk_people 수정: 관리 등급·상태·메모(성향 분류) 등 NBA 관련 컬럼이 바뀐 행만
+-- (전이 테이블 트리거는 UPDATE OF 컬럼 목록을 쓸 수 없어 함수에서 비교)
+CREATE OR REPLACE FUNCTION public.gk_agent_actions_touch_people()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = ''
+AS $$
+BEGIN
+    PERFORM public.gk_agent_actions_bump(ARRAY(
+        SELECT unnest(ARRAY[n.agent_id, o.agent_id])
+          FROM new_rows n
+          JOIN old_rows o ON o.person_id = n.person_id
+         WHERE (n.agent_id, n.name, n.memo, n.personality_type, n.management_tier, n.status, n.is_deleted)
+               IS DISTINCT FROM
+               (o.agent_id, o.name, o.memo, o.personality_type, o.management_tier, o.status, o.is_deleted)));
+    RETURN NULL;
+END;
+$$;
+
+-- 이전 행 단위 트리거 제거
+DROP TRIGGER IF EXISTS trg_gk_schedules_agent_actions ON gk_schedules;
+DROP TRIGGER IF EXISTS trg_gk_policies_agent_actions ON gk_policies;
+DROP TRIGGER IF EXISTS trg_gk_people_agent_actions ON gk_people;
+
+DROP TRIGGER IF EXISTS trg_gk_schedules_agent_actions_ins ON gk_schedules;
+CREATE TRIGGER trg_gk_schedules_agent_actions_ins
+    AFTER INSERT ON gk_schedules REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION public.gk_agent_actions_touch();
+DROP TRIGGER IF EXISTS trg_gk_schedules_agent_actions_upd ON gk_schedules;
+CREATE TRIGGER trg_gk_schedules_agent_actions_upd
+    AFTER UPDATE ON gk_schedules REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION public.gk_agent_actions_touch();
+DROP TRIGGER IF EXISTS trg_gk_schedules_agent_actions_del ON gk_schedules;
+CREATE TRIGGER trg_gk_schedules_agent_actions_del
+    AFTER DELETE ON gk_schedules REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION public.gk_agent_actions_touch();
+
+DROP TRIGGER IF EXISTS trg_gk_policies_agent_actions_ins ON gk_policies;
+CREATE TRIGGER trg_gk_policies_agent_actions_ins
+    AFTER INSERT ON gk_policies REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION public.gk_agent_actions_touch();
+DROP TRIGGER IF EXISTS trg_gk_policies_agent_actions_upd ON gk_policies;
+CREATE TRIGGER trg_gk_policies_agent_actions_upd
+    AFTER UPDATE ON gk_policies REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION public.gk_agent_actions_touch();
+DROP TRIGGER IF EXISTS trg_gk_policies_agent_actions_del ON gk_policies;
+CREATE TRIGGER trg_gk_policies_agent_actions_del
+    AFTER DELETE ON gk_policies REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION public.gk_agent_actions_touch();
+
+DROP TRIGGER IF EXISTS trg_gk_people_agent_actions_ins ON gk_people;
+CREATE TRIGGER trg_gk_people_agent_actions_ins
+    AFTER INSERT ON gk_people REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION public.gk_agent_actions_touch();
+DROP TRIGGER IF EXISTS trg_gk_people_agent_actions_upd ON gk_people;
+CREATE TRIGGER trg_gk_people_agent_actions_upd
+    AFTER UPDATE ON gk_people REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION public.gk_agent_actions_touch_people();
+DROP TRIGGER IF EXISTS trg_gk_people_agent_actions_del ON gk_people;
+CREATE TRIGGER trg_gk_people_agent_actions_del
+    AFTER DELETE ON gk_people REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION public.gk_agent_actions_touch();
+
+-- ──────────────────────────────────────────────────────────
+-- 3. RLS (service_role 전체 / 설계사 본인 행)
+-- ──────────────────────────────────────────────────────────
+ALTER TABLE public.gk_agent_actions ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "gk_agent_actions_service_role_policy" ON public.gk_agent_actions;
+CREATE POLICY "gk_agent_actions_service_role_policy"
+    ON public.gk_agent_actions
+    FOR ALL
+    TO service_role
+    USING (true)
+    WITH CHECK (true);
+
+DROP POLICY IF EXISTS "gk_agent_actions_own_agent_policy" ON public.gk_agent_actions;
+CREATE POLICY "gk_agent_actions_own_agent_policy"
+    ON public.gk_agent_actions
+    FOR ALL
+    TO authenticated
+    USING (agent_id = auth.uid()::text)
+    WITH CHECK (agent_id = auth.uid()::text);
@@ -0,0 +1,82 @@
+-- ============================================================
+-- NBA(Next Best Action) 집합 기반 스캐너 — 고객별 신호 1회 집계
+-- [GP-NBA] Goldkey AI Masters 2026
+--
+-- 목적: nba_engine.scan_dormant_customers 의 "고객 100명 조회 → 고객마다
+--       gk_schedules 최신 일정 1건 조회(N+1)" 를 단일 GROUP BY 집계로 대체
+--
+-- 반환 (고객 1명당 1행, 설계사 전체 고객 — p_agent_id NULL 이면 전 설계사, 야간 배치용):
+--   agent_id, person_id, name, memo, personality_type, management_tier, status,
+--   last_contact        — 최근 일정일 (MAX(date), 없으면 NULL)
+--   next_expiry         — 오늘~p_expiry_days 이내 가장 가까운 #보험만기 일정일
+--   expiry_schedule_id  — 해당 만기 일정 ID
+-- 신호 판정·점수화는 nba_engine.score_customer_signals() (pandas 벡터 연산)
+--
+-- Supabase SQL Editor에서 1회 실행하세요.
+-- ============================================================
+
+-- ──────────────────────────────────────────────────────────
+-- 1. 인덱스 (설계사별 고객 일정 집계)
+-- ──────────────────────────────────────────────────────────
+CREATE INDEX IF NOT EXISTS idx_gk_schedules_agent_person_date
+    ON gk_schedules (agent_id, person_id, date DESC)
+    WHERE is_deleted = FALSE;
+
+-- ──────────────────────────────────────────────────────────
+-- 2. 고객별 신호 RPC
+--    JSONB 배열 1건으로 반환 → PostgREST max-rows(1000) 제한 없이 전체 고객 1회 왕복
+-- ──────────────────────────────────────────────────────────
+CREATE OR REPLACE FUNCTION public.nba_customer_signals(
+    p_agent_id    TEXT,
+    p_expiry_days INT  DEFAULT 30,
+    p_today       DATE DEFAULT CURRENT_DATE
+)
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+SECURITY INVOKER
+SET search_path = ''
+AS $$
+    WITH contact AS (
+        SELECT s.person_id,
+               max(s.date) AS last_contact
+          FROM public.gk_schedules s
+         WHERE (p_agent_id IS NULL OR s.agent_id = p_agent_id)
+           AND s.is_deleted = FALSE
+           AND s.person_id IS NOT NULL
+         GROUP BY s.person_id
+    ),
+    expiry AS (
+        SELECT DISTINCT ON (s.person_id)
+               s.person_id,
+               s.date        AS next_expiry,
+               s.schedule_id AS expiry_schedule_id
+          FROM public.gk_schedules s
+         WHERE (p_agent_id IS NULL OR s.agent_id = p_agent_id)
+           AND s.is_deleted = FALSE
+           AND s.person_id IS NOT NULL
+           AND s.memo ILIKE '%#보험만기%'
+           AND s.date::DATE BETWEEN p_today AND p_today + p_expiry_days
+         ORDER BY s.person_id, s.date
+    )
+    SELECT coalesce(jsonb_agg(jsonb_build_object(
+               'agent_id',           p.agent_id,
+               'person_id',          p.person_id,
+               'name',               p.name,
+               'memo',               p.memo,
+               'personality_type',   p.personality_type,
+               'management_tier',    p.management_tier,
+               'status',             p.status,
+               'last_contact',       c.last_contact,
+               'next_expiry',        e.next_expiry,
+               'expiry_schedule_id', e.expiry_schedule_id
+           )), '[]'::jsonb)
+      FROM public.gk_people p
+      LEFT JOIN contact c ON c.person_id = p.person_id
+      LEFT JOIN expiry  e ON e.person_id = p.person_id
+     WHERE (p_agent_id IS NULL OR p.agent_id = p_agent_id)
+       AND p.is_deleted = FALSE;
+$$;
+
+COMMENT ON FUNCTION public.nba_customer_signals IS
+    '[GP-NBA] 설계사 전체 고객의 최근 소통일·임박 만기 일정 1회 집계 (NBA 스캐너 입력)';
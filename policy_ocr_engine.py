@@ -39,6 +39,19 @@ except ImportError:
     except ImportError:
         FUZZY_AVAILABLE = False
 
+try:
+    import numpy as np
+    from rapidfuzz.process import cdist as _rf_cdist
+    CDIST_AVAILABLE = True
+except ImportError:
+    CDIST_AVAILABLE = False
+
+try:
+    from hq_backend.services.term_automaton import TermAutomaton
+    AUTOMATON_AVAILABLE = True
+except ImportError:
+    AUTOMATON_AVAILABLE = False
+
 # ── 표 구조 파싱 모듈 임포트 ────────────────────────────────────────────────
 try:
     from modules.table_structure_parser import TableStructureParser
@@ -186,6 +199,178 @@ def normalize_amount(text: str) -> str:
 # =============================================================================
 
 _FUZZY_THRESHOLD = 82  # 유사도 82% 이상일 때만 치환
+_CORRECTION_CACHE_MAX = 8192  # (담보명, 임계값) 교정 결과 메모 상한
+
+
+class CoverageNameIndex:
+    """
+    담보명 교정 사전 컴파일 인덱스.
+      - 부분 포함 오타 교정: 오타 키 전체를 Aho–Corasick 오토마톤 1회 스캔으로 탐지
+        (사전 순서상 가장 앞선 키 적용 — 선형 탐색과 동일 결과)
+      - 퍼지 후보 축소: 표준 담보명 문자 2-gram 역색인 + q-gram 보조정리 하한
+        (ratio ≥ 임계값인 후보는 반드시 포함 → 전체 extractOne 과 동일 결과)
+        표준명이 BLOCKING_MIN_NAMES 미만이면 C 구현 전체 채점이 더 빨라 축소 생략
+      - 표 단위 일괄 채점: rapidfuzz.process.cdist 1회 호출
+      - (담보명, 임계값) 결과 메모
+    """
+
+    NGRAM = 2
+    BLOCKING_MIN_NAMES = 300
+
+    def __init__(self, typo_dict: dict[str, str], standard_names: list[str]):
+        self.typo_dict = typo_dict
+        self.typos = list(typo_dict)
+        self.standard_names = list(standard_names)
+        self.signature = (id(typo_dict), len(typo_dict), len(standard_names))
+        self._automaton = TermAutomaton(self.typos) if AUTOMATON_AVAILABLE else None
+        self._cache: dict[tuple[str, int], str] = {}
+        # rapidfuzz 만 인덱스 사용 — fuzzywuzzy extractOne 은 기본 전처리(processor)가 달라 결과 상이
+        self._indexed_fuzzy = (
+            FUZZY_AVAILABLE and CDIST_AVAILABLE and rfprocess.__name__.startswith("rapidfuzz")
+        )
+        self._blocking = self._indexed_fuzzy and len(self.standard_names) >= self.BLOCKING_MIN_NAMES
+        if self._blocking:
+            self._lengths = np.array([len(n) for n in self.standard_names], dtype=np.int32)
+            self._gram_rows: dict[str, int] = {}
+            counts = [self._ngram_counts(n) for n in self.standard_names]
+            for c in counts:
+                for gram in c:
+                    self._gram_rows.setdefault(gram, len(self._gram_rows))
+            # 2-gram × 표준명 출현 횟수 행렬 (역색인)
+            self._gram_mat = np.zeros((len(self._gram_rows), len(self.standard_names)), dtype=np.int16)
+            for col, c in enumerate(counts):
+                for gram, cnt in c.items():
+                    self._gram_mat[self._gram_rows[gram], col] = cnt
+
+    @classmethod
+    def _ngram_counts(cls, text: str) -> dict[str, int]:
+        counts: dict[str, int] = {}
+        for i in range(len(text) - cls.NGRAM + 1):
+            gram = text[i:i + cls.NGRAM]
+            counts[gram] = counts.get(gram, 0) + 1
+        return counts
+
+    def candidates(self, query: str, threshold: int) -> list[int]:
+        """
+        ratio ≥ threshold 가 가능한 표준명 번호 (원래 순서).
+        ratio = 2·LCS/(la+lb) 이므로 길이 창 밖은 제외, indel 거리 d 이하일 때
+        공유 2-gram ≥ (la-1) - 2d (q-gram 보조정리) — 하한이 0 이하면 길이 창 전체.
+        """
+        if not self._blocking:
+            return list(range(len(self.standard_names)))
+        la, t = len(query), float(threshold)
+        # 2·min(la, lb) / (la+lb) ≥ t/100 — 나눗셈 없이 비교 (경계값 부동소수 오차 방지)
+        lb = self._lengths
+        mask = (lb * (200 - t) >= la * t) & (la * (200 - t) >= lb * t)
+        if not mask.any():
+            return []
+        d_max = int((100 - t) * (la + int(lb[mask].max())) / 100 + 1e-9)
+        required = (la - self.NGRAM + 1) - self.NGRAM * d_max
+        if required > 0:
+            grams = self._ngram_counts(query)
+            rows = [self._gram_rows[g] for g in grams if g in self._gram_rows]
+            if not rows:
+                return []
+            qc = np.array([grams[g] for g in grams if g in self._gram_rows], dtype=np.int16)
+            shared = np.minimum(self._gram_mat[rows], qc[:, None]).sum(axis=0)
+            mask &= shared >= required
+        return np.flatnonzero(mask).tolist()
+
+    # ── 1·2차: 사전 교정 ──────────────────────────────────────────────────
+    def _dict_pass(self, name: str, name_stripped: str) -> Optional[str]:
+        if name_stripped in self.typo_dict:
+            return self.typo_dict[name_stripped]
+        if self._automaton is not None:
+            hits = self._automaton.find(name_stripped)
+            if hits:
+                typo = self.typos[min(hits)]
+                return name.replace(typo, self.typo_dict[typo])
+            return None
+        for typo, correct in self.typo_dict.items():
+            if typo in name_stripped:
+                return name.replace(typo, correct)
+        return None
+
+    # ── 3차: 퍼지 매칭 ────────────────────────────────────────────────────
+    def _fuzzy_one(self, name_stripped: str, threshold: int) -> Optional[str]:
+        if not FUZZY_AVAILABLE:
+            return None
+        if not self._blocking:
+            result = rfprocess.extractOne(name_stripped, self.standard_names, scorer=fuzz.ratio)
+            return result[0] if result and result[1] >= threshold else None
+        cand = self.candidates(name_stripped, threshold)
+        if not cand:
+            return None
+        result = rfprocess.extractOne(
+            name_stripped, [self.standard_names[i] for i in cand],
+            scorer=fuzz.ratio, score_cutoff=threshold,
+        )
+        return result[0] if result else None
+
+    def _fuzzy_batch(self, queries: list[str], threshold: int) -> list[Optional[str]]:
+        """표 전체 미교정 담보명을 후보 합집합과 cdist 1회로 채점."""
+        if not self._indexed_fuzzy or len(queries) < 2:
+            return [self._fuzzy_one(q, threshold) for q in queries]
+        if self._blocking:
+            union = sorted({i for q in queries for i in self.candidates(q, threshold)})
+            if not union:
+                return [None] * len(queries)
+            choices = [self.standard_names[i] for i in union]
+        else:
+            choices = self.standard_names
+        scores = _rf_cdist(queries, choices, scorer=fuzz.ratio, score_cutoff=threshold)
+        best = scores.argmax(axis=1)   # 동점 시 앞선 표준명 (extractOne 과 동일)
+        return [
+            choices[b] if scores[r, b] >= threshold else None
+            for r, b in enumerate(best)
+        ]
+
+    # ── 공개 API ──────────────────────────────────────────────────────────
+    def correct(self, name: str, threshold: int = _FUZZY_THRESHOLD) -> str:
+        return self.correct_many([name], threshold)[0]
+
+    def correct_many(self, names: list[str], threshold: int = _FUZZY_THRESHOLD) -> list[str]:
+        out: list[Optional[str]] = [None] * len(names)
+        fuzzy_rows: dict[str, list[int]] = {}
+        for i, name in enumerate(names):
+            if not name:
+                out[i] = name
+                continue
+            hit = self._cache.get((name, threshold))
+            if hit is not None:
+                out[i] = hit
+                continue
+            name_stripped = name.replace(" ", "")
+            fixed = self._dict_pass(name, name_stripped)
+            if fixed is not None:
+                out[i] = self._remember(name, threshold, fixed)
+            else:
+                fuzzy_rows.setdefault(name_stripped, []).append(i)
+
+        if fuzzy_rows:
+            queries = list(fuzzy_rows)
+            for query, match in zip(queries, self._fuzzy_batch(queries, threshold)):
+                for i in fuzzy_rows[query]:
+                    out[i] = self._remember(names[i], threshold, match or names[i])
+        return out
+
+    def _remember(self, name: str, threshold: int, result: str) -> str:
+        if len(self._cache) >= _CORRECTION_CACHE_MAX:
+            self._cache.clear()
+        self._cache[(name, threshold)] = result
+        return result
+
+
+_coverage_index: Optional[CoverageNameIndex] = None
+
+
+def get_coverage_index() -> CoverageNameIndex:
+    """모듈 공유 교정 인덱스 (사전·표준명 목록 변경 시 재컴파일)."""
+    global _coverage_index
+    signature = (id(INSURANCE_DOMAIN_DICT), len(INSURANCE_DOMAIN_DICT), len(STANDARD_COVERAGE_NAMES))
+    if _coverage_index is None or _coverage_index.signature != signature:
+        _coverage_index = CoverageNameIndex(INSURANCE_DOMAIN_DICT, STANDARD_COVERAGE_NAMES)
+    return _coverage_index
 
 
 def correct_coverage_name(name: str, threshold: int = _FUZZY_THRESHOLD) -> str:
@@ -195,29 +380,12 @@ def correct_coverage_name(name: str, threshold: int = _FUZZY_THRESHOLD) -> str:
     """
     if not name:
         return name
+    return get_coverage_index().correct(name, threshold)
 
-    name_stripped = name.replace(" ", "")
-
-    # 1차: 완전 일치 사전 교정
-    if name_stripped in INSURANCE_DOMAIN_DICT:
-        return INSURANCE_DOMAIN_DICT[name_stripped]
 
-    # 2차: 부분 포함 교정 (짧은 오타 키가 담보명 내부에 있는 경우)
-    for typo, correct in INSURANCE_DOMAIN_DICT.items():
-        if typo in name_stripped:
-            return name.replace(typo, correct)
-
-    # 3차: 퍼지 매칭 (rapidfuzz 또는 fuzzywuzzy)
-    if FUZZY_AVAILABLE:
-        result = rfprocess.extractOne(
-            name_stripped,
-            STANDARD_COVERAGE_NAMES,
-            scorer=fuzz.ratio,
-        )
-        if result and result[1] >= threshold:
-            return result[0]
-
-    return name  # 교정 불가 시 원본 반환
+def correct_coverage_names(names: list[str], threshold: int = _FUZZY_THRESHOLD) -> list[str]:
+    """correct_coverage_name 의 표 단위 일괄 버전 (결과 동일, 퍼지 채점 1회)."""
+    return get_coverage_index().correct_many(list(names), threshold)
 
 
 def postprocess_coverages(coverages: list[dict]) -> list[dict]:
@@ -225,16 +393,17 @@ def postprocess_coverages(coverages: list[dict]) -> list[dict]:
     AI가 반환한 담보 목록에 퍼지 교정 + 금액 정규화 적용.
     원본 name은 'raw_name'으로 보존.
     """
-    for c in coverages:
-        raw = c.get("name", "")
-        corrected = correct_coverage_name(raw)
+    raws = [c.get("name", "") for c in coverages]
+    stds = [c.get("standard_name", "") for c in coverages]
+    fixed = correct_coverage_names(raws + [s for s in stds if s])
+    fixed_std = iter(fixed[len(raws):])
+    for c, raw, std, corrected in zip(coverages, raws, stds, fixed):
         if corrected != raw:
             c["raw_name"] = raw
             c["name"] = corrected
         # standard_name도 함께 교정
-        std = c.get("standard_name", "")
         if std:
-            c["standard_name"] = correct_coverage_name(std)
+            c["standard_name"] = next(fixed_std)
     return coverages
 
 
@@ -257,31 +426,13 @@ def preprocess_image_bytes(img_bytes: bytes) -> bytes:
         return img_bytes
 
     try:
-        # bytes → numpy array
+        # bytes → numpy array (그레이스케일로 바로 디코딩)
         np_arr = np.frombuffer(img_bytes, np.uint8)
-        img = cv2.imdecode(np_arr, cv2.IMREAD_COLOR)
-        if img is None:
+        gray = cv2.imdecode(np_arr, cv2.IMREAD_GRAYSCALE)
+        if gray is None:
             return img_bytes
 
-        # ① 그레이스케일
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-
-        # ② CLAHE 대비 향상
-        clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-        gray = clahe.apply(gray)
-
-        # ③ 가우시안 블러 (잡음 제거)
-        blurred = cv2.GaussianBlur(gray, (3, 3), 0)
-
-        # ④ 적응형 이진화
-        binary = cv2.adaptiveThreshold(
-            blurred, 255,
-            cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
-            cv2.THRESH_BINARY, 15, 8
-        )
-
-        # ⑤ 투영 변환 (기울어진 문서 자동 보정)
-        binary = _perspective_correction(binary)
+        binary = preprocess_image_array(gray)
 
         # numpy → PNG bytes
         success, enc = cv2.imencode(".png", binary)
@@ -293,6 +444,38 @@ def preprocess_image_bytes(img_bytes: bytes) -> bytes:
         return img_bytes  # 전처리 실패 시 원본 반환
 
 
+def preprocess_image_array(img: "np.ndarray", workspace=None) -> "np.ndarray":
+    """
+    preprocess_image_bytes 의 배열 버전 — PDF 래스터(modules.pdf_rasterizer) 등
+    이미 디코딩된 배열을 인코딩·디코딩 없이 ②~⑤ 단계에 직접 통과.
+    img: 그레이스케일(H×W) 또는 BGR(H×W×3) uint8
+    workspace: RasterWorkspace 제공 시 중간 배열을 재사용 버퍼에 기록
+    """
+    def _buf(name):
+        return workspace.take(name, img.shape[:2]) if workspace is not None else None
+
+    # ① 그레이스케일
+    gray = img if img.ndim == 2 else cv2.cvtColor(img, cv2.COLOR_BGR2GRAY, _buf("gray"))
+
+    # ② CLAHE 대비 향상
+    clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+    gray = clahe.apply(gray, _buf("clahe"))
+
+    # ③ 가우시안 블러 (잡음 제거)
+    blurred = cv2.GaussianBlur(gray, (3, 3), 0, _buf("blur"))
+
+    # ④ 적응형 이진화
+    binary = cv2.adaptiveThreshold(
+        blurred, 255,
+        cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+        cv2.THRESH_BINARY, 15, 8,
+        _buf("binary"),
+    )
+
+    # ⑤ 투영 변환 (기울어진 문서 자동 보정)
+    return _perspective_correction(binary)
+
+
 def _perspective_correction(binary_img) -> "np.ndarray":
     """
     이진화된 이미지에서 문서 경계(최대 윤곽선)를 찾아
@@ -374,6 +557,36 @@ def prepare_image_for_vision(img_bytes: bytes, mime_type: str) -> tuple[bytes, s
     return processed, "image/png"
 
 
+def iter_pdf_pages_for_vision(pdf_bytes: bytes, max_pages: int = 10, dpi: int = 180):
+    """
+    스캔 PDF → 페이지별 전처리 PNG 바이트 (Vision AI 전송용, 앞 max_pages 페이지).
+    modules.pdf_rasterizer 그레이스케일 래스터를 preprocess_image_array 에 바로 전달 —
+    페이지 PNG 인코딩 → prepare_image_for_vision 디코딩 왕복 없이 최종 1회만 인코딩.
+    dpi 기본 180 = 기존 fitz.Matrix(2.5, 2.5) 확대 (메모리 예산 초과 시 자동 하향).
+    PyMuPDF 미설치 시 ImportError (호출자가 PDF 원본 전송으로 폴백).
+    """
+    from modules.pdf_rasterizer import iter_pdf_rasters, pdf_page_count, RasterWorkspace
+    if not (CV2_AVAILABLE or PIL_AVAILABLE):
+        raise ImportError("OpenCV / Pillow 미설치 — PNG 인코딩 불가")
+
+    workspace = RasterWorkspace() if CV2_AVAILABLE else None
+    pages = range(min(pdf_page_count(pdf_bytes), max_pages))
+    for raster in iter_pdf_rasters(pdf_bytes, grayscale=True, dpi=dpi, pages=pages):
+        img = raster["image"]
+        if not CV2_AVAILABLE:
+            buf = io.BytesIO()
+            PILImage.fromarray(img).save(buf, format="PNG")
+            yield buf.getvalue()
+            continue
+        try:
+            img = preprocess_image_array(img, workspace)
+        except Exception:
+            pass  # 전처리 실패 시 원본 래스터 전송
+        ok, enc = cv2.imencode(".png", img)
+        if ok:
+            yield enc.tobytes()
+
+
 def postprocess_ocr_text(text: str) -> str:
     """
     OCR 원문 텍스트에 전처리 파이프라인 적용.
@@ -0,0 +1,76 @@
+-- ============================================================
+-- 설계사 포트폴리오 갭 순위 테이블 (gk_portfolio_gaps)
+-- [GP-PORTFOLIO] Goldkey AI Masters 2026
+--
+-- 목적: 고객마다 AnalysisHub.run() 을 반복하던 보장 공백 분석을
+--       engines/portfolio_gap_engine.py 일괄 벡터 연산 1회로 계산 → 설계사별 순위 조회
+--
+-- 갱신: run_portfolio_gaps.py (야간, 전 설계사) / HQ 홈 [🔄 지금 재계산] (설계사 본인)
+--   → run_portfolio_analysis() → save_portfolio_gaps()
+--   (agent_id, person_id) upsert 후, 계산 범위(전체 또는 해당 설계사)에서
+--   computed_at 이 이번 계산보다 이전인 행 삭제 (고객 0명이 된 설계사 포함)
+--
+-- 선행: phase2_analysis_persistence_schema.sql (gk_trinity_analysis)
+-- Supabase SQL Editor에서 1회 실행하세요.
+-- ============================================================
+
+-- ──────────────────────────────────────────────────────────
+-- 1. 순위 테이블 (고객당 1행)
+-- ──────────────────────────────────────────────────────────
+CREATE TABLE IF NOT EXISTS gk_portfolio_gaps (
+    agent_id            TEXT NOT NULL,                      -- 담당 설계사
+    person_id           TEXT NOT NULL,                      -- gk_people.person_id 참조
+    name                TEXT,
+    age                 INTEGER,
+    has_income          BOOLEAN NOT NULL DEFAULT FALSE,     -- 건보료 기반 소득 추정 가능 여부
+
+    -- KB 7대 스탠다드
+    kb_total_score      NUMERIC(14,1) DEFAULT 0,            -- 가중 보유 합계 (만원)
+    kb_total_benchmark  NUMERIC(14,1) DEFAULT 0,            -- 연령 권장 합계 (만원)
+    kb_pct              NUMERIC(6,1)  DEFAULT 0,            -- 충족률 (%)
+    kb_grade            TEXT,                               -- S / A / B / C / D
+    shortfall_count     INTEGER DEFAULT 0,                  -- 권장 미달 항목 수
+
+    -- 트리니티 · 통합 Gap
+    monthly_income      NUMERIC(14,1) DEFAULT 0,            -- 추정 월 소득 (만원)
+    golden_time_fund    NUMERIC(14,1) DEFAULT 0,            -- 골든타임 필요 자금 (만원)
+    kb_cancer_score     NUMERIC(14,1) DEFAULT 0,            -- 암 진단 가중 보유액 (만원)
+    income_gap          NUMERIC(14,1) DEFAULT 0,            -- 골든타임 공백 (만원, 순위 기준)
+    total_gap           NUMERIC(14,1) DEFAULT 0,            -- KB 권장 대비 총 공백 (만원)
+    coverage_ratio      NUMERIC(6,1)  DEFAULT 0,            -- 골든타임 커버율 (%)
+    risk_level          TEXT,                               -- 위험 / 주의 / 양호
+    alert_mode          BOOLEAN DEFAULT FALSE,              -- 경보 모드 (커버율 50% 미만)
+    covered_amount      NUMERIC(14,1) DEFAULT 0,            -- 보유 담보 원금 합계 (만원)
+
+    gap_rank            INTEGER NOT NULL,                   -- 설계사 내 순위 (소득 추정 고객 우선, 공백 큰 순)
+    category_scores     JSONB NOT NULL DEFAULT '{}'::jsonb, -- KB 항목별 가중 보유액
+    category_gaps       JSONB NOT NULL DEFAULT '{}'::jsonb, -- KB 항목별 부족액
+    computed_at         TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+
+    PRIMARY KEY (agent_id, person_id)
+);
+
+COMMENT ON TABLE gk_portfolio_gaps IS
+    '[GP-PORTFOLIO] 설계사 고객 전체 보장 공백 일괄 분석 결과 (설계사별 gap_rank 순위)';
+
+-- ──────────────────────────────────────────────────────────
+-- 2. 인덱스 (설계사별 순위 조회 · 위험 등급 필터)
+-- ──────────────────────────────────────────────────────────
+CREATE INDEX IF NOT EXISTS idx_gk_portfolio_gaps_rank
+    ON gk_portfolio_gaps (agent_id, gap_rank);
+
+CREATE INDEX IF NOT EXISTS idx_gk_portfolio_gaps_risk
+    ON gk_portfolio_gaps (agent_id, risk_level, gap_rank);
+
+-- ──────────────────────────────────────────────────────────
+-- 3. RLS (service_role 전용)
+-- ──────────────────────────────────────────────────────────
+ALTER TABLE public.gk_portfolio_gaps ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "gk_portfolio_gaps_service_role_policy" ON public.gk_portfolio_gaps;
+CREATE POLICY "gk_portfolio_gaps_service_role_policy"
+    ON public.gk_portfolio_gaps
+    FOR ALL
+    TO service_role
+    USING (true)
+    WITH CHECK (true);
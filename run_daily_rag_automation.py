@@ -11,9 +11,10 @@ import os
 import sys
 import json
 import hashlib
+import argparse
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional
 import traceback
 
 # 환경변수 로드
@@ -32,6 +33,9 @@ REPORT_DIR.mkdir(parents=True, exist_ok=True)
 # 지원 파일 확장자
 SUPPORTED_EXTENSIONS = [".pdf", ".md", ".txt"]
 
+# 임베딩 동시 요청 수 (429 발생 시 스케줄러가 자동 축소)
+EMBEDDING_CONCURRENCY = int(os.getenv("RAG_EMBEDDING_CONCURRENCY", "4"))
+
 # ═══════════════════════════════════════════════════════════════════
 # [2단계] 유틸리티 함수
 # ═══════════════════════════════════════════════════════════════════
@@ -115,10 +119,19 @@ def scan_source_docs() -> Tuple[List[Path], List[Path], List[Path]]:
 # [4단계] RAG 인제스트 실행
 # ═══════════════════════════════════════════════════════════════════
 
-def run_rag_ingestion(new_files: List[Path]) -> Dict:
+def run_rag_ingestion(
+    new_files: List[Path],
+    workers: Optional[int] = None,
+    file_timeout: float = 300.0
+) -> Dict:
     """
     신규 파일에 대해 RAG 인제스트 실행
     
+    Args:
+        new_files: 신규 파일 리스트
+        workers: PDF 추출 워커 프로세스 수 (None이면 CPU 코어 수)
+        file_timeout: 파일당 추출 제한 시간 (초)
+    
     Returns:
         처리 결과 딕셔너리
     """
@@ -185,18 +198,10 @@ def run_rag_ingestion(new_files: List[Path]) -> Dict:
         print(f"⚠️ GCS 통합 모듈 로드 실패: {e}")
         gcs_enabled = False
     
-    # 파일별 처리
-    processed = 0
-    failed = 0
-    results = []
-    
-    for file_path in new_files:
-        try:
-            print(f"\n처리 중: {file_path.name}")
-            
-            # [1단계] GCS에 원본 파일 업로드
-            gcs_path = None
-            if gcs_enabled:
+    # [1단계] GCS에 원본 파일 업로드 (파일별)
+    if gcs_enabled:
+        for file_path in new_files:
+            try:
                 file_hash = calculate_file_hash(file_path)
                 gcs_success, gcs_result = upload_source_doc_to_gcs(
                     file_path=file_path,
@@ -205,40 +210,50 @@ def run_rag_ingestion(new_files: List[Path]) -> Dict:
                     encrypt=True
                 )
                 if gcs_success:
-                    gcs_path = gcs_result
-                    print(f"   ✅ GCS 업로드 완료: {gcs_path}")
+                    print(f"   ✅ GCS 업로드 완료: {gcs_result}")
                 else:
                     print(f"   ⚠️ GCS 업로드 실패: {gcs_result}")
-            
-            # [2단계] RAG 임베딩 및 Supabase 저장
-            result = pipeline.ingest_document_intelligent(
-                pdf_path=str(file_path),
-                source_root=str(SOURCE_DOCS_DIR)
-            )
-            
-            if result.get("success"):
-                processed += 1
-                results.append({
-                    "file": file_path.name,
-                    "status": "success",
-                    "chunks": result.get("chunks_count", 0)
-                })
-            else:
-                failed += 1
-                results.append({
-                    "file": file_path.name,
-                    "status": "failed",
-                    "error": result.get("reason", "Unknown")
-                })
-                
-        except Exception as e:
+            except Exception as e:
+                print(f"   ⚠️ GCS 업로드 실패: {file_path.name} - {e}")
+    
+    # [2단계] RAG 임베딩 및 Supabase 저장
+    # 모든 신규 파일의 청크를 토큰 상한 배치로 묶어 동시 처리 (중단 시 체크포인트부터 재개)
+    processed = 0
+    failed = 0
+    results = []
+    
+    try:
+        file_results = pipeline.ingest_files_scheduled(
+            [str(file_path) for file_path in new_files],
+            source_root=str(SOURCE_DOCS_DIR),
+            concurrency=EMBEDDING_CONCURRENCY,
+            workers=workers,
+            file_timeout=file_timeout
+        )
+    except Exception as e:
+        print(f"❌ 처리 실패: {e}")
+        return {
+            "success": False,
+            "processed": 0,
+            "failed": len(new_files),
+            "error": str(e)
+        }
+    
+    for result in file_results:
+        if result.get("success"):
+            processed += 1
+            results.append({
+                "file": result["document_name"],
+                "status": "success",
+                "chunks": result.get("chunks_count", 0)
+            })
+        else:
             failed += 1
             results.append({
-                "file": file_path.name,
+                "file": result["document_name"],
                 "status": "failed",
-                "error": str(e)
+                "error": result.get("error", result.get("reason", "Unknown"))
             })
-            print(f"❌ 처리 실패: {e}")
     
     return {
         "success": True,
@@ -283,6 +298,30 @@ def get_supabase_stats() -> Dict:
     except Exception as e:
         return {"error": str(e)}
 
+def sync_local_vector_index() -> Dict:
+    """
+    로컬 벡터 인덱스 증분 동기화 (RAG_LOCAL_INDEX_DIR)
+    
+    인제스트 직후 변경 문서만 내려받아 디스크 캐시를 갱신 →
+    같은 디렉터리를 쓰는 RAG 엔진은 다음 기동·재동기화 주기에 최신 인덱스 사용
+    """
+    try:
+        sys.path.insert(0, str(Path(__file__).parent))
+        from supabase_pool import get_supabase_client
+        from hq_backend.services.local_vector_index import LocalVectorIndex
+        
+        SUPABASE_URL = os.getenv("SUPABASE_URL")
+        SUPABASE_KEY = os.getenv("SUPABASE_SERVICE_KEY")
+        
+        if not SUPABASE_URL or not SUPABASE_KEY:
+            return {"error": "환경변수 미설정"}
+        
+        index = LocalVectorIndex(get_supabase_client(SUPABASE_URL, SUPABASE_KEY))
+        return index.sync()
+        
+    except Exception as e:
+        return {"error": str(e)}
+
 # ═══════════════════════════════════════════════════════════════════
 # [6단계] 보고서 생성
 # ═══════════════════════════════════════════════════════════════════
@@ -425,8 +464,26 @@ def generate_report(
 # [7단계] 메인 실행
 # ═══════════════════════════════════════════════════════════════════
 
-def main():
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="RAG 자동화 마스터 스크립트")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.getenv("RAG_EXTRACT_WORKERS", "0")) or None,
+        help="PDF 추출 워커 프로세스 수 (기본: CPU 코어 수)"
+    )
+    parser.add_argument(
+        "--file-timeout",
+        type=float,
+        default=300.0,
+        help="파일당 PDF 추출 제한 시간 (초)"
+    )
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None):
     """메인 실행 함수"""
+    args = parse_args(argv)
     print(f"\n{'='*80}")
     print(f"🤖 RAG 자동화 마스터 스크립트 시작")
     print(f"{'='*80}")
@@ -438,11 +495,20 @@ def main():
         new_files, duplicate_files, error_files = scan_source_docs()
         
         # [2단계] RAG 인제스트
-        ingestion_result = run_rag_ingestion(new_files)
+        ingestion_result = run_rag_ingestion(
+            new_files,
+            workers=args.workers,
+            file_timeout=args.file_timeout
+        )
         
         # [3단계] Supabase 통계
         supabase_stats = get_supabase_stats()
         
+        # [3-2단계] 로컬 벡터 인덱스 증분 동기화 (RAG_LOCAL_INDEX 사용 시)
+        if os.getenv("RAG_LOCAL_INDEX", "").lower() in ("1", "true", "yes"):
+            index_result = sync_local_vector_index()
+            print(f"🧭 로컬 벡터 인덱스 동기화: {index_result}")
+        
         # [4단계] 보고서 생성
         report_file = generate_report(
             new_files,
@@ -452,7 +518,23 @@ def main():
             supabase_stats
         )
         
-        # [5단계] 결과 출력
+        # [5단계] NBA / 만기 알림 사전 계산 (실패해도 RAG 결과에는 영향 없음)
+        try:
+            from nba_precompute import precompute_all
+            nba_result = precompute_all()
+            print(f"🤖 NBA 사전 계산: {nba_result}")
+        except Exception as e:
+            print(f"⚠️ NBA 사전 계산 실패: {e}")
+        
+        # [5-2단계] 고객 보장 공백 순위 (gk_portfolio_gaps)
+        try:
+            from engines.portfolio_gap_engine import run_portfolio_analysis
+            gap_result = run_portfolio_analysis()
+            print(f"📊 보장 공백 순위: {gap_result}")
+        except Exception as e:
+            print(f"⚠️ 보장 공백 순위 계산 실패: {e}")
+        
+        # [6단계] 결과 출력
         print(f"\n{'='*80}")
         print(f"✅ RAG 자동화 완료")
         print(f"{'='*80}")
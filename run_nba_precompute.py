@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""
+[GP-NBA] 설계사별 NBA / 만기 알림 야간 사전 계산
+매일 자정 실행 - 전 설계사 고객 신호 1회 집계 → 점수화 → gk_agent_actions 저장
+
+작성일: 2026-10-17
+실행: python run_nba_precompute.py [--dirty-only]
+      (run_daily_rag_automation.py 마지막 단계에서도 자동 호출)
+"""
+
+import sys
+import json
+import argparse
+from datetime import datetime
+from typing import List, Optional
+
+from dotenv import load_dotenv
+load_dotenv()
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="NBA / 만기 알림 사전 계산")
+    parser.add_argument(
+        "--dirty-only",
+        action="store_true",
+        help="변경(change_seq)·날짜 경과된 설계사만 재계산"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    print(f"\n{'='*80}")
+    print(f"🤖 NBA 사전 계산 시작 ({datetime.now().strftime('%Y-%m-%d %H:%M:%S')})")
+    print(f"{'='*80}")
+
+    from nba_precompute import precompute_all
+    result = precompute_all(dirty_only=args.dirty_only)
+
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    print(f"{'='*80}\n")
+    return 0 if result.get("ok") else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
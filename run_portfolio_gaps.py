@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""
+[GP-PORTFOLIO] 설계사 고객 전체 보장 공백 순위 야간 계산
+매일 자정 실행 - 전 설계사 고객·담보 1회 적재 → 일괄 벡터 채점 → gk_portfolio_gaps 저장
+
+작성일: 2026-10-17
+실행: python run_portfolio_gaps.py [--agent AGENT_ID]
+      (run_daily_rag_automation.py 마지막 단계에서도 자동 호출)
+"""
+
+import sys
+import json
+import argparse
+from datetime import datetime
+from typing import List, Optional
+
+from dotenv import load_dotenv
+load_dotenv()
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="고객 보장 공백 순위 일괄 계산")
+    parser.add_argument(
+        "--agent",
+        default=None,
+        help="특정 설계사만 재계산 (생략 시 전 설계사)"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    print(f"\n{'='*80}")
+    print(f"📊 보장 공백 순위 계산 시작 ({datetime.now().strftime('%Y-%m-%d %H:%M:%S')})")
+    print(f"{'='*80}")
+
+    from engines.portfolio_gap_engine import run_portfolio_analysis
+    result = run_portfolio_analysis(agent_id=args.agent)
+
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    print(f"{'='*80}\n")
+    return 0 if result.get("ok") or result.get("error") == "no_customers" else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+벤치마크 공용 측정 도구 (scripts/benchmark_*.py)
+
+작성일: 2026-10-17
+목적: 스크립트마다 복제되던 "최선 N회" 측정 루프를 한 곳에서 관리
+
+사용:
+    from bench_utils import timed
+    best, out = timed(lambda: work(), repeat=5)
+    best, out = timed(lambda data: work(data), repeat=5, setup=lambda: copy.deepcopy(src))
+"""
+
+import time
+
+
+def timed(fn, repeat, setup=None):
+    """
+    fn 을 repeat 회 실행해 최단 시간(초)과 마지막 결과 반환
+
+    Args:
+        fn: 측정 대상 (setup 이 값을 반환하면 그 값을 인자로 받음)
+        repeat: 반복 횟수 (최소 1회)
+        setup: 매 회 측정 직전 호출 — 캐시 초기화·입력 복사 등 (측정 시간 제외)
+
+    Returns:
+        (best_seconds, out)
+    """
+    best, out = float("inf"), None
+    for _ in range(max(1, repeat)):
+        prepared = setup() if setup else None
+        args = () if prepared is None else (prepared,)
+        t0 = time.perf_counter()
+        out = fn(*args)
+        best = min(best, time.perf_counter() - t0)
+    return best, out
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""
+담보명 교정 벤치마크 — 선형 탐색(기존) vs CoverageNameIndex(오토마톤 + 2-gram 후보 + cdist)
+
+작성일: 2026-10-17
+목적: 80행 보장 분석표 단위 postprocess_coverages 지연 측정 + 기존 구현과 결과 일치 검증
+
+실행:
+    python scripts/benchmark_coverage_correction.py [담보표.json ...] [--tables-count 50] [--repeat 5]
+    담보표 JSON: [{"name": ..., "standard_name": ...}, ...] 또는 {"coverages": [...]}
+    (파일이 없으면 표준 담보명 + 사전 오타 + OCR 잡음으로 80행 표 생성)
+"""
+
+import sys
+import copy
+import json
+import time
+import random
+import argparse
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import policy_ocr_engine as poe
+from bench_utils import timed
+from rapidfuzz import fuzz, process as rfprocess
+
+_PREFIXES = ["", "", "", "(갱신형)", "무배당 ", "[기본계약] ", "특약 "]
+_OCR_NOISE = "ㅇ이앎닫달맘맛0O1l|·."
+
+
+def linear_correct(name: str, threshold: int = poe._FUZZY_THRESHOLD) -> str:
+    """기존 correct_coverage_name (사전 선형 탐색 + 표준명 전체 extractOne)"""
+    if not name:
+        return name
+    name_stripped = name.replace(" ", "")
+    if name_stripped in poe.INSURANCE_DOMAIN_DICT:
+        return poe.INSURANCE_DOMAIN_DICT[name_stripped]
+    for typo, correct in poe.INSURANCE_DOMAIN_DICT.items():
+        if typo in name_stripped:
+            return name.replace(typo, correct)
+    result = rfprocess.extractOne(name_stripped, poe.STANDARD_COVERAGE_NAMES, scorer=fuzz.ratio)
+    if result and result[1] >= threshold:
+        return result[0]
+    return name
+
+
+def linear_postprocess(coverages):
+    for c in coverages:
+        raw = c.get("name", "")
+        corrected = linear_correct(raw)
+        if corrected != raw:
+            c["raw_name"] = raw
+            c["name"] = corrected
+        std = c.get("standard_name", "")
+        if std:
+            c["standard_name"] = linear_correct(std)
+    return coverages
+
+
+def synthetic_table(rng, rows=80):
+    """증권 보장 분석표 유사 80행 — 정상 60% / 사전 오타 15% / OCR 잡음 25%"""
+    names = list(dict.fromkeys(poe.STANDARD_COVERAGE_NAMES))
+    typos = [t for t, c in poe.INSURANCE_DOMAIN_DICT.items() if t != c]
+    table = []
+    for _ in range(rows):
+        roll = rng.random()
+        if roll < 0.60:
+            name = rng.choice(names)
+        elif roll < 0.75:
+            name = rng.choice(typos)
+        else:
+            chars = list(rng.choice(names))
+            for _ in range(rng.randint(1, 2)):
+                chars[rng.randrange(len(chars))] = rng.choice(_OCR_NOISE)
+            name = "".join(chars)
+        name = rng.choice(_PREFIXES) + name
+        table.append({
+            "name": name,
+            "standard_name": rng.choice(names) if rng.random() < 0.5 else "",
+            "amount": f"{rng.choice([1000, 2000, 3000, 5000])}만원",
+        })
+    return table
+
+
+def load_tables(paths):
+    tables = []
+    for p in paths:
+        data = json.loads(Path(p).read_text(encoding="utf-8"))
+        rows = data.get("coverages", []) if isinstance(data, dict) else data
+        if rows:
+            tables.append(rows)
+    return tables
+
+
+def run_tables(fn):
+    """표 목록 전체에 fn 적용 (postprocess_coverages 는 표를 제자리 교정) → 교정된 표 목록"""
+    def _run(work):
+        for table in work:
+            fn(table)
+        return work
+    return _run
+
+
+def main():
+    parser = argparse.ArgumentParser(description="담보명 교정 선형 vs 인덱스 벤치마크")
+    parser.add_argument("tables", nargs="*", help="담보표 JSON 경로 (없으면 80행 합성 표)")
+    parser.add_argument("--tables-count", type=int, default=50, dest="count")
+    parser.add_argument("--rows", type=int, default=80)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--vocab", type=int, default=5000, help="대형 표준명 목록 시나리오 크기")
+    args = parser.parse_args()
+
+    tables = load_tables(args.tables)
+    if not tables:
+        rng = random.Random(42)
+        tables = [synthetic_table(rng, args.rows) for _ in range(args.count)]
+    n_rows = sum(len(t) for t in tables)
+
+    print("=" * 72)
+    print(f"담보표 {len(tables)}개 / 총 {n_rows}행 | 사전 {len(poe.INSURANCE_DOMAIN_DICT)}개 · "
+          f"표준명 {len(poe.STANDARD_COVERAGE_NAMES)}개 | 최선 {args.repeat}회")
+    print("=" * 72)
+
+    def fresh():
+        return copy.deepcopy(tables)   # 제자리 교정 → 매 회 원본 복사 (측정 제외)
+
+    t_linear, ref = timed(run_tables(linear_postprocess), args.repeat, setup=fresh)
+
+    def cold(table):
+        poe._coverage_index = None   # 메모·인덱스 초기화 (컴파일 비용 포함)
+        return poe.postprocess_coverages(table)
+
+    def no_memo(table):
+        poe.get_coverage_index()._cache.clear()   # 인덱스 재사용, 메모만 초기화
+        return poe.postprocess_coverages(table)
+
+    t_cold, out = timed(run_tables(cold), args.repeat, setup=fresh)
+    t_nomemo, _ = timed(run_tables(no_memo), args.repeat, setup=fresh)
+    poe._coverage_index = None
+    poe.get_coverage_index()
+    t_warm, out_warm = timed(run_tables(poe.postprocess_coverages), args.repeat, setup=fresh)
+
+    t0 = time.perf_counter()
+    index = poe.CoverageNameIndex(poe.INSURANCE_DOMAIN_DICT, poe.STANDARD_COVERAGE_NAMES)
+    t_compile = time.perf_counter() - t0
+
+    mismatch = sum(a != b for ta, tb in zip(ref, out) for a, b in zip(ta, tb))
+    mismatch += sum(a != b for ta, tb in zip(ref, out_warm) for a, b in zip(ta, tb))
+    per_table = lambda t: t / len(tables) * 1000
+
+    print(f"  선형 탐색 (기존)              {per_table(t_linear):8.3f} ms/표")
+    print(f"  인덱스 + cdist (표마다 재컴파일) {per_table(t_cold):8.3f} ms/표")
+    print(f"  인덱스 + cdist (메모 없음)     {per_table(t_nomemo):8.3f} ms/표"
+          f"  (x{t_linear / max(t_nomemo, 1e-9):.1f})")
+    print(f"  인덱스 + cdist (공유·메모)     {per_table(t_warm):8.3f} ms/표"
+          f"  (x{t_linear / max(t_warm, 1e-9):.1f})")
+    print(f"  인덱스 컴파일 1회            {t_compile * 1000:8.3f} ms | 2-gram 축소 "
+          f"{'사용' if index._blocking else f'생략 (표준명 < {index.BLOCKING_MIN_NAMES})'}")
+    print(f"  결과 불일치                 {mismatch}행")
+
+    benchmark_large_vocab(tables, args.vocab)
+
+
+def benchmark_large_vocab(tables, vocab_size):
+    """표준명 목록이 커질 때(상품별 담보명 등) 2-gram 후보 축소 효과"""
+    base = list(dict.fromkeys(poe.STANDARD_COVERAGE_NAMES))
+    rng = random.Random(7)
+    syllables = "가나다라마바사아자차카타파하신무배당플러스케어종합건강든든"
+    vocab = list(base)
+    while len(vocab) < vocab_size:
+        tag = "".join(rng.choice(syllables) for _ in range(rng.randint(2, 4)))
+        vocab.append(f"{tag}{rng.choice(base)}")
+    vocab = list(dict.fromkeys(vocab))
+    queries = [
+        c[key].replace(" ", "") for t in tables for c in t for key in ("name", "standard_name") if c.get(key)
+    ]
+    queries = list(dict.fromkeys(queries))
+
+    print("=" * 72)
+    print(f"[2] 대형 표준명 목록 {len(vocab)}개 — 고유 담보명 {len(queries)}개 퍼지 채점")
+    print("=" * 72)
+    t0 = time.perf_counter()
+    ref = []
+    for q in queries:
+        r = rfprocess.extractOne(q, vocab, scorer=fuzz.ratio)
+        ref.append(r[0] if r and r[1] >= poe._FUZZY_THRESHOLD else None)
+    t_linear = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    index = poe.CoverageNameIndex({}, vocab)
+    t_compile = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    got = index._fuzzy_batch(queries, poe._FUZZY_THRESHOLD)
+    t_index = time.perf_counter() - t0
+    shortlist = sum(len(index.candidates(q, poe._FUZZY_THRESHOLD)) for q in queries) / max(len(queries), 1)
+
+    print(f"  extractOne 전체 채점         {t_linear * 1000:8.1f} ms")
+    print(f"  2-gram 축소 + cdist          {t_index * 1000:8.1f} ms  (x{t_linear / max(t_index, 1e-9):.1f})"
+          f" | 컴파일 {t_compile * 1000:.1f} ms | 평균 후보 {shortlist:.0f}개")
+    print(f"  결과 불일치                 {sum(a != b for a, b in zip(ref, got))}건")
+
+
+if __name__ == "__main__":
+    main()
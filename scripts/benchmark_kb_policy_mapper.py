@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+KB 담보 매핑 벤치마크 — 키마다 re.sub 순차 탐색(기존) vs CoverageMappingIndex(해시맵 + 오토마톤 + 단일 정규식)
+
+작성일: 2026-10-17
+목적: 10,000행 담보 코퍼스 기준 _MAPPING_INDEX.lookup / map_coverage 지연 측정 + 기존 구현과 결과 일치 검증
+      (map_coverages_bulk 는 통합 분류 리졸버의 영구 캐시를 거치므로 매핑 엔진 측정에서 제외)
+
+실행:
+    python scripts/benchmark_kb_policy_mapper.py [담보명.txt ...] [--rows 10000] [--repeat 5]
+    담보명 파일: 한 줄에 특약명 1개 (파일이 없으면 사전 키 변형 + 정규식 대상 + 미매핑 명칭으로 합성)
+"""
+
+import re
+import sys
+import time
+import random
+import argparse
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from engines import kb_policy_mapper as kpm
+from bench_utils import timed
+
+_PREFIXES = ["", "", "", "(무)", "무배당 ", "[기본계약] ", "(갱신형) ", "KB "]
+_SUFFIXES = ["", "", "", "(갱신형)", " 특약", "(20년갱신)", "_II", "[최초1회한]"]
+_REGEX_NAMES = [
+    "표적항암약물허가치료비", "갑상선암 진단", "뇌경색증진단", "지주막하출혈 진단",
+    "관상동맥우회술", "교통사고 벌금(대인)", "3종 수술", "질병 입원 일당(1일이상)",
+    "가족일상생활 배상 책임", "상해사망 보험금", "장기 요양 진단", "제자리암 진단비",
+]
+_UNMAPPED = ["보험료 납입지원", "특정감염병진단", "독감치료비", "대상포진진단", "통풍진단비", "ABC특약"]
+
+
+def legacy_map_coverage(name: str):
+    """기존 map_coverage (사전 키마다 re.sub + 패턴 미컴파일 순차 탐색)"""
+    key = name.strip()
+    if key in kpm._EXACT_DICT:
+        return kpm._EXACT_DICT[key]
+    clean = re.sub(r"[\s\-_\(\)（）\[\]「」]", "", name)
+    for raw_key, val in kpm._EXACT_DICT.items():
+        if re.sub(r"[\s\-_\(\)（）\[\]「」]", "", raw_key) == clean:
+            return val
+    for raw_key, val in kpm._EXACT_DICT.items():
+        stripped = re.sub(r"[\s\-_\(\)（）\[\]「」]", "", raw_key)
+        if stripped in clean or clean in stripped:
+            return val
+    for pattern, cat, weight, display in kpm.KB_REGEX_PATTERNS:
+        if re.search(pattern, name, re.IGNORECASE):
+            return (cat, weight, display)
+    return (kpm.CAT_OTHER, 0.30, name)
+
+
+def synthetic_corpus(rng, rows=10000):
+    """증권 보장 분석 행 유사 — 사전 키 변형 55% / 정규식 대상 20% / 부분 명칭 10% / 미매핑 15%"""
+    keys = list(kpm._EXACT_DICT)
+    corpus = []
+    for _ in range(rows):
+        roll = rng.random()
+        if roll < 0.55:
+            name = rng.choice(_PREFIXES) + rng.choice(keys) + rng.choice(_SUFFIXES)
+        elif roll < 0.75:
+            name = rng.choice(_REGEX_NAMES) + rng.choice(_SUFFIXES)
+        elif roll < 0.85:
+            key = rng.choice(keys)
+            name = key[: max(2, len(key) - rng.randint(1, 3))]
+        else:
+            name = rng.choice(_PREFIXES) + rng.choice(_UNMAPPED) + f" {rng.randint(1, 500)}형"
+        corpus.append({"name": name, "amount": rng.choice([1000, 2000, 3000, 5000])})
+    return corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description="KB 담보 매핑 순차 탐색 vs 컴파일 인덱스 벤치마크")
+    parser.add_argument("files", nargs="*", help="담보명 목록 파일 (없으면 합성 코퍼스)")
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    corpus = [
+        {"name": line.strip(), "amount": 0}
+        for p in args.files for line in Path(p).read_text(encoding="utf-8").splitlines() if line.strip()
+    ]
+    if not corpus:
+        corpus = synthetic_corpus(random.Random(42), args.rows)
+    unique = len({c["name"] for c in corpus})
+
+    print("=" * 72)
+    print(f"담보 {len(corpus)}행 (고유 {unique}개) | 사전 {len(kpm._EXACT_DICT)}개 · "
+          f"패턴 {len(kpm.KB_REGEX_PATTERNS)}개 | 오토마톤 "
+          f"{'사용' if kpm.AUTOMATON_AVAILABLE else '미사용 (선형 포함 검색)'} | 최선 {args.repeat}회")
+    print("=" * 72)
+
+    names = [c["name"] for c in corpus]
+    t_legacy, ref = timed(lambda: [legacy_map_coverage(n) for n in names], args.repeat // 2)
+    t_index, out_index = timed(lambda: [kpm._MAPPING_INDEX.lookup(n) for n in names], args.repeat)
+    t_cold, out_cold = timed(lambda: [kpm.map_coverage(n) for n in names], args.repeat,
+                             setup=kpm.map_coverage.cache_clear)
+    t_warm, out_warm = timed(lambda: [kpm.map_coverage(n) for n in names], args.repeat)
+
+    t0 = time.perf_counter()
+    kpm.CoverageMappingIndex(kpm._EXACT_DICT, kpm.KB_REGEX_PATTERNS)
+    t_compile = time.perf_counter() - t0
+
+    mismatch = sum(
+        ref[i] != out_index[i] or ref[i] != out_cold[i] or ref[i] != out_warm[i] for i in range(len(ref))
+    )
+    info = kpm.map_coverage.cache_info()
+    print(f"  순차 탐색 (기존)            {t_legacy * 1000:9.1f} ms")
+    print(f"  _MAPPING_INDEX.lookup       {t_index * 1000:9.1f} ms  (x{t_legacy / max(t_index, 1e-9):.0f})")
+    print(f"  map_coverage (메모 비움)     {t_cold * 1000:9.1f} ms  (x{t_legacy / max(t_cold, 1e-9):.0f})")
+    print(f"  map_coverage + LRU 메모      {t_warm * 1000:9.1f} ms  (x{t_legacy / max(t_warm, 1e-9):.0f})")
+    print(f"  인덱스 컴파일 1회            {t_compile * 1000:9.2f} ms | 메모 {info.currsize}/{info.maxsize}")
+    print(f"  결과 불일치                 {mismatch}행")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+"""
+Mesh-grid De-warp 벤치마크 — remap(벡터화) vs TPS(제어점 전체)
+
+작성일: 2026-10-17
+목적: GeometricCorrectionEngine.mesh_grid_dewarp 의 실해상도 이미지당 지연 측정 +
+      TPS 경로 대비 정확도(변위장·픽셀 오차) 비교
+
+실행:
+    python scripts/benchmark_mesh_dewarp.py [스캔 이미지 ...] [--grid 20] [--accuracy-side 640]
+    (이미지가 없으면 12MP(4000×3000) 합성 증권 스캔 3장 생성)
+
+정확도 비교는 TPS 가 현실적인 시간 안에 끝나는 축소본(--accuracy-side)에서 수행.
+cv2.createThinPlateSplineShapeTransformer(opencv-contrib)가 없으면 동일 제어점·동일
+커널(r² log r²)의 NumPy TPS 를 기준으로 사용.
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from modules.geometric_correction_engine import GeometricCorrectionEngine
+
+
+def synthetic_scan(width=4000, height=3000, seed=0):
+    """증권 스캔 유사 합성 이미지 (텍스트 행 + 표 괘선 + 종이 질감)"""
+    rng = np.random.default_rng(seed)
+    img = np.full((height, width, 3), 245, dtype=np.uint8)
+    img = cv2.add(img, rng.integers(0, 8, img.shape, dtype=np.uint8))
+    scale = width / 1000
+    for y in range(int(80 * scale), height - int(40 * scale), int(28 * scale)):
+        x = int(60 * scale)
+        while x < width - int(200 * scale):
+            word = "".join(rng.choice(list("ABCDEFGH0123456789"), int(rng.integers(3, 9))))
+            cv2.putText(img, word, (x, y), cv2.FONT_HERSHEY_SIMPLEX, 0.6 * scale, (20, 20, 20),
+                        max(1, int(1.5 * scale)), cv2.LINE_AA)
+            x += int((len(word) * 14 + 20) * scale)
+    for x in range(int(40 * scale), width, int(240 * scale)):
+        cv2.line(img, (x, 0), (x, height - 1), (120, 120, 120), max(1, int(scale)))
+    return img
+
+
+def tps_reference_map(shape, grid_size, dy):
+    """
+    TPS 역매핑 기준 변위장 (출력 픽셀별 map_y - y) — cv2 TPS 와 동일 제어점:
+    목적지 노드(src + dy) → 소스 노드, 커널 U(r) = r² log r²
+    """
+    h, w = shape[:2]
+    rows, cols = dy.shape[0] - 1, dy.shape[1] - 1
+    gy, gx = np.mgrid[0:rows + 1, 0:cols + 1]
+    pts = np.stack([gx * grid_size, gy * grid_size + dy], axis=-1).reshape(-1, 2).astype(np.float64)
+    vals = -dy.reshape(-1).astype(np.float64)
+
+    def kernel(d2):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(d2 > 0, d2 * np.log(d2), 0.0)
+
+    n = len(pts)
+    d2 = ((pts[:, None, :] - pts[None, :, :]) ** 2).sum(-1)
+    P = np.hstack([np.ones((n, 1)), pts])
+    A = np.zeros((n + 3, n + 3))
+    A[:n, :n] = kernel(d2)
+    A[:n, n:] = P
+    A[n:, :n] = P.T
+    coef = np.linalg.solve(A, np.concatenate([vals, np.zeros(3)]))
+    wts, aff = coef[:n], coef[n:]
+
+    yy, xx = np.mgrid[0:h, 0:w]
+    q = np.stack([xx.ravel(), yy.ravel()], axis=-1).astype(np.float64)
+    out = np.empty(len(q))
+    for s in range(0, len(q), 20000):
+        qb = q[s:s + 20000]
+        kb = kernel(((qb[:, None, :] - pts[None, :, :]) ** 2).sum(-1))
+        out[s:s + 20000] = kb @ wts + aff[0] + qb @ aff[1:]
+    return out.reshape(h, w).astype(np.float32)
+
+
+def remap_map(engine, shape, grid_size):
+    """remap 경로가 사용하는 변위장 (map_y - y)"""
+    h, w = shape[:2]
+    dy = engine._mesh_displacement(h // grid_size, w // grid_size)
+    field = (
+        engine._interp_matrix(h, dy.shape[0], grid_size)
+        @ dy
+        @ engine._interp_matrix(w, dy.shape[1], grid_size).T
+    )
+    return -field, dy
+
+
+def benchmark_latency(engine, images, grid_size, repeat):
+    print("=" * 72)
+    print(f"[1] 실해상도 지연 (grid={grid_size}px, {repeat}회 중앙값)")
+    print("=" * 72)
+    for name, img in images:
+        h, w = img.shape[:2]
+        n_ctrl = (h // grid_size + 1) * (w // grid_size + 1)
+        engine.mesh_grid_dewarp(img, grid_size)  # 워밍업
+        times = []
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            engine.mesh_grid_dewarp(img, grid_size)
+            times.append(time.perf_counter() - t0)
+        print(f"  {name:<24} {w}x{h} ({w * h / 1e6:.1f}MP) | remap {np.median(times) * 1000:8.1f} ms"
+              f" | TPS 제어점 {n_ctrl:,}개 (O(n³) ≈ {n_ctrl ** 3 / 1e12:,.0f}×10¹² 연산)")
+
+
+def benchmark_accuracy(engine, images, grid_size, side):
+    print("=" * 72)
+    print(f"[2] TPS 대비 정확도 (장변 {side}px 축소본)")
+    print("=" * 72)
+    has_cv_tps = hasattr(cv2, "createThinPlateSplineShapeTransformer")
+    print(f"  기준: {'cv2 TPS (opencv-contrib)' if has_cv_tps else 'NumPy TPS (opencv-contrib 미설치)'}")
+    for name, img in images:
+        h, w = img.shape[:2]
+        f = side / max(h, w)
+        small = cv2.resize(img, (int(w * f), int(h * f)), interpolation=cv2.INTER_AREA)
+        sh, sw = small.shape[:2]
+
+        t0 = time.perf_counter()
+        remapped = engine.mesh_grid_dewarp(small, grid_size)
+        t_remap = time.perf_counter() - t0
+
+        disp_remap, dy = remap_map(engine, small.shape, grid_size)
+        t0 = time.perf_counter()
+        if has_cv_tps:
+            reference = engine.mesh_grid_dewarp(small, grid_size, method="tps")
+            disp_err = None
+        else:
+            disp_tps = tps_reference_map(small.shape, grid_size, dy)
+            map_x = np.broadcast_to(np.arange(sw, dtype=np.float32)[None, :], (sh, sw)).copy()
+            map_y = np.arange(sh, dtype=np.float32)[:, None] + disp_tps
+            reference = cv2.remap(small, map_x, map_y, cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+            disp_err = np.abs(disp_tps - disp_remap)
+        t_tps = time.perf_counter() - t0
+
+        margin = grid_size  # 가장자리는 경계 처리 방식 차이만 반영되므로 제외
+        diff = np.abs(reference.astype(np.int16) - remapped.astype(np.int16))[margin:-margin, margin:-margin]
+        mse = float((diff.astype(np.float64) ** 2).mean())
+        psnr = 10 * np.log10(255 ** 2 / mse) if mse > 0 else float("inf")
+        line = (f"  {name:<24} {sw}x{sh} | remap {t_remap * 1000:7.1f} ms vs TPS {t_tps * 1000:9.1f} ms"
+                f" | 픽셀 MAE {diff.mean():.2f} PSNR {psnr:.1f} dB")
+        if disp_err is not None:
+            line += f" | 변위 오차 평균 {disp_err.mean():.3f}px 최대 {disp_err.max():.3f}px"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="mesh_grid_dewarp remap vs TPS 벤치마크")
+    parser.add_argument("images", nargs="*", help="스캔 이미지 경로 (없으면 12MP 합성 이미지)")
+    parser.add_argument("--grid", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--accuracy-side", type=int, default=640)
+    args = parser.parse_args()
+
+    images = []
+    for p in args.images:
+        img = cv2.imread(p, cv2.IMREAD_COLOR)
+        if img is None:
+            print(f"⚠️ 읽기 실패: {p}")
+            continue
+        images.append((Path(p).name, img))
+    if not images:
+        images = [(f"synthetic_12mp_{i}", synthetic_scan(seed=i)) for i in range(3)]
+
+    engine = GeometricCorrectionEngine()
+    benchmark_latency(engine, images, args.grid, args.repeat)
+    benchmark_accuracy(engine, images, args.grid, args.accuracy_side)
+
+
+if __name__ == "__main__":
+    main()
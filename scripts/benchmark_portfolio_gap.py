@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""
+설계사 포트폴리오 갭 분석 벤치마크 — 고객별 AnalysisHub.run() 반복(기존) vs score_portfolio 일괄 벡터 연산
+
+작성일: 2026-10-17
+목적: 설계사 1명 고객 2,000명 기준 KB 스코어·트리니티 골든타임·통합 Gap 산출 지연 측정 +
+      고객별 AnalysisHub 결과와 일치 검증
+
+실행:
+    python scripts/benchmark_portfolio_gap.py [--customers 2000] [--coverages 15] [--repeat 3]
+"""
+
+import sys
+import random
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from engines import kb_policy_mapper as kpm
+from engines.analysis_hub import AnalysisHub
+from engines.portfolio_gap_engine import score_portfolio
+from bench_utils import timed
+
+_EXTRA_NAMES = ["표적항암약물허가치료비", "갑상선암 진단", "뇌경색증진단", "질병 입원 일당", "상해사망 보험금",
+                "독감치료비", "대상포진진단", "(무)일반암진단비(갱신형)", "5종 수술비"]
+_AMOUNTS = [1000, 2000, 3000, 5000, 10_000_000, 20_000_000, 30_000_000, 50_000_000, "3,000만", "1억", 30]
+
+
+def synthetic_book(rng, customers=2000, coverages=15):
+    names = list(kpm._EXACT_DICT) + _EXTRA_NAMES
+    people, rows = [], []
+    for i in range(customers):
+        pid = f"p{i:05d}"
+        people.append({
+            "agent_id":        "agent_bench",
+            "person_id":       pid,
+            "name":            f"고객{i:05d}",
+            "age":             rng.choice([0, 28, 35, 42, 47, 53, 61, 70]),
+            "gender":          rng.choice(["남", "여", None]),
+            "nhis_premium":    rng.choice([0, 0, 80_000, 150_000, 250_000, 400_000, 4_500_000]),
+            "employment_type": rng.choice(["직장", "직장", "지역"]),
+            "ltc_included":    rng.random() < 0.3,
+        })
+        for _ in range(rng.randint(0, coverages * 2)):
+            rows.append({"person_id": pid, "name": rng.choice(names), "amount": rng.choice(_AMOUNTS)})
+    return pd.DataFrame(people), pd.DataFrame(rows, columns=["person_id", "name", "amount"])
+
+
+def hub_loop(customers, coverages):
+    by_person = {pid: grp[["name", "amount"]].to_dict("records") for pid, grp in coverages.groupby("person_id")}
+    results = {}
+    for c in customers.to_dict("records"):
+        report = AnalysisHub(
+            coverages       = [dict(r) for r in by_person.get(c["person_id"], [])],
+            nhis_premium    = c["nhis_premium"],
+            age             = c["age"],
+            gender          = c["gender"] or "남",
+            employment_type = c["employment_type"],
+            ltc_included    = c["ltc_included"],
+            customer_name   = c["name"],
+        ).run()
+        results[c["person_id"]] = report
+    return results
+
+
+def compare(batch, reports):
+    numeric = {
+        "kb_pct":           lambda r: r.kb.overall_pct,
+        "golden_time_fund": lambda r: r.gap.golden_time_fund,
+        "kb_cancer_score":  lambda r: r.gap.kb_cancer_score,
+        "kb_total_score":   lambda r: r.gap.kb_total_score,
+        "income_gap":       lambda r: r.gap.income_gap,
+        "total_gap":        lambda r: r.gap.total_gap,
+        "coverage_ratio":   lambda r: r.gap.coverage_ratio,
+    }
+    exact = {
+        "kb_grade":   lambda r: r.kb.grade,
+        "risk_level": lambda r: r.gap.risk_level,
+        "alert_mode": lambda r: r.gap.alert_mode,
+    }
+    rows = batch.set_index("person_id")
+    mismatch, max_diff = 0, 0.0
+    for pid, report in reports.items():
+        row = rows.loc[pid]
+        diffs = [abs(float(row[col]) - float(get(report))) for col, get in numeric.items()]
+        max_diff = max(max_diff, *diffs)
+        bad = any(d > 0.1 + 1e-9 for d in diffs) or any(row[col] != get(report) for col, get in exact.items())
+        mismatch += bad
+    return mismatch, max_diff
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AnalysisHub 고객별 반복 vs 포트폴리오 일괄 벡터 연산 벤치마크")
+    parser.add_argument("--customers", type=int, default=2000)
+    parser.add_argument("--coverages", type=int, default=15, help="고객당 평균 담보 수")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    customers, coverages = synthetic_book(random.Random(42), args.customers, args.coverages)
+    print("=" * 72)
+    print(f"고객 {len(customers)}명 · 담보 {len(coverages)}행 | 최선 {args.repeat}회")
+    print("=" * 72)
+
+    best_loop, reports = timed(lambda: hub_loop(customers, coverages), args.repeat // 2)
+    best_batch, batch = timed(lambda: score_portfolio(customers, coverages), args.repeat)
+
+    mismatch, max_diff = compare(batch, reports)
+    print(f"  AnalysisHub 고객별 반복 (기존)  {best_loop * 1000:9.1f} ms")
+    print(f"  score_portfolio 일괄 벡터      {best_batch * 1000:9.1f} ms  (x{best_loop / max(best_batch, 1e-9):.0f})")
+    print(f"  결과 불일치                   {mismatch}명 (수치 최대 차이 {max_diff:.3f}만원, 허용 0.1)")
+    print("-" * 72)
+    top = batch[batch["has_income"]].head(5)
+    for r in top.itertuples():
+        print(f"  #{r.gap_rank:<4} {r.name}  암 공백 {r.income_gap:>10,.1f}만원 · 커버율 {r.coverage_ratio:5.1f}%"
+              f" · {r.risk_level} · KB {r.kb_grade}")
+    assert np.all(np.diff(batch["gap_rank"].to_numpy()) == 1)
+
+
+if __name__ == "__main__":
+    main()
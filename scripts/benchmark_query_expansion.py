@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+Query Expansion 용어 추출 마이크로 벤치마크
+glossary 크기별 질의당 추출 시간 비교 (기존 선형 스캔 vs Aho–Corasick 오토마톤)
+
+작성일: 2026-10-17
+목적: 질의당 비용이 glossary 크기와 무관함을 확인
+
+실행:
+    python scripts/benchmark_query_expansion.py [질의 파일(한 줄 1질의)] [--sizes 3,300,3000]
+    (질의 파일이 없으면 상담 질의 템플릿으로 3,000건 생성)
+"""
+
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from hq_backend.services.query_expansion_engine import QueryExpansionEngine
+
+
+QUERY_TEMPLATES = [
+    "{a} 추가하면 얼마나 더 내야 해?",
+    "{a}이랑 {b} 차이가 뭐야?",
+    "나중에 보험료 올라? {a} 기준으로 알려줘",
+    "암 걸리면 {a}에서 얼마 받아?",
+    "중간에 해지하면 {a} 돌려받을 수 있어?",
+    "{a} 가입했는데 {b}도 필요할까요",
+    "고객이 {a} 관련해서 물어보는데 어떻게 설명하면 돼?",
+    "회사 그만두면 {a}는 어떻게 돼?"
+]
+
+
+def load_queries(path=None, count=3000):
+    if path:
+        with open(path, "r", encoding="utf-8") as f:
+            return [line.strip() for line in f if line.strip()]
+
+    base_terms = [entry["term"] for entry in QueryExpansionEngine().glossary] or ["특약"]
+    base_terms += ["주계약", "해지환급금", "입원비", "수술비", "퇴직연금", "세액공제", "CI보험", "실손"]
+    rng = random.Random(42)
+    return [
+        rng.choice(QUERY_TEMPLATES).format(a=rng.choice(base_terms), b=rng.choice(base_terms))
+        for _ in range(count)
+    ]
+
+
+def synthetic_glossary(size):
+    """실제 glossary + 합성 용어로 지정 크기의 용어 사전 생성"""
+    entries = list(QueryExpansionEngine().glossary)
+    syllables = "가나다라마바사아자차카타파하보험약관특갱신환급금진단입원수술"
+    rng = random.Random(size)
+    while len(entries) < size:
+        term = "".join(rng.choice(syllables) for _ in range(rng.randint(3, 6)))
+        entries.append({"term": term, "definition": term, "synonyms": [term + "형", term + " 특약"]})
+    return entries[:size]
+
+
+def naive_match(engine, query):
+    """기존 구현 (term_index / COLLOQUIAL_MAPPING 선형 스캔)"""
+    query_lower = query.lower()
+    matched = [term for term in engine.term_index if term in query_lower]
+    expanded = []
+    for colloquial, terms in engine.COLLOQUIAL_MAPPING.items():
+        if colloquial in query:
+            expanded.extend(terms)
+    return matched, expanded
+
+
+def time_per_query(fn, queries, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for query in queries:
+            fn(query)
+        best = min(best, time.perf_counter() - started)
+    return best / len(queries) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query Expansion 용어 추출 벤치마크")
+    parser.add_argument("queries", nargs="?", help="질의 파일 (한 줄 1질의)")
+    parser.add_argument("--sizes", default="3,300,3000", help="glossary 용어 수 목록")
+    args = parser.parse_args()
+
+    queries = load_queries(args.queries)
+    sizes = [int(s) for s in args.sizes.split(",")]
+
+    print("=" * 70)
+    print(f"⏱️  용어 추출 벤치마크 (질의 {len(queries)}건, 질의당 µs)")
+    print("=" * 70)
+    print(f"{'용어 수':>8} {'패턴 수':>8} {'선형 스캔':>12} {'오토마톤':>12} {'배속':>8}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            glossary_path = Path(tmp) / f"glossary_{size}.json"
+            glossary_path.write_text(json.dumps(synthetic_glossary(size), ensure_ascii=False), encoding="utf-8")
+            engine = QueryExpansionEngine(str(glossary_path), str(Path(tmp) / f"automaton_{size}.json"))
+
+            naive_us = time_per_query(lambda q: naive_match(engine, q), queries)
+            automaton_us = time_per_query(engine.match_query, queries)
+            patterns = len(engine.term_automaton.patterns)
+            print(f"{size:>8} {patterns:>8} {naive_us:>12.1f} {automaton_us:>12.1f} {naive_us / automaton_us:>7.1f}x")
+
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""
+결정론적 테이블 파서 벤치마크 — 윤곽선(RETR_TREE) + 30px 행 그룹핑(기존) vs 격자 재구성
+
+작성일: 2026-10-17
+목적: 보장 분석표(30행×8열) 파싱 지연 측정 + 격자 복원 정확도(행/열/병합 셀) 검증
+
+실행:
+    python scripts/benchmark_table_parser.py [표 이미지 ...] [--rows 30] [--cols 8] [--repeat 5]
+    (이미지가 없으면 괘선형·병합 셀·가로 괘선 전용 합성 보장 분석표 생성)
+
+pytesseract 가 설치되어 있으면 셀별 OCR(기존) vs 표당 1회 모자이크 OCR 시간도 비교.
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from modules import deterministic_table_parser as dtp
+from modules.deterministic_table_parser import DeterministicTableParser
+from bench_utils import timed
+
+
+def synthetic_table(rows=30, cols=8, cell_w=150, cell_h=36, merged=False, ruled_cols=True, seed=0):
+    """
+    보장 분석표 유사 합성 이미지 + 기대 격자
+    merged: 1열 담보 구분 칸을 3행씩 세로 병합, 헤더 마지막 두 칸 가로 병합
+    ruled_cols: False 면 바깥 테두리 + 가로 괘선만 (열은 공백 간격으로 구분)
+    """
+    rng = np.random.default_rng(seed)
+    margin = 20
+    h, w = rows * cell_h + 2 * margin, cols * cell_w + 2 * margin
+    img = np.full((h, w, 3), 250, dtype=np.uint8)
+    ys = margin + np.arange(rows + 1) * cell_h
+    xs = margin + np.arange(cols + 1) * cell_w
+    color, thick = (40, 40, 40), 2
+
+    for r, y in enumerate(ys):
+        if merged and 0 < r < rows and (r - 1) % 3 != 0:
+            cv2.line(img, (xs[1], y), (xs[-1], y), color, thick)   # 1열 병합 구간은 끊김
+        else:
+            cv2.line(img, (xs[0], y), (xs[-1], y), color, thick)
+    for c, x in enumerate(xs):
+        if not ruled_cols and 0 < c < cols:
+            continue
+        if merged and c == cols - 1:
+            cv2.line(img, (x, ys[1]), (x, ys[-1]), color, thick)  # 헤더 마지막 두 칸 병합
+        else:
+            cv2.line(img, (x, ys[0]), (x, ys[-1]), color, thick)
+
+    for r in range(rows):
+        for c in range(cols):
+            if merged and c == 0 and r > 0 and (r - 1) % 3 != 0:
+                continue
+            if merged and r == 0 and c == cols - 1:
+                continue
+            word = "".join(rng.choice(list("ABCDEFGH0123456789"), int(rng.integers(3, 8))))
+            cv2.putText(img, word, (xs[c] + 10, ys[r] + cell_h - 11), cv2.FONT_HERSHEY_SIMPLEX,
+                        0.6, (20, 20, 20), 1, cv2.LINE_AA)
+
+    expected = rows * cols
+    if merged:
+        expected -= 1                                                # 헤더 가로 병합
+        expected -= sum((r - 1) % 3 != 0 for r in range(1, rows))   # 1열 끊긴 가로 괘선
+    return img, expected
+
+
+# ── 기존 구현 (윤곽선 + 30px 그룹핑 + 셀별 OCR) ────────────────────────────────
+
+def legacy_detect_cells(table_image, min_w=50, min_h=20):
+    gray = cv2.cvtColor(table_image, cv2.COLOR_BGR2GRAY) if table_image.ndim == 3 else table_image.copy()
+    _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+    contours, _ = cv2.findContours(binary, cv2.RETR_TREE, cv2.CHAIN_APPROX_SIMPLE)
+    cells = []
+    for contour in contours:
+        x, y, w, h = cv2.boundingRect(contour)
+        if w > min_w and h > min_h:
+            cells.append({"x": x, "y": y, "width": w, "height": h,
+                          "center_x": x + w // 2, "center_y": y + h // 2})
+    rows, current, prev_y = [], [], -1000
+    for cell in sorted(cells, key=lambda c: c["center_y"]):
+        if abs(cell["center_y"] - prev_y) < 30:
+            current.append(cell)
+        else:
+            if current:
+                rows.append(current)
+            current = [cell]
+        prev_y = cell["center_y"]
+    if current:
+        rows.append(current)
+    for r, row in enumerate(rows):
+        for c, cell in enumerate(sorted(row, key=lambda c: c["center_x"])):
+            cell["row"], cell["col"] = r, c
+    return cells
+
+
+def legacy_ocr(table_image, cells):
+    import pytesseract
+    gray = cv2.cvtColor(table_image, cv2.COLOR_BGR2GRAY) if table_image.ndim == 3 else table_image
+    return [
+        pytesseract.image_to_string(
+            gray[c["y"]:c["y"] + c["height"], c["x"]:c["x"] + c["width"]], lang="kor+eng", config="--psm 6"
+        ).strip()
+        for c in cells
+    ]
+
+
+def grid_shape(cells):
+    if cells.size == 0:
+        return 0, 0
+    return int((cells["row"] + cells["row_span"]).max()), int((cells["col"] + cells["col_span"]).max())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DeterministicTableParser 셀 감지 벤치마크")
+    parser.add_argument("images", nargs="*", help="표 이미지 경로 (없으면 합성 보장 분석표)")
+    parser.add_argument("--rows", type=int, default=30)
+    parser.add_argument("--cols", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    samples = []
+    for p in args.images:
+        img = cv2.imread(p, cv2.IMREAD_COLOR)
+        if img is None:
+            print(f"⚠️ 읽기 실패: {p}")
+            continue
+        samples.append((Path(p).name, img, None))
+    if not samples:
+        for name, kwargs in (("ruled", {}), ("merged", {"merged": True}), ("h_rules_only", {"ruled_cols": False})):
+            img, expected = synthetic_table(args.rows, args.cols, **kwargs)
+            samples.append((f"{args.rows}x{args.cols}_{name}", img, expected))
+
+    engine = DeterministicTableParser()
+    print("=" * 78)
+    print(f"[1] 셀 감지 + 행/열 할당 ({args.repeat}회 중 최선)")
+    print("=" * 78)
+    for name, img, expected in samples:
+        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        t_old, old_cells = timed(lambda: legacy_detect_cells(img), args.repeat)
+        t_new, (cells, _) = timed(lambda: engine._detect_cells(gray), args.repeat)
+        t_full, result = timed(lambda: engine.parse_insurance_table(img), args.repeat)
+        old_rows = 1 + max((c["row"] for c in old_cells), default=-1)
+        n_rows, n_cols = grid_shape(cells)
+        ok = "" if expected is None else (" ✅" if cells.size == expected else f" ❌ 기대 {expected}")
+        print(f"  {name:<18} 기존 {t_old * 1000:7.1f} ms ({len(old_cells)}셀 / {old_rows}행)"
+              f" | 격자 {t_new * 1000:6.1f} ms ({cells.size}셀 / {n_rows}×{n_cols}){ok}"
+              f" | 전체 파싱 {t_full * 1000:6.1f} ms ({len(result['tables'])}표)")
+
+    print("=" * 78)
+    print("[2] 셀 텍스트 OCR — 셀별 호출(기존) vs 표당 1회 모자이크")
+    print("=" * 78)
+    if not dtp.TESSERACT_AVAILABLE:
+        print("  pytesseract 미설치 — 모자이크 구성 시간만 측정")
+    for name, img, _ in samples:
+        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        cells, text_gray = engine._detect_cells(gray)
+        t_mosaic, (mosaic, _) = timed(lambda: engine._build_cell_mosaic(text_gray, cells), args.repeat)
+        line = (f"  {name:<18} 모자이크 {mosaic.shape[1]}×{mosaic.shape[0]} 구성 {t_mosaic * 1000:6.1f} ms"
+                f" | 빈 셀 생략 {int((cells['ink'] == 0).sum())}개")
+        if dtp.TESSERACT_AVAILABLE:
+            old_cells = legacy_detect_cells(img)
+            t_old, _ = timed(lambda: legacy_ocr(img, old_cells), 1)
+            t_new, texts = timed(lambda: engine._extract_cells_text(text_gray, cells), 1)
+            line += (f" | 셀별 {t_old:6.2f} s ({len(old_cells)}회) vs 일괄 {t_new:6.2f} s (1회)"
+                     f" | 텍스트 셀 {sum(bool(t) for t in texts)}개")
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
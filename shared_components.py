@@ -793,11 +793,13 @@ def customer_input_form(customer_data: dict, agent_id: str,
 
     if supabase_client is None:
         try:
-            from supabase import create_client
+            from supabase_pool import get_supabase_client
             sb_url = get_env_secret("SUPABASE_URL", "")
             sb_key = get_env_secret("SUPABASE_SERVICE_ROLE_KEY",
                         get_env_secret("SUPABASE_KEY", ""))
-            supabase_client = create_client(sb_url, sb_key)
+            supabase_client = get_supabase_client(sb_url, sb_key)
+            if supabase_client is None:
+                raise ValueError("SUPABASE_URL / SUPABASE_KEY 미설정")
         except Exception as e:
             raise RuntimeError(f"Supabase 연결 실패: {e}")
 
@@ -1488,11 +1490,13 @@ def upload_file_with_tag(
 
     if supabase_client is None:
         try:
-            from supabase import create_client
+            from supabase_pool import get_supabase_client
             sb_url = get_env_secret("SUPABASE_URL", "")
             sb_key = get_env_secret("SUPABASE_SERVICE_ROLE_KEY",
                         get_env_secret("SUPABASE_KEY", ""))
-            supabase_client = create_client(sb_url, sb_key)
+            supabase_client = get_supabase_client(sb_url, sb_key)
+            if supabase_client is None:
+                raise ValueError("SUPABASE_URL / SUPABASE_KEY 미설정")
         except Exception as e:
             raise RuntimeError(f"Supabase 연결 실패: {e}")
 
@@ -1539,7 +1543,7 @@ def _perform_zero_touch_healing(
         _contact_hash = _hl.sha256(contact_clean.encode()).hexdigest()
         
         # 2. Supabase에서 회원 조회
-        from supabase import create_client as _sc_sb
+        from supabase_pool import get_supabase_client as _sc_sb
         _sb_url = get_env_secret("SUPABASE_URL", "")
         _sb_key = get_env_secret("SUPABASE_SERVICE_ROLE_KEY",
                       get_env_secret("SUPABASE_KEY", ""))
@@ -1635,7 +1639,7 @@ def notify_admin_member_error(
     # ── 1) Supabase member_errors 기록 ──────────────────────────────────────
     _sb_ok = False
     try:
-        from supabase import create_client as _sc_sb
+        from supabase_pool import get_supabase_client as _sc_sb
         _sb_url = get_env_secret("SUPABASE_URL", "")
         _sb_key = get_env_secret("SUPABASE_SERVICE_ROLE_KEY",
                       get_env_secret("SUPABASE_KEY", ""))
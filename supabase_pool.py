@@ -0,0 +1,331 @@
+"""
+supabase_pool.py — Goldkey AI 공통 Supabase 클라이언트 팩토리
+HQ / CRM / head_api / hq_backend 모든 데이터 접근 모듈이 같은 HTTP 커넥션 풀을 공유.
+
+  - 프로세스 공유 httpx 전송 계층: HTTP/2(h2 설치 시) + keep-alive 커넥션 풀
+  - 일관된 타임아웃 (connect/read/write/pool) + call_timeout() 으로 호출별 재정의
+  - 지터 포함 지수 백오프 재시도
+      · 연결 실패(요청 미전송)         → 모든 메서드 재시도
+      · 읽기 타임아웃 / 502·503·504·429 → 멱등 메서드(GET/HEAD/OPTIONS)만 재시도
+  - get_pool_metrics(): 요청 수·재시도·오류·동시 요청·지연(p50/p95/p99)·풀 커넥션 현황
+
+사용:
+    from supabase_pool import get_supabase_client
+    sb = get_supabase_client()                 # SUPABASE_URL / SUPABASE_SERVICE_ROLE_KEY 자동 탐지
+    sb = get_supabase_client(url, key)         # 명시적 URL/키 (키별 클라이언트, 풀은 공유)
+
+    with call_timeout(3):                      # 이 블록의 요청만 3초 제한
+        sb.table("gk_people").select("*").execute()
+
+환경변수 (기본값):
+  SUPABASE_HTTP2=1  SUPABASE_POOL_MAX_CONNECTIONS=20  SUPABASE_POOL_MAX_KEEPALIVE=10
+  SUPABASE_KEEPALIVE_EXPIRY=30  SUPABASE_CONNECT_TIMEOUT=5  SUPABASE_READ_TIMEOUT=30
+  SUPABASE_MAX_RETRIES=2
+"""
+from __future__ import annotations
+
+import os
+import time
+import random
+import threading
+import contextlib
+import contextvars
+from collections import deque
+from typing import Optional, Any
+
+try:
+    import httpx
+    _HTTPX_OK = True
+except ImportError:
+    _HTTPX_OK = False
+
+
+def _env_float(key: str, default: float) -> float:
+    try:
+        return float(os.environ.get(key, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _env_int(key: str, default: int) -> int:
+    try:
+        return int(os.environ.get(key, default))
+    except (TypeError, ValueError):
+        return default
+
+
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+_RETRY_STATUS       = frozenset({429, 502, 503, 504})
+
+_CALL_TIMEOUT: contextvars.ContextVar = contextvars.ContextVar("gk_sb_call_timeout", default=None)
+
+
+@contextlib.contextmanager
+def call_timeout(seconds: float):
+    """블록 내 Supabase 요청의 connect/read/write/pool 타임아웃을 seconds 로 제한."""
+    token = _CALL_TIMEOUT.set(float(seconds))
+    try:
+        yield
+    finally:
+        _CALL_TIMEOUT.reset(token)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# §1 계측 + 재시도 전송 계층
+# ══════════════════════════════════════════════════════════════════════════════
+
+class _PoolMetrics:
+    """요청 계측 (스레드 안전)."""
+
+    def __init__(self, window: int = 2048):
+        self._lock         = threading.Lock()
+        self._latencies    = deque(maxlen=window)
+        self.requests      = 0
+        self.retries       = 0
+        self.errors        = 0
+        self.in_flight     = 0
+        self.max_in_flight = 0
+
+    def start(self) -> None:
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def finish(self, elapsed: float, ok: bool) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self._latencies.append(elapsed)
+            if not ok:
+                self.errors += 1
+
+    def retry(self) -> None:
+        with self._lock:
+            self.retries += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            lat = sorted(self._latencies)
+            snap = {
+                "requests":      self.requests,
+                "retries":       self.retries,
+                "errors":        self.errors,
+                "in_flight":     self.in_flight,
+                "max_in_flight": self.max_in_flight,
+            }
+
+        def _pct(p: float) -> float:
+            if not lat:
+                return 0.0
+            return round(lat[min(len(lat) - 1, int(p * len(lat)))] * 1000, 1)
+
+        snap.update({
+            "latency_ms_p50": _pct(0.50),
+            "latency_ms_p95": _pct(0.95),
+            "latency_ms_p99": _pct(0.99),
+            "latency_samples": len(lat),
+        })
+        return snap
+
+
+if _HTTPX_OK:
+    class _PooledTransport(httpx.BaseTransport):
+        """httpx.HTTPTransport 래퍼 — 재시도(지터 백오프) + 계측 + 호출별 타임아웃."""
+
+        def __init__(self, inner: "httpx.HTTPTransport", metrics: _PoolMetrics,
+                     max_retries: int, base_delay: float = 0.2, max_delay: float = 2.0):
+            self._inner      = inner
+            self._metrics    = metrics
+            self.max_retries = max_retries
+            self.base_delay  = base_delay
+            self.max_delay   = max_delay
+
+        def _sleep(self, attempt: int) -> None:
+            delay = min(self.max_delay, self.base_delay * (2 ** attempt))
+            time.sleep(delay * (0.5 + random.random() / 2))
+
+        def handle_request(self, request: "httpx.Request") -> "httpx.Response":
+            override = _CALL_TIMEOUT.get()
+            if override is not None:
+                request.extensions["timeout"] = httpx.Timeout(override).as_dict()
+
+            idempotent = request.method in _IDEMPOTENT_METHODS
+            attempt = 0
+            while True:
+                self._metrics.start()
+                started = time.perf_counter()
+                try:
+                    response = self._inner.handle_request(request)
+                except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout):
+                    # 요청이 서버에 도달하지 않음 → 메서드 무관 재시도 안전
+                    self._metrics.finish(time.perf_counter() - started, ok=False)
+                    if attempt >= self.max_retries:
+                        raise
+                except (httpx.ReadTimeout, httpx.RemoteProtocolError, httpx.ReadError):
+                    self._metrics.finish(time.perf_counter() - started, ok=False)
+                    if not idempotent or attempt >= self.max_retries:
+                        raise
+                else:
+                    retryable = idempotent and response.status_code in _RETRY_STATUS
+                    self._metrics.finish(time.perf_counter() - started, ok=response.status_code < 500)
+                    if not retryable or attempt >= self.max_retries:
+                        return response
+                    response.close()
+
+                self._metrics.retry()
+                self._sleep(attempt)
+                attempt += 1
+
+        def close(self) -> None:
+            self._inner.close()
+
+        def pool_stats(self) -> dict:
+            pool = getattr(self._inner, "_pool", None)
+            conns = list(getattr(pool, "connections", []) or [])
+            idle = 0
+            http2 = 0
+            for c in conns:
+                try:
+                    idle += 1 if c.is_idle() else 0
+                    http2 += 1 if "HTTP/2" in repr(c) else 0
+                except Exception:
+                    pass
+            return {
+                "pool_connections":        len(conns),
+                "pool_idle_connections":   idle,
+                "pool_active_connections": len(conns) - idle,
+                "pool_http2_connections":  http2,
+            }
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# §2 클라이언트 팩토리 (프로세스 싱글턴)
+# ══════════════════════════════════════════════════════════════════════════════
+
+_LOCK = threading.Lock()
+_CLIENTS: dict = {}
+_TRANSPORT: Any = None
+_METRICS = _PoolMetrics()
+
+
+def _http2_enabled() -> bool:
+    if os.environ.get("SUPABASE_HTTP2", "1").lower() in ("0", "false", "no"):
+        return False
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def _default_timeout() -> "httpx.Timeout":
+    connect = _env_float("SUPABASE_CONNECT_TIMEOUT", 5.0)
+    read    = _env_float("SUPABASE_READ_TIMEOUT", 30.0)
+    return httpx.Timeout(read, connect=connect, write=read, pool=connect)
+
+
+def _shared_transport() -> Any:
+    """프로세스 공유 커넥션 풀 (_LOCK 보유 상태에서 호출)."""
+    global _TRANSPORT
+    if _TRANSPORT is None:
+        limits = httpx.Limits(
+            max_connections=_env_int("SUPABASE_POOL_MAX_CONNECTIONS", 20),
+            max_keepalive_connections=_env_int("SUPABASE_POOL_MAX_KEEPALIVE", 10),
+            keepalive_expiry=_env_float("SUPABASE_KEEPALIVE_EXPIRY", 30.0),
+        )
+        _TRANSPORT = _PooledTransport(
+            httpx.HTTPTransport(http2=_http2_enabled(), limits=limits),
+            _METRICS,
+            max_retries=_env_int("SUPABASE_MAX_RETRIES", 2),
+        )
+    return _TRANSPORT
+
+
+def _resolve_credentials(url: str, key: str) -> tuple[str, str]:
+    if url and key:
+        return url, key
+    try:
+        from shared_components import get_env_secret
+    except Exception:
+        def get_env_secret(k: str, d: str = "") -> str:
+            return os.environ.get(k, d)
+    url = url or get_env_secret("SUPABASE_URL", "")
+    key = key or get_env_secret(
+        "SUPABASE_SERVICE_ROLE_KEY",
+        get_env_secret("SUPABASE_KEY", ""),
+    )
+    return url, key
+
+
+def get_supabase_client(url: str = "", key: str = "", schema: str = "public") -> Any:
+    """
+    공유 풀 기반 Supabase 클라이언트 반환 (url/key/schema 별 1개, 스레드 안전).
+    url/key 생략 시 SUPABASE_URL / SUPABASE_SERVICE_ROLE_KEY(→ SUPABASE_KEY) 사용.
+    자격증명이 없으면 None.
+    """
+    url, key = _resolve_credentials(url, key)
+    if not url or not key:
+        return None
+
+    cache_key = (url, key, schema)
+    client = _CLIENTS.get(cache_key)
+    if client is not None:
+        return client
+
+    from supabase import create_client
+
+    with _LOCK:
+        client = _CLIENTS.get(cache_key)
+        if client is not None:
+            return client
+
+        if not _HTTPX_OK:
+            client = create_client(url, key)
+        else:
+            # 클라이언트별 httpx.Client (base_url/헤더 분리) + 전송 계층(커넥션 풀)은 공유
+            http_client = httpx.Client(
+                transport=_shared_transport(),
+                timeout=_default_timeout(),
+                follow_redirects=True,
+            )
+            try:
+                from supabase import ClientOptions
+            except ImportError:
+                ClientOptions = None
+            if ClientOptions is None:
+                http_client.close()
+                client = create_client(url, key)
+            else:
+                try:
+                    options = ClientOptions(schema=schema, httpx_client=http_client)
+                except TypeError:
+                    # 구버전 supabase-py (httpx_client 미지원) → 타임아웃만 통일
+                    http_client.close()
+                    options = ClientOptions(schema=schema, postgrest_client_timeout=_default_timeout())
+                client = create_client(url, key, options=options)
+
+        _CLIENTS[cache_key] = client
+        return client
+
+
+def get_pool_metrics() -> dict:
+    """커넥션 풀 사용량 + 요청 지연 지표."""
+    metrics = _METRICS.snapshot()
+    metrics["clients"] = len(_CLIENTS)
+    metrics["http2"] = _http2_enabled()
+    if _TRANSPORT is not None:
+        metrics.update(_TRANSPORT.pool_stats())
+    return metrics
+
+
+def reset_clients() -> None:
+    """캐시된 클라이언트와 커넥션 풀 폐기 (자격증명 교체·테스트용)."""
+    global _TRANSPORT
+    with _LOCK:
+        _CLIENTS.clear()
+        if _TRANSPORT is not None:
+            try:
+                _TRANSPORT.close()
+            except Exception:
+                pass
+        _TRANSPORT = None
@@ -51,12 +51,12 @@ def get_trinity_db():
     SUPABASE_URL / SUPABASE_SERVICE_ROLE_KEY 환경변수 또는 secrets.toml 자동 감지.
     """
     try:
-        from supabase import create_client
+        from supabase_pool import get_supabase_client
         url = (_env("SUPABASE_URL") or "").strip()
         key = (_env("SUPABASE_SERVICE_ROLE_KEY") or _env("SUPABASE_KEY") or "").strip()
         if not url or not key:
             return None
-        return create_client(url, key)
+        return get_supabase_client(url, key)
     except Exception as _e:
         try:
             st.warning(f"⚠️ trinity_engine: Supabase 연결 실패 — {_e}")
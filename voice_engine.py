@@ -12,7 +12,7 @@ Architecture:
   [6] STT 보이스 검색 — Web Speech API 기반 음성 인식 + 의도 파서
 """
 from __future__ import annotations
-import re, json, datetime, html as _html, os, random
+import re, json, datetime, html as _html, os, random, threading
 import streamlit as st
 import streamlit.components.v1 as _cv1
 
@@ -85,24 +85,198 @@ def _pcm_to_wav(pcm_data: bytes, sample_rate: int = 24000) -> bytes:
     return buf.getvalue()
 
 
+# ══════════════════════════════════════════════════════════════════════════════
+# [GP-VOICE-CACHE] 콘텐츠 주소 TTS 오디오 캐시
+# 키   : sha256(정규화 텍스트 | 보이스 | 모델) — 같은 문장은 세션·디바이스·재시작과 무관하게 1회 합성
+# 저장 : 16-bit PCM 1차 차분 + zlib 압축 (원본 WAV 대비 축소) — 재생 시 WAV 헤더만 붙임
+# 축출 : 총 용량 GK_TTS_CACHE_MAX_MB(기본 200MB) 초과 시 최근 사용(mtime) 오래된 순 삭제
+# 권한 : 디렉터리 0700 · 파일 0600 (브리핑 음성에 고객명·계약 정보 포함 — 다른 계정 열람 차단)
+# ══════════════════════════════════════════════════════════════════════════════
+_TTS_CACHE_DIR       = os.environ.get("GK_TTS_CACHE_DIR", "") or os.path.join(
+    __import__("tempfile").gettempdir(), "gk_tts_cache")
+_TTS_CACHE_MAX_BYTES = int(float(os.environ.get("GK_TTS_CACHE_MAX_MB", "200")) * 1024 * 1024)
+_TTS_CACHE_MAGIC     = b"GKZ1"
+_TTS_CACHE_EXT       = ".pcmz"
+
+_tts_lock        = threading.Lock()
+_tts_cache_bytes = -1                  # -1: 미집계 (첫 쓰기 시 디렉터리 스캔)
+_tts_inflight: dict[str, threading.Event] = {}
+_tts_clients: dict[str, object] = {}
+_tts_model_ok    = ""                  # 마지막 성공 모델 — 다음 합성 시 1순위
+
+
+def _tts_plain_text(text: str) -> str:
+    # plain text 사용 (SSML 거부 이슈 회피)
+    return re.sub(r"[#*`>]+", "", text or "").strip()
+
+
+def _tts_cache_key(plain: str, model: str, voice: str = _ZEPHYR_VOICE) -> str:
+    import hashlib as _hl
+    return _hl.sha256(f"{voice}|{model}|{plain}".encode("utf-8")).hexdigest()
+
+
+def _tts_cache_path(key: str) -> str:
+    return os.path.join(_TTS_CACHE_DIR, key[:2], key + _TTS_CACHE_EXT)
+
+
+def _encode_pcm(pcm: bytes, sample_rate: int = 24000) -> bytes:
+    """16-bit PCM → 1차 차분(음성은 인접 샘플 상관이 커서 엔트로피 감소) + zlib."""
+    import zlib as _zl, struct as _st
+    import numpy as _np
+    samples = _np.frombuffer(pcm[: len(pcm) - len(pcm) % 2], dtype="<i2")
+    delta = _np.diff(samples, prepend=_np.int16(0)).astype("<i2")  # int16 랩어라운드 → cumsum 으로 복원
+    return _TTS_CACHE_MAGIC + _st.pack("<I", sample_rate) + _zl.compress(delta.tobytes(), 6)
+
+
+def _decode_pcm(blob: bytes) -> tuple[bytes, int] | None:
+    import zlib as _zl, struct as _st
+    import numpy as _np
+    if not blob.startswith(_TTS_CACHE_MAGIC):
+        return None
+    sample_rate = _st.unpack("<I", blob[4:8])[0]
+    delta = _np.frombuffer(_zl.decompress(blob[8:]), dtype="<i2")
+    return _np.cumsum(delta, dtype="<i2").tobytes(), sample_rate
+
+
+def _tts_cache_get(plain: str, model: str) -> bytes | None:
+    """캐시 적중 시 WAV 바이트 (mtime 갱신 = LRU 터치)."""
+    path = _tts_cache_path(_tts_cache_key(plain, model))
+    try:
+        with open(path, "rb") as _f:
+            decoded = _decode_pcm(_f.read())
+        if decoded is None:
+            return None
+        os.utime(path)
+        return _pcm_to_wav(decoded[0], decoded[1])
+    except Exception:
+        return None
+
+
+def _tts_cache_put(plain: str, model: str, pcm: bytes) -> None:
+    global _tts_cache_bytes
+    path = _tts_cache_path(_tts_cache_key(plain, model))
+    try:
+        blob = _encode_pcm(pcm)
+        os.makedirs(_TTS_CACHE_DIR, mode=0o700, exist_ok=True)
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        _fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(_fd, "wb") as _f:
+            _f.write(blob)
+        os.replace(tmp, path)
+    except Exception:
+        return
+    with _tts_lock:
+        if _tts_cache_bytes < 0:
+            _tts_cache_bytes = sum(sz for _p, sz, _m in _tts_cache_entries())
+        else:
+            _tts_cache_bytes += len(blob)
+        if _tts_cache_bytes > _TTS_CACHE_MAX_BYTES:
+            _tts_cache_evict()
+
+
+def _tts_cache_entries() -> list[tuple[str, int, float]]:
+    entries = []
+    for _root, _dirs, _files in os.walk(_TTS_CACHE_DIR):
+        for _fn in _files:
+            if _fn.endswith(_TTS_CACHE_EXT):
+                _p = os.path.join(_root, _fn)
+                try:
+                    _stt = os.stat(_p)
+                    entries.append((_p, _stt.st_size, _stt.st_mtime))
+                except OSError:
+                    pass
+    return entries
+
+
+def _tts_cache_evict() -> None:
+    """용량 한도의 90%까지 오래 안 쓴 항목부터 삭제 (_tts_lock 보유 상태에서 호출)."""
+    global _tts_cache_bytes
+    entries = sorted(_tts_cache_entries(), key=lambda e: e[2])
+    total = sum(e[1] for e in entries)
+    target = int(_TTS_CACHE_MAX_BYTES * 0.9)
+    for _p, _sz, _m in entries:
+        if total <= target:
+            break
+        try:
+            os.remove(_p)
+            total -= _sz
+        except OSError:
+            pass
+    _tts_cache_bytes = total
+
+
+def _genai_tts_client(api_key: str):
+    """genai.Client 는 API 키별 1회 생성 후 재사용."""
+    _c = _tts_clients.get(api_key)
+    if _c is None:
+        from google import genai as _gnai
+        _c = _gnai.Client(api_key=api_key)
+        _tts_clients[api_key] = _c
+    return _c
+
+
+def _tts_models() -> list[str]:
+    models = [_ZEPHYR_MODEL, _ZEPHYR_MODEL2, _ZEPHYR_MODEL3]
+    if _tts_model_ok in models:
+        models.remove(_tts_model_ok)
+        models.insert(0, _tts_model_ok)
+    return models
+
+
+def _tts_report(model: str | None, err: str | None) -> None:
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx as _gctx
+        if _gctx() is None:
+            return  # 백그라운드 사전 합성 — 세션 없음
+        st.session_state["_zephyr_err"] = err
+        if model:
+            st.session_state["_zephyr_model_ok"] = model
+    except Exception:
+        pass
+
+
 def synthesize_zephyr(text: str, api_key: str) -> bytes | None:
     """[GP-VOICE-2026] Gemini TTS — Zephyr 아나운서 보이스 합성.
     성공 시 WAV 바이트. 실패 시 None + st.session_state["_zephyr_err"]= 오류 메시지.
-    모델 시도 순서: gemini-2.0-flash-exp → gemini-2.0-flash → gemini-2.0-flash-preview-tts
+    모델 시도 순서: 마지막 성공 모델 → gemini-2.0-flash-exp → gemini-2.0-flash → gemini-2.0-flash-preview-tts
+    [GP-VOICE-CACHE] 캐시 적중 시 API 호출 없이 즉시 반환, 동일 문장 동시 합성은 1회로 병합.
     """
+    global _tts_model_ok
     if not api_key or api_key == "여기에_발급받은_API_키를_넣어주세요":
         return None
 
+    _plain = _tts_plain_text(text)
+    if not _plain:
+        return None
+    for _m in _tts_models():
+        _hit = _tts_cache_get(_plain, _m)
+        if _hit:
+            _tts_report(_m, None)
+            return _hit
+
+    # 같은 문장을 다른 세션/사전 합성이 합성 중이면 완료를 기다린 뒤 캐시 재조회
+    _flight_key = _tts_cache_key(_plain, "*")
+    with _tts_lock:
+        _ev = _tts_inflight.get(_flight_key)
+        _owner = _ev is None
+        if _owner:
+            _ev = _tts_inflight[_flight_key] = threading.Event()
+    if not _owner:
+        _ev.wait(60)
+        for _m in _tts_models():
+            _hit = _tts_cache_get(_plain, _m)
+            if _hit:
+                _tts_report(_m, None)
+                return _hit
+
     import base64 as _b64s
-    # plain text 사용 (SSML 거부 이슈 회피)
-    _plain = re.sub(r"[#*`>]+", "", text).strip()
     _errs: list[str] = []
 
     def _try_model(model_name: str) -> bytes | None:
         try:
-            from google import genai as _gnai
             from google.genai import types as _gt
-            _c = _gnai.Client(api_key=api_key)
+            _c = _genai_tts_client(api_key)
             _r = _c.models.generate_content(
                 model=model_name,
                 contents=_plain,
@@ -121,30 +295,175 @@ def synthesize_zephyr(text: str, api_key: str) -> bytes | None:
                 _raw = _r.candidates[0].content.parts[0].inline_data.data
                 if isinstance(_raw, str):
                     _raw = _b64s.b64decode(_raw)
-                return _pcm_to_wav(_raw)
+                return _raw
             _errs.append(f"{model_name}: candidates 없음")
         except Exception as _e:
             _errs.append(f"{model_name}: {type(_e).__name__}({_e})")
         return None
 
-    for _m in [_ZEPHYR_MODEL, _ZEPHYR_MODEL2, _ZEPHYR_MODEL3]:
-        _result = _try_model(_m)
-        if _result:
-            try:
-                import streamlit as _st_tts
-                _st_tts.session_state["_zephyr_err"] = None
-                _st_tts.session_state["_zephyr_model_ok"] = _m
-            except Exception:
-                pass
-            return _result
+    try:
+        for _m in _tts_models():
+            _pcm = _try_model(_m)
+            if _pcm:
+                _tts_model_ok = _m
+                _tts_cache_put(_plain, _m, _pcm)
+                _tts_report(_m, None)
+                return _pcm_to_wav(_pcm)
+    finally:
+        if _owner:
+            with _tts_lock:
+                _tts_inflight.pop(_flight_key, None)
+            _ev.set()
+
+    _tts_report(None, " | ".join(_errs))
+    return None
+
 
-    _err_msg = " | ".join(_errs)
+def _tts_api_key() -> str:
     try:
-        import streamlit as _st_tts
-        _st_tts.session_state["_zephyr_err"] = _err_msg
+        from shared_components import get_env_secret as _genv_p
+        return _genv_p("GEMINI_API_KEY", "") or _genv_p("GOOGLE_API_KEY", "")
     except Exception:
-        pass
-    return None
+        return os.environ.get("GEMINI_API_KEY", "") or os.environ.get("GOOGLE_API_KEY", "")
+
+
+def is_zephyr_cached(text: str) -> bool:
+    _plain = _tts_plain_text(text)
+    return any(os.path.exists(_tts_cache_path(_tts_cache_key(_plain, _m))) for _m in _tts_models())
+
+
+def presynthesize_zephyr(texts, api_key: str = "") -> int:
+    """
+    [GP-VOICE-CACHE] 재생 예정 문장을 백그라운드 워커 풀에서 미리 합성 → 재생 시 캐시 적중.
+    이미 캐시된 문장은 건너뜀. 제출 건수 반환.
+    """
+    api_key = api_key or _tts_api_key()
+    if not api_key or api_key == "여기에_발급받은_API_키를_넣어주세요":
+        return 0
+    try:
+        from write_behind import submit_background
+    except Exception:
+        return 0
+    submitted = 0
+    for _t in dict.fromkeys(t for t in texts if t):
+        if is_zephyr_cached(_t):
+            continue
+        _plain = _tts_plain_text(_t)
+        submit_background(("tts-presynth", _tts_cache_key(_plain, "*")),
+                          lambda _t=_t: synthesize_zephyr(_t, api_key))
+        submitted += 1
+    return submitted
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# [GP-VOICE-STREAM] 청크 단위 스트리밍 합성
+# 긴 브리핑을 문장 묶음 세그먼트로 나눠 워커 풀에서 동시 합성 → 준비되는 대로 순서대로 방출.
+# 첫 세그먼트는 1문장만 담아 첫 음성 출력 시간이 브리핑 길이와 무관하도록 함.
+# ══════════════════════════════════════════════════════════════════════════════
+_STREAM_SEG_CHARS = int(os.environ.get("GK_TTS_STREAM_SEG_CHARS", "160"))
+_STREAM_WORKERS   = int(os.environ.get("GK_TTS_STREAM_WORKERS", "3"))
+_STREAM_TIMEOUT   = 60                 # 세그먼트당 서버 대기 한도(초) — 플레이어 대기 한도도 이 값 기준
+_STREAM_WAIT_MS   = (_STREAM_TIMEOUT + 5) * 1000   # 플레이어: 서버 한도 + iframe 전달 여유
+
+
+def split_tts_segments(text: str, max_chars: int = _STREAM_SEG_CHARS) -> list[str]:
+    """문장 경계(build_ssml_chunks 와 동일 규칙)로 자른 뒤 max_chars 이내로 묶음."""
+    sentences = [s.strip() for s in re.split(r"(?<=[.!?。])\s+", _tts_plain_text(text)) if s.strip()]
+    if not sentences:
+        return []
+    segments = [sentences[0]]
+    cur = ""
+    for s in sentences[1:]:
+        if cur and len(cur) + 1 + len(s) > max_chars:
+            segments.append(cur)
+            cur = s
+        else:
+            cur = f"{cur} {s}" if cur else s
+    if cur:
+        segments.append(cur)
+    return segments
+
+
+def _wav_to_pcm(wav: bytes) -> bytes:
+    """_pcm_to_wav 의 역 — 44바이트 헤더 제거."""
+    return wav[44:] if wav[:4] == b"RIFF" and wav[36:40] == b"data" else b""
+
+
+def synthesize_zephyr_stream(
+    segments: list[str],
+    api_key: str,
+    workers: int = _STREAM_WORKERS,
+    text: str = "",
+):
+    """
+    세그먼트별 Zephyr 합성을 동시 실행하고 (index, WAV | None) 을 순서대로 yield.
+    세그먼트는 각각 TTS 캐시를 거치므로 반복 문장(인사·맺음말)은 즉시 반환.
+    text(원문) 지정 시 전 세그먼트 합성 성공하면 이어 붙인 음성을 원문 키로 캐시 저장
+    → 같은 브리핑 재생 시 is_zephyr_cached(text) 적중 → 스트리밍 없이 단일 재생.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    if not segments:
+        return
+    _ex = ThreadPoolExecutor(max_workers=max(1, min(workers, len(segments))),
+                             thread_name_prefix="gk-tts-stream")
+    _pcms: list[bytes] = []
+    try:
+        _futs = [_ex.submit(synthesize_zephyr, _seg, api_key) for _seg in segments]
+        for _i, _fut in enumerate(_futs):
+            try:
+                _wav = _fut.result(timeout=_STREAM_TIMEOUT)
+            except Exception:
+                _wav = None
+            if _wav:
+                _pcms.append(_wav_to_pcm(_wav))
+            yield _i, _wav
+    finally:
+        _ex.shutdown(wait=False, cancel_futures=True)
+    _plain = _tts_plain_text(text)
+    if _plain and len(_pcms) == len(segments) and all(_pcms):
+        _tts_cache_put(_plain, _tts_model_ok or _ZEPHYR_MODEL, b"".join(_pcms))
+
+
+def _push_tts_segment(stream_id: str, index: int, wav: bytes | None) -> None:
+    """세그먼트를 부모 창 큐에 적재 — _build_player_html(stream_id=...) 플레이어가 소비."""
+    import base64 as _b64q
+    _payload = json.dumps(_b64q.b64encode(wav).decode("ascii") if wav else None)
+    _cv1.html(
+        "<script>try{var w=window.parent;w.__gkTtsQ=w.__gkTtsQ||{};"
+        f"var q=w.__gkTtsQ[{json.dumps(stream_id)}]=w.__gkTtsQ[{json.dumps(stream_id)}]||{{}};"
+        f"q[{index}]={_payload};}}catch(e){{}}</script>",
+        height=0,
+    )
+
+
+def _render_zephyr_stream(
+    segments: list[str],
+    key: str,
+    api_key: str,
+    auto_play: bool = False,
+    mini: bool = False,
+    text: str = "",
+) -> int:
+    """스트리밍 플레이어 렌더링 후 세그먼트 방출. 합성 성공 세그먼트 수 반환."""
+    import hashlib as _hl
+    _sid  = f"{key}_{_hl.sha1('|'.join(segments).encode('utf-8')).hexdigest()[:12]}"
+    _prof = dict(_VOICE_PROFILES["Emotional"], icon="🎙️", label=f"AI 음성 · {_ZEPHYR_VOICE}")
+    _chunks = [
+        {"text": _seg, "rate": _prof["rate"], "pitch": _prof["pitch"],
+         "volume": _prof["volume"], "emph": False}
+        for _seg in segments
+    ]
+    _cv1.html(
+        _build_player_html(json.dumps(_chunks, ensure_ascii=False), _ZEPHYR_LANG, _prof, key,
+                           "true" if auto_play else "false", mini=mini, stream_id=_sid),
+        height=60 if mini else 90,
+        scrolling=False,
+    )
+    _ok = 0
+    for _i, _wav in synthesize_zephyr_stream(segments, api_key, text=text):
+        _push_tts_segment(_sid, _i, _wav)
+        _ok += 1 if _wav else 0
+    return _ok
 
 
 # ── [Fix] 직함 이중 출력 방지 헬퍼 ────────────────────────────────────────────────
@@ -248,22 +567,23 @@ _EQ_MORNING_GREETS: dict[int, list[str]] = {
     ],
 }
 
-def _ev_empathy(ev_count: int) -> str:
+def _ev_empathy(ev_count: int, rng: random.Random | None = None) -> str:
     """일정 수에 따라 공감 추임새 반환."""
+    _choice = (rng or random).choice
     if ev_count >= 5:
-        return random.choice([
+        return _choice([
             "오늘 정말 바쁘시겠어요! 식사 꼭 챙기시고 안전하게 이동하세요.",
             "일정이 빽빽하네요! 혹시 잠깐이라도 쉬어가는 시간을 만드세요.",
             "오늘 하루 정말 치열하실 것 같아요. 중간중간 물도 꼭 챙겨드세요!",
         ])
     elif ev_count >= 1:
-        return random.choice([
+        return _choice([
             "오늘도 일정을 꼭 확인하고 준비된 자세로 출발하세요!",
             "만남이 있는 하루, 작은 준비 하나하나가 큰 인상을 남길 거예요.",
             "고객과의 만남 전 메모 한 번 더 확인해보세요. 디테일이 신뢰를 만들어요.",
         ])
     else:
-        return random.choice([
+        return _choice([
             "오늘은 차분히 기존 고객님들께 안부 인사를 건네보기 좋은 날이네요.",
             "일정이 없는 날도 기회입니다! 오랫동안 연락 못 한 고객께 전화 한 통 어떨까요?",
             "오늘은 새로운 전략을 세워보기 좋은 날이에요. 여유롭게 시작해 보세요!",
@@ -366,20 +686,22 @@ def build_morning_briefing(
 ) -> str:
     """
     [EQ v2] 요일별·상황별 감성 스크립트 풀 기반 모닝 브리핑.
-    random.choice()로 매일 다른 인사말 + 일정 수 공감 추임새 삽입.
+    매일 다른 인사말 + 일정 수 공감 추임새 삽입.
+    [GP-VOICE-CACHE] 날짜·설계사 시드 → 같은 날 재렌더링은 동일 문장 (TTS 캐시 적중).
     """
     today    = datetime.date.today()
     weekdays = ["월요일", "화요일", "수요일", "목요일", "금요일", "토요일", "일요일"]
     wd_str   = weekdays[today.weekday()]
     today_s  = f"{today.year}년 {today.month}월 {today.day}일 {wd_str}"
     _name    = _clean_agent_name(agent_name)
+    _rng     = random.Random(f"{today.isoformat()}|{_name}")
 
     try:
         from shared_components import get_time_aware_greeting as _gtag
         _greet_base = _gtag()
     except Exception:
         _greet_pool = _EQ_MORNING_GREETS.get(today.weekday(), [])
-        _greet_base = random.choice(_greet_pool) if _greet_pool else "안녕하세요! 좋은 하루 되세요."
+        _greet_base = _rng.choice(_greet_pool) if _greet_pool else "안녕하세요! 좋은 하루 되세요."
     _greet = (f"{_name} 설계사님, {_greet_base}" if _name else _greet_base) + " "
 
     intro    = f"오늘은 {today_s}입니다. "
@@ -392,7 +714,7 @@ def build_morning_briefing(
             f"오늘 예정된 일정은 총 {ev_count}건이며, "
             f"첫 번째 일정은 '{first}'입니다. "
         )
-    ev_part += _ev_empathy(ev_count) + " "
+    ev_part += _ev_empathy(ev_count, _rng) + " "
 
     nba_part = ""
     if nba_count > 0:
@@ -401,7 +723,7 @@ def build_morning_briefing(
             "만기 임박, 휴면 재접촉, 보장 공백 고객을 확인해 보세요. "
         )
 
-    closing = random.choice([
+    closing = _rng.choice([
         "오늘도 최고의 하루 되시길 바랍니다! Goldkey AI 마스터가 함께합니다.",
         "오늘 하루도 빛나는 성과를 거두세요! 언제나 응원하고 있어요.",
         "설계사님의 오늘이 환하게 빛나길 바랍니다. Goldkey가 함께하겠습니다.",
@@ -423,12 +745,13 @@ def build_morning_briefing_compact(
     _name    = _clean_agent_name(agent_name)
     ev_count = len(today_evs) if today_evs else 0
     first_ev = today_evs[0].get("title", "없음") if today_evs else "없음"
+    _rng     = random.Random(f"{datetime.date.today().isoformat()}|{_name}")
 
     try:
         from shared_components import get_time_aware_greeting as _gtag
         _warm = _gtag()
     except Exception:
-        _warm = random.choice([
+        _warm = _rng.choice([
             "좋은 아침입니다!",
             "오늘도 파이팅입니다!",
             "밝은 하루 시작하세요!",
@@ -443,7 +766,7 @@ def build_morning_briefing_compact(
         _stats += f". 첫 일정: {first_ev}"
     _stats += "."
 
-    _closing = random.choice(["오늘도 화이팅!", "응원합니다!", "멋진 하루 되세요!"])
+    _closing = _rng.choice(["오늘도 화이팅!", "응원합니다!", "멋진 하루 되세요!"])
     return f"{_greet} {_stats} {_closing}"
 
 
@@ -456,12 +779,6 @@ def build_customer_briefing(
     고객 상세 화면 진입 시 — 성향별 맞춤 AI 브리핑 텍스트.
     [EQ Skip Logic] 당일 동일 고객 2회차부터는 감성 인사 생략, 핵심 메모만 요약.
     """
-    name   = customer.get("name", "고객")
-    memo   = customer.get("memo", "")
-    status = customer.get("status", "")
-    tier   = customer.get("management_tier", 3)
-    _memo_s = memo[:30] + "..." if len(memo) > 30 else (memo or "특이사항 없음")
-
     # ── Skip 로직: 당일 이미 브리핑된 고객 → 핵심만 요약 ────────────────────
     _skip_key = (
         f"_cust_briefed_{person_id}_{datetime.date.today().strftime('%Y%m%d')}"
@@ -470,9 +787,24 @@ def build_customer_briefing(
     _already = bool(_skip_key and st.session_state.get(_skip_key))
     if _skip_key:
         st.session_state[_skip_key] = True
+    return customer_briefing_text(customer, personality_type, repeat=_already)
+
 
-    if _already:
-        return random.choice([
+def customer_briefing_text(
+    customer: dict,
+    personality_type: str,
+    repeat: bool = False,
+) -> str:
+    """build_customer_briefing 문장 생성부 (세션 상태 미사용 — 사전 합성에서도 호출)."""
+    name   = customer.get("name", "고객")
+    memo   = customer.get("memo", "")
+    status = customer.get("status", "")
+    tier   = customer.get("management_tier", 3)
+    _memo_s = memo[:30] + "..." if len(memo) > 30 else (memo or "특이사항 없음")
+
+    if repeat:
+        _rng = random.Random(f"{datetime.date.today().isoformat()}|{customer.get('person_id', name)}")
+        return _rng.choice([
             f"{name}님 다시 확인하셨군요. 추가로 확인하실 메모 내용은 {_memo_s}입니다. "
             f"현재 상태는 '{status}', {tier}등급으로 관리 중입니다.",
             f"{name}님을 또 만났네요! 메모: {_memo_s}. 상태: '{status}'. 언제든 함께하겠습니다.",
@@ -495,6 +827,45 @@ def build_customer_briefing(
         )
 
 
+# ── [GP-VOICE-CACHE] 사전 합성 대상 ─────────────────────────────────────────
+# hq_app_impl 완료 안내 (render_zephyr_completion_chime) 고정 문구
+_CHIME_PRESETS: tuple[str, ...] = (
+    "완료되었습니다.",
+    "분석이 완료되었습니다.",
+    "1차 추가 답변이 완료되었습니다.",
+    "2차 추가 답변이 완료되었습니다.",
+    "3차 추가 답변이 완료되었습니다.",
+)
+
+
+def presynthesize_priority_briefings(
+    agent_id: str,
+    customers: list[dict],
+    limit: int = 5,
+    personality_type: str = "Emotional",
+) -> int:
+    """
+    [GP-VOICE-CACHE] 오늘 NBA 상위 고객 브리핑 + 완료 안내 문구를 백그라운드 사전 합성.
+    고객 상세 진입·분석 완료 시 캐시 적중 → 재생 대기 없음. 제출 건수 반환.
+    """
+    texts = list(_CHIME_PRESETS)
+    try:
+        from nba_engine import get_all_nba_actions
+        _by_pid = {c.get("person_id"): c for c in customers or [] if c.get("person_id")}
+        _seen: set = set()
+        for _a in get_all_nba_actions(agent_id):
+            _c = _by_pid.get(_a.get("person_id"))
+            if _c is None or _a.get("person_id") in _seen:
+                continue
+            _seen.add(_a.get("person_id"))
+            texts.append(customer_briefing_text(_c, personality_type))
+            if len(_seen) >= limit:
+                break
+    except Exception:
+        pass
+    return presynthesize_zephyr(texts)
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # [GP-NEWS] 실시간 정보 수집 엔진 — 네이버 뉴스 + 날씨
 # ══════════════════════════════════════════════════════════════════════════════
@@ -682,7 +1053,16 @@ def _build_player_html(
     key: str,
     auto_js: str,
     mini: bool = False,
+    stream_id: str = "",
 ) -> str:
+    """
+    청크 순차 재생 플레이어 HTML.
+    stream_id 지정 시 [GP-VOICE-STREAM] 모드 — 청크 i 의 Zephyr WAV 세그먼트를
+    부모 창 큐(window.parent.__gkTtsQ[stream_id][i])에서 꺼내 순서대로 재생.
+    세그먼트가 아직 없으면 도착까지 대기, 합성 실패(null)·대기 초과 시 해당 청크만 Web Speech 폴백.
+    대기 한도(_STREAM_WAIT_MS)는 서버 세그먼트 한도(_STREAM_TIMEOUT)보다 길게 — 서버가 늦게라도
+    보낸 세그먼트를 플레이어가 먼저 포기하지 않도록.
+    """
     icon  = _html.escape(prof["icon"])
     label = _html.escape(prof.get("label", ""))
     btn_h = "44px" if mini else "52px"
@@ -725,6 +1105,18 @@ var lang   = "{lang}";
 var idx    = 0;
 var playing= false;
 var synth  = window.speechSynthesis;
+var sid    = "{stream_id}";
+var audio  = null;
+var waitMs = 0;
+var waitMax = {_STREAM_WAIT_MS};
+
+function segQ() {{
+  try {{
+    var w = window.parent;
+    w.__gkTtsQ = w.__gkTtsQ || {{}};
+    return (w.__gkTtsQ[sid] = w.__gkTtsQ[sid] || {{}});
+  }} catch(e) {{ return {{}}; }}
+}}
 
 function getVoice(l) {{
   var vs = synth.getVoices();
@@ -732,8 +1124,41 @@ function getVoice(l) {{
   return null;
 }}
 
+function showChunk(i) {{
+  var c   = chunks[i];
+  var pct = Math.round((i / chunks.length) * 100);
+  document.getElementById('progBar').style.width = pct + '%';
+  document.getElementById('progLabel').textContent = (i+1) + ' / ' + chunks.length;
+  document.getElementById('curWord').textContent = c.emph ? '🔴 ' + c.text : c.text;
+}}
+
 function speakChunk(i) {{
   if(i >= chunks.length) {{ stopAll(); return; }}
+  idx = i;
+  if(sid) {{ playSegment(i); return; }}
+  speakText(i);
+}}
+
+function playSegment(i) {{
+  showChunk(i);
+  var q = segQ();
+  if(!(i in q)) {{
+    if(waitMs >= waitMax) {{ waitMs = 0; speakText(i); return; }}
+    waitMs += 150;
+    setTimeout(function() {{ if(playing && idx === i) playSegment(i); }}, 150);
+    return;
+  }}
+  waitMs = 0;
+  if(!q[i]) {{ speakText(i); return; }}
+  audio = new Audio('data:audio/wav;base64,' + q[i]);
+  audio.onended = function() {{ if(playing) speakChunk(i+1); }};
+  audio.onerror = function() {{ if(playing) speakText(i); }};
+  var p = audio.play();
+  if(p && p.catch) p.catch(function() {{ if(playing && audio && audio.paused) speakText(i); }});
+}}
+
+function speakText(i) {{
+  audio = null;
   var c  = chunks[i];
   var u  = new SpeechSynthesisUtterance(c.text);
   u.lang   = lang;
@@ -741,10 +1166,7 @@ function speakChunk(i) {{
   u.pitch  = 1 + (c.pitch || 0) * 0.1;
   u.volume = c.volume || 1.0;
   var v = getVoice(lang); if(v) u.voice = v;
-  var pct  = Math.round((i / chunks.length) * 100);
-  document.getElementById('progBar').style.width = pct + '%';
-  document.getElementById('progLabel').textContent = (i+1) + ' / ' + chunks.length;
-  document.getElementById('curWord').textContent = c.emph ? '🔴 ' + c.text : c.text;
+  showChunk(i);
   u.onend = function() {{ if(playing) speakChunk(i+1); }};
   u.onerror = function() {{ if(playing) speakChunk(i+1); }};
   synth.speak(u);
@@ -753,10 +1175,18 @@ function speakChunk(i) {{
 function togglePlay() {{
   var btn = document.getElementById('playBtn');
   if(playing) {{
-    synth.pause();
+    if(audio) audio.pause(); else synth.pause();
     playing = false;
     btn.textContent = '▶';
   }} else {{
+    if(audio && audio.paused && audio.currentTime > 0) {{
+      playing = true;
+      btn.textContent = '⏸';
+      audio.play();
+      return;
+    }}
+    playing = true;
+    btn.textContent = '⏸';
     if(synth.paused) {{
       synth.resume();
     }} else {{
@@ -764,12 +1194,11 @@ function togglePlay() {{
       idx = 0;
       speakChunk(0);
     }}
-    playing = true;
-    btn.textContent = '⏸';
   }}
 }}
 
 function stopAll() {{
+  if(audio) {{ audio.onended = null; audio.pause(); audio = null; }}
   synth.cancel();
   playing = false;
   idx = 0;
@@ -807,6 +1236,26 @@ if({auto_js}) {{
 </script></body></html>"""
 
 
+def _zephyr_label(model: str) -> None:
+    try:
+        from shared_components import GeminiProTTSVoice as _GTV
+
+        _lbl = _GTV.label_html()
+    except Exception:
+        _lbl = (
+            f"🎙️ <b>AI 음성 합성</b> · <b>Gemini Pro TTS</b> · "
+            f"언어: 한국어 · 보이스: {_ZEPHYR_VOICE}"
+        )
+    st.markdown(
+        "<div style='background:rgba(30,91,164,0.08);border:1px dashed #1e5ba4;"
+        "border-radius:10px;padding:6px 14px;font-size:clamp(11px,1.8vw,13px);color:#1e5ba4;"
+        "margin-bottom:6px;'>"
+        f"{_lbl} · 모델: {model}<br>"
+        "📱 <b>모바일·태블릿:</b> 아래 ▶ 버튼을 눌러 재생하세요</div>",
+        unsafe_allow_html=True,
+    )
+
+
 def render_voice_player_zephyr(
     text: str,
     key: str = "vp_zephyr",
@@ -827,28 +1276,18 @@ def render_voice_player_zephyr(
 
     _audio_bytes = None
     if _api_key and _api_key != "여기에_발급받은_API_키를_넣어주세요":
+        # [GP-VOICE-STREAM] 미캐시 장문 → 세그먼트 동시 합성 + 도착 순 재생
+        _segs = split_tts_segments(text)
+        if len(_segs) > 1 and not is_zephyr_cached(text):
+            _zephyr_label(st.session_state.get("_zephyr_model_ok", _tts_model_ok or _ZEPHYR_MODEL))
+            if not _render_zephyr_stream(_segs, key, _api_key, auto_play=auto_play, text=text) and not compact:
+                st.caption("⚠️ AI 음성 합성 오류 → 기본 음성 사용")
+            return
         _audio_bytes = synthesize_zephyr(text, _api_key)
 
     if _audio_bytes:
         # ── Gemini Zephyr TTS 성공 — st.audio 재생 ─────────────────────
-        _ok_model = st.session_state.get("_zephyr_model_ok", _ZEPHYR_MODEL)
-        try:
-            from shared_components import GeminiProTTSVoice as _GTV
-
-            _lbl = _GTV.label_html()
-        except Exception:
-            _lbl = (
-                f"🎙️ <b>AI 음성 합성</b> · <b>Gemini Pro TTS</b> · "
-                f"언어: 한국어 · 보이스: {_ZEPHYR_VOICE}"
-            )
-        st.markdown(
-            "<div style='background:rgba(30,91,164,0.08);border:1px dashed #1e5ba4;"
-            "border-radius:10px;padding:6px 14px;font-size:clamp(11px,1.8vw,13px);color:#1e5ba4;"
-            "margin-bottom:6px;'>"
-            f"{_lbl} · 모델: {_ok_model}<br>"
-            "📱 <b>모바일·태블릿:</b> 아래 ▶ 버튼을 눌러 재생하세요</div>",
-            unsafe_allow_html=True,
-        )
+        _zephyr_label(st.session_state.get("_zephyr_model_ok", _ZEPHYR_MODEL))
         import io as _io
         st.audio(_io.BytesIO(_audio_bytes), format="audio/wav")
     else:
@@ -879,6 +1318,11 @@ def render_voice_player_bar_zephyr(text: str, key: str = "vp_bar_zephyr") -> Non
         _api_key = os.environ.get("GEMINI_API_KEY", "") or os.environ.get("GOOGLE_API_KEY", "")
 
     if _api_key and _api_key != "여기에_발급받은_API_키를_넣어주세요":
+        _segs = split_tts_segments(text)
+        if len(_segs) > 1 and not is_zephyr_cached(text):
+            # [GP-VOICE-STREAM] 세그먼트 합성 실패 시 플레이어가 해당 구간만 Web Speech 폴백
+            _render_zephyr_stream(_segs, key, _api_key, mini=True, text=text)
+            return
         _audio_bytes = synthesize_zephyr(text, _api_key)
         if _audio_bytes:
             import io as _io
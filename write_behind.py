@@ -0,0 +1,368 @@
+"""
+write_behind.py — Goldkey AI 로그/감사 기록 write-behind 큐
+상담일지·카카오 발송·디바이스·사용량 로그를 요청 경로에서 분리하여 백그라운드에서 일괄 기록.
+
+  - 프로세스 공유 유한 큐 + 단일 flusher 스레드 (요청마다 스레드 생성 금지)
+  - 테이블(+on_conflict, 컬럼 구성)별 배치 insert/upsert
+  - 실패 시 지터 백오프 재시도 → 한도 초과·백엔드 불가 시 로컬 append-only 파일(JSONL)로 스필
+    (상담일지 원문 포함 → 디렉터리 0700 · 파일 0600, 다른 계정 열람 차단)
+  - 백엔드 복구 시 스필 파일 자동 재전송
+  - 프로세스 종료(atexit) 시 잔여 행 flush → 실패분은 스필 (유실 없음)
+  - submit_background(): GCS 백업 등 fire-and-forget 작업용 고정 크기 워커 풀 (키별 최신 작업만 유지)
+
+사용:
+    from write_behind import enqueue_row
+    enqueue_row("gk_consulting_logs", payload)                         # insert
+    enqueue_row("gk_device_history", row, on_conflict="user_name,fp_id")  # upsert
+
+환경변수 (기본값):
+  GK_WB_MAX_QUEUE=10000  GK_WB_BATCH_SIZE=200  GK_WB_FLUSH_INTERVAL=1.0
+  GK_WB_MAX_RETRIES=3    GK_WB_SPILL_PATH=<tempdir>/gk_write_behind/spill.jsonl
+  GK_BG_WORKERS=2        GK_BG_MAX_PENDING=256
+"""
+from __future__ import annotations
+
+import os
+import json
+import time
+import queue
+import atexit
+import random
+import logging
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _env_float(key: str, default: float) -> float:
+    try:
+        return float(os.environ.get(key, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _env_int(key: str, default: int) -> int:
+    try:
+        return int(os.environ.get(key, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _default_client() -> Any:
+    from db_utils import _get_sb
+    return _get_sb()
+
+
+def _default_spill_path() -> str:
+    return os.path.join(tempfile.gettempdir(), "gk_write_behind", "spill.jsonl")
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# §1 write-behind 큐
+# ══════════════════════════════════════════════════════════════════════════════
+
+class WriteBehindQueue:
+    """
+    유한 큐 + 백그라운드 flusher.
+    enqueue() 는 절대 블로킹하지 않음 — 큐가 가득 차면 해당 행은 즉시 스필 파일로.
+    """
+
+    def __init__(
+        self,
+        client_getter: Callable[[], Any] = _default_client,
+        max_queue: int = 10000,
+        batch_size: int = 200,
+        flush_interval: float = 1.0,
+        max_retries: int = 3,
+        spill_path: str = "",
+    ):
+        self._client_getter = client_getter
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self.batch_size     = batch_size
+        self.flush_interval = flush_interval
+        self.max_retries    = max_retries
+        self.spill_path     = spill_path or _default_spill_path()
+
+        self._lock        = threading.Lock()       # flush 직렬화 (flusher ↔ flush()/close())
+        self._spill_lock  = threading.Lock()
+        self._start_lock  = threading.Lock()
+        self._wakeup      = threading.Event()
+        self._stop        = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._closed      = False
+        self.stats = {"enqueued": 0, "written": 0, "batches": 0, "retries": 0,
+                      "spilled": 0, "replayed": 0}
+
+    # ── 생산자 ──────────────────────────────────────────────────────────────
+    def enqueue(self, table: str, row: dict, on_conflict: str = "") -> bool:
+        """행 적재 (즉시 반환). 큐 적재 시 True, 스필 파일로 우회 시 False."""
+        item = (table, on_conflict or "", row)
+        if self._closed:
+            self._spill([item])
+            return False
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            self._spill([item])
+            return False
+        self.stats["enqueued"] += 1
+        if self._queue.qsize() >= self.batch_size:
+            self._wakeup.set()
+        return True
+
+    # ── flusher ────────────────────────────────────────────────────────────
+    def _ensure_started(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name="gk-write-behind", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        last_replay = 0.0
+        while not self._stop.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+                # 스필 파일 재전송은 최대 30초에 1회
+                if time.monotonic() - last_replay >= 30.0:
+                    last_replay = time.monotonic()
+                    self.replay_spill()
+            except Exception as exc:  # flusher 스레드는 절대 종료되지 않음
+                logger.warning("[write_behind] flush 루프 오류: %s", exc)
+
+    def _drain(self) -> list:
+        items = []
+        while True:
+            try:
+                items.append(self._queue.get_nowait())
+            except queue.Empty:
+                return items
+
+    def flush(self) -> int:
+        """큐에 쌓인 행을 테이블별 배치로 기록. 기록 행 수 반환 (실패분은 스필)."""
+        with self._lock:
+            items = self._drain()
+            if not items:
+                return 0
+            return self._write(items)
+
+    def _write(self, items: list) -> int:
+        # (table, on_conflict, 컬럼 구성) 별 그룹 — PostgREST 벌크 insert 는 동일 키 집합 필요
+        groups: "OrderedDict[tuple, list]" = OrderedDict()
+        for table, on_conflict, row in items:
+            groups.setdefault((table, on_conflict, tuple(sorted(row))), []).append(row)
+
+        sb = self._client_getter()
+        written = 0
+        for (table, on_conflict, _cols), rows in groups.items():
+            for start in range(0, len(rows), self.batch_size):
+                chunk = rows[start:start + self.batch_size]
+                if sb is not None and self._write_chunk(sb, table, on_conflict, chunk):
+                    written += len(chunk)
+                else:
+                    self._spill([(table, on_conflict, r) for r in chunk])
+        self.stats["written"] += written
+        return written
+
+    def _write_chunk(self, sb: Any, table: str, on_conflict: str, rows: list) -> bool:
+        for attempt in range(self.max_retries + 1):
+            try:
+                if on_conflict:
+                    sb.table(table).upsert(rows, on_conflict=on_conflict).execute()
+                else:
+                    sb.table(table).insert(rows).execute()
+                self.stats["batches"] += 1
+                return True
+            except Exception as exc:
+                if attempt >= self.max_retries:
+                    logger.warning("[write_behind] %s %d행 기록 실패 → 스필: %s", table, len(rows), exc)
+                    return False
+                self.stats["retries"] += 1
+                if self._stop.is_set():
+                    continue  # 종료 중에는 대기 없이 재시도
+                time.sleep(min(2.0, 0.2 * (2 ** attempt)) * (0.5 + random.random() / 2))
+        return False
+
+    # ── 스필 파일 (append-only JSONL) ──────────────────────────────────────
+    def _spill(self, items: list) -> None:
+        if not items:
+            return
+        try:
+            with self._spill_lock, self._open_spill() as f:
+                for table, on_conflict, row in items:
+                    f.write(json.dumps({"table": table, "on_conflict": on_conflict, "row": row},
+                                       ensure_ascii=False, default=str) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self.stats["spilled"] += len(items)
+        except OSError as exc:
+            logger.error("[write_behind] 스필 파일 기록 실패 (%d행 유실): %s", len(items), exc)
+
+    def _open_spill(self):
+        """스필 파일 append 열기 — 디렉터리 0700 · 파일 0600 (기존 파일 권한도 축소)."""
+        directory = os.path.dirname(self.spill_path)
+        if directory:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+        fd = os.open(self.spill_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+        try:
+            os.fchmod(fd, 0o600)
+        except (AttributeError, OSError):  # Windows 등
+            pass
+        return os.fdopen(fd, "a", encoding="utf-8")
+
+    def replay_spill(self) -> int:
+        """스필 파일을 재전송. 백엔드 불가 시 파일은 그대로 유지."""
+        if not os.path.exists(self.spill_path) or self._client_getter() is None:
+            return 0
+        replay_path = self.spill_path + ".replay"
+        with self._spill_lock:
+            if os.path.exists(replay_path):
+                return 0  # 다른 스레드/프로세스가 재전송 중
+            try:
+                os.replace(self.spill_path, replay_path)
+            except OSError:
+                return 0
+
+        items = []
+        with open(replay_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    rec = json.loads(line)
+                    items.append((rec["table"], rec.get("on_conflict", ""), rec["row"]))
+                except (ValueError, KeyError, TypeError):
+                    continue  # 종료 중 잘린 마지막 줄 등
+        with self._lock:
+            written = self._write(items)  # 실패분은 새 스필 파일로 다시 기록됨
+        os.remove(replay_path)
+        self.stats["replayed"] += written
+        return written
+
+    # ── 종료 ───────────────────────────────────────────────────────────────
+    def close(self, timeout: float = 10.0) -> None:
+        """flusher 정지 후 잔여 행 flush — 기록 실패분은 스필."""
+        if self._closed:
+            return
+        self._stop.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._closed = True
+        self.flush()
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# §2 백그라운드 작업 풀 (GCS 백업 등 fire-and-forget)
+# ══════════════════════════════════════════════════════════════════════════════
+
+class BackgroundTasks:
+    """
+    고정 크기 워커 풀. 같은 key 작업이 아직 대기 중이면 최신 작업으로 교체(coalesce)하여
+    같은 고객 프로파일을 연속 저장해도 업로드는 마지막 스냅샷 1회만 수행.
+    대기 작업이 max_pending 을 넘으면 가장 오래된 대기 작업을 버림.
+    """
+
+    def __init__(self, workers: int = 2, max_pending: int = 256):
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gk-bg")
+        self._pending: "OrderedDict[Hashable, Callable[[], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_pending = max_pending
+        self.dropped = 0
+
+    def submit(self, key: Hashable, fn: Callable[[], Any]) -> None:
+        with self._lock:
+            replaced = key in self._pending
+            self._pending[key] = fn
+            self._pending.move_to_end(key)
+            if len(self._pending) > self.max_pending:
+                self._pending.popitem(last=False)
+                self.dropped += 1
+        if not replaced:
+            try:
+                self._executor.submit(self._run_one)
+            except RuntimeError:  # 종료 후 제출
+                pass
+
+    def _run_one(self) -> None:
+        with self._lock:
+            if not self._pending:
+                return
+            _key, fn = self._pending.popitem(last=False)
+        try:
+            fn()
+        except Exception as exc:
+            logger.warning("[write_behind] 백그라운드 작업 실패: %s", exc)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# §3 프로세스 싱글턴
+# ══════════════════════════════════════════════════════════════════════════════
+
+_WB_QUEUE: Optional[WriteBehindQueue] = None
+_BG_TASKS: Optional[BackgroundTasks] = None
+_SINGLETON_LOCK = threading.Lock()
+
+
+def get_write_behind_queue() -> WriteBehindQueue:
+    global _WB_QUEUE
+    if _WB_QUEUE is None:
+        with _SINGLETON_LOCK:
+            if _WB_QUEUE is None:
+                _WB_QUEUE = WriteBehindQueue(
+                    max_queue=_env_int("GK_WB_MAX_QUEUE", 10000),
+                    batch_size=_env_int("GK_WB_BATCH_SIZE", 200),
+                    flush_interval=_env_float("GK_WB_FLUSH_INTERVAL", 1.0),
+                    max_retries=_env_int("GK_WB_MAX_RETRIES", 3),
+                    spill_path=os.environ.get("GK_WB_SPILL_PATH", ""),
+                )
+    return _WB_QUEUE
+
+
+def get_background_tasks() -> BackgroundTasks:
+    global _BG_TASKS
+    if _BG_TASKS is None:
+        with _SINGLETON_LOCK:
+            if _BG_TASKS is None:
+                _BG_TASKS = BackgroundTasks(
+                    workers=_env_int("GK_BG_WORKERS", 2),
+                    max_pending=_env_int("GK_BG_MAX_PENDING", 256),
+                )
+    return _BG_TASKS
+
+
+def enqueue_row(table: str, row: dict, on_conflict: str = "") -> bool:
+    """로그 행 비동기 기록 (insert, on_conflict 지정 시 upsert)."""
+    return get_write_behind_queue().enqueue(table, row, on_conflict)
+
+
+def submit_background(key: Hashable, fn: Callable[[], Any]) -> None:
+    """fire-and-forget 작업 제출 (key 별 최신 작업만 실행)."""
+    get_background_tasks().submit(key, fn)
+
+
+def write_behind_stats() -> dict:
+    wb = get_write_behind_queue()
+    return {**wb.stats, "pending": wb.pending(), "spill_path": wb.spill_path}
+
+
+@atexit.register
+def shutdown(timeout: float = 10.0) -> None:
+    """프로세스 종료 시 백그라운드 작업 완료 대기 → 로그 큐 flush."""
+    if _BG_TASKS is not None:
+        _BG_TASKS.shutdown(wait=True)
+    if _WB_QUEUE is not None:
+        _WB_QUEUE.close(timeout)